@@ -0,0 +1,349 @@
+"""Cost-aware admission control in front of the parser engines.
+
+Every parse request is given an estimated cost (roughly "pages of work",
+derived from the file type, byte size and, for PDFs, a quick page count) and
+must be admitted by the server-wide :class:`AdmissionController` before it is
+parsed. The controller
+
+* runs at most ``max_running`` jobs at once and keeps ``reserved_small``
+  of those slots for small jobs, so an 800-page scan can never occupy every
+  slot while one-page markdown files queue behind it;
+* queues waiting jobs in two FIFO lanes (small / large) and always serves
+  the small lane first;
+* rejects a job outright (``AdmissionRejected`` -> ``RESOURCE_EXHAUSTED``)
+  when the cost already queued or running would exceed the backlog budget,
+  or when it waited longer than its queue deadline, with a retry hint derived
+  from the observed seconds-per-cost-unit throughput.
+
+The per-engine ``parser_worker_limit`` semaphores still apply inside a job;
+admission only decides which requests may start parsing. It is opt-in
+(``DOCREADER_ADMISSION_ENABLED``) because callers must retry rejections.
+"""
+
+import asyncio
+import collections
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from docreader.config import CONFIG
+from docreader.models.read_config import PageSelection
+
+logger = logging.getLogger(__name__)
+
+# Bytes per cost unit for formats whose page count is not cheap to read.
+# A cost unit is roughly one PDF page of work.
+_BYTES_PER_COST_UNIT = {
+    "doc": 32 * 1024,
+    "docx": 32 * 1024,
+    "ppt": 128 * 1024,
+    "pptx": 128 * 1024,
+    "xls": 64 * 1024,
+    "xlsx": 64 * 1024,
+    "csv": 256 * 1024,
+    "md": 256 * 1024,
+    "markdown": 256 * 1024,
+    "txt": 256 * 1024,
+}
+_DEFAULT_BYTES_PER_COST_UNIT = 128 * 1024
+# Fallback for PDFs that pdfium cannot open here (the parser reports the error).
+_PDF_BYTES_PER_PAGE = 64 * 1024
+
+# Initial throughput guess used for retry hints until jobs have completed.
+_INITIAL_SECONDS_PER_COST = 0.5
+_EMA_ALPHA = 0.2
+_MIN_RETRY_AFTER = 1.0
+_MAX_RETRY_AFTER = 600.0
+
+_pdfium_lock = threading.Lock()
+
+
+def _pdf_page_count(content=None, path: Optional[str] = None) -> Optional[int]:
+    try:
+        import pypdfium2 as pdfium
+
+        with _pdfium_lock:
+            pdf = pdfium.PdfDocument(path or content)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    except Exception:
+        return None
+
+
+def estimate_cost(
+    file_type: str,
+    size: int,
+    content=None,
+    path: Optional[str] = None,
+    page_selection: Optional[PageSelection] = None,
+) -> int:
+    """Estimate the parse cost of a file in cost units (>= 1).
+
+    PDFs cost one unit per page (page count read from ``content`` or
+    ``path``), counting only the selected pages of a page-range request;
+    other formats are estimated from their byte size.
+    """
+    ft = (file_type or "").lower().lstrip(".")
+    if ft == "pdf":
+        pages = None
+        if content is not None or path:
+            pages = _pdf_page_count(content, path)
+        if pages is None:
+            pages = size // _PDF_BYTES_PER_PAGE
+        if page_selection is not None:
+            try:
+                pages = len(page_selection.indices(pages))
+            except ValueError:
+                return 1  # rejected by the parser straight away
+        return max(1, pages)
+    if ft in ("jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp"):
+        return 1
+    per_unit = _BYTES_PER_COST_UNIT.get(ft, _DEFAULT_BYTES_PER_COST_UNIT)
+    return max(1, -(-size // per_unit))
+
+
+def estimate_request_cost(request, source_path: Optional[str] = None) -> int:
+    """Estimate the cost of a ReadRequest (``source_path`` for ReadUpload)."""
+    if request.url:
+        return 1
+    file_type = request.file_type or os.path.splitext(request.file_name)[1][1:]
+    try:
+        selection = PageSelection.from_config(request.config)
+    except ValueError:
+        return 1  # invalid selection: the parse fails straight away
+    if source_path:
+        return estimate_cost(
+            file_type,
+            os.path.getsize(source_path),
+            path=source_path,
+            page_selection=selection,
+        )
+    content = request.file_content
+    return estimate_cost(
+        file_type, len(content), content=content, page_selection=selection
+    )
+
+
+class AdmissionRejected(Exception):
+    """Raised when a job is refused; ``retry_after`` is a hint in seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Job:
+    __slots__ = ("cost", "small", "granted", "_wake")
+
+    def __init__(self, cost: int, small: bool, wake: Callable[[], None]):
+        self.cost = cost
+        self.small = small
+        self.granted = False
+        self._wake = wake
+
+
+class AdmissionController:
+    """Two-lane admission queue bounded by a cost budget (see module doc)."""
+
+    def __init__(
+        self,
+        max_running: int,
+        reserved_small: int = 1,
+        small_cost: int = 10,
+        backlog_budget: int = 0,
+        max_queued: int = 0,
+        queue_timeout: float = 0,
+    ):
+        self.max_running = max(1, max_running)
+        # Large jobs may use every slot but the reserved ones (at least one).
+        self.large_limit = max(1, self.max_running - max(0, reserved_small))
+        self.small_cost = small_cost
+        self.backlog_budget = backlog_budget
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+
+        self._lock = threading.Lock()
+        self._small: "collections.deque[_Job]" = collections.deque()
+        self._large: "collections.deque[_Job]" = collections.deque()
+        self._running_small = 0
+        self._running_large = 0
+        self._backlog = 0
+        self._seconds_per_cost = _INITIAL_SECONDS_PER_COST
+        self._counters = {"admitted": 0, "rejected": 0, "timed_out": 0}
+
+    # -- public API -------------------------------------------------------
+
+    @contextlib.contextmanager
+    def admit(self, cost: int, timeout: Optional[float] = None):
+        """Block until a job of ``cost`` may run; release the slot on exit."""
+        event = threading.Event()
+        job = self._submit(cost, event.set)
+        if not job.granted:
+            if not event.wait(self._deadline(timeout)):
+                self._expire(job)
+        with self._running(job):
+            yield
+
+    @contextlib.asynccontextmanager
+    async def admit_async(self, cost: int, timeout: Optional[float] = None):
+        """asyncio counterpart of :meth:`admit`."""
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(
+                lambda: granted.done() or granted.set_result(None)
+            )
+
+        job = self._submit(cost, wake)
+        if not job.granted:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(granted), self._deadline(timeout)
+                )
+            except asyncio.TimeoutError:
+                self._expire(job)
+            except asyncio.CancelledError:
+                self._expire(job, cancelled=True)
+                raise
+        with self._running(job):
+            yield
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update(
+                running_small=self._running_small,
+                running_large=self._running_large,
+                queued_small=len(self._small),
+                queued_large=len(self._large),
+                backlog_cost=self._backlog,
+            )
+        return stats
+
+    # -- internals --------------------------------------------------------
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        limits = [t for t in (timeout, self.queue_timeout) if t and t > 0]
+        return min(limits) if limits else None
+
+    def _retry_after(self) -> float:
+        # Time for the current backlog to drain at the observed throughput.
+        seconds = self._backlog * self._seconds_per_cost / self.max_running
+        return min(_MAX_RETRY_AFTER, max(_MIN_RETRY_AFTER, seconds))
+
+    def _submit(self, cost: int, wake: Callable[[], None]) -> _Job:
+        job = _Job(max(1, cost), cost <= self.small_cost, wake)
+        with self._lock:
+            busy = self._backlog > 0
+            queued = len(self._small) + len(self._large)
+            over_budget = (
+                self.backlog_budget > 0
+                and self._backlog + job.cost > self.backlog_budget
+            )
+            over_queue = self.max_queued > 0 and queued >= self.max_queued
+            # An idle server always accepts, so an oversized document is
+            # slow rather than permanently rejected.
+            if busy and (over_budget or over_queue):
+                self._counters["rejected"] += 1
+                retry_after = self._retry_after()
+                logger.warning(
+                    "Admission rejected: cost=%d backlog=%d queued=%d",
+                    job.cost,
+                    self._backlog,
+                    queued,
+                )
+                raise AdmissionRejected(
+                    f"server busy (backlog {self._backlog} units), "
+                    f"retry after {retry_after:.0f}s",
+                    retry_after,
+                )
+            self._backlog += job.cost
+            (self._small if job.small else self._large).append(job)
+            self._dispatch()
+        return job
+
+    def _dispatch(self) -> None:
+        """Grant free slots to queued jobs, small lane first (lock held)."""
+        while self._running_small + self._running_large < self.max_running:
+            if self._small:
+                job = self._small.popleft()
+                self._running_small += 1
+            elif self._large and self._running_large < self.large_limit:
+                job = self._large.popleft()
+                self._running_large += 1
+            else:
+                return
+            job.granted = True
+            self._counters["admitted"] += 1
+            job._wake()
+
+    def _expire(self, job: _Job, cancelled: bool = False) -> None:
+        """Withdraw a job whose wait ended; raise unless it won the race."""
+        with self._lock:
+            if job.granted:
+                if not cancelled:
+                    return
+                self._release(job, None)
+                return
+            (self._small if job.small else self._large).remove(job)
+            self._backlog -= job.cost
+            if cancelled:
+                return
+            self._counters["timed_out"] += 1
+            retry_after = self._retry_after()
+        raise AdmissionRejected(
+            f"queue deadline exceeded, retry after {retry_after:.0f}s", retry_after
+        )
+
+    @contextlib.contextmanager
+    def _running(self, job: _Job):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._release(job, time.monotonic() - start)
+
+    def _release(self, job: _Job, elapsed: Optional[float]) -> None:
+        if job.small:
+            self._running_small -= 1
+        else:
+            self._running_large -= 1
+        self._backlog -= job.cost
+        if elapsed is not None:
+            self._seconds_per_cost += _EMA_ALPHA * (
+                elapsed / job.cost - self._seconds_per_cost
+            )
+        self._dispatch()
+
+
+_controller: Optional[AdmissionController] = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller(default_running: int) -> Optional[AdmissionController]:
+    """Return the process-wide controller built from ``CONFIG``, or None.
+
+    ``default_running`` is used when ``DOCREADER_ADMISSION_MAX_RUNNING`` is
+    unset: the gRPC thread count in sync mode, the parse pool size in aio mode.
+    """
+    global _controller
+    if not CONFIG.admission_enabled:
+        return None
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController(
+                max_running=CONFIG.admission_max_running or default_running,
+                reserved_small=CONFIG.admission_reserved_small_slots,
+                small_cost=CONFIG.admission_small_cost,
+                backlog_budget=CONFIG.admission_backlog_budget,
+                max_queued=CONFIG.admission_max_queued,
+                queue_timeout=CONFIG.admission_queue_timeout_s,
+            )
+        return _controller
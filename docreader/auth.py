@@ -153,16 +153,52 @@ def _make_abort_handler(original: Optional[grpc.RpcMethodHandler]) -> grpc.RpcMe
     )
 
 
-class AuthInterceptor(grpc.ServerInterceptor):
-    """Token 认证拦截器
+def _make_async_abort_handler(
+    original: Optional[grpc.RpcMethodHandler],
+) -> grpc.RpcMethodHandler:
+    """``_make_abort_handler`` 的 asyncio 版本，供 grpc.aio 服务端使用。"""
 
-    环境变量配置：
-        GRPC_AUTH_TOKEN: 认证 Token，如果设置则启用认证
+    async def _abort(_request, context):
+        await context.abort(
+            grpc.StatusCode.UNAUTHENTICATED,
+            "Invalid or missing authentication token",
+        )
 
-    客户端需要在 metadata 中传递 Token：
-        - key: "authorization"
-        - value: "Bearer <token>" 或直接 "<token>"
-    """
+    async def _abort_stream(_request, context):
+        await context.abort(
+            grpc.StatusCode.UNAUTHENTICATED,
+            "Invalid or missing authentication token",
+        )
+        return
+        yield  # pragma: no cover - make this an async generator
+
+    if original is None or original.unary_unary is not None:
+        return grpc.unary_unary_rpc_method_handler(
+            _abort,
+            request_deserializer=getattr(original, "request_deserializer", None),
+            response_serializer=getattr(original, "response_serializer", None),
+        )
+    if original.unary_stream is not None:
+        return grpc.unary_stream_rpc_method_handler(
+            _abort_stream,
+            request_deserializer=original.request_deserializer,
+            response_serializer=original.response_serializer,
+        )
+    if original.stream_unary is not None:
+        return grpc.stream_unary_rpc_method_handler(
+            _abort,
+            request_deserializer=original.request_deserializer,
+            response_serializer=original.response_serializer,
+        )
+    return grpc.stream_stream_rpc_method_handler(
+        _abort_stream,
+        request_deserializer=original.request_deserializer,
+        response_serializer=original.response_serializer,
+    )
+
+
+class _TokenAuth:
+    """Token 校验逻辑，同步与 asyncio 拦截器共用。"""
 
     def __init__(self) -> None:
         token = os.getenv("GRPC_AUTH_TOKEN") or ""
@@ -176,13 +212,13 @@ class AuthInterceptor(grpc.ServerInterceptor):
         else:
             logger.warning("Token authentication disabled (GRPC_AUTH_TOKEN not set)")
 
-    def intercept_service(self, continuation, handler_call_details):
+    def is_authorized(self, handler_call_details) -> bool:
         if not self.auth_token:
-            return continuation(handler_call_details)
+            return True
 
         method = handler_call_details.method
         if method in _HEALTH_METHODS:
-            return continuation(handler_call_details)
+            return True
 
         metadata = dict(handler_call_details.invocation_metadata or [])
         raw = metadata.get("authorization", "") or ""
@@ -192,7 +228,35 @@ class AuthInterceptor(grpc.ServerInterceptor):
 
         if not hmac.compare_digest(token_bytes, self.auth_token):
             logger.warning("Authentication failed for method: %s", method)
-            original = continuation(handler_call_details)
-            return _make_abort_handler(original)
+            return False
+        return True
+
+
+class AuthInterceptor(_TokenAuth, grpc.ServerInterceptor):
+    """Token 认证拦截器
+
+    环境变量配置：
+        GRPC_AUTH_TOKEN: 认证 Token，如果设置则启用认证
+
+    客户端需要在 metadata 中传递 Token：
+        - key: "authorization"
+        - value: "Bearer <token>" 或直接 "<token>"
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        if self.is_authorized(handler_call_details):
+            return continuation(handler_call_details)
+
+        original = continuation(handler_call_details)
+        return _make_abort_handler(original)
+
+
+class AsyncAuthInterceptor(_TokenAuth, grpc.aio.ServerInterceptor):
+    """AuthInterceptor 的 grpc.aio 版本（DOCREADER_GRPC_SERVER_MODE=aio 时使用）。"""
+
+    async def intercept_service(self, continuation, handler_call_details):
+        if self.is_authorized(handler_call_details):
+            return await continuation(handler_call_details)
 
-        return continuation(handler_call_details)
+        original = await continuation(handler_call_details)
+        return _make_async_abort_handler(original)
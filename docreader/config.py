@@ -37,6 +37,14 @@ def _get_bool(keys: Iterable[str], default: bool) -> bool:
     return str(v).strip().lower() in {"1", "true", "yes", "y", "on"}
 
 
+def _get_list(keys: Iterable[str]) -> Tuple[str, ...]:
+    """Comma-separated values, stripped and lower-cased; empty entries dropped."""
+    v, _ = _get_first_env(keys)
+    if v is None:
+        return ()
+    return tuple(part.strip().lower() for part in str(v).split(",") if part.strip())
+
+
 def _mask_secret(v: str) -> str:
     if not v:
         return ""
@@ -50,7 +58,14 @@ class DocReaderConfig:
     # gRPC
     grpc_max_workers: int
     grpc_max_file_size_mb: int
+    grpc_max_upload_size_mb: int
     grpc_port: int
+    grpc_server_mode: str
+    grpc_parse_process_workers: int
+    grpc_batch_concurrency: int
+    metrics_port: int
+    otel_tracing: bool
+    parser_warmup: Tuple[str, ...]
 
     # Parser
     docx_max_pages: int
@@ -66,6 +81,26 @@ class DocReaderConfig:
     pdf_render_dpi: int
     pdf_jpeg_quality: int
     pdf_render_max_edge: int
+    pdf_direct_page_images: bool
+    pdf_adaptive_render: bool
+    pdf_adaptive_min_dpi: int
+    cpu_tokens: int
+
+    # Parse result cache
+    parse_cache_enabled: bool
+    parse_cache_memory_mb: int
+    parse_cache_disk_mb: int
+    pdf_page_cache_enabled: bool
+    pdf_page_cache_disk_mb: int
+
+    # Admission control
+    admission_enabled: bool
+    admission_max_running: int
+    admission_reserved_small_slots: int
+    admission_small_cost: int
+    admission_backlog_budget: int
+    admission_max_queued: int
+    admission_queue_timeout_s: int
 
     # Proxy
     external_http_proxy: str
@@ -84,7 +119,32 @@ def load_config() -> DocReaderConfig:
         * 1024
         * 1024
     )
+    # Size limit for ReadUpload (chunked uploads spooled to disk). Unlike
+    # MAX_FILE_SIZE_MB it does not bound any single gRPC message.
+    grpc_max_upload_size_mb = (
+        _get_int(["DOCREADER_GRPC_MAX_UPLOAD_SIZE_MB"], 2048) * 1024 * 1024
+    )
     grpc_port = _get_int(["DOCREADER_GRPC_PORT", "PORT"], 50051)
+    # "sync" serves RPCs on a thread pool (parsing runs on the gRPC threads and
+    # is serialised by the GIL); "aio" serves them on an asyncio event loop and
+    # offloads every parse to a process pool so one container can use all its
+    # cores while health checks / ListEngines / stream writes stay responsive.
+    grpc_server_mode = _get_str(["DOCREADER_GRPC_SERVER_MODE"], "sync").strip().lower()
+    grpc_parse_process_workers = _get_int(
+        ["DOCREADER_GRPC_PARSE_PROCESS_WORKERS"], max(1, os.cpu_count() or 1)
+    )
+    # Documents of one ReadBatch call parsed concurrently (threads in "sync"
+    # mode, in-flight process-pool tasks in "aio" mode).
+    grpc_batch_concurrency = _get_int(["DOCREADER_GRPC_BATCH_CONCURRENCY"], 4)
+    # Port of the Prometheus /metrics endpoint; 0 disables it.
+    metrics_port = _get_int(["DOCREADER_METRICS_PORT"], 0)
+    # Export parser stage spans through the OpenTelemetry API (needs the
+    # opentelemetry packages and an SDK/exporter configured by the deployment).
+    otel_tracing = _get_bool(["DOCREADER_OTEL_TRACING"], False)
+    # Parsers are imported on first use; these file types / engine names (or
+    # "all") are imported at startup instead, trading memory for first-request
+    # latency.
+    parser_warmup = _get_list(["DOCREADER_PARSER_WARMUP"])
     docx_max_pages = _get_int(["DOCREADER_DOCX_MAX_PAGES"], 0)
     markitdown_max_workers = _get_int(["DOCREADER_MARKITDOWN_MAX_WORKERS"], 1)
     odl_max_workers = _get_int(["DOCREADER_ODL_MAX_WORKERS"], 1)
@@ -116,6 +176,45 @@ def load_config() -> DocReaderConfig:
     # gRPC message limit (and are far higher-res than OCR needs). ~2000px keeps
     # dense CJK text legible for OCR while keeping page images well under ~1MB.
     pdf_render_max_edge = _get_int(["DOCREADER_PDF_RENDER_MAX_EDGE"], 2000)
+    # A scanned page that is just one upright full-page image is emitted from
+    # that image (its JPEG stream or native bitmap) instead of being rendered.
+    pdf_direct_page_images = _get_bool(["DOCREADER_PDF_DIRECT_PAGE_IMAGES"], True)
+    # Rendered scanned pages without colour are encoded as grayscale and sparse
+    # ones at a lower DPI (down to pdf_adaptive_min_dpi). Opt-in: it changes
+    # the images downstream OCR reads.
+    pdf_adaptive_render = _get_bool(["DOCREADER_PDF_ADAPTIVE_RENDER"], False)
+    pdf_adaptive_min_dpi = _get_int(["DOCREADER_PDF_ADAPTIVE_MIN_DPI"], 150)
+    # CPU tokens shared by every fan-out point (render-pool pages, DOCX page
+    # workers, ImageMagick / LibreOffice subprocesses) across all requests of
+    # the container, so concurrent documents do not each claim every core.
+    # 0 disables the budget.
+    cpu_tokens = _get_int(["DOCREADER_CPU_TOKENS"], _cpu)
+
+    # Content-addressed parse result cache (see docreader/parse_cache.py).
+    # Memory tier is per process; the disk tier lives under image_output_dir
+    # and is shared by every process of the container. 0 MB disables a tier.
+    parse_cache_enabled = _get_bool(["DOCREADER_PARSE_CACHE_ENABLED"], True)
+    parse_cache_memory_mb = _get_int(["DOCREADER_PARSE_CACHE_MEMORY_MB"], 256)
+    parse_cache_disk_mb = _get_int(["DOCREADER_PARSE_CACHE_DISK_MB"], 1024)
+    # Per-page PDF cache keyed by page fingerprints (see docreader/page_cache.py),
+    # under image_output_dir; off by default as it stores every page's render.
+    pdf_page_cache_enabled = _get_bool(["DOCREADER_PDF_PAGE_CACHE_ENABLED"], False)
+    pdf_page_cache_disk_mb = _get_int(["DOCREADER_PDF_PAGE_CACHE_DISK_MB"], 2048)
+
+    # Admission control: requests are costed (~pages) and queued in small /
+    # large lanes before parsing. MAX_RUNNING 0 = gRPC workers (sync) or parse
+    # processes (aio); the budget caps queued + running cost, beyond which
+    # requests get RESOURCE_EXHAUSTED with a retry hint. Off by default until
+    # every client retries RESOURCE_EXHAUSTED (the Go callers do not yet).
+    admission_enabled = _get_bool(["DOCREADER_ADMISSION_ENABLED"], False)
+    admission_max_running = _get_int(["DOCREADER_ADMISSION_MAX_RUNNING"], 0)
+    admission_reserved_small_slots = _get_int(
+        ["DOCREADER_ADMISSION_RESERVED_SMALL_SLOTS"], 1
+    )
+    admission_small_cost = _get_int(["DOCREADER_ADMISSION_SMALL_COST"], 10)
+    admission_backlog_budget = _get_int(["DOCREADER_ADMISSION_BACKLOG_BUDGET"], 5000)
+    admission_max_queued = _get_int(["DOCREADER_ADMISSION_MAX_QUEUED"], 64)
+    admission_queue_timeout_s = _get_int(["DOCREADER_ADMISSION_QUEUE_TIMEOUT_S"], 300)
 
     external_http_proxy = _get_str(
         ["DOCREADER_EXTERNAL_HTTP_PROXY", "EXTERNAL_HTTP_PROXY"], ""
@@ -131,7 +230,14 @@ def load_config() -> DocReaderConfig:
     return DocReaderConfig(
         grpc_max_workers=grpc_max_workers,
         grpc_max_file_size_mb=grpc_max_file_size_mb,
+        grpc_max_upload_size_mb=grpc_max_upload_size_mb,
         grpc_port=grpc_port,
+        grpc_server_mode=grpc_server_mode,
+        grpc_parse_process_workers=grpc_parse_process_workers,
+        grpc_batch_concurrency=grpc_batch_concurrency,
+        metrics_port=metrics_port,
+        otel_tracing=otel_tracing,
+        parser_warmup=parser_warmup,
         docx_max_pages=docx_max_pages,
         markitdown_max_workers=markitdown_max_workers,
         odl_max_workers=odl_max_workers,
@@ -145,6 +251,22 @@ def load_config() -> DocReaderConfig:
         pdf_render_dpi=pdf_render_dpi,
         pdf_jpeg_quality=pdf_jpeg_quality,
         pdf_render_max_edge=pdf_render_max_edge,
+        pdf_direct_page_images=pdf_direct_page_images,
+        pdf_adaptive_render=pdf_adaptive_render,
+        pdf_adaptive_min_dpi=pdf_adaptive_min_dpi,
+        cpu_tokens=cpu_tokens,
+        parse_cache_enabled=parse_cache_enabled,
+        parse_cache_memory_mb=parse_cache_memory_mb,
+        parse_cache_disk_mb=parse_cache_disk_mb,
+        pdf_page_cache_enabled=pdf_page_cache_enabled,
+        pdf_page_cache_disk_mb=pdf_page_cache_disk_mb,
+        admission_enabled=admission_enabled,
+        admission_max_running=admission_max_running,
+        admission_reserved_small_slots=admission_reserved_small_slots,
+        admission_small_cost=admission_small_cost,
+        admission_backlog_budget=admission_backlog_budget,
+        admission_max_queued=admission_max_queued,
+        admission_queue_timeout_s=admission_queue_timeout_s,
         external_http_proxy=external_http_proxy,
         external_https_proxy=external_https_proxy,
         image_output_dir=image_output_dir,
@@ -159,7 +281,14 @@ def dump_config(mask_secrets: bool = True) -> Dict[str, Any]:
     d: Dict[str, Any] = {
         "DOCREADER_GRPC_MAX_WORKERS": cfg.grpc_max_workers,
         "DOCREADER_GRPC_MAX_FILE_SIZE_MB": cfg.grpc_max_file_size_mb,
+        "DOCREADER_GRPC_MAX_UPLOAD_SIZE_MB": cfg.grpc_max_upload_size_mb,
         "DOCREADER_GRPC_PORT": cfg.grpc_port,
+        "DOCREADER_GRPC_SERVER_MODE": cfg.grpc_server_mode,
+        "DOCREADER_GRPC_PARSE_PROCESS_WORKERS": cfg.grpc_parse_process_workers,
+        "DOCREADER_GRPC_BATCH_CONCURRENCY": cfg.grpc_batch_concurrency,
+        "DOCREADER_METRICS_PORT": cfg.metrics_port,
+        "DOCREADER_OTEL_TRACING": cfg.otel_tracing,
+        "DOCREADER_PARSER_WARMUP": ",".join(cfg.parser_warmup),
         "DOCREADER_DOCX_MAX_PAGES": cfg.docx_max_pages,
         "DOCREADER_MARKITDOWN_MAX_WORKERS": cfg.markitdown_max_workers,
         "DOCREADER_ODL_MAX_WORKERS": cfg.odl_max_workers,
@@ -173,6 +302,22 @@ def dump_config(mask_secrets: bool = True) -> Dict[str, Any]:
         "DOCREADER_PDF_RENDER_DPI": cfg.pdf_render_dpi,
         "DOCREADER_PDF_JPEG_QUALITY": cfg.pdf_jpeg_quality,
         "DOCREADER_PDF_RENDER_MAX_EDGE": cfg.pdf_render_max_edge,
+        "DOCREADER_PDF_DIRECT_PAGE_IMAGES": cfg.pdf_direct_page_images,
+        "DOCREADER_PDF_ADAPTIVE_RENDER": cfg.pdf_adaptive_render,
+        "DOCREADER_PDF_ADAPTIVE_MIN_DPI": cfg.pdf_adaptive_min_dpi,
+        "DOCREADER_CPU_TOKENS": cfg.cpu_tokens,
+        "DOCREADER_PARSE_CACHE_ENABLED": cfg.parse_cache_enabled,
+        "DOCREADER_PARSE_CACHE_MEMORY_MB": cfg.parse_cache_memory_mb,
+        "DOCREADER_PARSE_CACHE_DISK_MB": cfg.parse_cache_disk_mb,
+        "DOCREADER_PDF_PAGE_CACHE_ENABLED": cfg.pdf_page_cache_enabled,
+        "DOCREADER_PDF_PAGE_CACHE_DISK_MB": cfg.pdf_page_cache_disk_mb,
+        "DOCREADER_ADMISSION_ENABLED": cfg.admission_enabled,
+        "DOCREADER_ADMISSION_MAX_RUNNING": cfg.admission_max_running,
+        "DOCREADER_ADMISSION_RESERVED_SMALL_SLOTS": cfg.admission_reserved_small_slots,
+        "DOCREADER_ADMISSION_SMALL_COST": cfg.admission_small_cost,
+        "DOCREADER_ADMISSION_BACKLOG_BUDGET": cfg.admission_backlog_budget,
+        "DOCREADER_ADMISSION_MAX_QUEUED": cfg.admission_max_queued,
+        "DOCREADER_ADMISSION_QUEUE_TIMEOUT_S": cfg.admission_queue_timeout_s,
         "DOCREADER_EXTERNAL_HTTP_PROXY": cfg.external_http_proxy,
         "DOCREADER_EXTERNAL_HTTPS_PROXY": cfg.external_https_proxy,
         "DOCREADER_IMAGE_OUTPUT_DIR": cfg.image_output_dir,
@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+import functools
 import logging
 import os
 import re
@@ -11,22 +14,53 @@ import grpc
 from grpc_health.v1 import health_pb2_grpc
 from grpc_health.v1.health import HealthServicer
 
-from docreader.auth import AuthInterceptor, TLSConfigError, load_tls_credentials
-from docreader import config
+from docreader.auth import (
+    AsyncAuthInterceptor,
+    AuthInterceptor,
+    TLSConfigError,
+    load_tls_credentials,
+)
+from docreader import config, metrics
+from docreader.admission import (
+    AdmissionRejected,
+    estimate_request_cost,
+    get_admission_controller,
+)
 from docreader.config import CONFIG
+from docreader.models.document import image_bytes
+from docreader.parse_cache import get_parse_cache
+from docreader.parse_pool import (
+    create_parse_pool,
+    iter_in_parse_pool,
+    iter_read_request,
+    parse_read_request,
+    run_in_parse_pool,
+)
 from docreader.parser import Parser
 from docreader.proto import docreader_pb2_grpc
 from docreader.parser.registry import registry
 from docreader.proto.docreader_pb2 import (
+    ReadBatchResponse,
     ReadRequest,
     ReadResponse,
+    ReadUploadRequest,
     ImageRef,
+    ReadStreamDone,
+    ReadStreamFragment,
     ReadStreamMeta,
     ReadStreamResponse,
     ListEnginesResponse,
     ParserEngineInfo,
+    InspectResponse,
+)
+from docreader.utils.cancel import (
+    ParseCancelled,
+    cancel_scope,
+    deadline_from_context,
+    token_from_context,
 )
 from docreader.utils.request import init_logging_request_id, request_id_context
+from docreader.utils.tempfile import UploadSpool, UploadTooLargeError
 
 _SURROGATE_RE = re.compile(r"[\ud800-\udfff]")
 
@@ -59,46 +93,27 @@ def _resolve_images(
 ) -> tuple[str, list]:
     """Resolve document images into inline bytes for the Go App to persist.
 
-    ``images`` is a dict of {relative_path: raw_data} where raw_data is
-    base64-encoded string or raw bytes.
+    ``images`` is a dict of {relative_path: raw_bytes} (base64 strings from
+    older parsers are still accepted).
 
     The Go App is solely responsible for persisting images to the configured
-    storage backend (local/minio/cos/tos). This function only decodes images
-    and returns them as inline bytes via ImageRef.
+    storage backend (local/minio/cos/tos). This function only wraps images
+    as inline bytes via ImageRef.
 
     Returns ("", list[ImageRef]).  image_dir_path is always empty.
     """
-    import base64
-
     if not images:
         return "", []
 
-    mime_map = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".gif": "image/gif",
-        ".webp": "image/webp",
-        ".bmp": "image/bmp",
-    }
-
     refs = []
-    for ref_path, b64data in images.items():
-        try:
-            img_bytes = base64.b64decode(b64data)
-        except Exception:
-            img_bytes = b64data.encode("utf-8") if isinstance(b64data, str) else b64data
-
-        fname = os.path.basename(ref_path) or f"{uuid.uuid4().hex}.png"
-        ext = os.path.splitext(fname)[1].lower()
-        mime = mime_map.get(ext, "application/octet-stream")
-
+    for ref_path, data in images.items():
+        fname, mime = _mime_for_ref(ref_path)
         refs.append(
             ImageRef(
                 filename=fname,
                 original_ref=ref_path,
                 mime_type=mime,
-                image_data=img_bytes,
+                image_data=_image_payload(data),
             )
         )
 
@@ -106,6 +121,14 @@ def _resolve_images(
     return "", refs
 
 
+def _image_payload(data) -> bytes:
+    try:
+        return image_bytes(data)
+    except Exception:
+        # Not valid base64: pass the string through as-is.
+        return data.encode("utf-8")
+
+
 def _mime_for_ref(ref_path: str) -> tuple[str, str]:
     """Return (filename, mime_type) for an image reference path."""
     mime_map = {
@@ -124,19 +147,11 @@ def _mime_for_ref(ref_path: str) -> tuple[str, str]:
 def _iter_image_refs(images: dict):
     """Yield ImageRef one at a time, freeing each source entry as we go.
 
-    Used by the streaming RPC so we never hold every decoded image plus its
-    base64 source in memory simultaneously (the inline path's peak-memory and
-    message-size problem for large scanned PDFs).
+    Used by the streaming RPC so we never hold every image twice (document
+    plus response frames) for large scanned PDFs.
     """
-    import base64
-
     for ref_path in list(images.keys()):
-        b64data = images.pop(ref_path)
-        try:
-            img_bytes = base64.b64decode(b64data)
-        except Exception:
-            img_bytes = b64data.encode("utf-8") if isinstance(b64data, str) else b64data
-        del b64data
+        img_bytes = _image_payload(images.pop(ref_path))
         fname, mime = _mime_for_ref(ref_path)
         yield ImageRef(
             filename=fname,
@@ -146,167 +161,624 @@ def _iter_image_refs(images: dict):
         )
 
 
-class DocReaderServicer(docreader_pb2_grpc.DocReaderServicer):
-    def __init__(self):
-        super().__init__()
-        self.parser = Parser()
+def _build_read_response(result, source_desc: str, request_id: str) -> ReadResponse:
+    """Build the unary ReadResponse for a parse result."""
+    if not result or not result.content:
+        error_msg = f"Failed to parse: {source_desc}"
+        logger.error(error_msg)
+        return ReadResponse(error=error_msg)
 
-    def _parse_request(self, request: ReadRequest):
-        """Run the parser for a ReadRequest, returning (result, source_desc).
+    _c = to_valid_utf8_text
+    image_dir, image_refs = _resolve_images(result.images, request_id)
 
-        Shared by the unary Read and streaming ReadStream RPCs.
-        """
-        cfg = request.config
-        parser_engine = cfg.parser_engine if cfg else ""
-        engine_overrides = dict(cfg.parser_engine_overrides) if cfg else {}
-
-        if request.url:
-            logger.info("Read(URL): url=%s", request.url)
-            result = self.parser.parse_url(
-                request.url,
-                request.title,
-                parser_engine=parser_engine,
-                engine_overrides=engine_overrides,
+    response = ReadResponse(
+        markdown_content=_c(result.content),
+        image_refs=image_refs,
+        image_dir_path=image_dir,
+        metadata={k: _c(str(v)) for k, v in result.metadata.items()}
+        if result.metadata
+        else {},
+    )
+    logger.info(
+        "Read response: content_len=%d, images=%d",
+        len(result.content),
+        len(image_refs),
+    )
+    return response
+
+
+def _iter_stream_frames(result, source_desc: str):
+    """Yield the ReadStream frames for a parse result: meta first, then images."""
+    _c = to_valid_utf8_text
+    if not result or not result.content:
+        error_msg = f"Failed to parse: {source_desc}"
+        logger.error(error_msg)
+        yield ReadStreamResponse(meta=ReadStreamMeta(error=error_msg))
+        return
+
+    images = result.images or {}
+    image_count = len(images)
+    yield ReadStreamResponse(
+        meta=ReadStreamMeta(
+            markdown_content=_c(result.content),
+            image_dir_path="",
+            metadata={k: _c(str(v)) for k, v in result.metadata.items()}
+            if result.metadata
+            else {},
+            image_count=image_count,
+        )
+    )
+
+    sent = 0
+    for ref in _iter_image_refs(images):
+        yield ReadStreamResponse(image=ref)
+        sent += 1
+
+    logger.info(
+        "ReadStream response: content_len=%d, images=%d",
+        len(result.content),
+        sent,
+    )
+
+
+class _IncrementalFrames:
+    """Turn DocumentParts into incremental ReadStream frames.
+
+    Each part becomes its image frames followed by its markdown fragment (so a
+    fragment never references an image the client has not received yet); the
+    stream is closed by a single ``done`` frame carrying the metadata.
+    """
+
+    def __init__(self, source_desc: str):
+        self.source_desc = source_desc
+        self.metadata: dict = {}
+        self.fragments = 0
+        self.images = 0
+        self.content_len = 0
+
+    def frames(self, part):
+        for ref in _iter_image_refs(part.images):
+            self.images += 1
+            yield ReadStreamResponse(image=ref)
+        if part.content:
+            self.fragments += 1
+            self.content_len += len(part.content)
+            yield ReadStreamResponse(
+                fragment=ReadStreamFragment(
+                    markdown_content=to_valid_utf8_text(part.content),
+                    page_index=part.page_index,
+                )
             )
-            return result, request.url
+        self.metadata.update(part.metadata)
 
-        file_type = request.file_type or os.path.splitext(request.file_name)[1][1:]
+    def done(self, error: str = "") -> ReadStreamResponse:
+        if not error and not self.fragments:
+            error = f"Failed to parse: {self.source_desc}"
+            logger.error(error)
         logger.info(
-            "Read(File): file=%s, type=%s, size=%d bytes",
-            request.file_name,
-            file_type,
-            len(request.file_content),
+            "ReadStream incremental response: content_len=%d, fragments=%d, images=%d",
+            self.content_len,
+            self.fragments,
+            self.images,
+        )
+        _c = to_valid_utf8_text
+        return ReadStreamResponse(
+            done=ReadStreamDone(
+                metadata={k: _c(str(v)) for k, v in self.metadata.items()},
+                error=error,
+                fragment_count=self.fragments,
+                image_count=self.images,
+            )
         )
-        result = self.parser.parse_file(
+
+
+def _source_desc(request) -> str:
+    return request.url or request.file_name
+
+
+def _list_engines_response(request, engines_data=None) -> ListEnginesResponse:
+    if engines_data is None:
+        engines_data = registry.list_engines(overrides=_engine_overrides(request))
+    engines = [
+        ParserEngineInfo(
+            name=e["name"],
+            description=e["description"],
+            file_types=e["file_types"],
+            available=e.get("available", True),
+            unavailable_reason=e.get("unavailable_reason", ""),
+        )
+        for e in engines_data
+    ]
+    return ListEnginesResponse(engines=engines)
+
+
+def _inspect_response(parser, request: ReadRequest) -> InspectResponse:
+    """Answer an Inspect call; failures are reported in ``error``."""
+    if request.url:
+        return InspectResponse(error="Inspect needs file_content, not a URL")
+    file_type = request.file_type or os.path.splitext(request.file_name)[1][1:]
+    try:
+        info = parser.inspect(
             request.file_name,
             file_type,
             request.file_content,
-            parser_engine=parser_engine,
-            engine_overrides=engine_overrides,
+            parser_engine=request.config.parser_engine,
         )
-        return result, request.file_name
+    except Exception as e:
+        logger.error("Error inspecting document %s: %s", request.file_name, e)
+        return InspectResponse(error=str(e))
+    logger.info(
+        "Inspect: file=%s, page_count=%d", request.file_name, info["page_count"]
+    )
+    return InspectResponse(**info)
+
+
+def _engine_overrides(request) -> dict | None:
+    overrides = dict(getattr(request, "config_overrides", None) or {})
+    return overrides or None
+
+
+def _batch_items(request) -> list[tuple[int, str, ReadRequest]]:
+    """Return (index, request_id, request) for each request of a ReadBatch."""
+    return [
+        (index, item.request_id or str(uuid.uuid4()), item)
+        for index, item in enumerate(request.requests)
+    ]
+
+
+def _abort_rejected(context, e: AdmissionRejected):
+    """Fail the RPC with RESOURCE_EXHAUSTED and a ``retry-after-ms`` trailer."""
+    context.set_trailing_metadata((("retry-after-ms", str(int(e.retry_after * 1000))),))
+    return context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+
+
+def _time_remaining(context) -> Optional[float]:
+    return context.time_remaining() if context is not None else None
+
+
+def _upload_header(message: Optional[ReadUploadRequest]) -> ReadRequest:
+    """Validate the first ReadUpload message and return its header."""
+    if message is None or message.WhichOneof("payload") != "header":
+        raise ValueError("first ReadUpload message must carry the header")
+    header = message.header
+    if header.url or header.file_content:
+        raise ValueError("ReadUpload header must not set url or file_content")
+    if not header.file_name:
+        raise ValueError("ReadUpload header must set file_name")
+    return header
+
+
+def _upload_chunk(message: ReadUploadRequest) -> bytes:
+    if message.WhichOneof("payload") != "chunk":
+        raise ValueError("ReadUpload expects chunk messages after the header")
+    return message.chunk
+
+
+def _upload_spool(header: ReadRequest) -> UploadSpool:
+    suffix = os.path.splitext(header.file_name)[1]
+    return UploadSpool(max_bytes=CONFIG.grpc_max_upload_size_mb, suffix=suffix)
+
+
+def _upload_abort_status(e: ValueError) -> grpc.StatusCode:
+    if isinstance(e, UploadTooLargeError):
+        return grpc.StatusCode.RESOURCE_EXHAUSTED
+    return grpc.StatusCode.INVALID_ARGUMENT
+
+
+class DocReaderServicer(docreader_pb2_grpc.DocReaderServicer):
+    def __init__(self, admission=None):
+        super().__init__()
+        self.parser = Parser()
+        # AdmissionController gating every parse (None: parse immediately).
+        self.admission = admission
+
+    @contextlib.contextmanager
+    def _admitted(self, request: ReadRequest, context, source_path=None):
+        """Hold an admission slot for ``request``; rejections abort the RPC.
+
+        Without a ``context`` (ReadBatch items) AdmissionRejected propagates.
+        """
+        if self.admission is None:
+            yield
+            return
+        cost = estimate_request_cost(request, source_path)
+        try:
+            with self.admission.admit(cost, _time_remaining(context)):
+                yield
+        except AdmissionRejected as e:
+            if context is None:
+                raise
+            _abort_rejected(context, e)
+
+    def _parse_request(self, request: ReadRequest, source_path: Optional[str] = None):
+        """Run the parser for a ReadRequest, returning (result, source_desc).
+
+        Shared by the unary Read and the streaming ReadStream / ReadUpload RPCs.
+        """
+        return parse_read_request(self.parser, request, source_path)
 
     def Read(self, request: ReadRequest, context):
         """Unified read: file mode (file_content set) or URL mode (url set)."""
-        request_id = request.request_id or str(uuid.uuid4())
+        with cancel_scope(token_from_context(context)), self._admitted(
+            request, context
+        ):
+            return self._read(request, request.request_id or str(uuid.uuid4()))
 
+    def _read(self, request: ReadRequest, request_id: str) -> ReadResponse:
         with request_id_context(request_id):
             try:
                 result, source_desc = self._parse_request(request)
+                return _build_read_response(result, source_desc, request_id)
 
-                if not result or not result.content:
-                    error_msg = f"Failed to parse: {source_desc}"
-                    logger.error(error_msg)
-                    return ReadResponse(error=error_msg)
-
-                _c = to_valid_utf8_text
-                image_dir, image_refs = _resolve_images(result.images, request_id)
-
-                response = ReadResponse(
-                    markdown_content=_c(result.content),
-                    image_refs=image_refs,
-                    image_dir_path=image_dir,
-                    metadata={k: _c(str(v)) for k, v in result.metadata.items()}
-                    if result.metadata
-                    else {},
-                )
-                logger.info(
-                    "Read response: content_len=%d, images=%d",
-                    len(result.content),
-                    len(image_refs),
-                )
-                return response
-
+            except ParseCancelled as e:
+                logger.info("Stopped reading document: %s", e)
+                return ReadResponse(error=str(e))
             except Exception as e:
                 error_msg = f"Error reading document: {e}"
                 logger.error(error_msg)
                 logger.info("Traceback: %s", traceback.format_exc())
                 return ReadResponse(error=str(e))
 
+    def _read_batch_item(
+        self, request: ReadRequest, request_id: str, token=None
+    ) -> ReadResponse:
+        try:
+            with cancel_scope(token), self._admitted(request, None):
+                return self._read(request, request_id)
+        except AdmissionRejected as e:
+            return ReadResponse(error=str(e))
+
+    def ReadBatch(self, request, context):
+        """Parse every request of the batch, yielding results as they complete.
+
+        Up to ``DOCREADER_GRPC_BATCH_CONCURRENCY`` documents are parsed at
+        once on a per-call thread pool; all of them share this servicer's
+        Parser (and its cache).
+        """
+        items = _batch_items(request)
+        if not items:
+            return
+        logger.info("ReadBatch: %d requests", len(items))
+        token = token_from_context(context)
+        workers = max(1, min(len(items), CONFIG.grpc_batch_concurrency))
+        with futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="read-batch"
+        ) as executor:
+            pending = {
+                executor.submit(self._read_batch_item, item, request_id, token): (
+                    index,
+                    request_id,
+                )
+                for index, request_id, item in items
+            }
+            try:
+                for future in futures.as_completed(pending):
+                    index, request_id = pending[future]
+                    yield ReadBatchResponse(
+                        request_id=request_id, index=index, response=future.result()
+                    )
+            finally:
+                # Client went away: drop the requests that have not started.
+                for future in pending:
+                    future.cancel()
+
     def ReadStream(self, request: ReadRequest, context):
         """Streaming read: yields one meta frame, then one frame per image.
 
         Each frame is a small, independent gRPC message, so documents with many
         page images (large scanned PDFs) are returned without hitting the unary
         message-size cap, and neither side has to hold the whole payload at once.
+
+        With ``config.incremental_stream`` the frames are produced while the
+        document is still being parsed (page by page for PDFs), so the first
+        bytes go out in seconds and only one page is held in memory at a time.
         """
         request_id = request.request_id or str(uuid.uuid4())
 
+        with request_id_context(request_id), cancel_scope(
+            token_from_context(context)
+        ), self._admitted(request, context):
+            yield from self._read_stream(request)
+
+    def ReadUpload(self, request_iterator, context):
+        """ReadStream for a file uploaded in chunks (see docreader.proto).
+
+        Chunks are spooled to a temporary file as they arrive and the parser
+        reads that file, so the upload size is bounded by
+        ``DOCREADER_GRPC_MAX_UPLOAD_SIZE_MB`` rather than the message-size cap.
+        """
+        try:
+            header = _upload_header(next(request_iterator, None))
+        except ValueError as e:
+            context.abort(_upload_abort_status(e), str(e))
+        request_id = header.request_id or str(uuid.uuid4())
+
+        with request_id_context(request_id), _upload_spool(header) as spool:
+            try:
+                for message in request_iterator:
+                    spool.write(_upload_chunk(message))
+            except ValueError as e:
+                logger.error("Rejected upload %s: %s", header.file_name, e)
+                context.abort(_upload_abort_status(e), str(e))
+            source_path = spool.finish()
+            with cancel_scope(token_from_context(context)), self._admitted(
+                header, context, source_path
+            ):
+                yield from self._read_stream(header, source_path)
+
+    def _read_stream(self, request: ReadRequest, source_path: Optional[str] = None):
+        if request.config.incremental_stream:
+            yield from self._read_stream_incremental(request, source_path)
+            return
+
+        try:
+            result, source_desc = self._parse_request(request, source_path)
+        except ParseCancelled as e:
+            logger.info("Stopped reading document: %s", e)
+            yield ReadStreamResponse(meta=ReadStreamMeta(error=str(e)))
+            return
+        except Exception as e:
+            logger.error("Error reading document: %s", e)
+            logger.info("Traceback: %s", traceback.format_exc())
+            yield ReadStreamResponse(meta=ReadStreamMeta(error=str(e)))
+            return
+
+        yield from _iter_stream_frames(result, source_desc)
+
+    def _read_stream_incremental(
+        self, request: ReadRequest, source_path: Optional[str] = None
+    ):
+        stream = _IncrementalFrames(_source_desc(request))
+        parts = iter_read_request(self.parser, request, source_path)
+        try:
+            for part in parts:
+                yield from stream.frames(part)
+        except ParseCancelled as e:
+            logger.info("Stopped reading document: %s", e)
+            yield stream.done(error=str(e))
+            return
+        except Exception as e:
+            logger.error("Error reading document: %s", e)
+            logger.info("Traceback: %s", traceback.format_exc())
+            yield stream.done(error=str(e))
+            return
+        finally:
+            parts.close()
+        yield stream.done()
+
+    def ListEngines(self, request, context):
+        return _list_engines_response(request)
+
+    def Inspect(self, request: ReadRequest, context):
+        with request_id_context(request.request_id or str(uuid.uuid4())):
+            return _inspect_response(self.parser, request)
+
+
+class AsyncDocReaderServicer(docreader_pb2_grpc.DocReaderServicer):
+    """asyncio servicer used by the ``aio`` server mode.
+
+    ``Read`` / ``ReadStream`` await a parse in the process pool, so the event
+    loop itself only (de)serialises messages and never runs parser code.
+    """
+
+    def __init__(self, pool, admission=None):
+        super().__init__()
+        self.pool = pool
+        self.cache = get_parse_cache()
+        self.admission = admission
+        # Answers Inspect in-process (page counts only, no parsing).
+        self.parser = Parser(use_cache=False)
+
+    @contextlib.asynccontextmanager
+    async def _admitted(self, request: ReadRequest, context, source_path=None):
+        """asyncio counterpart of ``DocReaderServicer._admitted``."""
+        if self.admission is None:
+            yield
+            return
+        # The PDF page count is read with pdfium: keep it off the loop.
+        cost = await asyncio.get_running_loop().run_in_executor(
+            None, estimate_request_cost, request, source_path
+        )
+        try:
+            async with self.admission.admit_async(cost, _time_remaining(context)):
+                yield
+        except AdmissionRejected as e:
+            if context is None:
+                raise
+            await _abort_rejected(context, e)
+
+    async def _parse_request(
+        self,
+        request: ReadRequest,
+        request_id: str,
+        source_path: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ):
+        return await run_in_parse_pool(
+            self.pool, request, request_id, self.cache, source_path, deadline
+        )
+
+    async def Read(self, request: ReadRequest, context):
+        async with self._admitted(request, context):
+            return await self._read(
+                request,
+                request.request_id or str(uuid.uuid4()),
+                deadline_from_context(context),
+            )
+
+    async def _read(
+        self, request: ReadRequest, request_id: str, deadline: Optional[float] = None
+    ) -> ReadResponse:
         with request_id_context(request_id):
-            _c = to_valid_utf8_text
             try:
-                result, source_desc = self._parse_request(request)
-            except Exception as e:
-                logger.error("Error reading document: %s", e)
-                logger.info("Traceback: %s", traceback.format_exc())
-                yield ReadStreamResponse(meta=ReadStreamMeta(error=str(e)))
-                return
+                result, source_desc = await self._parse_request(
+                    request, request_id, deadline=deadline
+                )
+                return _build_read_response(result, source_desc, request_id)
 
-            if not result or not result.content:
-                error_msg = f"Failed to parse: {source_desc}"
+            except ParseCancelled as e:
+                logger.info("Stopped reading document: %s", e)
+                return ReadResponse(error=str(e))
+            except Exception as e:
+                error_msg = f"Error reading document: {e}"
                 logger.error(error_msg)
-                yield ReadStreamResponse(meta=ReadStreamMeta(error=error_msg))
-                return
+                logger.info("Traceback: %s", traceback.format_exc())
+                return ReadResponse(error=str(e))
 
-            images = result.images or {}
-            image_count = len(images)
-            yield ReadStreamResponse(
-                meta=ReadStreamMeta(
-                    markdown_content=_c(result.content),
-                    image_dir_path="",
-                    metadata={k: _c(str(v)) for k, v in result.metadata.items()}
-                    if result.metadata
-                    else {},
-                    image_count=image_count,
+    async def ReadBatch(self, request, context):
+        items = _batch_items(request)
+        if not items:
+            return
+        logger.info("ReadBatch: %d requests", len(items))
+        deadline = deadline_from_context(context)
+        # Bound the in-flight pool tasks so one large batch cannot monopolise
+        # the parse pool queue ahead of concurrent Read calls.
+        slots = asyncio.Semaphore(max(1, CONFIG.grpc_batch_concurrency))
+
+        async def read_one(index: int, request_id: str, item: ReadRequest):
+            async with slots:
+                try:
+                    async with self._admitted(item, None):
+                        response = await self._read(item, request_id, deadline)
+                except AdmissionRejected as e:
+                    response = ReadResponse(error=str(e))
+                return index, request_id, response
+
+        tasks = [asyncio.ensure_future(read_one(*entry)) for entry in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, request_id, response = await next_done
+                yield ReadBatchResponse(
+                    request_id=request_id, index=index, response=response
                 )
-            )
-
-            sent = 0
-            for ref in _iter_image_refs(images):
-                yield ReadStreamResponse(image=ref)
-                sent += 1
+        finally:
+            for task in tasks:
+                task.cancel()
 
-            logger.info(
-                "ReadStream response: content_len=%d, images=%d",
-                len(result.content),
-                sent,
-            )
+    async def ReadStream(self, request: ReadRequest, context):
+        request_id = request.request_id or str(uuid.uuid4())
 
-    def ListEngines(self, request, context):
-        overrides = dict(getattr(request, "config_overrides", None) or {})
-        engines_data = registry.list_engines(overrides=overrides or None)
-        engines = [
-            ParserEngineInfo(
-                name=e["name"],
-                description=e["description"],
-                file_types=e["file_types"],
-                available=e.get("available", True),
-                unavailable_reason=e.get("unavailable_reason", ""),
-            )
-            for e in engines_data
-        ]
-        return ListEnginesResponse(engines=engines)
+        with request_id_context(request_id):
+            async with self._admitted(request, context):
+                async for frame in self._read_stream(
+                    request, request_id, deadline=deadline_from_context(context)
+                ):
+                    yield frame
+
+    async def ReadUpload(self, request_iterator, context):
+        messages = request_iterator.__aiter__()
+        try:
+            header = _upload_header(await anext(messages, None))
+        except ValueError as e:
+            await context.abort(_upload_abort_status(e), str(e))
+        request_id = header.request_id or str(uuid.uuid4())
 
+        loop = asyncio.get_running_loop()
+        with request_id_context(request_id), _upload_spool(header) as spool:
+            try:
+                async for message in messages:
+                    # Disk writes go to the default executor; the loop only
+                    # receives messages.
+                    await loop.run_in_executor(
+                        None, spool.write, _upload_chunk(message)
+                    )
+            except ValueError as e:
+                logger.error("Rejected upload %s: %s", header.file_name, e)
+                await context.abort(_upload_abort_status(e), str(e))
+            source_path = await loop.run_in_executor(None, spool.finish)
+            async with self._admitted(header, context, source_path):
+                async for frame in self._read_stream(
+                    header, request_id, source_path, deadline_from_context(context)
+                ):
+                    yield frame
+
+    async def _read_stream(
+        self,
+        request: ReadRequest,
+        request_id: str,
+        source_path: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ):
+        if request.config.incremental_stream:
+            async for frame in self._read_stream_incremental(
+                request, request_id, source_path, deadline
+            ):
+                yield frame
+            return
 
-def main():
-    config.print_config()
+        try:
+            result, source_desc = await self._parse_request(
+                request, request_id, source_path, deadline
+            )
+        except ParseCancelled as e:
+            logger.info("Stopped reading document: %s", e)
+            yield ReadStreamResponse(meta=ReadStreamMeta(error=str(e)))
+            return
+        except Exception as e:
+            logger.error("Error reading document: %s", e)
+            logger.info("Traceback: %s", traceback.format_exc())
+            yield ReadStreamResponse(meta=ReadStreamMeta(error=str(e)))
+            return
+
+        for frame in _iter_stream_frames(result, source_desc):
+            yield frame
+
+    async def _read_stream_incremental(
+        self,
+        request: ReadRequest,
+        request_id: str,
+        source_path: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ):
+        stream = _IncrementalFrames(_source_desc(request))
+        parts = iter_in_parse_pool(
+            self.pool, request, request_id, self.cache, source_path, deadline
+        )
+        try:
+            async for part in parts:
+                for frame in stream.frames(part):
+                    yield frame
+        except ParseCancelled as e:
+            logger.info("Stopped reading document: %s", e)
+            yield stream.done(error=str(e))
+            return
+        except Exception as e:
+            logger.error("Error reading document: %s", e)
+            logger.info("Traceback: %s", traceback.format_exc())
+            yield stream.done(error=str(e))
+            return
+        finally:
+            await parts.aclose()
+        yield stream.done()
+
+    async def ListEngines(self, request, context):
+        # Availability probes may hit the network (hybrid health checks with
+        # retries), so keep them off the event loop.
+        loop = asyncio.get_running_loop()
+        engines_data = await loop.run_in_executor(
+            None,
+            functools.partial(
+                registry.list_engines, overrides=_engine_overrides(request)
+            ),
+        )
+        return _list_engines_response(request, engines_data)
 
-    interceptors = [AuthInterceptor()]
+    async def Inspect(self, request: ReadRequest, context):
+        with request_id_context(request.request_id or str(uuid.uuid4())):
+            return await asyncio.get_running_loop().run_in_executor(
+                None, _inspect_response, self.parser, request
+            )
 
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=CONFIG.grpc_max_workers),
-        options=[
-            ("grpc.max_send_message_length", CONFIG.grpc_max_file_size_mb),
-            ("grpc.max_receive_message_length", CONFIG.grpc_max_file_size_mb),
-        ],
-        interceptors=interceptors,
-    )
 
-    docreader_pb2_grpc.add_DocReaderServicer_to_server(DocReaderServicer(), server)
+def _server_options() -> list:
+    return [
+        ("grpc.max_send_message_length", CONFIG.grpc_max_file_size_mb),
+        ("grpc.max_receive_message_length", CONFIG.grpc_max_file_size_mb),
+    ]
 
-    health_servicer = HealthServicer()
-    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
 
+def _bind_port(server) -> None:
+    """Bind the configured port (TLS when enabled); exit on bad TLS config."""
     try:
         tls_credentials = load_tls_credentials()
     except TLSConfigError as e:
@@ -322,6 +794,53 @@ def main():
             "Server starting on port %d WITHOUT TLS (insecure mode)", CONFIG.grpc_port
         )
 
+
+def _start_metrics(admission, executor=None) -> None:
+    """Expose ``/metrics`` when ``DOCREADER_METRICS_PORT`` is set."""
+    if not CONFIG.metrics_port:
+        return
+    metrics.register_parse_cache(get_parse_cache())
+    metrics.register_admission(admission)
+    if executor is not None:
+        metrics.register_executor_queue(executor)
+    metrics.start_metrics_server(CONFIG.metrics_port)
+
+
+def _shutdown_render_pool() -> None:
+    # Parsers load lazily: without pdf_parser imported there is no pool.
+    pdf_parser = sys.modules.get("docreader.parser.pdf_parser")
+    if pdf_parser is not None:
+        pdf_parser.shutdown_render_pool()
+
+
+def _serve_sync() -> None:
+    interceptors = [AuthInterceptor()]
+    if CONFIG.parser_warmup:
+        registry.warm_up(CONFIG.parser_warmup)
+
+    admission = get_admission_controller(CONFIG.grpc_max_workers)
+    max_workers = CONFIG.grpc_max_workers
+    if admission is not None:
+        # Requests wait for admission on a gRPC thread: size the pool for the
+        # queue too, or waiting RPCs would sit unordered in the executor.
+        max_workers += max(0, CONFIG.admission_max_queued)
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    server = grpc.server(
+        executor,
+        options=_server_options(),
+        interceptors=interceptors,
+    )
+    _start_metrics(admission, executor)
+
+    docreader_pb2_grpc.add_DocReaderServicer_to_server(
+        DocReaderServicer(admission), server
+    )
+
+    health_servicer = HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(health_servicer, server)
+
+    _bind_port(server)
+
     server.start()
 
     logger.info("Server started on port %d", CONFIG.grpc_port)
@@ -332,6 +851,57 @@ def main():
     except KeyboardInterrupt:
         logger.info("Received termination signal, shutting down server")
         server.stop(0)
+    finally:
+        _shutdown_render_pool()
+
+
+async def _serve_aio() -> None:
+    from grpc_health.v1.health import aio as health_aio
+
+    pool = create_parse_pool(CONFIG.grpc_parse_process_workers)
+    server = grpc.aio.server(
+        options=_server_options(),
+        interceptors=[AsyncAuthInterceptor()],
+    )
+
+    admission = get_admission_controller(CONFIG.grpc_parse_process_workers)
+    _start_metrics(admission)
+    docreader_pb2_grpc.add_DocReaderServicer_to_server(
+        AsyncDocReaderServicer(pool, admission),
+        server,
+    )
+    health_pb2_grpc.add_HealthServicer_to_server(health_aio.HealthServicer(), server)
+
+    _bind_port(server)
+
+    await server.start()
+
+    logger.info(
+        "Server started on port %d (aio, %d parse processes)",
+        CONFIG.grpc_port,
+        CONFIG.grpc_parse_process_workers,
+    )
+    logger.info("Server is ready to accept connections")
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0)
+        pool.shutdown(wait=False, cancel_futures=True)
+        _shutdown_render_pool()
+
+
+def main():
+    config.print_config()
+
+    if CONFIG.grpc_server_mode == "aio":
+        try:
+            asyncio.run(_serve_aio())
+        except KeyboardInterrupt:
+            logger.info("Received termination signal, shutting down server")
+        return
+
+    _serve_sync()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,405 @@
+"""Prometheus-style metrics for docreader.
+
+A small dependency-free registry rendering the Prometheus text exposition
+format, served on a side HTTP port (``DOCREADER_METRICS_PORT``, ``/metrics``).
+
+Counters and histograms are recorded wherever the work happens. In ``aio``
+mode that is a parse-pool worker process, so workers ship the increments they
+recorded back to the server process with every result (``export_delta`` /
+``merge_delta``); gauges are sampled in the server process at scrape time.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+# Parse latencies range from milliseconds (markdown) to many minutes (large
+# scanned PDFs).
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for key, value in items:
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+    def export_delta(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge_delta(self, delta: Dict[LabelValues, float]) -> None:
+        with self._lock:
+            for key, value in delta.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[0]) if state else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(v[0]), v[1])) for k, v in self._values.items())
+        lines = self._header()
+        names = self.labelnames + ("le",)
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                labels = _format_labels(names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+    def export_delta(self) -> Dict[LabelValues, list]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge_delta(self, delta: Dict[LabelValues, list]) -> None:
+        with self._lock:
+            for key, (counts, total) in delta.items():
+                state = self._values.get(key)
+                if state is None:
+                    state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+                state[0] = [a + b for a, b in zip(state[0], counts)]
+                state[1] += total
+
+
+class GaugeCallback(_Metric):
+    """Gauge (or counter) whose samples are read from a callback at scrape time.
+
+    The callback returns ``[(label_values, value), ...]``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+        type_name: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.type_name = type_name
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        try:
+            samples = list(self.callback())
+        except Exception as e:
+            logger.warning("Metric callback %s failed: %s", self.name, e)
+            return []
+        lines = self._header()
+        for key, value in samples:
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def export_delta(self) -> dict:
+        """Return and reset the counter/histogram values recorded so far."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        delta = {}
+        for metric in metrics:
+            if isinstance(metric, (Counter, Histogram)):
+                values = metric.export_delta()
+                if values:
+                    delta[metric.name] = values
+        return delta
+
+    def merge_delta(self, delta: Optional[dict]) -> None:
+        """Add values exported by another process (see :meth:`export_delta`)."""
+        for name, values in (delta or {}).items():
+            metric = self._metrics.get(name)
+            if isinstance(metric, (Counter, Histogram)):
+                metric.merge_delta(values)
+
+
+REGISTRY = Registry()
+
+PARSE_DURATION = REGISTRY.register(
+    Histogram(
+        "docreader_parse_duration_seconds",
+        "Time spent parsing a document (cache misses only).",
+        ("engine", "file_type"),
+    )
+)
+PARSE_ERRORS = REGISTRY.register(
+    Counter(
+        "docreader_parse_errors_total",
+        "Documents whose parse raised an error.",
+        ("engine", "file_type"),
+    )
+)
+PARSE_CANCELLED = REGISTRY.register(
+    Counter(
+        "docreader_parse_cancelled_total",
+        "Parses stopped early because the RPC was cancelled or timed out.",
+        ("engine", "file_type"),
+    )
+)
+BYTES_IN = REGISTRY.register(
+    Counter(
+        "docreader_input_bytes_total",
+        "Bytes of documents parsed (cache misses).",
+        ("file_type",),
+    )
+)
+BYTES_OUT = REGISTRY.register(
+    Counter(
+        "docreader_output_bytes_total",
+        "Bytes of parse output, by kind (markdown / image).",
+        ("file_type", "kind"),
+    )
+)
+IMAGES_EMITTED = REGISTRY.register(
+    Counter(
+        "docreader_images_emitted_total",
+        "Images returned in parse results.",
+        ("file_type",),
+    )
+)
+PDF_PAGES = REGISTRY.register(
+    Counter(
+        "docreader_pdf_pages_total",
+        "PDF pages parsed, by classification (text / scanned).",
+        ("kind",),
+    )
+)
+PDF_STAGE_DURATION = REGISTRY.register(
+    Histogram(
+        "docreader_pdf_stage_seconds",
+        "Time per PDFParser routing stage, summed over the pages of a document.",
+        ("stage",),
+    )
+)
+LIMITER_WAIT = REGISTRY.register(
+    Histogram(
+        "docreader_limiter_wait_seconds",
+        "Time spent waiting for a parser_worker_limit slot.",
+        ("limiter",),
+        buckets=WAIT_BUCKETS,
+    )
+)
+
+
+def register_callback(
+    name: str,
+    documentation: str,
+    callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+    labelnames: Sequence[str] = (),
+    type_name: str = "gauge",
+) -> None:
+    REGISTRY.register(
+        GaugeCallback(name, documentation, callback, labelnames, type_name)
+    )
+
+
+def register_parse_cache(cache) -> None:
+    """Export ``ParseCache.stats()`` (None: nothing to export)."""
+    if cache is None:
+        return
+
+    def stat(field):
+        return lambda: [((), cache.stats()[field])]
+
+    for field in ("hits", "memory_hits", "disk_hits", "misses", "stores", "evictions"):
+        register_callback(
+            f"docreader_parse_cache_{field}_total",
+            f"Parse cache {field.replace('_', ' ')}.",
+            stat(field),
+            type_name="counter",
+        )
+    register_callback(
+        "docreader_parse_cache_memory_bytes",
+        "Approximate size of the in-memory parse cache tier.",
+        stat("memory_bytes"),
+    )
+
+
+def register_admission(controller) -> None:
+    """Export AdmissionController queue/running state (None: nothing)."""
+    if controller is None:
+        return
+    register_callback(
+        "docreader_admission_jobs",
+        "Admission controller jobs by lane and state.",
+        lambda: [
+            ((lane, state), controller.stats()[f"{state}_{lane}"])
+            for lane in ("small", "large")
+            for state in ("queued", "running")
+        ],
+        ("lane", "state"),
+    )
+    register_callback(
+        "docreader_admission_backlog_cost",
+        "Estimated cost of queued and running jobs.",
+        lambda: [((), controller.stats()["backlog_cost"])],
+    )
+    register_callback(
+        "docreader_admission_rejected_total",
+        "Requests refused by admission control (budget, queue or deadline).",
+        lambda: [
+            ((), controller.stats()["rejected"] + controller.stats()["timed_out"])
+        ],
+        type_name="counter",
+    )
+
+
+def register_executor_queue(executor) -> None:
+    """Export the number of RPCs waiting for a gRPC server thread."""
+    register_callback(
+        "docreader_grpc_queue_depth",
+        "RPCs queued for a gRPC server worker thread.",
+        lambda: [((), executor._work_queue.qsize())],
+    )
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics: " + format, *args)
+
+
+def start_metrics_server(port: int, host: str = "") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` on a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, name="metrics-http", daemon=True
+    )
+    thread.start()
+    logger.info("Metrics endpoint listening on port %d", server.server_address[1])
+    return server
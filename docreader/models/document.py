@@ -1,9 +1,29 @@
 """Chunk document schema."""
 
+import base64
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+def image_bytes(data: Any) -> bytes:
+    """Return the raw bytes of an image payload.
+
+    Images are carried as raw bytes; base64 strings (the format parsers used
+    before) and other buffers are still accepted and converted.
+    """
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return base64.b64decode(data)
+    return bytes(data)
+
+
+def _coerce_images(images: Any) -> Any:
+    if not isinstance(images, dict):
+        return images
+    return {ref: image_bytes(data) for ref, data in images.items()}
 
 
 class Chunk(BaseModel):
@@ -65,8 +85,9 @@ class Document(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
     content: str = Field(default="", description="document text content")
-    images: Dict[str, str] = Field(
-        default_factory=dict, description="Images in the document"
+    images: Dict[str, bytes] = Field(
+        default_factory=dict,
+        description="Images in the document: storage-relative path -> raw bytes",
     )
 
     chunks: List[Chunk] = Field(default_factory=list, description="document chunks")
@@ -85,3 +106,54 @@ class Document(BaseModel):
 
     def is_valid(self) -> bool:
         return self.content != ""
+
+    @field_validator("images", mode="before")
+    @classmethod
+    def _validate_images(cls, images: Any) -> Any:
+        return _coerce_images(images)
+
+    def images_base64(self) -> Dict[str, str]:
+        """Return ``images`` base64-encoded, for callers of the old format."""
+        return {
+            ref: base64.b64encode(data).decode() for ref, data in self.images.items()
+        }
+
+
+class DocumentPart(BaseModel):
+    """One incremental piece of a parsed document.
+
+    Produced by ``BaseParser.iter_parse_into_text`` in reading order. ``images``
+    holds exactly the images referenced by ``content``; document-level
+    ``metadata`` is only known once parsing finishes and is carried by the last
+    part (which may have empty content).
+    """
+
+    content: str = Field(default="", description="markdown fragment")
+    images: Dict[str, bytes] = Field(
+        default_factory=dict, description="Images referenced by the fragment"
+    )
+    page_index: int = Field(
+        default=-1, description="0-based source page, -1 if not page-based"
+    )
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="document-level metadata fields",
+    )
+
+    @field_validator("images", mode="before")
+    @classmethod
+    def _validate_images(cls, images: Any) -> Any:
+        return _coerce_images(images)
+
+
+def merge_document_parts(parts: Iterable[DocumentPart]) -> Document:
+    """Assemble a Document from parts; fragments are joined by blank lines."""
+    blocks: List[str] = []
+    images: Dict[str, bytes] = {}
+    metadata: Dict[str, Any] = {}
+    for part in parts:
+        if part.content:
+            blocks.append(part.content)
+        images.update(part.images)
+        metadata.update(part.metadata)
+    return Document(content="\n\n".join(blocks), images=images, metadata=metadata)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -15,3 +16,64 @@ class ChunkingConfig:
     enable_multimodal: bool = False
     storage_config: dict[str, str] | None = None
     vlm_config: dict[str, str] | None = None
+
+
+@dataclass(frozen=True)
+class PageSelection:
+    """Pages of a document requested through ``ReadConfig``.
+
+    ``from_page`` / ``to_page`` are 1-based and inclusive; 0 leaves that end
+    of the range open. A non-empty ``pages`` (1-based) overrides the range.
+    Parsers work with the 0-based indices returned by :meth:`indices`.
+    """
+
+    from_page: int = 0
+    to_page: int = 0
+    pages: tuple[int, ...] = ()
+
+    def __post_init__(self):
+        if self.from_page < 0 or self.to_page < 0:
+            raise ValueError("from_page and to_page must not be negative")
+        if self.to_page and self.from_page > self.to_page:
+            raise ValueError(
+                f"from_page {self.from_page} is after to_page {self.to_page}"
+            )
+        if any(p < 1 for p in self.pages):
+            raise ValueError("pages are 1-based")
+
+    @classmethod
+    def from_config(cls, cfg) -> Optional["PageSelection"]:
+        """Selection of a ``ReadConfig`` message; None when it means every page."""
+        if cfg is None:
+            return None
+        selection = cls(cfg.from_page, cfg.to_page, tuple(cfg.pages))
+        return None if selection.is_all() else selection
+
+    def is_all(self) -> bool:
+        return not self.pages and self.from_page <= 1 and not self.to_page
+
+    def indices(self, page_count: int) -> list[int]:
+        """Sorted 0-based indices of the selected pages that exist.
+
+        Raises ValueError when none of them does, so a shard past the end of
+        the document is reported instead of returning an empty result.
+        """
+        if self.pages:
+            selected = sorted({p - 1 for p in self.pages if p <= page_count})
+        else:
+            start = max(1, self.from_page) - 1
+            stop = min(self.to_page or page_count, page_count)
+            selected = list(range(start, stop))
+        if not selected:
+            raise ValueError(
+                f"page selection {self.describe()} matches no page "
+                f"(document has {page_count} pages)"
+            )
+        return selected
+
+    def describe(self) -> str:
+        """Compact form, e.g. ``3-10``, ``5-`` or ``1,4,7``."""
+        if self.pages:
+            return ",".join(str(p) for p in sorted(set(self.pages)))
+        start = self.from_page or 1
+        return f"{start}-{self.to_page or ''}"
@@ -0,0 +1,54 @@
+"""On-disk cache of per-page PDF parse results.
+
+Users often re-upload a revised version of a long PDF where only a few pages
+changed: the file hash differs, so the parse cache (see ``parse_cache.py``)
+misses and every page is analysed and rendered again. ``PDFParser`` therefore
+also keys each page by a fingerprint of its own content stream and resources
+and stores what the page cost to produce (class, pass-1 text, vector clips,
+rendered JPEG) here, so only the changed pages need real work.
+
+Entries are pickled dicts under ``CONFIG.image_output_dir/pdf_page_cache``,
+kept by the parse cache's :class:`~docreader.parse_cache.DiskCache`: sharded
+by key prefix, shared by every process of the container and held under its
+size budget least-recently-used first.
+
+Cache failures are logged and treated as misses; they never fail a parse.
+"""
+
+import os
+import threading
+from typing import Optional
+
+from docreader.config import CONFIG
+from docreader.parse_cache import DiskCache
+
+# Once over budget, evict down to this share of it so the directory is not
+# rescanned on every store.
+_EVICT_TO = 0.9
+
+
+class PageCache(DiskCache):
+    """Size-bounded on-disk LRU of per-page parse results."""
+
+    def __init__(self, disk_dir: str, disk_max_bytes: int):
+        super().__init__(
+            disk_dir, disk_max_bytes, name="page cache", shard=True, evict_to=_EVICT_TO
+        )
+
+
+_cache: Optional[PageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """Return the process-wide page cache built from ``CONFIG``, or None if disabled."""
+    global _cache
+    if not CONFIG.pdf_page_cache_enabled or CONFIG.pdf_page_cache_disk_mb <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageCache(
+                disk_dir=os.path.join(CONFIG.image_output_dir, "pdf_page_cache"),
+                disk_max_bytes=CONFIG.pdf_page_cache_disk_mb * 1024 * 1024,
+            )
+        return _cache
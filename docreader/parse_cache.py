@@ -0,0 +1,427 @@
+"""Content-addressed cache of parse results.
+
+The same file is routinely uploaded to several knowledge bases; without a
+cache each upload re-runs the whole pipeline (PDF classification, page
+rendering, JPEG encoding). Results are keyed by a hash of the file bytes plus
+everything that can change the output for those bytes: the file name and type
+(page image refs are derived from the name), the engine, the per-request
+engine overrides and the render-related ``CONFIG`` settings.
+
+Two tiers:
+
+* an in-process LRU bounded by the approximate size of the cached documents;
+* an on-disk tier under ``CONFIG.image_output_dir/parse_cache`` shared by all
+  processes of the container (e.g. the ``aio`` parse pool workers), evicted
+  least-recently-used first once it exceeds its size budget. The same
+  :class:`DiskCache` backs the per-page PDF cache (see ``page_cache.py``).
+
+Cache failures are logged and treated as misses; they never fail a parse.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from docreader.config import CONFIG
+from docreader.models.document import Document
+from docreader.models.read_config import PageSelection
+
+logger = logging.getLogger(__name__)
+
+# Bump when a parser change alters the output for identical input, so stale
+# on-disk entries written by an older build are never served.
+CACHE_FORMAT_VERSION = 5
+
+_DISK_SUFFIX = ".pkl"
+
+# Metadata set by the PDF page watchdog when it had to lower a page's DPI, give
+# up on it or cut its embedded-image scan short. Such output is a one-off
+# workaround for a pathological page, so it is returned but never cached: the
+# next upload gets a real try.
+DEGRADED_METADATA_KEYS = ("low_dpi_pages", "skipped_pages", "partial_image_pages")
+
+
+def _render_settings() -> Dict[str, Any]:
+    cfg = CONFIG
+    return {
+        "pdf_render_dpi": cfg.pdf_render_dpi,
+        "pdf_jpeg_quality": cfg.pdf_jpeg_quality,
+        "pdf_render_max_edge": cfg.pdf_render_max_edge,
+        "pdf_direct_page_images": cfg.pdf_direct_page_images,
+        "pdf_adaptive_render": cfg.pdf_adaptive_render,
+        "pdf_adaptive_min_dpi": cfg.pdf_adaptive_min_dpi,
+        "docx_max_pages": cfg.docx_max_pages,
+        "odl_hybrid": cfg.odl_hybrid,
+        "odl_hybrid_mode": cfg.odl_hybrid_mode,
+        "odl_hybrid_fallback": cfg.odl_hybrid_fallback,
+        "odl_markdown_with_html": cfg.odl_markdown_with_html,
+    }
+
+
+def parse_cache_key(
+    file_name: str,
+    file_type: str,
+    content: bytes,
+    parser_engine: Optional[str] = None,
+    engine_overrides: Optional[Dict[str, Any]] = None,
+    page_selection: Optional[PageSelection] = None,
+) -> str:
+    """Return the cache key for parsing ``content`` with the given settings."""
+    params = {
+        "v": CACHE_FORMAT_VERSION,
+        "file_name": os.path.basename(file_name or ""),
+        "file_type": (file_type or "").lower(),
+        "engine": parser_engine or "",
+        "overrides": {str(k): str(v) for k, v in (engine_overrides or {}).items()},
+        "render": _render_settings(),
+    }
+    if page_selection is not None:
+        # Only present for partial parses, so whole-document keys are unchanged.
+        params["pages"] = page_selection.describe()
+    h = hashlib.sha256()
+    h.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    h.update(b"\0")
+    h.update(content)
+    return h.hexdigest()
+
+
+class DiskCache:
+    """Size-bounded directory of pickled entries shared by every process.
+
+    Entries are written atomically (temp file + rename) and reads refresh an
+    entry's mtime. Once the directory outgrows ``max_bytes`` the least
+    recently used entries are removed until it is down to ``evict_to`` of the
+    budget. With ``shard`` entries live in subdirectories named after the key
+    prefix, for caches holding many entries.
+
+    Entries are pickles, so the directory must be private to the server: it
+    is created with mode 0700, and one owned by another user or writable by
+    anyone else (e.g. planted under the default ``/tmp`` output dir) turns
+    the cache off. Entry files not owned by the server are never loaded.
+    """
+
+    def __init__(
+        self,
+        disk_dir: str,
+        max_bytes: int,
+        name: str = "cache",
+        shard: bool = False,
+        evict_to: float = 1.0,
+    ):
+        self.disk_dir = disk_dir
+        self.max_bytes = max(0, max_bytes)
+        self.name = name
+        self.shard = shard
+        self.evict_to = evict_to
+
+        self._lock = threading.Lock()
+        # Estimated size of the directory; None until the first scan. Other
+        # processes write too, so every eviction pass recounts it.
+        self._bytes: Optional[int] = None
+        # Whether disk_dir passed _check_dir; None until first used.
+        self._usable: Optional[bool] = None
+        self._counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def get(self, key: str) -> Any:
+        """The entry stored under ``key``, or None."""
+        if not self._ready():
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if not _owned_by_us(os.fstat(f.fileno())):
+                    raise PermissionError("entry is not owned by the server user")
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            value = None
+        except Exception as e:
+            logger.warning("Discarding unreadable %s entry %s: %s", self.name, path, e)
+            self.discard(key)
+            value = None
+        with self._lock:
+            self._counters["hits" if value is not None else "misses"] += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        if self.max_bytes <= 0 or not self._ready():
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    size = f.tell()
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except Exception as e:
+            logger.warning("Failed to write %s entry: %s", self.name, e)
+            return
+        with self._lock:
+            self._counters["stores"] += 1
+            if self._bytes is not None:
+                self._bytes += size
+            scan = self._bytes is None or self._bytes > self.max_bytes
+        if scan:
+            self._evict()
+
+    def discard(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def _ready(self) -> bool:
+        if self._usable is None:
+            usable = _check_dir(self.disk_dir)
+            if not usable:
+                logger.warning(
+                    "%s dir %s is not private to the server user; disk cache off",
+                    self.name,
+                    self.disk_dir,
+                )
+            self._usable = usable
+        return self._usable
+
+    def _path(self, key: str) -> str:
+        if self.shard:
+            return os.path.join(self.disk_dir, key[:2], key + _DISK_SUFFIX)
+        return os.path.join(self.disk_dir, key + _DISK_SUFFIX)
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        try:
+            for root, _dirs, files in os.walk(self.disk_dir):
+                for name in files:
+                    if not name.endswith(_DISK_SUFFIX):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, st.st_size, path))
+                    total += st.st_size
+        except OSError as e:
+            logger.warning("Failed to scan %s dir %s: %s", self.name, self.disk_dir, e)
+            return
+
+        evicted = 0
+        if total > self.max_bytes:
+            target = self.max_bytes * self.evict_to
+            entries.sort()
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+        with self._lock:
+            self._bytes = total
+            self._counters["evictions"] += evicted
+
+
+def _owned_by_us(st: os.stat_result) -> bool:
+    return not hasattr(os, "geteuid") or st.st_uid == os.geteuid()
+
+
+def _check_dir(path: str) -> bool:
+    """Create ``path`` with mode 0700, or check an existing one is ours alone.
+
+    An existing directory of ours that only we can write to is tightened to
+    0700; one that is another user's, group/world-writable or a symlink is
+    refused, since its entries may have been planted.
+    """
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+        if not stat.S_ISDIR(st.st_mode) or not _owned_by_us(st):
+            return False
+        if st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)
+        return True
+    except OSError as e:
+        logger.warning("Cannot use cache dir %s: %s", path, e)
+        return False
+
+
+def _document_size(doc: Document) -> int:
+    size = len(doc.content)
+    for ref, data in doc.images.items():
+        size += len(ref) + len(data)
+    return size
+
+
+def _copy_document(doc: Document) -> Document:
+    # Callers mutate the result (ReadStream pops images as it streams them),
+    # so never hand out the cached instance itself. Values are immutable
+    # str/bytes, so copying the containers is enough.
+    return doc.model_copy(
+        update={"images": dict(doc.images), "metadata": dict(doc.metadata)}
+    )
+
+
+# Once over budget, evict down to this share of it so the directory is not
+# rescanned on every store.
+_EVICT_TO = 0.9
+
+
+class ParseCache:
+    """Two-tier (memory LRU + disk) cache of parsed ``Document`` objects."""
+
+    def __init__(
+        self,
+        memory_max_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.memory_max_bytes = max(0, memory_max_bytes)
+        self.disk: Optional[DiskCache] = None
+        if disk_dir and disk_max_bytes > 0:
+            self.disk = DiskCache(
+                disk_dir, disk_max_bytes, name="parse cache", evict_to=_EVICT_TO
+            )
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Document]" = OrderedDict()
+        self._memory_sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._counters = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    # -- public API -------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Document]:
+        with self._lock:
+            doc = self._memory.get(key)
+            if doc is not None:
+                self._memory.move_to_end(key)
+                self._counters["hits"] += 1
+                self._counters["memory_hits"] += 1
+                return _copy_document(doc)
+
+        doc = self._disk_get(key)
+        with self._lock:
+            if doc is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            self._counters["disk_hits"] += 1
+            self._memory_put(key, doc)
+        return _copy_document(doc)
+
+    def put(self, key: str, doc: Document) -> None:
+        if not doc or not doc.content:
+            return
+        if any(k in doc.metadata for k in DEGRADED_METADATA_KEYS):
+            logger.info("Not caching degraded parse result for key %s", key[:12])
+            return
+        doc = _copy_document(doc)
+        with self._lock:
+            self._counters["stores"] += 1
+            self._memory_put(key, doc)
+        self._disk_put(key, doc)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+        if self.disk is not None:
+            stats["evictions"] += self.disk.stats()["evictions"]
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_sizes.clear()
+            self._memory_bytes = 0
+
+    # -- memory tier ------------------------------------------------------
+
+    def _memory_put(self, key: str, doc: Document) -> None:
+        size = _document_size(doc)
+        if size > self.memory_max_bytes:
+            return
+        if key in self._memory:
+            self._memory_bytes -= self._memory_sizes.pop(key)
+            del self._memory[key]
+        self._memory[key] = doc
+        self._memory_sizes[key] = size
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes and self._memory:
+            old_key, _ = self._memory.popitem(last=False)
+            self._memory_bytes -= self._memory_sizes.pop(old_key)
+            self._counters["evictions"] += 1
+
+    # -- disk tier --------------------------------------------------------
+
+    def _disk_get(self, key: str) -> Optional[Document]:
+        if self.disk is None:
+            return None
+        data = self.disk.get(key)
+        if data is None:
+            return None
+        try:
+            return Document(**data)
+        except Exception as e:
+            logger.warning("Discarding invalid parse cache entry %s: %s", key, e)
+            self.disk.discard(key)
+            return None
+
+    def _disk_put(self, key: str, doc: Document) -> None:
+        if self.disk is None:
+            return
+        self.disk.put(
+            key,
+            {"content": doc.content, "images": doc.images, "metadata": doc.metadata},
+        )
+
+
+_cache: Optional[ParseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the process-wide cache built from ``CONFIG``, or None if disabled."""
+    global _cache
+    if not CONFIG.parse_cache_enabled:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParseCache(
+                memory_max_bytes=CONFIG.parse_cache_memory_mb * 1024 * 1024,
+                disk_dir=os.path.join(CONFIG.image_output_dir, "parse_cache"),
+                disk_max_bytes=CONFIG.parse_cache_disk_mb * 1024 * 1024,
+            )
+        return _cache
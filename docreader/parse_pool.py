@@ -0,0 +1,415 @@
+"""Process pool that runs document parsing off the gRPC event loop.
+
+In the ``aio`` server mode every ``Read`` / ``ReadStream`` call is shipped to
+one of these worker processes. Parsing is CPU-bound pure Python for most
+formats (PDF layout reconstruction, DOCX walking), so a thread pool is
+serialised by the GIL; separate processes let one container use all its cores
+while the event loop keeps serving health checks, ``ListEngines`` and stream
+writes.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, Optional, Tuple
+
+from docreader import metrics
+from docreader.models.document import Document, DocumentPart
+from docreader.models.read_config import PageSelection
+from docreader.parse_cache import ParseCache, parse_cache_key
+from docreader.parser.concurrency import (
+    CpuBudget,
+    install_cpu_budget,
+    select_mp_context,
+)
+from docreader.utils.cancel import CancelToken, cancel_scope
+from docreader.utils.request import request_id_context
+from docreader.utils.tempfile import mapped_file
+
+logger = logging.getLogger(__name__)
+
+# Per-worker parser facade, populated by the pool initializer.
+_WORKER_PARSER = None
+
+# Incremental reads hand parts back to the server process through a bounded
+# manager queue, so a slow client applies backpressure to the worker instead
+# of parts piling up in memory.
+_PART_QUEUE_SIZE = 4
+# How often a blocked producer/consumer re-checks for cancellation/completion.
+_PART_QUEUE_POLL_SECONDS = 0.5
+
+_stream_manager = None
+_stream_manager_lock = threading.Lock()
+
+
+def parse_read_request(
+    parser, request, source_path: Optional[str] = None
+) -> Tuple[Optional[Document], str]:
+    """Run ``parser`` for a ReadRequest, returning (result, source_desc).
+
+    Shared by the sync servicer (in-process) and the pool workers. For
+    ReadUpload the file lives in ``source_path`` and ``request`` is the
+    upload header (no file_content).
+    """
+    cfg = request.config
+    parser_engine = cfg.parser_engine if cfg else ""
+    engine_overrides = dict(cfg.parser_engine_overrides) if cfg else {}
+
+    if request.url:
+        logger.info("Read(URL): url=%s", request.url)
+        result = parser.parse_url(
+            request.url,
+            request.title,
+            parser_engine=parser_engine,
+            engine_overrides=engine_overrides,
+        )
+        return result, request.url
+
+    file_type = _request_file_type(request)
+    page_selection = PageSelection.from_config(cfg)
+    logger.info(
+        "Read(File): file=%s, type=%s, size=%d bytes",
+        request.file_name,
+        file_type,
+        _request_file_size(request, source_path),
+    )
+    if source_path:
+        result = parser.parse_path(
+            request.file_name,
+            file_type,
+            source_path,
+            parser_engine=parser_engine,
+            engine_overrides=engine_overrides,
+            page_selection=page_selection,
+        )
+    else:
+        result = parser.parse_file(
+            request.file_name,
+            file_type,
+            request.file_content,
+            parser_engine=parser_engine,
+            engine_overrides=engine_overrides,
+            page_selection=page_selection,
+        )
+    return result, request.file_name
+
+
+def iter_read_request(
+    parser, request, source_path: Optional[str] = None
+) -> Iterator[DocumentPart]:
+    """Incremental counterpart of :func:`parse_read_request`.
+
+    URL reads are not page-based and are yielded as a single part.
+    """
+    cfg = request.config
+    parser_engine = cfg.parser_engine if cfg else ""
+    engine_overrides = dict(cfg.parser_engine_overrides) if cfg else {}
+
+    if request.url:
+        result, _ = parse_read_request(parser, request)
+        if result is not None:
+            yield DocumentPart(
+                content=result.content, images=result.images, metadata=result.metadata
+            )
+        return
+
+    file_type = _request_file_type(request)
+    page_selection = PageSelection.from_config(cfg)
+    logger.info(
+        "ReadStream(File, incremental): file=%s, type=%s, size=%d bytes",
+        request.file_name,
+        file_type,
+        _request_file_size(request, source_path),
+    )
+    if source_path:
+        yield from parser.iter_parse_path(
+            request.file_name,
+            file_type,
+            source_path,
+            parser_engine=parser_engine,
+            engine_overrides=engine_overrides,
+            page_selection=page_selection,
+        )
+        return
+    yield from parser.iter_parse_file(
+        request.file_name,
+        file_type,
+        request.file_content,
+        parser_engine=parser_engine,
+        engine_overrides=engine_overrides,
+        page_selection=page_selection,
+    )
+
+
+def _request_file_type(request) -> str:
+    return request.file_type or os.path.splitext(request.file_name)[1][1:]
+
+
+def _request_file_size(request, source_path: Optional[str]) -> int:
+    if source_path:
+        return os.path.getsize(source_path)
+    return len(request.file_content)
+
+
+def read_request_cache_key(request, source_path: Optional[str] = None) -> Optional[str]:
+    """Return the parse cache key for a file-mode ReadRequest (None for URLs)."""
+    if request.url:
+        return None
+    cfg = request.config
+    key = functools.partial(
+        parse_cache_key,
+        request.file_name,
+        _request_file_type(request),
+        parser_engine=cfg.parser_engine if cfg else "",
+        engine_overrides=dict(cfg.parser_engine_overrides) if cfg else {},
+        page_selection=PageSelection.from_config(cfg),
+    )
+    if source_path:
+        with mapped_file(source_path) as content:
+            return key(content)
+    return key(request.file_content)
+
+
+def _parse_worker_init(cpu_budget: Optional[CpuBudget] = None) -> None:
+    global _WORKER_PARSER
+    from docreader.config import CONFIG
+    from docreader.parser import Parser
+    from docreader.parser.registry import registry
+
+    # One CPU budget for all workers instead of one per worker process.
+    if cpu_budget is not None:
+        install_cpu_budget(cpu_budget)
+    # The server process owns the cache (one LRU and one set of counters).
+    _WORKER_PARSER = Parser(use_cache=False)
+    # Workers do the parsing in aio mode, so they are the ones to warm up.
+    if CONFIG.parser_warmup:
+        registry.warm_up(CONFIG.parser_warmup)
+
+
+def _parse_worker_task(
+    request_bytes: bytes,
+    request_id: str,
+    cancelled,
+    deadline: Optional[float],
+    source_path: Optional[str] = None,
+):
+    """Returns ``(error, (result, source_desc), metrics_delta)``.
+
+    Errors are returned rather than raised so the metrics recorded for a
+    failed parse still reach the server process.
+    """
+    from docreader.proto.docreader_pb2 import ReadRequest
+
+    token = CancelToken(cancelled, deadline)
+    with request_id_context(request_id), cancel_scope(token):
+        try:
+            value = parse_read_request(
+                _WORKER_PARSER, ReadRequest.FromString(request_bytes), source_path
+            )
+        except Exception as e:
+            return e, None, metrics.REGISTRY.export_delta()
+        return None, value, metrics.REGISTRY.export_delta()
+
+
+def _iter_parse_worker_task(
+    request_bytes: bytes,
+    request_id: str,
+    part_queue,
+    cancelled,
+    deadline: Optional[float],
+    source_path: Optional[str] = None,
+) -> None:
+    from docreader.proto.docreader_pb2 import ReadRequest
+
+    def put(item) -> bool:
+        while not cancelled.is_set():
+            try:
+                part_queue.put(item, timeout=_PART_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    token = CancelToken(cancelled, deadline)
+    with request_id_context(request_id), cancel_scope(token):
+        parts = iter_read_request(
+            _WORKER_PARSER, ReadRequest.FromString(request_bytes), source_path
+        )
+        try:
+            for part in parts:
+                if not put(("part", part)):
+                    logger.info("Incremental read cancelled by the server")
+                    return
+        finally:
+            parts.close()
+            put(("metrics", metrics.REGISTRY.export_delta()))
+        put(("end", None))
+
+
+def _get_stream_manager():
+    global _stream_manager
+    with _stream_manager_lock:
+        if _stream_manager is None:
+            _stream_manager = select_mp_context().Manager()
+        return _stream_manager
+
+
+def _signal_cancelled(loop: asyncio.AbstractEventLoop, cancelled) -> None:
+    """Set the manager Event ``cancelled`` off the event loop, without waiting.
+
+    Every call on a manager proxy is a blocking round-trip to the manager
+    process, which must never stall the other RPCs served by the loop.
+    """
+
+    def signal():
+        try:
+            cancelled.set()
+        except Exception as e:
+            logger.warning("Failed to signal parse worker cancellation: %s", e)
+
+    loop.run_in_executor(None, signal)
+
+
+def create_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create the process pool used by the aio servicer.
+
+    Workers are started from a ``forkserver`` (or ``fork``) context so they do
+    not inherit the event loop / gRPC threads of the server process. They
+    share one CPU budget (``DOCREADER_CPU_TOKENS``) for their fan-out.
+    """
+    from docreader.config import CONFIG
+
+    max_workers = max(1, max_workers)
+    logger.info("Starting parse process pool with %d workers", max_workers)
+    mp_context = select_mp_context()
+    cpu_budget = None
+    if CONFIG.cpu_tokens > 0 and mp_context is not None:
+        cpu_budget = CpuBudget(CONFIG.cpu_tokens, mp_context)
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_parse_worker_init,
+        initargs=(cpu_budget,),
+    )
+
+
+async def run_in_parse_pool(
+    pool: ProcessPoolExecutor,
+    request,
+    request_id: str,
+    cache: Optional[ParseCache] = None,
+    source_path: Optional[str] = None,
+    deadline: Optional[float] = None,
+):
+    """Parse ``request`` in ``pool`` without blocking the running event loop.
+
+    When ``cache`` is given it is consulted (and filled) here, in the server
+    process, so hits never touch the pool. Hashing and disk I/O run on the
+    default thread executor. ``source_path`` is a spooled ReadUpload file,
+    which workers open by path. The worker stops between pages once
+    ``deadline`` (``time.time()`` timestamp) passes or the calling task is
+    cancelled.
+
+    The request crosses the process boundary in its wire format: generated
+    protobuf classes are not picklable.
+    """
+    loop = asyncio.get_running_loop()
+    cache_key = None
+    if cache is not None and not request.url:
+        cache_key = await loop.run_in_executor(
+            None, read_request_cache_key, request, source_path
+        )
+        cached = await loop.run_in_executor(None, cache.get, cache_key)
+        if cached is not None:
+            logger.info("Parse cache hit for %s", request.file_name)
+            return cached, request.file_name
+
+    manager = await loop.run_in_executor(None, _get_stream_manager)
+    cancelled = await loop.run_in_executor(None, manager.Event)
+    try:
+        error, value, delta = await loop.run_in_executor(
+            pool,
+            _parse_worker_task,
+            request.SerializeToString(),
+            request_id,
+            cancelled,
+            deadline,
+            source_path,
+        )
+    except asyncio.CancelledError:
+        # Client went away: stop the worker at its next page boundary.
+        _signal_cancelled(loop, cancelled)
+        raise
+    metrics.REGISTRY.merge_delta(delta)
+    if error is not None:
+        raise error
+    result, source_desc = value
+    if cache_key is not None and result is not None:
+        await loop.run_in_executor(None, cache.put, cache_key, result)
+    return result, source_desc
+
+
+async def iter_in_parse_pool(
+    pool: ProcessPoolExecutor,
+    request,
+    request_id: str,
+    cache: Optional[ParseCache] = None,
+    source_path: Optional[str] = None,
+    deadline: Optional[float] = None,
+):
+    """Incrementally parse ``request`` in ``pool``, yielding DocumentParts.
+
+    Async counterpart of :func:`iter_read_request`. Cache hits are served from
+    the server process as a single part. Closing the generator early (client
+    went away) tells the worker to stop after its current page.
+    """
+    loop = asyncio.get_running_loop()
+    if cache is not None and not request.url:
+        cache_key = await loop.run_in_executor(
+            None, read_request_cache_key, request, source_path
+        )
+        cached = await loop.run_in_executor(None, cache.get, cache_key)
+        if cached is not None:
+            logger.info("Parse cache hit for %s", request.file_name)
+            yield DocumentPart(
+                content=cached.content, images=cached.images, metadata=cached.metadata
+            )
+            return
+
+    manager = await loop.run_in_executor(None, _get_stream_manager)
+    part_queue = await loop.run_in_executor(None, manager.Queue, _PART_QUEUE_SIZE)
+    cancelled = await loop.run_in_executor(None, manager.Event)
+    future = loop.run_in_executor(
+        pool,
+        _iter_parse_worker_task,
+        request.SerializeToString(),
+        request_id,
+        part_queue,
+        cancelled,
+        deadline,
+        source_path,
+    )
+    get = functools.partial(part_queue.get, timeout=_PART_QUEUE_POLL_SECONDS)
+    try:
+        while True:
+            try:
+                kind, part = await loop.run_in_executor(None, get)
+            except queue.Empty:
+                if future.done():
+                    break
+                continue
+            if kind == "end":
+                break
+            if kind == "metrics":
+                metrics.REGISTRY.merge_delta(part)
+                continue
+            yield part
+        # Surfaces worker exceptions.
+        await future
+    finally:
+        if not future.done():
+            _signal_cancelled(loop, cancelled)
@@ -13,15 +13,32 @@ The parsers extract content from documents and can split them into
 meaningful chunks for further processing and indexing.
 """
 
-from .doc_parser import DocParser
-from .docx2_parser import Docx2Parser
-from .excel_parser import ExcelParser
-from .image_parser import ImageParser
-from .markdown_parser import MarkdownParser
-from .parser import Parser
-from .pdf_parser import PDFParser
-from .registry import ParserEngineRegistry, registry
-from .web_parser import WebParser
+import importlib
+
+# Public name -> submodule. Imported on first attribute access so that
+# ``import docreader.parser`` does not pull in every parser backend.
+_LAZY_ATTRS = {
+    "DocParser": ".doc_parser",
+    "Docx2Parser": ".docx2_parser",
+    "ExcelParser": ".excel_parser",
+    "ImageParser": ".image_parser",
+    "MarkdownParser": ".markdown_parser",
+    "Parser": ".parser",
+    "PDFParser": ".pdf_parser",
+    "ParserEngineRegistry": ".registry",
+    "registry": ".registry",
+    "WebParser": ".web_parser",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 # Export public classes and modules
 __all__ = [
@@ -2,9 +2,10 @@
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional
 
-from docreader.models.document import Document
+from docreader.models.document import Document, DocumentPart
+from docreader.models.read_config import PageSelection
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -18,14 +19,29 @@ class BaseParser(ABC):
     and VLM caption are handled by the Go App module.
     """
 
+    # Parsers that can read the document straight from ``self.source_path``
+    # set this; ``Parser.parse_path`` then hands them a read-only mmap of the
+    # file as ``content`` instead of loading it into a bytes object.
+    accepts_source_path: bool = False
+    # Parsers that parse only ``self.page_selection`` (ReadConfig page ranges)
+    # and implement :meth:`page_count` set this; ``Parser`` rejects a page
+    # selection for every other parser.
+    accepts_page_selection: bool = False
+
     def __init__(
         self,
         file_name: str = "",
         file_type: Optional[str] = None,
+        source_path: Optional[str] = None,
+        page_selection: Optional[PageSelection] = None,
         **kwargs,
     ):
         self.file_name = file_name
         self.file_type = file_type or os.path.splitext(file_name)[1].lstrip(".")
+        # Path of a file holding exactly ``content`` (spooled uploads), if any.
+        self.source_path = source_path
+        # Pages to parse (None: all of them).
+        self.page_selection = page_selection
 
         logger.info(
             "Initializing parser for file=%s, type=%s",
@@ -33,14 +49,50 @@ class BaseParser(ABC):
             self.file_type,
         )
 
+    @classmethod
+    def supports_source_path(cls) -> bool:
+        return cls.accepts_source_path
+
+    @classmethod
+    def supports_page_selection(cls) -> bool:
+        return cls.accepts_page_selection
+
+    def page_count(self, content: bytes) -> int:
+        """Number of pages a page selection refers to (0: not paged)."""
+        return 0
+
+    def selected_pages(self, page_count: int) -> list:
+        """0-based indices to parse out of ``page_count`` pages."""
+        if self.page_selection is None:
+            return list(range(page_count))
+        return self.page_selection.indices(page_count)
+
     @abstractmethod
     def parse_into_text(self, content: bytes) -> Document:
         """Parse document content into markdown text.
 
         Returns:
             Document with ``content`` (markdown string) and optional
-            ``images`` dict mapping storage-relative paths to base64 data.
+            ``images`` dict mapping storage-relative paths to raw image bytes.
+        """
+
+    def iter_parse_into_text(self, content: bytes) -> Iterator[DocumentPart]:
+        """Incremental variant of :meth:`parse_into_text`.
+
+        Yields ``DocumentPart`` fragments in reading order as soon as each is
+        ready (e.g. page by page), so callers can stream output before the
+        whole document is parsed. Joining the fragments with blank lines gives
+        the same markdown as :meth:`parse_into_text`.
+
+        The default yields the whole document as a single part; parsers that
+        can produce output progressively override it.
         """
+        document = self.parse_into_text(content)
+        yield DocumentPart(
+            content=document.content,
+            images=document.images,
+            metadata=document.metadata,
+        )
 
     def parse(self, content: bytes) -> Document:
         """Parse document and return markdown + image references.
@@ -59,3 +111,16 @@ class BaseParser(ABC):
             self.file_name,
         )
         return document
+
+    def iter_parse(self, content: bytes) -> Iterator[DocumentPart]:
+        """Incremental counterpart of :meth:`parse`."""
+        logger.info(
+            "Incrementally parsing document with %s, bytes: %d",
+            self.__class__.__name__,
+            len(content),
+        )
+        chars = 0
+        for part in self.iter_parse_into_text(content):
+            chars += len(part.content)
+            yield part
+        logger.info("Extracted %d characters from %s", chars, self.file_name)
@@ -12,6 +12,7 @@ from typing import Dict, List, Tuple, Type
 from docreader.models.document import Document
 from docreader.parser.base_parser import BaseParser
 from docreader.utils import endecode
+from docreader.utils.cancel import ParseCancelled
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -39,12 +40,31 @@ class FirstParser(BaseParser):
         """Initialize FirstParser with configured parser classes."""
         super().__init__(*args, **kwargs)
 
-        # Instantiate all parser classes into parser instances
+        # Instantiate all parser classes into parser instances. A page
+        # selection is only honoured by some parsers: skip the others.
         self._parsers: List[BaseParser] = []
         for parser_cls in self._parser_cls:
+            if self.page_selection and not parser_cls.supports_page_selection():
+                continue
             parser = parser_cls(*args, **kwargs)
             self._parsers.append(parser)
 
+    @classmethod
+    def supports_source_path(cls) -> bool:
+        return bool(cls._parser_cls) and all(
+            p.supports_source_path() for p in cls._parser_cls
+        )
+
+    @classmethod
+    def supports_page_selection(cls) -> bool:
+        return any(p.supports_page_selection() for p in cls._parser_cls)
+
+    def page_count(self, content: bytes) -> int:
+        for p in self._parsers:
+            if p.supports_page_selection():
+                return p.page_count(content)
+        return 0
+
     def parse_into_text(self, content: bytes) -> Document:
         """Parse content using the first parser that succeeds.
 
@@ -59,6 +79,8 @@ class FirstParser(BaseParser):
             logger.info(f"FirstParser: using parser {p.__class__.__name__}")
             try:
                 document = p.parse_into_text(content)
+            except ParseCancelled:
+                raise
             except Exception:
                 logger.exception(
                     "FirstParser: parser %s raised exception; trying next parser",
@@ -113,12 +135,19 @@ class PipelineParser(BaseParser):
         """Initialize PipelineParser with configured parser classes."""
         super().__init__(*args, **kwargs)
 
-        # Instantiate all parser classes into parser instances
+        # Instantiate all parser classes into parser instances. Only the first
+        # stage sees the original file; later stages parse derived content.
         self._parsers: List[BaseParser] = []
-        for parser_cls in self._parser_cls:
+        for i, parser_cls in enumerate(self._parser_cls):
+            if i == 1:
+                kwargs.pop("source_path", None)
             parser = parser_cls(*args, **kwargs)
             self._parsers.append(parser)
 
+    @classmethod
+    def supports_source_path(cls) -> bool:
+        return bool(cls._parser_cls) and cls._parser_cls[0].supports_source_path()
+
     def parse_into_text(self, content: bytes) -> Document:
         """Parse content through a pipeline of parsers.
 
@@ -133,7 +162,7 @@ class PipelineParser(BaseParser):
                      with accumulated images from all stages
         """
         # Accumulate images and metadata from all parsers
-        images: Dict[str, str] = {}
+        images: Dict[str, bytes] = {}
         metadata: Dict = {}
         document = Document()
         for p in self._parsers:
@@ -1,7 +1,12 @@
 import logging
 import threading
+import time
 from contextlib import contextmanager
-from typing import Dict, Iterator
+from typing import Dict, Iterator, Optional
+
+from docreader.config import CONFIG
+from docreader.metrics import LIMITER_WAIT
+from docreader.utils.cancel import CANCEL_POLL_SECONDS, check_cancelled
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,24 @@ def _get_limiter(name: str, max_workers: int) -> threading.BoundedSemaphore:
         return limiter
 
 
+def select_mp_context():
+    """Pick the safest available multiprocessing start method.
+
+    ``forkserver`` forks workers from a clean, single-threaded server process,
+    avoiding the fork-in-a-multithreaded-process hazards of the gRPC server.
+    Falls back to ``fork`` and finally returns ``None`` (serial) when neither
+    is available (e.g. Windows/dev).
+    """
+    import multiprocessing as mp
+
+    for method in ("forkserver", "fork"):
+        try:
+            return mp.get_context(method)
+        except ValueError:
+            continue
+    return None
+
+
 @contextmanager
 def parser_worker_limit(name: str, max_workers: int) -> Iterator[None]:
     """Limit concurrent access to heavy, process-wide parser operations.
@@ -32,8 +55,217 @@ def parser_worker_limit(name: str, max_workers: int) -> Iterator[None]:
 
     limiter = _get_limiter(name, max_workers)
     logger.debug("Waiting for %s parser slot (max_workers=%d)", name, max_workers)
-    limiter.acquire()
+    start = time.perf_counter()
+    # A cancelled request gives up its place in the queue.
+    while not limiter.acquire(timeout=CANCEL_POLL_SECONDS):
+        check_cancelled()
+    LIMITER_WAIT.observe(time.perf_counter() - start, limiter=name)
     try:
         yield
     finally:
         limiter.release()
+
+
+def abort_process_pool(executor) -> None:
+    """Stop a per-request ProcessPoolExecutor now, killing busy workers.
+
+    Queued tasks are cancelled and running ones are terminated, so a
+    cancelled request does not keep cores busy until its pages finish.
+    """
+    # shutdown() drops the executor's process table: grab it first.
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        try:
+            process.terminate()
+        except Exception:
+            pass
+
+
+class _Cell:
+    """Stand-in for a shared ``multiprocessing`` value within one process."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+class CpuBudget:
+    """CPU tokens shared by every fan-out point of the service.
+
+    Render-pool jobs, DOCX page workers and ImageMagick / LibreOffice
+    subprocesses take tokens through :func:`cpu_lease` for the extra cores
+    they keep busy. Built on ``mp_context`` primitives the budget can be
+    handed to the parse-pool workers of the aio server, so the whole
+    container draws from it; otherwise it is local to the process.
+    """
+
+    def __init__(self, tokens: int, mp_context=None):
+        self.tokens = max(1, tokens)
+        if mp_context is None:
+            self._cond = threading.Condition()
+            self._free = _Cell(self.tokens)
+            self._waiting = _Cell(0)
+        else:
+            self._cond = mp_context.Condition()
+            self._free = mp_context.RawValue("i", self.tokens)
+            self._waiting = mp_context.RawValue("i", 0)
+
+    def acquire(self, n: int, name: str) -> None:
+        """Block until ``n`` tokens are free and take them."""
+        start = time.perf_counter()
+        with self._cond:
+            self._waiting.value += 1
+            try:
+                # A cancelled request gives up its place in the queue.
+                while self._free.value < n:
+                    self._cond.wait(CANCEL_POLL_SECONDS)
+                    check_cancelled()
+                self._free.value -= n
+            finally:
+                self._waiting.value -= 1
+        LIMITER_WAIT.observe(time.perf_counter() - start, limiter=f"cpu:{name}")
+
+    def try_acquire(self, n: int, yield_to_waiters: bool = True) -> int:
+        """Take up to ``n`` free tokens without blocking; returns how many.
+
+        Nothing is taken while others are blocked in :meth:`acquire`, unless
+        ``yield_to_waiters`` is false.
+        """
+        with self._cond:
+            if yield_to_waiters and self._waiting.value:
+                return 0
+            taken = max(0, min(n, self._free.value))
+            self._free.value -= taken
+            return taken
+
+    def release(self, n: int) -> None:
+        if n <= 0:
+            return
+        with self._cond:
+            self._free.value += n
+            self._cond.notify_all()
+
+    @property
+    def contended(self) -> bool:
+        """Whether someone is waiting for tokens."""
+        with self._cond:
+            return self._waiting.value > 0
+
+    @property
+    def free(self) -> int:
+        with self._cond:
+            return self._free.value
+
+
+_cpu_budget: Optional[CpuBudget] = None
+_cpu_budget_installed = False
+_cpu_budget_lock = threading.Lock()
+# Tokens held by the leases of the current thread (see cpu_lease).
+_thread_tokens = threading.local()
+
+
+def install_cpu_budget(budget: Optional[CpuBudget]) -> None:
+    """Use ``budget`` (None: no budget) instead of a process-local one."""
+    global _cpu_budget, _cpu_budget_installed
+    with _cpu_budget_lock:
+        _cpu_budget = budget
+        _cpu_budget_installed = True
+
+
+def get_cpu_budget() -> Optional[CpuBudget]:
+    """The installed budget, else one of ``CONFIG.cpu_tokens`` for this process."""
+    global _cpu_budget, _cpu_budget_installed
+    with _cpu_budget_lock:
+        if not _cpu_budget_installed:
+            if CONFIG.cpu_tokens > 0:
+                _cpu_budget = CpuBudget(CONFIG.cpu_tokens)
+            _cpu_budget_installed = True
+        return _cpu_budget
+
+
+def _held_by_thread() -> _Cell:
+    cell = getattr(_thread_tokens, "cell", None)
+    if cell is None:
+        cell = _thread_tokens.cell = _Cell(0)
+    return cell
+
+
+class CpuLease:
+    """Tokens held by one fan-out point; see :func:`cpu_lease`."""
+
+    def __init__(
+        self, budget: Optional[CpuBudget], name: str, want: int, minimum: int
+    ):
+        self.budget = budget
+        self.name = name
+        self.want = max(1, want)
+        self.minimum = minimum
+        self.held = 0 if budget is not None else self.want
+        # Tokens of the thread that took the lease, this lease's included.
+        self._owner = _held_by_thread()
+
+    def _floor(self) -> int:
+        # A thread already holding tokens elsewhere never blocks for more:
+        # nested fan-out (e.g. rendering queued during pass 1) would deadlock
+        # on a small budget.
+        return 0 if self._owner.value > self.held else self.minimum
+
+    def _take(self, n: int) -> None:
+        self.held += n
+        self._owner.value += n
+
+    def _give_back(self, n: int) -> None:
+        n = min(n, self.held)
+        self.budget.release(n)
+        self.held -= n
+        self._owner.value -= n
+
+    def acquire(self) -> None:
+        floor = min(self._floor(), self.budget.tokens)
+        if floor:
+            self.budget.acquire(floor, self.name)
+            self._take(floor)
+        self._take(self.budget.try_acquire(self.want - self.held))
+
+    def rebalance(self) -> int:
+        """Shrink to the minimum while others wait, else grow toward ``want``.
+
+        Returns the tokens now held: the parallelism to use until the next
+        call.
+        """
+        if self.budget is None:
+            return self.held
+        floor = self._floor()
+        if self.held < floor:
+            self._take(self.budget.try_acquire(floor - self.held, False))
+        if self.held > floor and self.budget.contended:
+            self._give_back(self.held - floor)
+        elif self.held < self.want:
+            self._take(self.budget.try_acquire(self.want - self.held))
+        return self.held
+
+    def release(self) -> None:
+        if self.budget is not None and self.held:
+            self._give_back(self.held)
+
+
+@contextmanager
+def cpu_lease(name: str, want: int, minimum: int = 1) -> Iterator[CpuLease]:
+    """Hold between ``minimum`` and ``want`` CPU tokens of the shared budget.
+
+    Blocks for ``minimum`` tokens (unless this thread already holds some),
+    then takes whatever else is free while nobody is waiting. ``lease.held``
+    is the parallelism to use; long-running fan-outs call
+    :meth:`CpuLease.rebalance` between units of work so they shrink when the
+    node gets busy and grow back when it idles. Without a budget
+    (``DOCREADER_CPU_TOKENS=0``) the lease always holds ``want``.
+    """
+    lease = CpuLease(get_cpu_budget(), name, want, minimum)
+    if lease.budget is not None:
+        lease.acquire()
+    try:
+        yield lease
+    finally:
+        lease.release()
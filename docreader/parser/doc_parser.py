@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import os
 import subprocess
@@ -10,6 +11,7 @@ import textract
 
 from docreader.config import CONFIG
 from docreader.models.document import Document
+from docreader.parser.concurrency import cpu_lease
 from docreader.parser.docx2_parser import Docx2Parser
 from docreader.utils.tempfile import TempDirContext, TempFileContext
 
@@ -100,7 +102,11 @@ class DocParser(Docx2Parser):
 
     def __init__(self, *args, **kwargs):
         """Initialize DOC parser with sandbox executor"""
+        # The chained DOCX parsers parse the converted document, never the
+        # original .doc file, so they must not see its path.
+        source_path = kwargs.pop("source_path", None)
         super().__init__(*args, **kwargs)
+        self.source_path = source_path
         self.sandbox_executor = SandboxExecutor()
 
     def parse_into_text(self, content: bytes) -> Document:
@@ -117,8 +123,12 @@ class DocParser(Docx2Parser):
             # self._parse_with_textract,
         ]
 
-        # Save byte content as a temporary file
-        with TempFileContext(content, ".doc") as temp_file_path:
+        # Save byte content as a temporary file (spooled uploads already are one)
+        if self.source_path:
+            file_context = contextlib.nullcontext(self.source_path)
+        else:
+            file_context = TempFileContext(content, ".doc")
+        with file_context as temp_file_path:
             for handle in handle_chain:
                 try:
                     document = handle(temp_file_path)
@@ -217,9 +227,10 @@ class DocParser(Docx2Parser):
                 )
 
                 # Execute in sandbox with proxy configuration
-                stdout, stderr, returncode = self.sandbox_executor.execute_in_sandbox(
-                    cmd
-                )
+                with cpu_lease("soffice", 1):
+                    stdout, stderr, returncode = (
+                        self.sandbox_executor.execute_in_sandbox(cmd)
+                    )
 
                 if returncode != 0:
                     logger.warning(
@@ -5,7 +5,8 @@ import tempfile
 import threading
 import time
 import traceback
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 from io import BytesIO
 from multiprocessing import Manager
@@ -43,8 +44,11 @@ from PIL import Image
 
 from docreader.config import CONFIG
 from docreader.models.document import Document as DocumentModel
+from docreader.models.read_config import PageSelection
 from docreader.parser.base_parser import BaseParser
+from docreader.parser.concurrency import abort_process_pool, cpu_lease
 from docreader.utils import endecode
+from docreader.utils.cancel import CANCEL_POLL_SECONDS, ParseCancelled, check_cancelled
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +79,9 @@ class LineData:
 class DocxParser(BaseParser):
     """DOCX document parser"""
 
+    accepts_source_path = True
+    accepts_page_selection = True
+
     def __init__(
         self,
         max_pages: Optional[int] = None,  # Maximum number of pages to process
@@ -101,6 +108,10 @@ class DocxParser(BaseParser):
             self.max_pages = 100000  # no limit (matches Docx.__call__ default)
         logger.info(f"DocxParser initialized with max_pages={self.max_pages}")
 
+    def page_count(self, content: bytes) -> int:
+        """Pages as numbered by page selections (after the max_pages limit)."""
+        return Docx().count_pages(self.source_path or content, self.max_pages)
+
     def parse_into_text(self, content: bytes) -> DocumentModel:
         """Parse DOCX document, extract text content and image Markdown links"""
         logger.info(f"Parsing DOCX document, content size: {len(content)} bytes")
@@ -114,15 +125,14 @@ class DocxParser(BaseParser):
         logger.info(f"Setting max_workers to {max_workers} for document processing")
 
         try:
-            inline_images: Dict[str, str] = {}
+            inline_images: Dict[str, bytes] = {}
 
             def _inline_upload(local_path: str) -> str:
-                """Read temp image file, base64-encode, and return a ref path.
+                """Read temp image file into Document.images, return its ref path.
 
                 The Go-side ImageResolver (or main.py _resolve_images) handles
                 actual storage upload from Document.images.
                 """
-                import base64
                 import uuid as _uuid
 
                 try:
@@ -130,7 +140,7 @@ class DocxParser(BaseParser):
                         raw = f.read()
                     ext = os.path.splitext(local_path)[1].lower() or ".png"
                     ref = f"images/{_uuid.uuid4().hex}{ext}"
-                    inline_images[ref] = base64.b64encode(raw).decode()
+                    inline_images[ref] = raw
                     return ref
                 except Exception as exc:
                     logger.warning("Failed to read temp image %s: %s", local_path, exc)
@@ -146,6 +156,8 @@ class DocxParser(BaseParser):
                 binary=content,
                 max_workers=max_workers,
                 to_page=self.max_pages,
+                source_path=self.source_path,
+                page_selection=self.page_selection,
             )
             processing_time = time.time() - start_time
             logger.info(
@@ -157,7 +169,7 @@ class DocxParser(BaseParser):
             section_start_time = time.time()
 
             text_parts = []
-            image_parts: Dict[str, str] = {}
+            image_parts: Dict[str, bytes] = {}
 
             for sec_idx, line in enumerate(all_lines):
                 try:
@@ -172,7 +184,7 @@ class DocxParser(BaseParser):
                     if line.images:
                         for image_data in line.images:
                             if image_data.url and image_data.object:
-                                image_parts[image_data.url] = endecode.decode_image(
+                                image_parts[image_data.url] = endecode.image_to_bytes(
                                     image_data.object
                                 )
                                 image_data.object.close()
@@ -189,6 +201,18 @@ class DocxParser(BaseParser):
             logger.info("Combining all text parts")
             text = "\n\n".join([part for part in text_parts if part])
 
+            image_parts.update(inline_images)
+            metadata = {}
+            if self.page_selection is not None:
+                metadata = {
+                    "page_count": docx_processor.page_count,
+                    "selected_pages": self.page_selection.describe(),
+                }
+                # The simplified method cannot honour a page selection; the
+                # selected pages may simply hold no text.
+                if not text:
+                    return DocumentModel(images=image_parts, metadata=metadata)
+
             # Check if the generated text is empty
             if not text:
                 logger.warning("Generated text is empty, trying alternative method")
@@ -200,11 +224,14 @@ class DocxParser(BaseParser):
                 f"generated {len(text)} characters of text"
             )
 
-            image_parts.update(inline_images)
-            return DocumentModel(content=text, images=image_parts)
+            return DocumentModel(content=text, images=image_parts, metadata=metadata)
+        except ParseCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error parsing DOCX document: {str(e)}")
             logger.error(f"Detailed stack trace: {traceback.format_exc()}")
+            if self.page_selection is not None:
+                raise
             return self._parse_using_simple_method(content)
 
     def _parse_using_simple_method(self, content: bytes) -> DocumentModel:
@@ -298,6 +325,9 @@ class Docx:
         self.picture_cache = {}
         self.enable_multimodal = enable_multimodal
         self.upload_file = upload_file
+        self.source_path = None
+        # Pages within the to_page limit, set by __call__.
+        self.page_count = 0
 
     def get_picture(self, document, paragraph) -> Optional[Image.Image]:
         logger.info("Extracting image from paragraph")
@@ -481,6 +511,8 @@ class Docx:
         from_page: int = 0,
         to_page: int = 100000,
         max_workers: Optional[int] = None,
+        source_path: Optional[str] = None,
+        page_selection: Optional[PageSelection] = None,
     ) -> Tuple[List[LineData], List[Any]]:
         """
         Process DOCX document, supporting concurrent processing of each page
@@ -490,6 +522,9 @@ class Docx:
             from_page: Starting page number
             to_page: Ending page number
             max_workers: Maximum number of workers, default to None (system decides)
+            source_path: File holding ``binary``; when given the document is
+                loaded from it and shared with worker processes as-is
+            page_selection: Pages to process, numbered in page-mapping order
 
         Returns:
             tuple: (List of LineData objects with document content, List of tables)
@@ -501,7 +536,8 @@ class Docx:
         logger.info(f"System has {cpu_count} CPU cores available")
 
         # Load document
-        self.doc = self._load_document(binary)
+        self.source_path = source_path
+        self.doc = self._load_document(source_path or binary)
         if not self.doc:
             return [], []
 
@@ -515,6 +551,12 @@ class Docx:
         pages_to_process = self._apply_page_limit(
             self.para_page_mapping, from_page, to_page
         )
+        self.page_count = len(pages_to_process)
+        if page_selection is not None:
+            wanted = set(page_selection.indices(self.page_count))
+            pages_to_process = [
+                page for pos, page in enumerate(pages_to_process) if pos in wanted
+            ]
         if not pages_to_process:
             logger.warning("No pages to process after applying page limits!")
             return [], []
@@ -543,17 +585,28 @@ class Docx:
         )
         return self.all_lines, tbls
 
+    def count_pages(self, binary, max_page: int = 100000) -> int:
+        """Number of pages ``__call__`` would process with ``to_page=max_page``."""
+        self.doc = self._load_document(binary)
+        if not self.doc:
+            return 0
+        try:
+            mapping = self._identify_page_paragraph_mapping(max_page)
+            return len(self._apply_page_limit(mapping, 0, max_page))
+        finally:
+            self.doc = None
+
     def _load_document(self, binary):
         """Load document
 
         Args:
-            binary: Document binary content
+            binary: Document binary content, or a path to the document
 
         Returns:
             Document: Document object, or None (if loading fails)
         """
         try:
-            doc = Document(BytesIO(binary))
+            doc = Document(binary if isinstance(binary, str) else BytesIO(binary))
             logger.info("Successfully loaded document from binary content")
             return doc
         except Exception as e:
@@ -671,11 +724,12 @@ class Docx:
             temp_file_path,
         )
 
-        # Execute multiprocess tasks
-        self._execute_multiprocess_tasks(args_list, max_workers)
-
-        # Clean up temporary file
-        self._cleanup_temp_file(temp_file_path)
+        try:
+            # Execute multiprocess tasks
+            self._execute_multiprocess_tasks(args_list, max_workers)
+        finally:
+            # Clean up temporary file
+            self._cleanup_temp_file(temp_file_path)
 
     def _check_document_has_images(self):
         """Check if the document contains images
@@ -721,6 +775,8 @@ class Docx:
         Returns:
             str: Temporary file path, or None if not using
         """
+        if self.source_path:
+            return self.source_path
 
         temp_file = tempfile.NamedTemporaryFile(delete=False)
         temp_file_path = temp_file.name
@@ -783,30 +839,57 @@ class Docx:
 
             # Use ProcessPoolExecutor to truly implement multi-core parallelization
             batch_start_time = time.time()
-            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            with cpu_lease("docx", max_workers) as lease, ProcessPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
                 logger.info(f"Started ProcessPoolExecutor with {max_workers} workers")
 
-                # Submit all tasks
-                future_to_idx = {
-                    executor.submit(process_page_multiprocess, *args): i
-                    for i, args in enumerate(args_list)
-                }
+                # Pages are submitted as CPU tokens allow: as many running at
+                # once as the lease holds (at least one), rebalanced per page.
+                future_to_idx = {}
+                queued = deque(range(len(args_list)))
+
+                def submit_more():
+                    submitted = set()
+                    running = sum(not f.done() for f in future_to_idx)
+                    limit = max(1, lease.rebalance())
+                    while queued and running < limit:
+                        idx = queued.popleft()
+                        future = executor.submit(
+                            process_page_multiprocess, *args_list[idx]
+                        )
+                        future_to_idx[future] = idx
+                        submitted.add(future)
+                        running += 1
+                    return submitted
+
+                submit_more()
                 logger.info(
-                    f"Submitted {len(future_to_idx)} processing tasks to process pool"
+                    f"Submitted {len(future_to_idx)}/{len(args_list)} processing "
+                    f"tasks to process pool ({lease.held} CPU tokens)"
                 )
 
                 # Collect results
-                self._collect_process_results(
-                    future_to_idx, args_list, batch_start_time
-                )
+                try:
+                    self._collect_process_results(
+                        future_to_idx, args_list, batch_start_time, submit_more
+                    )
+                except ParseCancelled:
+                    logger.info("Request cancelled, stopping page workers")
+                    abort_process_pool(executor)
+                    raise
 
-    def _collect_process_results(self, future_to_idx, args_list, batch_start_time):
+    def _collect_process_results(
+        self, future_to_idx, args_list, batch_start_time, submit_more=None
+    ):
         """Collect multiprocess processing results
 
         Args:
             future_to_idx: Mapping of Future to index
             args_list: List of arguments
             batch_start_time: Batch start time
+            submit_more: Optional callable submitting further pages (adding
+                them to future_to_idx) and returning their futures
 
         Returns:
             List[LineData]: Processed results as LineData objects
@@ -816,39 +899,48 @@ class Docx:
         results = []
         temp_img_paths = set()  # Collect all temporary image paths
 
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            page_num = args_list[idx][0]
-            try:
-                page_lines = future.result()
-
-                # Collect temporary image paths for later cleanup
-                for line in page_lines:
-                    for image_data in line.images:
-                        if image_data.local_path and image_data.local_path.startswith(
-                            "/tmp/docx_img_"
-                        ):
-                            temp_img_paths.add(image_data.local_path)
+        pending = set(future_to_idx)
+        while pending:
+            # Checked between pages and while waiting for slow ones.
+            check_cancelled()
+            done, pending = wait(
+                pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED
+            )
+            if submit_more is not None:
+                pending |= submit_more()
+            for future in done:
+                idx = future_to_idx[future]
+                page_num = args_list[idx][0]
+                try:
+                    page_lines = future.result()
 
-                results.extend(page_lines)
-                completed_count += 1
+                    # Collect temporary image paths for later cleanup
+                    for line in page_lines:
+                        for image_data in line.images:
+                            if image_data.local_path and image_data.local_path.startswith(
+                                "/tmp/docx_img_"
+                            ):
+                                temp_img_paths.add(image_data.local_path)
+
+                    results.extend(page_lines)
+                    completed_count += 1
+
+                    if completed_count % max(
+                        1, len(args_list) // 10
+                    ) == 0 or completed_count == len(args_list):
+                        elapsed_ms = int((time.time() - batch_start_time) * 1000)
+                        progress_pct = int((completed_count / len(args_list)) * 100)
+                        logger.info(
+                            f"Progress: {completed_count}/{len(args_list)} pages processed "
+                            f"({progress_pct}%, elapsed: {elapsed_ms}ms)"
+                        )
 
-                if completed_count % max(
-                    1, len(args_list) // 10
-                ) == 0 or completed_count == len(args_list):
-                    elapsed_ms = int((time.time() - batch_start_time) * 1000)
-                    progress_pct = int((completed_count / len(args_list)) * 100)
-                    logger.info(
-                        f"Progress: {completed_count}/{len(args_list)} pages processed "
-                        f"({progress_pct}%, elapsed: {elapsed_ms}ms)"
+                except Exception as e:
+                    logger.error(f"Error processing page {page_num}: {str(e)}")
+                    logger.error(
+                        f"Detailed traceback for page {page_num}: {traceback.format_exc()}"
                     )
 
-            except Exception as e:
-                logger.error(f"Error processing page {page_num}: {str(e)}")
-                logger.error(
-                    f"Detailed traceback for page {page_num}: {traceback.format_exc()}"
-                )
-
         # Process completion
         processing_elapsed_ms = int((time.time() - batch_start_time) * 1000)
         logger.info(f"All processing completed in {processing_elapsed_ms}ms")
@@ -1020,6 +1112,8 @@ class Docx:
         Args:
             temp_file_path: Temporary file path
         """
+        if temp_file_path == self.source_path:
+            return  # owned by the caller
         if temp_file_path and os.path.exists(temp_file_path):
             try:
                 os.unlink(temp_file_path)
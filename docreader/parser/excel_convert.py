@@ -10,6 +10,8 @@ import time
 from pathlib import Path
 from typing import Optional
 
+from docreader.parser.concurrency import cpu_lease
+
 logger = logging.getLogger(__name__)
 
 _XLS_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
@@ -71,7 +73,8 @@ def convert_excel_to_xlsx_bytes(content: bytes, suffix: str = ".xlsx") -> bytes
                 src,
             ]
             try:
-                result = subprocess.run(cmd, capture_output=True, timeout=120)
+                with cpu_lease("soffice", 1):
+                    result = subprocess.run(cmd, capture_output=True, timeout=120)
             except (OSError, subprocess.TimeoutExpired) as exc:
                 logger.warning("LibreOffice convert failed to start: %s", exc)
                 return None
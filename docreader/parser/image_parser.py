@@ -1,4 +1,3 @@
-import base64
 import logging
 import os
 
@@ -23,6 +22,6 @@ class ImageParser(BaseParser):
         ref_path = f"images/{self.file_name}"
 
         text = f"![{self.file_name}]({ref_path})"
-        images = {ref_path: base64.b64encode(content).decode()}
+        images = {ref_path: content}
 
         return Document(content=text, images=images)
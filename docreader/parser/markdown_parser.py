@@ -11,7 +11,6 @@ The parser uses a pipeline approach to process Markdown content through
 multiple stages: table formatting -> image processing.
 """
 
-import base64
 import logging
 import os
 import re
@@ -429,9 +428,7 @@ class MarkdownImageBase64(BaseParser):
         text = endecode.decode_bytes(content)
         text, img_b64 = self.image_helper.extract_base64(text, path_prefix="images")
 
-        images: Dict[str, str] = {}
-        for ipath, raw_bytes in img_b64.items():
-            images[ipath] = base64.b64encode(raw_bytes).decode()
+        images: Dict[str, bytes] = dict(img_b64)
 
         logger.debug("Extracted %d base64 images from markdown", len(images))
         return Document(content=text, images=images)
@@ -1,5 +1,6 @@
 import io
 import logging
+import threading
 
 from markitdown import MarkItDown
 
@@ -17,6 +18,22 @@ from docreader.parser.pptx_media import (
 
 logger = logging.getLogger(__name__)
 
+_markitdown = None
+_markitdown_lock = threading.Lock()
+
+
+def _shared_markitdown() -> MarkItDown:
+    """Return the process-wide MarkItDown instance.
+
+    Building one registers every converter (tens of ms), which dominated
+    parsing small files; ``convert`` keeps no per-call state, so it is shared.
+    """
+    global _markitdown
+    with _markitdown_lock:
+        if _markitdown is None:
+            _markitdown = MarkItDown()
+        return _markitdown
+
 
 class StdMarkitdownParser(BaseParser):
     """
@@ -26,10 +43,12 @@ class StdMarkitdownParser(BaseParser):
     (docx, pptx, pdf, etc.) into text/markdown.
     """
 
+    accepts_source_path = True
+
     def __init__(self, *args, **kwargs):
         # 这里的 super() 会调用 BaseParser 的初始化，确保 self.file_type 被正确赋值
         super().__init__(*args, **kwargs)
-        self.markitdown = MarkItDown()
+        self.markitdown = _shared_markitdown()
 
     def parse_into_text(self, content: bytes) -> Document:
         """
@@ -40,7 +59,7 @@ class StdMarkitdownParser(BaseParser):
         ft = (ext or "").lstrip(".").lower()
         pptx_bytes: bytes | None = None
         if ft in ("ppt", "pptx"):
-            content, ext = normalize_ppt_bytes(content, ft)
+            content, ext = normalize_ppt_bytes(bytes(content), ft)
             pptx_bytes = content
             ft = "pptx"
         elif ext and not ext.startswith("."):
@@ -56,13 +75,20 @@ class StdMarkitdownParser(BaseParser):
                 result = self._convert_markitdown(content, ext, keep_data_uris=False)
 
         text = result.text_content
-        images: dict[str, str] = {}
+        images: dict[str, bytes] = {}
         if pptx_bytes is not None and markdown_needs_pptx_media_attach(text):
             text, images = attach_pptx_media_to_markdown(text, pptx_bytes)
         return Document(content=text, images=images)
 
     def _convert_markitdown(self, content: bytes, ext: str | None, *, keep_data_uris: bool):
         try:
+            if self.source_path and ext not in (".ppt", ".pptx"):
+                # Spooled upload: let MarkItDown read the file instead of a
+                # BytesIO copy of the whole document.
+                with open(self.source_path, "rb") as f:
+                    return self.markitdown.convert(
+                        f, file_extension=ext, keep_data_uris=keep_data_uris
+                    )
             return self.markitdown.convert(
                 io.BytesIO(content),
                 file_extension=ext,
@@ -10,7 +10,6 @@ Hybrid mode (``docling-fast``, etc.) needs a running
 
 from __future__ import annotations
 
-import base64
 import html
 import logging
 import os
@@ -159,9 +158,9 @@ def _canonical_image_ref(abs_path: str, output_dir: str) -> str:
     return f"images/{name}"
 
 
-def _collect_images_under_output(output_dir: str) -> Dict[str, str]:
+def _collect_images_under_output(output_dir: str) -> Dict[str, bytes]:
     """Collect every extracted image under the convert output tree."""
-    images: Dict[str, str] = {}
+    images: Dict[str, bytes] = {}
     for root, _, files in os.walk(output_dir):
         for name in files:
             if not name.lower().endswith(_IMAGE_SUFFIXES):
@@ -171,7 +170,7 @@ def _collect_images_under_output(output_dir: str) -> Dict[str, str]:
             if ref in images:
                 continue
             with open(abs_path, "rb") as f:
-                images[ref] = base64.b64encode(f.read()).decode("utf-8")
+                images[ref] = f.read()
     return images
 
 
@@ -181,7 +180,7 @@ def _register_image_alias(aliases: Dict[str, str], alias: str, canonical: str) -
         aliases[key] = canonical
 
 
-def _build_path_alias_map(images: Dict[str, str]) -> Dict[str, str]:
+def _build_path_alias_map(images: Dict[str, bytes]) -> Dict[str, str]:
     """Map ODL markdown spellings (angle brackets, entities, basenames) to dict keys."""
     aliases: Dict[str, str] = {}
     for ref in images:
@@ -228,7 +227,7 @@ def _resolve_image_ref(url: str, aliases: Dict[str, str]) -> Optional[str]:
 
 
 def _rewrite_markdown_image_refs(
-    markdown: str, images: Dict[str, str]
+    markdown: str, images: Dict[str, bytes]
 ) -> str:
     if not images:
         return markdown
@@ -282,6 +281,8 @@ def _run_convert(
 class OpenDataLoaderParser(BaseParser):
     """Parse PDFs with OpenDataLoader (layout-aware markdown + external images)."""
 
+    accepts_source_path = True
+
     def __init__(self, *args: Any, **kwargs: Any):
         self._engine_overrides: Dict[str, Any] = {
             k: v
@@ -304,8 +305,11 @@ class OpenDataLoaderParser(BaseParser):
         with parser_worker_limit("opendataloader", max_workers):
             with tempfile.TemporaryDirectory(prefix="weknora-odl-") as tmp_dir:
                 pdf_path = os.path.join(tmp_dir, safe_name)
-                with open(pdf_path, "wb") as f:
-                    f.write(content)
+                if self.source_path:
+                    shutil.copyfile(self.source_path, pdf_path)
+                else:
+                    with open(pdf_path, "wb") as f:
+                        f.write(content)
                 image_dir = os.path.join(tmp_dir, "images")
                 os.makedirs(image_dir, exist_ok=True)
 
@@ -332,7 +336,9 @@ class OpenDataLoaderParser(BaseParser):
             from docreader.parser.pdf_parser import PDFScannedParser
 
             return PDFScannedParser(
-                file_name=self.file_name, file_type=self.file_type
+                file_name=self.file_name,
+                file_type=self.file_type,
+                source_path=self.source_path,
             ).parse_into_text(content)
 
         logger.info(
@@ -1,9 +1,14 @@
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Iterator, Optional
 
-from docreader.models.document import Document
+from docreader import metrics
+from docreader.models.document import Document, DocumentPart
+from docreader.models.read_config import PageSelection
+from docreader.parse_cache import get_parse_cache, parse_cache_key
 from docreader.parser.registry import registry
-from docreader.parser.web_parser import WebParser
+from docreader.utils.cancel import ParseCancelled
+from docreader.utils.tempfile import mapped_file
 
 logger = logging.getLogger(__name__)
 
@@ -15,8 +20,11 @@ class Parser:
     No chunking, no storage, no OCR, no VLM.
     """
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.registry = registry
+        # The aio parse-pool workers pass use_cache=False: the server process
+        # consults the cache before dispatching to them.
+        self.cache = get_parse_cache() if use_cache else None
         logger.info(
             "Parser initialized with engines: %s",
             ", ".join(self.registry.get_engine_names()),
@@ -29,8 +37,15 @@ class Parser:
         content: bytes,
         parser_engine: Optional[str] = None,
         engine_overrides: Optional[dict[str, Any]] = None,
+        source_path: Optional[str] = None,
+        page_selection: Optional[PageSelection] = None,
     ) -> Document:
-        """Parse file content to markdown."""
+        """Parse file content to markdown.
+
+        ``source_path`` names a file holding exactly ``content`` (see
+        :meth:`parse_path`). ``page_selection`` restricts paged formats to
+        some pages; other parsers reject it.
+        """
         engine = parser_engine or ""
         overrides = engine_overrides or {}
         logger.info(
@@ -40,28 +55,221 @@ class Parser:
             engine or "builtin",
         )
 
+        cache_key = None
+        if self.cache is not None:
+            cache_key = parse_cache_key(
+                file_name, file_type, content, engine, overrides, page_selection
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    "Parse cache hit for %s, content length=%d",
+                    file_name,
+                    len(cached.content),
+                )
+                return cached
+
         cls = self.registry.get_parser_class(engine, file_type)
+        metrics.BYTES_IN.inc(len(content), file_type=file_type.lower())
         logger.info(
             "Creating %s parser instance for %s file",
             cls.__name__,
             file_type,
         )
-        parser = cls(
-            file_name=file_name,
-            file_type=file_type,
-            **overrides,
+        parser, content = self._create_parser(
+            cls, file_name, file_type, content, overrides, source_path, page_selection
         )
 
         logger.info("Starting to parse file content, size: %d bytes", len(content))
-        result = parser.parse(content)
+        labels = {
+            "engine": self.registry.resolve_engine_name(engine, file_type),
+            "file_type": file_type.lower(),
+        }
+        start = time.perf_counter()
+        try:
+            result = parser.parse(content)
+        except ParseCancelled:
+            metrics.PARSE_CANCELLED.inc(**labels)
+            raise
+        except Exception:
+            metrics.PARSE_ERRORS.inc(**labels)
+            raise
+        metrics.PARSE_DURATION.observe(time.perf_counter() - start, **labels)
+        _record_output(file_type.lower(), result)
 
         if not result.content:
             logger.warning("Parser returned empty content for file: %s", file_name)
         logger.info(
             "Parsed file %s, content length=%d", file_name, len(result.content)
         )
+        if cache_key is not None:
+            self.cache.put(cache_key, result)
         return result
 
+    def iter_parse_file(
+        self,
+        file_name: str,
+        file_type: str,
+        content: bytes,
+        parser_engine: Optional[str] = None,
+        engine_overrides: Optional[dict[str, Any]] = None,
+        source_path: Optional[str] = None,
+        page_selection: Optional[PageSelection] = None,
+    ) -> Iterator[DocumentPart]:
+        """Parse file content incrementally, yielding parts in reading order.
+
+        Cache hits are served as a single part. Misses are not written back:
+        holding every part until the end would defeat the bounded memory this
+        path exists for.
+        """
+        engine = parser_engine or ""
+        overrides = engine_overrides or {}
+        logger.info(
+            "Incrementally parsing file: %s, type: %s, engine: %s",
+            file_name,
+            file_type,
+            engine or "builtin",
+        )
+
+        if self.cache is not None:
+            cache_key = parse_cache_key(
+                file_name, file_type, content, engine, overrides, page_selection
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("Parse cache hit for %s", file_name)
+                yield DocumentPart(
+                    content=cached.content,
+                    images=cached.images,
+                    metadata=cached.metadata,
+                )
+                return
+
+        cls = self.registry.get_parser_class(engine, file_type)
+        metrics.BYTES_IN.inc(len(content), file_type=file_type.lower())
+        parser, content = self._create_parser(
+            cls, file_name, file_type, content, overrides, source_path, page_selection
+        )
+        labels = {
+            "engine": self.registry.resolve_engine_name(engine, file_type),
+            "file_type": file_type.lower(),
+        }
+        # Time spent yielding to the consumer is excluded from the histogram.
+        elapsed = 0.0
+        parts = parser.iter_parse(content)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    part = next(parts)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    break
+                except ParseCancelled:
+                    metrics.PARSE_CANCELLED.inc(**labels)
+                    raise
+                except Exception:
+                    metrics.PARSE_ERRORS.inc(**labels)
+                    raise
+                elapsed += time.perf_counter() - start
+                _record_output(file_type.lower(), part)
+                yield part
+        finally:
+            parts.close()
+        metrics.PARSE_DURATION.observe(elapsed, **labels)
+
+    def parse_path(
+        self,
+        file_name: str,
+        file_type: str,
+        path: str,
+        parser_engine: Optional[str] = None,
+        engine_overrides: Optional[dict[str, Any]] = None,
+        page_selection: Optional[PageSelection] = None,
+    ) -> Document:
+        """Parse a document stored on disk (e.g. a spooled upload).
+
+        Parsers that support it read the file directly and receive a read-only
+        mmap as ``content``; the others get the file's bytes. Either way the
+        document is never held twice in memory.
+        """
+        with mapped_file(path) as content:
+            return self.parse_file(
+                file_name,
+                file_type,
+                content,
+                parser_engine=parser_engine,
+                engine_overrides=engine_overrides,
+                source_path=path,
+                page_selection=page_selection,
+            )
+
+    def iter_parse_path(
+        self,
+        file_name: str,
+        file_type: str,
+        path: str,
+        parser_engine: Optional[str] = None,
+        engine_overrides: Optional[dict[str, Any]] = None,
+        page_selection: Optional[PageSelection] = None,
+    ) -> Iterator[DocumentPart]:
+        """Incremental counterpart of :meth:`parse_path`."""
+        with mapped_file(path) as content:
+            yield from self.iter_parse_file(
+                file_name,
+                file_type,
+                content,
+                parser_engine=parser_engine,
+                engine_overrides=engine_overrides,
+                source_path=path,
+                page_selection=page_selection,
+            )
+
+    def inspect(
+        self,
+        file_name: str,
+        file_type: str,
+        content: bytes,
+        parser_engine: Optional[str] = None,
+        source_path: Optional[str] = None,
+    ) -> dict:
+        """Cheap facts about a file, without parsing it.
+
+        Returns ``page_count`` (0 when the parser has no page selection) and
+        ``supports_page_selection``.
+        """
+        cls = self.registry.get_parser_class(parser_engine or "", file_type)
+        if not cls.supports_page_selection():
+            return {"page_count": 0, "supports_page_selection": False}
+        parser, content = self._create_parser(
+            cls, file_name, file_type, content, {}, source_path
+        )
+        return {
+            "page_count": parser.page_count(content),
+            "supports_page_selection": True,
+        }
+
+    @staticmethod
+    def _create_parser(
+        cls, file_name, file_type, content, overrides, source_path, page_selection=None
+    ):
+        """Instantiate ``cls``, returning (parser, content to feed it)."""
+        kwargs = dict(overrides)
+        if page_selection is not None:
+            if not cls.supports_page_selection():
+                raise ValueError(
+                    f"{cls.__name__} does not support page selection "
+                    f"(file type {file_type})"
+                )
+            kwargs["page_selection"] = page_selection
+        if source_path:
+            if cls.supports_source_path():
+                kwargs["source_path"] = source_path
+            elif not isinstance(content, bytes):
+                content = content[:]
+        parser = cls(file_name=file_name, file_type=file_type, **kwargs)
+        return parser, content
+
     def parse_url(
         self,
         url: str,
@@ -72,6 +280,8 @@ class Parser:
         """Parse content from a URL to markdown."""
         logger.info("Parsing URL: %s, title: %s", url, title)
 
+        from docreader.parser.web_parser import WebParser
+
         parser = WebParser(title=title)
         logger.info("Starting to parse URL content")
         result = parser.parse(url.encode())
@@ -80,3 +290,17 @@ class Parser:
             logger.warning("Parser returned empty content for url: %s", url)
         logger.info("Parsed url %s, content length=%d", url, len(result.content))
         return result
+
+
+def _record_output(file_type: str, result) -> None:
+    """Count the markdown / image bytes of a Document or DocumentPart."""
+    metrics.BYTES_OUT.inc(
+        len(result.content.encode("utf-8")), file_type=file_type, kind="markdown"
+    )
+    if result.images:
+        metrics.IMAGES_EMITTED.inc(len(result.images), file_type=file_type)
+        metrics.BYTES_OUT.inc(
+            sum(len(data) for data in result.images.values()),
+            file_type=file_type,
+            kind="image",
+        )
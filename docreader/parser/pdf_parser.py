@@ -16,17 +16,44 @@ No external services (e.g. MinerU) are required: the builtin engine is fully
 self-sufficient using pypdfium2 + the Go-side OCR that already exists.
 """
 
-import base64
+import array
+import contextlib
+import ctypes
+import functools
+import hashlib
 import io
 import logging
 import os
 import re
 import statistics
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator
+
+import numpy as np
 
 from docreader.config import CONFIG
-from docreader.models.document import Document
+from docreader.metrics import PDF_PAGES, PDF_STAGE_DURATION
+from docreader.models.document import Document, DocumentPart, merge_document_parts
+from docreader.page_cache import get_page_cache
 from docreader.parser.base_parser import BaseParser
-from docreader.parser.concurrency import parser_worker_limit
+from docreader.parser.concurrency import (
+    abort_process_pool,
+    cpu_lease,
+    parser_worker_limit,
+    select_mp_context,
+)
+from docreader.utils.cancel import (
+    CANCEL_POLL_SECONDS,
+    ParseCancelled,
+    check_cancelled,
+)
+from docreader.utils.timing import StageTimer
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +111,32 @@ EMBED_REPEAT_PAGE_FRAC = _env_float("DOCREADER_PDF_EMBED_REPEAT_PAGE_FRAC", 0.5)
 # Hard cap on the number of embedded images extracted per document.
 EMBED_MAX_IMAGES = _env_int("DOCREADER_PDF_EMBED_MAX_IMAGES", 50)
 
+# --- Scanned page images --------------------------------------------------
+# A scanned page that is just one upright full-page image (typical scanner
+# output, possibly under an invisible OCR text layer) is emitted from that
+# image directly -- its JPEG stream or native bitmap -- instead of rendering
+# the page; only images larger than ``pdf_render_max_edge`` are scaled down.
+# Switched by ``CONFIG.pdf_direct_page_images``, which the parse cache keys on.
+# Allowed offset of each image edge from the page box, as a share of the page.
+_PAGE_IMAGE_EDGE_TOLERANCE = 0.02
+# With ``CONFIG.pdf_adaptive_render``, scanned pages that are rendered are
+# first probed at a low resolution: pages without colour are encoded as
+# grayscale JPEGs, and pages with little ink (cover sheets, short letters) are
+# rendered at a DPI between ``pdf_adaptive_min_dpi`` and ``pdf_render_dpi``
+# that grows with their ink coverage.
+_PROBE_DPI = 36
+# A probe pixel is ink when this much darker than the page background, and
+# coloured when its chroma is this far from the background's (tinted paper
+# is not colour).
+_PROBE_INK_CONTRAST = 64
+_PROBE_COLOR_CHROMA = 40
+# Share of coloured probe pixels from which a page keeps RGB.
+_PROBE_COLOR_RATIO = 0.002
+# Ink coverage up to which a page gets the minimum DPI, and from which it
+# gets the full DPI (a page of body text is around 0.12).
+_PROBE_SPARSE_INK = 0.01
+_PROBE_DENSE_INK = 0.08
+
 # --- Layout-aware text extraction (native text pages) ---------------------
 # Reconstruct reading order with a geometric XY-cut so multi-column pages are
 # linearised column-by-column instead of line-interleaved.
@@ -115,6 +168,66 @@ MIN_CHART_REGION_AREA_RATIO = _env_float("DOCREADER_PDF_MIN_CHART_REGION_AREA",
 MAX_CHART_REGION_AREA_RATIO = _env_float("DOCREADER_PDF_MAX_CHART_REGION_AREA", 0.42)
 MAX_FIGURE_HEIGHT_RATIO = _env_float("DOCREADER_PDF_MAX_FIGURE_HEIGHT_RATIO", 0.38)
 
+# --- Stage timings ----------------------------------------------------------
+# Per-stage totals are always returned in metadata (``stage_timings_ms``);
+# this adds a per-page breakdown (``page_timings_ms``), which grows with the
+# page count.
+PAGE_TIMINGS = _env_bool("DOCREADER_PDF_PAGE_TIMINGS", False)
+
+# --- Parallel pass 1 --------------------------------------------------------
+# Documents with at least this many pages run pass 1 (text extraction,
+# classification, layout, vector figures) in the render pool; 0 disables it.
+PARALLEL_ANALYSIS_MIN_PAGES = _env_int("DOCREADER_PDF_PARALLEL_ANALYSIS_MIN_PAGES", 32)
+# Pages per pass-1 task in the render pool.
+ANALYSIS_RANGE_PAGES = _env_int("DOCREADER_PDF_ANALYSIS_RANGE_PAGES", 16)
+# Scanned pages the render pool may render ahead of pass 2, per request, while
+# pass 1 and embedded-image extraction are still running.
+RENDER_AHEAD_PAGES = _env_int("DOCREADER_PDF_RENDER_AHEAD_PAGES", 32)
+
+# --- Scanned fast path -------------------------------------------------------
+# Documents with at least this many pages are sampled first; when every
+# sampled page is scanned, pass 1 is skipped and all pages go straight to the
+# render pool, which checks each page as it renders it. 0 disables sampling.
+SCANNED_SAMPLE_MIN_PAGES = _env_int("DOCREADER_PDF_SCANNED_SAMPLE_MIN_PAGES", 64)
+# Pages sampled, spread evenly over the document (first and last included).
+SCANNED_SAMPLE_PAGES = _env_int("DOCREADER_PDF_SCANNED_SAMPLE_PAGES", 8)
+
+# --- Page watchdog -----------------------------------------------------------
+# A render-pool task running longer than this (per page) is taken as stuck on
+# a pathological page: the pool is restarted and the page retried at
+# PAGE_FALLBACK_DPI, then skipped. Work done in the request thread cannot be
+# stopped like that; its page-object walks give up after the same time instead
+# (see _page_objects). 0 disables both.
+PAGE_TIMEOUT_SECONDS = _env_float("DOCREADER_PDF_PAGE_TIMEOUT_S", 120.0)
+PAGE_FALLBACK_DPI = _env_int("DOCREADER_PDF_PAGE_FALLBACK_DPI", 72)
+
+# --- Per-page cache ----------------------------------------------------------
+# Bump when a parser change alters a page's cached result for identical input
+# (the settings listed in _page_cache_settings are picked up on their own).
+PAGE_CACHE_FORMAT_VERSION = 1
+# Page dictionary entries that do not change how the page parses: links back
+# up the document tree and structure / editing bookkeeping.
+_FINGERPRINT_SKIP_KEYS = frozenset(
+    {
+        "/Parent",
+        "/P",
+        "/StructParents",
+        "/StructParent",
+        "/Metadata",
+        "/PieceInfo",
+        "/LastModified",
+        "/Thumb",
+    }
+)
+# Stands in for the file name and page number in cached figure refs.
+_PAGE_REF_TOKEN = "\0page\0"
+
+# One record per glyph for layout reconstruction: the normalised box in PDF
+# points plus the Unicode code point (0 for a glyph with no text).
+GLYPH_DTYPE = np.dtype(
+    [("x0", "f8"), ("y0", "f8"), ("x1", "f8"), ("y1", "f8"), ("code", "u4")]
+)
+
 # pdfium / Adobe text layers often emit U+FFFE for missing hyphenation or ligatures.
 _PDF_ARTIFACT_RE = re.compile(r"[\u00ad\u200b-\u200f\ufeff\ufffe\uffff]")
 _PDF_ARTIFACT_JOIN_RE = re.compile(r"(\w)[\u00ad\ufffe](\w)")
@@ -135,6 +248,17 @@ _ARXIV_LINE_RE = re.compile(r"^arXiv:\s*\S+", re.IGNORECASE)
 _PAGE_NUM_LINE_RE = re.compile(r"^\d{1,3}$")
 
 
+def _pdf_page_count(source) -> int:
+    """Page count of a PDF given as bytes or a path."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        return len(pdf)
+    finally:
+        _close_pdfium_resource(pdf)
+
+
 def _close_pdfium_resource(resource) -> None:
     close = getattr(resource, "close", None)
     if close:
@@ -158,7 +282,30 @@ def _classify_page(image_area_ratio: float, text_len: int) -> str:
     return "text"
 
 
-def _page_image_area_ratio(page, raw) -> float:
+class _PageTimeout(Exception):
+    """A page-object walk in the request thread ran past its deadline."""
+
+
+def _page_deadline() -> float | None:
+    """Deadline for page work done outside the render-pool watchdog."""
+    if PAGE_TIMEOUT_SECONDS <= 0:
+        return None
+    return time.monotonic() + PAGE_TIMEOUT_SECONDS
+
+
+def _page_objects(page, deadline: float | None = None):
+    """``page.get_objects()``, raising :class:`_PageTimeout` past ``deadline``.
+
+    Pathological pages hold hundreds of thousands of objects, so walking them
+    is where a page stalls the request thread.
+    """
+    for obj in page.get_objects():
+        if deadline is not None and time.monotonic() > deadline:
+            raise _PageTimeout
+        yield obj
+
+
+def _page_image_area_ratio(page, raw, deadline: float | None = None) -> float:
     """Return the fraction of the page area covered by image objects.
 
     Overlapping images can push the ratio above 1.0; callers only compare it
@@ -170,7 +317,7 @@ def _page_image_area_ratio(page, raw) -> float:
         return 0.0
 
     image_area = 0.0
-    for obj in page.get_objects():
+    for obj in _page_objects(page, deadline):
         try:
             if obj.type == raw.FPDF_PAGEOBJ_IMAGE:
                 left, bottom, right, top = obj.get_bounds()
@@ -190,6 +337,41 @@ def _extract_page_text(page) -> str:
         _close_pdfium_resource(textpage)
 
 
+def _page_class(page, raw) -> str:
+    """:func:`_classify_page` of ``page``, from its own text and images."""
+    text_len = len(_extract_page_text(page).strip())
+    return _classify_page(_page_image_area_ratio(page, raw), text_len)
+
+
+def _sample_indices(indices: list, n: int) -> list:
+    """Up to ``n`` of ``indices``, spread evenly and including both ends."""
+    if len(indices) <= n:
+        return list(indices)
+    if n <= 1:
+        return [indices[len(indices) // 2]]
+    step = (len(indices) - 1) / (n - 1)
+    return sorted({indices[round(k * step)] for k in range(n)})
+
+
+def _looks_fully_scanned(pdf, indices: list, raw) -> bool:
+    """Whether a long selection samples as scanned pages only.
+
+    Only the sample is classified here; the other pages are checked by the
+    render workers (:func:`_render_scanned_page`).
+    """
+    if SCANNED_SAMPLE_MIN_PAGES <= 0 or len(indices) < SCANNED_SAMPLE_MIN_PAGES:
+        return False
+    for i in _sample_indices(indices, SCANNED_SAMPLE_PAGES):
+        check_cancelled()
+        page = pdf[i]
+        try:
+            if _page_class(page, raw) != "scanned":
+                return False
+        finally:
+            _close_pdfium_resource(page)
+    return True
+
+
 def _sanitize_pdf_text(text: str) -> str:
     """Remove PDF text-layer placeholders and repair broken hyphenations."""
     if not text:
@@ -320,12 +502,51 @@ def _char_looks_chart_axis_tick(ch: str) -> bool:
     return False
 
 
-def _chars_bbox(char_list: list) -> tuple:
+def _glyph_array(chars) -> np.ndarray:
+    """Pack ``{"x0", "y0", "x1", "y1", "ch"}`` glyph dicts into a glyph array."""
+    return np.array(
+        [
+            (c["x0"], c["y0"], c["x1"], c["y1"], ord(c["ch"][0]) if c["ch"] else 0)
+            for c in chars
+        ],
+        dtype=GLYPH_DTYPE,
+    )
+
+
+def _glyph_chars(glyphs: np.ndarray) -> list:
+    """Glyph strings, in array order (code point 0 is an empty glyph)."""
+    return [chr(code) if code else "" for code in glyphs["code"].tolist()]
+
+
+def _median_height(glyphs: np.ndarray, default: float) -> float:
+    heights = glyphs["y1"] - glyphs["y0"]
+    heights = heights[heights > 0]
+    return float(np.median(heights)) if heights.size else default
+
+
+def _group_medians(
+    values: np.ndarray, groups: np.ndarray, n_groups: int, default: float
+) -> np.ndarray:
+    """Median of the positive ``values`` of each group id (``default`` if none)."""
+    keep = values > 0
+    values, groups = values[keep], groups[keep]
+    values = values[np.lexsort((values, groups))]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.cumsum(counts) - counts
+    out = np.full(n_groups, default, dtype=np.float64)
+    has = counts > 0
+    lo = (starts + (counts - 1) // 2)[has]
+    hi = (starts + counts // 2)[has]
+    out[has] = (values[lo] + values[hi]) / 2
+    return out
+
+
+def _chars_bbox(glyphs: np.ndarray) -> tuple:
     return (
-        min(c["x0"] for c in char_list),
-        min(c["y0"] for c in char_list),
-        max(c["x1"] for c in char_list),
-        max(c["y1"] for c in char_list),
+        float(glyphs["x0"].min()),
+        float(glyphs["y0"].min()),
+        float(glyphs["x1"].max()),
+        float(glyphs["y1"].max()),
     )
 
 
@@ -337,9 +558,15 @@ def _bbox_area_ratio(bbox, page_w: float, page_h: float) -> float:
     return max(0.0, (x1 - x0) * (y1 - y0) / page_area)
 
 
-def _chart_region_bbox(chars: list, page_w: float, page_h: float):
+def _chart_region_bbox(chars: np.ndarray, page_w: float, page_h: float):
     """Bounding box of numeric chart axis labels (fallback when caption walk fails)."""
-    chart = [c for c in chars if _char_looks_chart_axis_tick(c["ch"])]
+    # Classify each distinct code point once instead of every glyph.
+    codes, inverse = np.unique(chars["code"], return_inverse=True)
+    is_tick = np.array(
+        [_char_looks_chart_axis_tick(chr(c) if c else "") for c in codes.tolist()],
+        dtype=bool,
+    )
+    chart = chars[is_tick[inverse.reshape(-1)]]
     if len(chart) < MIN_CHART_REGION_CHARS:
         return None
     bbox = _chars_bbox(chart)
@@ -397,43 +624,75 @@ def _pil_to_jpeg_bytes(pil, quality: int) -> bytes:
     return buf.getvalue()
 
 
-def _group_lines_with_chars(chars: list) -> list:
-    """Group glyphs into lines; each line includes its char list and bbox."""
-    if not chars:
-        return []
-    heights = [c["y1"] - c["y0"] for c in chars if c["y1"] > c["y0"]]
-    med_h = statistics.median(heights) if heights else 1.0
-    ordered = sorted(chars, key=lambda c: -(c["y0"] + c["y1"]) / 2)
+def _line_groups(glyphs: np.ndarray, med_h: float) -> list:
+    """Split glyphs into visual lines, top to bottom, each sorted by x.
+
+    A line takes every following glyph whose vertical centre is within half a
+    median glyph height of its first (topmost) glyph. Returns index arrays.
+    """
+    key = -(glyphs["y0"] + glyphs["y1"]) / 2
+    order = np.argsort(key, kind="stable")
+    key = key[order]
+    centres = ((glyphs["y0"] + glyphs["y1"]) / 2)[order].tolist()
+    limit = 0.5 * med_h
+    x0 = glyphs["x0"]
     groups: list = []
-    cur: list = []
-    ref = None
-    for c in ordered:
-        yc = (c["y0"] + c["y1"]) / 2
-        if ref is None or abs(yc - ref) <= 0.5 * med_h:
-            cur.append(c)
-            ref = yc if ref is None else ref
-        else:
-            groups.append(cur)
-            cur = [c]
-            ref = yc
-    if cur:
-        groups.append(cur)
+    start, n = 0, len(order)
+    while start < n:
+        ref = centres[start]
+        # Centres only decrease along ``order``: bisect for the end of the line,
+        # then settle rounding at the boundary with the exact test.
+        end = max(start + 1, int(np.searchsorted(key, limit - ref, side="right")))
+        while end < n and abs(centres[end] - ref) <= limit:
+            end += 1
+        while end > start + 1 and abs(centres[end - 1] - ref) > limit:
+            end -= 1
+        idx = order[start:end]
+        groups.append(idx[np.argsort(x0[idx], kind="stable")])
+        start = end
+    return groups
+
+
+def _build_lines(glyphs: np.ndarray) -> list:
+    """Visual lines of ``glyphs`` as ``(index_array, text, height)`` tuples.
+
+    Line heights, glyph widths and word gaps are computed for every line in
+    one pass rather than line by line; lines with no text are dropped.
+    """
+    med_h = _median_height(glyphs, 1.0)
+    groups = _line_groups(glyphs, med_h)
+    sizes = np.array([len(idx) for idx in groups])
+    line_of = np.repeat(np.arange(len(groups)), sizes)
+    ordered = glyphs[np.concatenate(groups)]
+    heights = _group_medians(
+        ordered["y1"] - ordered["y0"], line_of, len(groups), med_h
+    ).tolist()
+    widths = _group_medians(ordered["x1"] - ordered["x0"], line_of, len(groups), 1.0)
+    # Pairs straddling two lines are computed too but never looked at.
+    gap_threshold = widths * WORD_GAP_WIDTH_RATIO
+    wide_gap = (ordered["x0"][1:] - ordered["x1"][:-1]) > gap_threshold[line_of[1:]]
+    wide_gap = wide_gap.tolist()
+    chars = _glyph_chars(ordered)
 
     lines: list = []
-    for grp in groups:
-        grp_sorted = sorted(grp, key=lambda c: c["x0"])
-        text = _join_line_glyphs(grp_sorted)
-        if not text:
-            continue
-        hs = [c["y1"] - c["y0"] for c in grp_sorted if c["y1"] > c["y0"]]
-        lines.append(
-            {
-                "text": text,
-                "h": statistics.median(hs) if hs else med_h,
-                "chars": grp_sorted,
-                "bbox": _chars_bbox(grp_sorted),
-            }
-        )
+    start = 0
+    for k, idx in enumerate(groups):
+        end = start + len(idx)
+        text = _join_glyph_text(chars[start:end], wide_gap[start : end - 1])
+        if text:
+            lines.append((idx, text, heights[k]))
+        start = end
+    return lines
+
+
+def _group_lines_with_chars(chars: np.ndarray) -> list:
+    """Group glyphs into lines; each line includes its glyph array and bbox."""
+    if len(chars) == 0:
+        return []
+    lines: list = []
+    for idx, text, h in _build_lines(chars):
+        grp = chars[idx]
+        lines.append({"text": text, "h": h, "chars": grp, "bbox": _chars_bbox(grp)})
     return lines
 
 
@@ -518,7 +777,7 @@ def _extract_vector_figure_clips(
 ) -> list:
     """Render vector figure regions anchored at each ``Figure N.`` caption on the page.
 
-    Returns ``[(ref_path, b64, y_sort, caption_line), ...]`` for markdown injection.
+    Returns ``[(ref_path, jpeg_bytes, y_sort, caption_line), ...]`` for markdown injection.
     """
     if not RENDER_VECTOR_FIGURES or not re.search(r"\bFigure\s+\d+", plain_text, re.I):
         return []
@@ -526,7 +785,7 @@ def _extract_vector_figure_clips(
     try:
         textpage = page.get_textpage()
         chars, page_w = _page_chars(textpage, page, raw)
-        if not chars:
+        if len(chars) == 0:
             return []
         page_h = page.get_size()[1]
         lines = _merge_orphan_punctuation_lines(_group_lines_with_chars(chars))
@@ -565,7 +824,7 @@ def _extract_vector_figure_clips(
             results.append(
                 (
                     ref_path,
-                    base64.b64encode(jpeg).decode("utf-8"),
+                    jpeg,
                     bbox[3],
                     cap_line,
                 )
@@ -603,66 +862,130 @@ def _collect_invisible_boxes(page, raw) -> list:
     return boxes
 
 
-def _point_in_boxes(x: float, y: float, boxes: list) -> bool:
+def _point_in_boxes(x, y, boxes: list):
+    """Whether ``(x, y)`` lies in any of ``boxes``; elementwise for arrays."""
+    x, y = np.asarray(x), np.asarray(y)
+    inside = np.zeros(np.broadcast(x, y).shape, dtype=bool)
     for x0, y0, x1, y1 in boxes:
-        if x0 <= x <= x1 and y0 <= y <= y1:
-            return True
-    return False
+        inside |= (x0 <= x) & (x <= x1) & (y0 <= y) & (y <= y1)
+    return inside
+
+
+def _page_glyph_boxes(textpage, n: int, raw) -> tuple:
+    """Read the boxes and code points of a text page's ``n`` chars in bulk.
+
+    Returns ``(boxes, codes)``: ``(left, bottom, right, top)`` rows and the
+    matching code points for the chars pdfium has a box for. The text comes
+    from one ``FPDFText_GetText`` call over the whole page and the boxes from
+    a tight loop over the raw API, instead of two pypdfium2 helper calls (each
+    several FFI round trips) per char.
+
+    pdfium may exclude or insert text units relative to the char list
+    (crbug.com/pdfium/2079), so, as in pypdfium2's ``get_text_range``, the
+    buffer is sized from the text indices of the first and last active chars
+    and each char is mapped to its own text index.
+    """
+    handle = textpage.raw
+    text_index = raw.FPDFText_GetTextIndexFromCharIndex
+    first, last = 0, n - 1
+    while first <= last and text_index(handle, first) == -1:
+        first += 1
+    while last >= first and text_index(handle, last) == -1:
+        last -= 1
+    units = np.empty(0, dtype=np.uint16)
+    t_start = 0
+    if first <= last:
+        t_start = text_index(handle, first)
+        size = text_index(handle, last) + 2 - t_start  # including NUL
+        buf = (ctypes.c_ushort * size)()
+        written = raw.FPDFText_GetText(handle, first, last - first + 1, buf)
+        if written > size:
+            raise RuntimeError(f"pdfium text buffer overrun: {written} > {size}")
+        units = np.frombuffer(buf, dtype=np.uint16)[: max(written - 1, 0)]
+
+    left, right, bottom, top = (ctypes.c_double() for _ in range(4))
+    get_charbox = raw.FPDFText_GetCharBox
+    flat = array.array("d", bytes(32 * n))
+    has_box = np.zeros(n, dtype=bool)
+    offsets = np.full(n, -1, dtype=np.int64)
+    k = 0
+    for i in range(n):
+        offsets[i] = text_index(handle, i)
+        if get_charbox(handle, i, left, right, bottom, top):
+            flat[k] = left.value
+            flat[k + 1] = bottom.value
+            flat[k + 2] = right.value
+            flat[k + 3] = top.value
+            has_box[i] = True
+            k += 4
+    boxes = np.frombuffer(flat, dtype=np.float64)[:k].reshape(-1, 4)
+
+    offsets -= t_start
+    # Excluded chars (text index -1) have no text.
+    valid = (offsets >= 0) & (offsets < len(units))
+    codes = np.zeros(n, dtype=np.uint32)
+    codes[valid] = units[offsets[valid]]
+    # Like get_text_range (UCS-2, errors ignored): a lone surrogate is empty.
+    codes[(codes >= 0xD800) & (codes <= 0xDFFF)] = 0
+    return boxes, codes[has_box]
 
 
 def _page_chars(textpage, page, raw) -> tuple:
-    """Return ``(chars, page_width)`` with hidden/off-page glyphs filtered.
+    """Return ``(glyphs, page_width)`` with hidden/off-page glyphs filtered.
 
     Working at the glyph level (instead of pdfium rect segments) keeps mixed
     CJK + Latin/number lines in their true left-to-right order, which the
-    rect-level ``get_text_bounded`` API scrambles.
+    rect-level ``get_text_bounded`` API scrambles. ``glyphs`` is a
+    :data:`GLYPH_DTYPE` array with normalised (x0 <= x1, y0 <= y1) boxes.
     """
     n = textpage.count_chars()
     if n <= 0:
-        return [], 0.0
+        return np.empty(0, dtype=GLYPH_DTYPE), 0.0
     width, height = page.get_size()
     invisible = _collect_invisible_boxes(page, raw) if FILTER_HIDDEN_TEXT else []
 
-    chars: list = []
-    for i in range(n):
-        try:
-            left, bottom, right, top = textpage.get_charbox(i)
-        except Exception:
-            continue
-        ch = textpage.get_text_range(i, 1)
-        if ch in ("\r", "\n"):
-            continue
-        x0, x1 = (left, right) if left <= right else (right, left)
-        y0, y1 = (bottom, top) if bottom <= top else (top, bottom)
-        if FILTER_HIDDEN_TEXT:
-            if x1 < 0 or x0 > width or y1 < 0 or y0 > height:
-                continue  # off-page glyph
-            if invisible and _point_in_boxes((x0 + x1) / 2, (y0 + y1) / 2, invisible):
-                continue  # covered by an invisible text object
-        chars.append({"x0": x0, "y0": y0, "x1": x1, "y1": y1, "ch": ch})
-    return chars, width
-
-
-def _find_split(items: list, axis: str, min_gap: float):
+    boxes, codes = _page_glyph_boxes(textpage, n, raw)
+    line_break = (codes == ord("\r")) | (codes == ord("\n"))
+    boxes, codes = boxes[~line_break], codes[~line_break]
+    left, bottom, right, top = boxes.T
+    glyphs = np.empty(len(codes), dtype=GLYPH_DTYPE)
+    glyphs["x0"] = np.minimum(left, right)
+    glyphs["x1"] = np.maximum(left, right)
+    glyphs["y0"] = np.minimum(bottom, top)
+    glyphs["y1"] = np.maximum(bottom, top)
+    glyphs["code"] = codes
+    if FILTER_HIDDEN_TEXT:
+        x0, y0, x1, y1 = (glyphs[k] for k in ("x0", "y0", "x1", "y1"))
+        off_page = (x1 < 0) | (x0 > width) | (y1 < 0) | (y0 > height)
+        # Glyphs covered by an invisible text object are hidden too.
+        hidden = off_page | _point_in_boxes((x0 + x1) / 2, (y0 + y1) / 2, invisible)
+        glyphs = glyphs[~hidden]
+    return glyphs, width
+
+
+def _find_split(items: np.ndarray, axis: str, min_gap: float):
     """Return a coordinate at the widest clean gap on ``axis`` ('x'), or None.
 
     A "clean" gap means no item interval bridges it — i.e. a full-height column
     gutter. Used to detect multi-column layouts.
     """
     lo, hi = ("x0", "x1") if axis == "x" else ("y0", "y1")
-    intervals = sorted(((s[lo], s[hi]) for s in items), key=lambda iv: iv[0])
-    cur_end = intervals[0][1]
-    best_gap, best_cut = 0.0, None
-    for a, b in intervals[1:]:
-        gap = a - cur_end
-        if gap >= min_gap and gap > best_gap:
-            best_gap, best_cut = gap, cur_end + gap / 2
-        if b > cur_end:
-            cur_end = b
-    return best_cut
-
-
-def _split_columns(chars: list, scale: float, width: float, depth: int = 0) -> list:
+    order = np.argsort(items[lo], kind="stable")
+    # Each gap is measured from the furthest end of every interval before it.
+    ends = np.maximum.accumulate(items[hi][order])
+    gaps = items[lo][order][1:] - ends[:-1]
+    if gaps.size == 0:
+        return None
+    best = int(np.argmax(gaps))
+    gap = gaps[best]
+    if gap < min_gap or gap <= 0:
+        return None
+    return float(ends[best] + gap / 2)
+
+
+def _split_columns(
+    chars: np.ndarray, scale: float, width: float, depth: int = 0
+) -> list:
     """Split glyphs into reading-order columns at full-height gutters."""
     if len(chars) <= 1 or depth > 10:
         return [chars]
@@ -670,19 +993,18 @@ def _split_columns(chars: list, scale: float, width: float, depth: int = 0) -> l
     cut = _find_split(chars, "x", min_gap)
     if cut is None:
         return [chars]
-    left = [c for c in chars if (c["x0"] + c["x1"]) / 2 < cut]
-    right = [c for c in chars if (c["x0"] + c["x1"]) / 2 >= cut]
-    if not left or not right:
+    is_left = (chars["x0"] + chars["x1"]) / 2 < cut
+    if is_left.all() or not is_left.any():
         return [chars]
-    return _split_columns(left, scale, width, depth + 1) + _split_columns(
-        right, scale, width, depth + 1
+    return _split_columns(chars[is_left], scale, width, depth + 1) + _split_columns(
+        chars[~is_left], scale, width, depth + 1
     )
 
 
-def _column_x_span(chars: list) -> float:
-    if not chars:
+def _column_x_span(chars: np.ndarray) -> float:
+    if len(chars) == 0:
         return 0.0
-    return max(c["x1"] for c in chars) - min(c["x0"] for c in chars)
+    return float(chars["x1"].max() - chars["x0"].min())
 
 
 def _column_single_line_fraction(lines: list) -> float:
@@ -692,14 +1014,14 @@ def _column_single_line_fraction(lines: list) -> float:
     return single / len(lines)
 
 
-def _is_artifact_column(chars: list, width: float) -> bool:
+def _is_artifact_column(chars: np.ndarray, width: float) -> bool:
     """Detect margin strips and vertical watermarks (e.g. arXiv sidebar).
 
     Docling / MinerU solve this with learned layout regions; here we use
     geometry only: a narrow column whose lines are mostly one glyph tall is not
     part of the reading order.
     """
-    if not chars or width <= 0:
+    if len(chars) == 0 or width <= 0:
         return True
     span = _column_x_span(chars)
     if span <= 0:
@@ -709,15 +1031,15 @@ def _is_artifact_column(chars: list, width: float) -> bool:
     narrow = span / width < MARGIN_COL_WIDTH_RATIO
     if narrow and single_frac >= 0.45:
         return True
-    ys = [(c["y0"] + c["y1"]) / 2 for c in chars]
-    y_span = max(ys) - min(ys)
+    ys = (chars["y0"] + chars["y1"]) / 2
+    y_span = float(ys.max() - ys.min())
     # Vertical text: tall stack, narrow horizontal extent, mostly one char/line.
     if y_span > span * 3.5 and len(chars) >= 8 and single_frac >= 0.35:
         return True
     return False
 
 
-def _filter_reading_columns(chars: list, scale: float, width: float) -> list:
+def _filter_reading_columns(chars: np.ndarray, scale: float, width: float) -> list:
     """Split into columns and drop margin / watermark strips."""
     cols = _split_columns(chars, scale, width)
     kept = [c for c in cols if not _is_artifact_column(c, width)]
@@ -757,63 +1079,38 @@ def _merge_orphan_punctuation_lines(lines: list) -> list:
     return merged
 
 
-def _join_line_glyphs(ln_sorted: list) -> str:
+def _join_line_glyphs(ln_sorted: np.ndarray) -> str:
     """Join a visual line's glyphs, inferring word spaces from horizontal gaps."""
-    if not ln_sorted:
+    if len(ln_sorted) == 0:
         return ""
-    widths = [c["x1"] - c["x0"] for c in ln_sorted if c["x1"] > c["x0"]]
-    med_w = statistics.median(widths) if widths else 1.0
+    widths = ln_sorted["x1"] - ln_sorted["x0"]
+    widths = widths[widths > 0]
+    med_w = float(np.median(widths)) if widths.size else 1.0
     gap_threshold = med_w * WORD_GAP_WIDTH_RATIO
+    wide_gap = (ln_sorted["x0"][1:] - ln_sorted["x1"][:-1]) > gap_threshold
+    return _join_glyph_text(_glyph_chars(ln_sorted), wide_gap.tolist())
 
-    parts: list[str] = []
-    for i, cur in enumerate(ln_sorted):
-        ch = cur["ch"]
-        if i == 0:
-            parts.append(ch)
-            continue
-        prev = ln_sorted[i - 1]
-        if ch.isspace() or prev["ch"].isspace():
+
+def _join_glyph_text(chars: list, wide_gap: list) -> str:
+    """Join glyph strings; ``wide_gap[i]`` marks a word gap after ``chars[i]``."""
+    parts: list[str] = [chars[0]]
+    for i in range(1, len(chars)):
+        ch, prev = chars[i], chars[i - 1]
+        if ch.isspace() or prev.isspace():
             if not ch.isspace() or (parts and not parts[-1].endswith(" ")):
                 parts.append(ch)
             continue
-        if cur["x0"] - prev["x1"] > gap_threshold:
+        if wide_gap[i - 1]:
             parts.append(" ")
         parts.append(ch)
     return "".join(parts).strip()
 
 
-def _group_lines(chars: list) -> list:
+def _group_lines(chars: np.ndarray) -> list:
     """Group a column's glyphs into lines (top-to-bottom, glyphs sorted by x)."""
-    if not chars:
+    if len(chars) == 0:
         return []
-    heights = [c["y1"] - c["y0"] for c in chars if c["y1"] - c["y0"] > 0]
-    med_h = statistics.median(heights) if heights else 1.0
-
-    ordered = sorted(chars, key=lambda c: -(c["y0"] + c["y1"]) / 2)
-    lines: list = []
-    cur: list = []
-    ref = None
-    for c in ordered:
-        yc = (c["y0"] + c["y1"]) / 2
-        if ref is None or abs(yc - ref) <= 0.5 * med_h:
-            cur.append(c)
-            ref = yc if ref is None else ref
-        else:
-            lines.append(cur)
-            cur = [c]
-            ref = yc
-    if cur:
-        lines.append(cur)
-
-    out: list = []
-    for ln in lines:
-        ln_sorted = sorted(ln, key=lambda c: c["x0"])
-        text = _join_line_glyphs(ln_sorted)
-        if not text:
-            continue
-        hs = [c["y1"] - c["y0"] for c in ln_sorted if c["y1"] - c["y0"] > 0]
-        out.append({"h": statistics.median(hs) if hs else med_h, "text": text})
-    return out
+    return [{"h": h, "text": text} for _, text, h in _build_lines(chars)]
 
 
 def _segments_to_markdown(lines: list) -> str:
@@ -853,7 +1150,7 @@ def _segments_to_markdown(lines: list) -> str:
     return "\n".join(out)
 
 
-def _chars_to_layout_markdown(chars: list, scale: float, width: float) -> str:
+def _chars_to_layout_markdown(chars: np.ndarray, scale: float, width: float) -> str:
     blocks: list = []
     for col in _filter_reading_columns(chars, scale, width):
         lines = _merge_orphan_punctuation_lines(_group_lines(col))
@@ -957,10 +1254,9 @@ def _extract_layout_text(page, raw) -> str:
     try:
         textpage = page.get_textpage()
         chars, width = _page_chars(textpage, page, raw)
-        if not chars:
+        if len(chars) == 0:
             return ""
-        heights = [c["y1"] - c["y0"] for c in chars if c["y1"] - c["y0"] > 0]
-        scale = (statistics.median(heights) if heights else 1.0) or 1.0
+        scale = _median_height(chars, 1.0) or 1.0
         return _chars_to_layout_markdown(chars, scale, width)
     except Exception:
         logger.debug("layout extraction failed; using plain text", exc_info=True)
@@ -985,12 +1281,105 @@ def _effective_scale(page, scale: float, max_edge: int) -> float:
     return min(scale, max_edge / longest_pt)
 
 
+def _probe_page(page) -> tuple:
+    """Ink coverage and coloured-pixel share of ``page`` from a low-res render."""
+    bitmap = page.render(scale=_PROBE_DPI / 72)
+    try:
+        pixels = bitmap.to_numpy().astype(np.int16)
+    finally:
+        _close_pdfium_resource(bitmap)
+    if pixels.ndim != 3 or pixels.size == 0:
+        return 0.0, 0.0
+    pixels = pixels[..., :3]
+    gray = pixels.mean(axis=2)
+    ink = gray < np.median(gray) - _PROBE_INK_CONTRAST
+    chroma = pixels.max(axis=2) - pixels.min(axis=2)
+    colored = np.abs(chroma - np.median(chroma)) > _PROBE_COLOR_CHROMA
+    return float(ink.mean()), float(colored.mean())
+
+
+def _adaptive_render_params(page, scale: float) -> tuple:
+    """Render ``(scale, grayscale)`` of a scanned page (see pdf_adaptive_render)."""
+    if not CONFIG.pdf_adaptive_render:
+        return scale, False
+    ink, colored = _probe_page(page)
+    min_scale = min(scale, max(1, CONFIG.pdf_adaptive_min_dpi) / 72)
+    density = (ink - _PROBE_SPARSE_INK) / (_PROBE_DENSE_INK - _PROBE_SPARSE_INK)
+    density = min(1.0, max(0.0, density))
+    return min_scale + (scale - min_scale) * density, colored < _PROBE_COLOR_RATIO
+
+
+def _sole_page_image(page, raw):
+    """The image object that makes up the whole page on its own, or None.
+
+    The page must be unrotated and hold exactly one image, drawn upright (no
+    rotation, skew or flip) over the page box; any other object must be
+    invisible text.
+    """
+    if page.get_rotation() != 0:
+        return None
+    image = None
+    for obj in page.get_objects():
+        if obj.type == raw.FPDF_PAGEOBJ_IMAGE and image is None:
+            image = obj
+        elif obj.type != raw.FPDF_PAGEOBJ_TEXT or (
+            raw.FPDFTextObj_GetTextRenderMode(obj.raw)
+            != raw.FPDF_TEXTRENDERMODE_INVISIBLE
+        ):
+            return None
+    if image is None:
+        return None
+    matrix = image.get_matrix()
+    if matrix.b != 0 or matrix.c != 0 or matrix.a <= 0 or matrix.d <= 0:
+        return None
+    box = page.get_cropbox()
+    tol_x = (box[2] - box[0]) * _PAGE_IMAGE_EDGE_TOLERANCE
+    tol_y = (box[3] - box[1]) * _PAGE_IMAGE_EDGE_TOLERANCE
+    bounds = image.get_bounds()
+    for edge, page_edge, tol in zip(bounds, box, (tol_x, tol_y, tol_x, tol_y)):
+        if abs(edge - page_edge) > tol:
+            return None
+    return image
+
+
+def _page_image_to_jpeg(page, raw, quality: int, max_edge: int):
+    """JPEG of a single-image page taken from the image itself, or None."""
+    image = _sole_page_image(page, raw)
+    if image is None:
+        return None
+    jpeg = _embedded_jpeg(image)
+    if jpeg is not None:
+        return _fit_jpeg(*jpeg, quality, max_edge)
+    return _encode_fitted_jpeg(image.get_bitmap().to_pil(), quality, max_edge)
+
+
 def _render_page_to_jpeg(page, scale: float, quality: int, max_edge: int = 0) -> bytes:
+    if CONFIG.pdf_direct_page_images:
+        import pypdfium2.raw as pdfium_r
+
+        try:
+            jpeg = _page_image_to_jpeg(page, pdfium_r, quality, max_edge)
+        except Exception:
+            logger.debug("direct page image failed; rendering", exc_info=True)
+            jpeg = None
+        if jpeg is not None:
+            return jpeg
+    scale, grayscale = _adaptive_render_params(page, scale)
     bitmap = None
     try:
-        bitmap = page.render(scale=_effective_scale(page, scale, max_edge))
+        scale = _effective_scale(page, scale, max_edge)
+        if grayscale:
+            import pypdfium2.raw as pdfium_r
+
+            bitmap = page.render(
+                scale=scale,
+                grayscale=True,
+                force_bitmap_format=pdfium_r.FPDFBitmap_Gray,
+            )
+        else:
+            bitmap = page.render(scale=scale)
         img_obj = bitmap.to_pil()
-        if img_obj.mode != "RGB":
+        if img_obj.mode not in ("RGB", "L"):
             img_obj = img_obj.convert("RGB")
         buf = io.BytesIO()
         img_obj.save(buf, format="JPEG", quality=quality, optimize=True)
@@ -1002,124 +1391,1065 @@ def _render_page_to_jpeg(page, scale: float, quality: int, max_edge: int = 0) ->
 # --- Parallel scanned-page rendering --------------------------------------
 # pdfium is NOT thread-safe (concurrent get_page on one document crashes), so
 # we parallelise across *processes*: each worker opens its own PdfDocument from
-# a temp file and renders an assigned slice of pages. This turns the serial
+# a file on disk and renders the pages it is handed. This turns the serial
 # per-page render (the dominant cost for big scanned PDFs — hours on
 # CPU-constrained containers) into a near-linear speedup.
 
-# Per-worker document handle, populated by the pool initializer.
-_WORKER_RENDER_DOC = None
-
-
-def _render_pool_init(pdf_path: str) -> None:
-    global _WORKER_RENDER_DOC
+# The render pool is process-wide and long-lived: workers are forked once and
+# keep recently used documents open, keyed by a per-request document id, so a
+# scanned document pays neither pool start-up nor a re-open per page. Pages of
+# concurrent requests are dispatched round-robin, so one large scan cannot
+# starve the others.
+
+# Per-worker open documents: doc_id -> PdfDocument, least recently used first.
+_WORKER_RENDER_DOCS: "OrderedDict[str, object]" = OrderedDict()
+# Open documents kept per render worker.
+_WORKER_RENDER_DOC_CACHE = 4
+# Pages submitted ahead of the consumer, per render worker and request.
+_RENDER_WINDOW_PER_WORKER = 2
+# Tasks queued in the executor per render worker, across all requests.
+_RENDER_QUEUE_PER_WORKER = 2
+# Recently finished documents, passed along with tasks so workers drop them.
+_RENDER_CLOSED_HISTORY = 16
+# Worker crashes in a row (no task succeeding in between) before the pool is
+# given up as broken and requests fall back to serial rendering.
+_RENDER_MAX_CRASHES = 3
+# Result of a scanned page the watchdog gave up on.
+_SKIPPED_PAGE = b""
+# Per-worker start records of the render pool: worker ``k`` writes the ticket
+# of the task it picks up and the time it started at ``[2k]`` / ``[2k + 1]``,
+# so the watchdog times a page from when a worker really starts it (a future
+# already counts as running while it waits in the executor's call queue).
+_WORKER_TASK_STARTS = None
+_WORKER_TASK_SLOT = 0
+
+
+def _render_worker_doc(doc_id: str, pdf_path: str, closed: tuple):
     import pypdfium2 as pdfium
 
-    with open(pdf_path, "rb") as f:
-        _WORKER_RENDER_DOC = pdfium.PdfDocument(f.read())
+    for stale in closed:
+        doc = _WORKER_RENDER_DOCS.pop(stale, None)
+        if doc is not None:
+            _close_pdfium_resource(doc)
+    doc = _WORKER_RENDER_DOCS.get(doc_id)
+    if doc is not None:
+        _WORKER_RENDER_DOCS.move_to_end(doc_id)
+        return doc
+    doc = pdfium.PdfDocument(pdf_path)
+    _WORKER_RENDER_DOCS[doc_id] = doc
+    while len(_WORKER_RENDER_DOCS) > _WORKER_RENDER_DOC_CACHE:
+        _, evicted = _WORKER_RENDER_DOCS.popitem(last=False)
+        _close_pdfium_resource(evicted)
+    return doc
+
+
+def _init_render_worker(starts, next_slot) -> None:
+    global _WORKER_TASK_STARTS, _WORKER_TASK_SLOT
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    _WORKER_TASK_STARTS = starts
+    _WORKER_TASK_SLOT = slot % (len(starts) // 2)
+
+
+def _run_render_task(ticket: int, task, args):
+    """Run one render-pool task, recording that this worker started it."""
+    starts = _WORKER_TASK_STARTS
+    if starts is not None:
+        with starts.get_lock():
+            starts[2 * _WORKER_TASK_SLOT] = ticket
+            starts[2 * _WORKER_TASK_SLOT + 1] = time.time()
+    return task(args)
 
 
 def _render_pool_task(args):
-    index, scale, quality, max_edge = args
-    page = _WORKER_RENDER_DOC[index]
+    doc_id, pdf_path, closed, index, scale, quality, max_edge = args
+    page = _render_worker_doc(doc_id, pdf_path, closed)[index]
     try:
         return index, _render_page_to_jpeg(page, scale, quality, max_edge)
     finally:
         _close_pdfium_resource(page)
 
 
-def _select_mp_context():
-    """Pick the safest available multiprocessing start method.
+def _render_scanned_page(page, raw, scale: float, quality: int, max_edge: int):
+    """Render ``page`` to JPEG, or return None if it is not a scanned page."""
+    if _page_class(page, raw) != "scanned":
+        return None
+    return _render_page_to_jpeg(page, scale, quality, max_edge)
+
+
+def _render_scanned_task(args):
+    """Render-pool task of the scanned fast path (see :func:`_render_scanned_page`)."""
+    import pypdfium2.raw as pdfium_r
+
+    doc_id, pdf_path, closed, index, scale, quality, max_edge = args
+    page = _render_worker_doc(doc_id, pdf_path, closed)[index]
+    try:
+        return index, _render_scanned_page(page, pdfium_r, scale, quality, max_edge)
+    finally:
+        _close_pdfium_resource(page)
+
+
+class _RenderJob:
+    """Tasks of one document waiting for (or held in) the render pool.
 
-    ``forkserver`` forks workers from a clean, single-threaded server process,
-    avoiding the fork-in-a-multithreaded-process hazards of the gRPC server.
-    Falls back to ``fork`` and finally returns ``None`` (serial) when neither
-    is available (e.g. Windows/dev).
+    Each item (a page index, or a page range for pass-1 analysis) becomes one
+    ``task((doc_id, pdf_path, closed, item) + render_args)`` call.
     """
-    import multiprocessing as mp
 
-    for method in ("forkserver", "fork"):
-        try:
-            return mp.get_context(method)
-        except ValueError:
-            continue
-    return None
+    def __init__(
+        self,
+        doc_id: str,
+        pdf_path: str,
+        indices: list,
+        render_args,
+        window,
+        task=None,
+    ):
+        self.doc_id = doc_id
+        self.pdf_path = pdf_path
+        self.remaining = deque(indices)
+        self.render_args = render_args
+        self.window = window
+        self.task = task or _render_pool_task
+        # Submitted futures, in page order; popped by the consumer.
+        self.futures: deque = deque()
+        # More items may still be added (see RenderPool.open_job).
+        self.feeding = False
+        self.released = False
+        # CPU tokens of the request: at most lease.held tasks run at once.
+        self.lease = None
+        self.running = 0
+        # Watchdog: future -> (item, args, ticket) until consumed, and the
+        # items that already stalled the pool. ``fallback(item)`` gives the replacement
+        # ``(item, args)`` tasks of a first offender (or None), and
+        # ``placeholder(item)`` the result standing in for a second one.
+        self.items: dict = {}
+        self.strikes: dict = {}
+        self.fallback = None
+        self.placeholder = None
+
+
+def _item_pages(item) -> int:
+    return len(item) if isinstance(item, tuple) else 1
+
+
+class _DegradedPages:
+    """Pages the watchdog rendered at low DPI, skipped or cut short.
+
+    ``partial_images`` are text pages whose embedded-image scan ran out of
+    time (see :func:`_extract_embedded_images`).
+    """
 
+    def __init__(self):
+        self.low_dpi: list = []
+        self.skipped: list = []
+        self.partial_images: list = []
+
+    def metadata(self) -> dict:
+        """``low_dpi_pages`` / ``skipped_pages`` (1-based) for ``Document.metadata``."""
+        skipped = sorted(set(self.skipped))
+        low_dpi = sorted(set(self.low_dpi) - set(skipped))
+        metadata = {}
+        if low_dpi:
+            metadata["low_dpi_pages"] = ",".join(str(i + 1) for i in low_dpi)
+        if skipped:
+            metadata["skipped_pages"] = ",".join(str(i + 1) for i in skipped)
+        if self.partial_images:
+            metadata["partial_image_pages"] = ",".join(
+                str(i + 1) for i in sorted(set(self.partial_images))
+            )
+        return metadata
+
+
+class RenderPool:
+    """Process-wide pool of render workers shared by every request.
 
-def _render_pages_parallel(
-    content: bytes, indices: list, scale: float, quality: int, max_edge: int, workers: int
-) -> dict | None:
-    """Render ``indices`` in parallel. Returns ``{index: jpeg_bytes}`` or None.
+    The pool belongs to one process: in aio mode each parse worker starts its
+    own, so a container runs up to ``grpc_parse_process_workers *
+    pdf_render_parallelism`` renderers, with CPU tokens bounding how many of
+    them work at once.
 
-    Returns None to signal the caller to fall back to serial rendering (when
-    parallelism is disabled, only one page is requested, or no usable
-    multiprocessing start method exists).
+    Each request registers a job; :meth:`_pump` keeps at most
+    ``workers * _RENDER_QUEUE_PER_WORKER`` pages in the executor, taking them
+    round-robin from jobs that have fewer than ``window`` unconsumed pages
+    and, with a CPU lease, fewer running pages than the tokens it holds.
+
+    A consumer whose next task runs past ``page_timeout`` seconds per page, or
+    whose worker dies, restarts the executor (see :meth:`_restart`): the
+    other tasks in flight are resubmitted and the offending page is retried
+    with the job's fallback, then replaced by its placeholder. A task is
+    timed, and blamed for a crash, only once a worker has started it (see
+    :meth:`_started_at`); tasks still queued are resubmitted unchanged.
     """
-    if workers <= 1 or len(indices) <= 1:
-        return None
-    ctx = _select_mp_context()
-    if ctx is None:
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.page_timeout = PAGE_TIMEOUT_SECONDS
+        self._tickets = 0
+        self._starts = None
+        self._executor = self._new_executor()
+        # Bumped by _restart; done callbacks of older executors are ignored.
+        self._generation = 0
+        self._crashes = 0
+        # Re-entrant: done callbacks may run synchronously inside _pump
+        # (already-finished or cancelled futures).
+        self._lock = threading.RLock()
+        # Signalled whenever a page is submitted or the pool breaks.
+        self._submitted = threading.Condition(self._lock)
+        self._jobs: deque = deque()
+        self._queued = 0
+        self._closed: deque = deque(maxlen=_RENDER_CLOSED_HISTORY)
+        self.broken = False
+
+    def iter_pages(self, pdf_path: str, indices: list, scale, quality, max_edge):
+        """Render ``indices`` of ``pdf_path``, yielding ``(index, jpeg)`` in order."""
+        return self.iter_tasks(
+            pdf_path, indices, _render_pool_task, (scale, quality, max_edge)
+        )
+
+    def iter_tasks(
+        self,
+        pdf_path: str,
+        items: list,
+        task,
+        args: tuple,
+        lease=None,
+        fallback=None,
+        placeholder=None,
+    ):
+        """Run ``task`` for each of ``items`` of ``pdf_path``, yielding results in order."""
+        window = max(1, min(len(items), self.workers * _RENDER_WINDOW_PER_WORKER))
+        job = self.open_job(
+            pdf_path,
+            task,
+            args,
+            window,
+            items,
+            feeding=False,
+            lease=lease,
+            fallback=fallback,
+            placeholder=placeholder,
+        )
+        yield from self.iter_results(job)
+
+    def open_job(
+        self,
+        pdf_path: str,
+        task,
+        args: tuple,
+        window: int,
+        items: list = (),
+        feeding: bool = True,
+        lease=None,
+        fallback=None,
+        placeholder=None,
+    ) -> _RenderJob:
+        """Register a job; with ``feeding`` more items follow via :meth:`add_items`.
+
+        The job must be consumed with :meth:`iter_results` or given back with
+        :meth:`release`. With a :class:`CpuLease` the job runs as many tasks
+        at once as the lease holds tokens, rebalanced as results are taken.
+        ``fallback`` and ``placeholder`` handle items that stall the pool
+        (see :class:`_RenderJob`); without a placeholder such an item fails.
+        """
+        job = _RenderJob(uuid.uuid4().hex, pdf_path, list(items), args, window, task)
+        job.feeding = feeding
+        job.lease = lease
+        job.fallback = fallback
+        job.placeholder = placeholder
+        with self._lock:
+            self._jobs.append(job)
+            self._pump()
+        return job
+
+    def add_items(self, job: _RenderJob, items: list) -> None:
+        if job.lease is not None:
+            job.lease.rebalance()
+        with self._lock:
+            job.remaining.extend(items)
+            self._pump()
+
+    def end_items(self, job: _RenderJob) -> None:
+        """No more items for ``job``: its consumer stops after the last one."""
+        with self._lock:
+            job.feeding = False
+            self._submitted.notify_all()
+
+    def iter_results(self, job: _RenderJob):
+        """Yield the results of ``job`` in item order, then release it."""
+        try:
+            while True:
+                if job.lease is not None:
+                    job.lease.rebalance()
+                with self._lock:
+                    self._pump()
+                    # Other jobs may hold every executor slot (or the items are
+                    # still being added, or the node is out of CPU tokens):
+                    # wait our turn.
+                    while (
+                        not job.futures
+                        and (job.remaining or job.feeding)
+                        and not self.broken
+                    ):
+                        self._submitted.wait(CANCEL_POLL_SECONDS)
+                        check_cancelled()
+                        if job.lease is not None and not job.lease.held:
+                            job.lease.rebalance()
+                            self._pump()
+                    if self.broken and not job.futures:
+                        raise BrokenProcessPool("render pool is broken")
+                    if not job.futures:
+                        break
+                page = self._await_head(job)
+                with self._lock:
+                    job.items.pop(job.futures.popleft(), None)
+                    self._pump()
+                yield page
+        finally:
+            self.release(job)
+
+    def _await_head(self, job: _RenderJob):
+        """Result of the next task of ``job``, watching it for stalls and crashes.
+
+        A restart replaces the job's futures, so the head is looked up again
+        on every poll.
+        """
+        future = None
+        started = None
+        while True:
+            check_cancelled()
+            with self._lock:
+                if job.futures[0] is not future:
+                    future, started = job.futures[0], None
+                item, _, ticket = job.items.get(future, (None, None, None))
+            try:
+                return future.result(timeout=CANCEL_POLL_SECONDS)
+            except FutureTimeoutError:
+                pass
+            except (BrokenProcessPool, CancelledError):
+                with self._lock:
+                    if job.futures and job.futures[0] is not future:
+                        continue
+                    self._crashes += 1
+                    if self._crashes > _RENDER_MAX_CRASHES or self.broken:
+                        self.broken = True
+                        self._submitted.notify_all()
+                        raise BrokenProcessPool("render pool is broken")
+                    # A page no worker had started cannot have killed one.
+                    if started is None:
+                        started = self._started_at(ticket)
+                    logger.warning(
+                        "render worker died %s page %s of %s; restarting the pool",
+                        "on" if started is not None else "before",
+                        item,
+                        job.pdf_path,
+                    )
+                    self._restart(future if started is not None else None)
+                continue
+            if started is None:
+                started = self._started_at(ticket)
+                continue
+            budget = self.page_timeout * _item_pages(item)
+            if self.page_timeout <= 0 or time.time() - started < budget:
+                continue
+            with self._lock:
+                if job.futures[0] is future and not future.done():
+                    logger.warning(
+                        "page %s of %s still running after %.0fs; "
+                        "restarting the render pool",
+                        item,
+                        job.pdf_path,
+                        budget,
+                    )
+                    self._restart(future)
+
+    def _started_at(self, ticket) -> float | None:
+        """When a worker started the task ``ticket`` (``time.time()``), or None."""
+        starts = self._starts
+        if starts is None or ticket is None:
+            return None
+        with starts.get_lock():
+            for slot in range(0, len(starts), 2):
+                if starts[slot] == ticket:
+                    return starts[slot + 1]
         return None
 
-    import tempfile
-    from concurrent.futures import ProcessPoolExecutor
+    def _restart(self, culprit: Future | None) -> None:
+        """Replace the executor, killing its workers (lock held).
 
-    tmp_path = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            prefix="docreader_render_", suffix=".pdf", delete=False
-        ) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
-        max_workers = min(workers, len(indices))
-        tasks = [(i, scale, quality, max_edge) for i in indices]
-        result: dict = {}
-        with ProcessPoolExecutor(
-            max_workers=max_workers,
+        Unfinished tasks of every job are resubmitted in order. The item of
+        ``culprit`` (if any) is resubmitted as its job's fallback tasks the
+        first time and completed with the job's placeholder the second time.
+        """
+        old = self._executor
+        try:
+            self._executor = self._new_executor()
+        except Exception:
+            self.broken = True
+            self._submitted.notify_all()
+            raise
+        self._generation += 1
+        self._queued = 0
+        for job in self._jobs:
+            job.running = 0
+            futures = list(job.futures)
+            job.futures.clear()
+            for future in futures:
+                # Finished pages and placeholders are kept.
+                if future not in job.items or (
+                    future.done()
+                    and not future.cancelled()
+                    and future.exception() is None
+                ):
+                    job.futures.append(future)
+                    continue
+                item, args, _ = job.items.pop(future)
+                if future is not culprit:
+                    job.futures.append(self._submit(job, item, args))
+                    continue
+                strikes = job.strikes[item] = job.strikes.get(item, 0) + 1
+                replacements = None
+                if strikes == 1 and job.fallback is not None:
+                    replacements = job.fallback(item)
+                if replacements is not None:
+                    for new_item, new_args in replacements:
+                        job.futures.append(self._submit(job, new_item, new_args))
+                    continue
+                done = Future()
+                if job.placeholder is not None:
+                    done.set_result(job.placeholder(item))
+                else:
+                    done.set_exception(
+                        TimeoutError(f"render pool task {item} stalled the pool")
+                    )
+                job.futures.append(done)
+        abort_process_pool(old)
+        self._submitted.notify_all()
+
+    def release(self, job: _RenderJob) -> None:
+        """Unregister ``job``, dropping the items it has not consumed."""
+        with self._lock:
+            if job.released:
+                return
+            job.released = True
+            if job in self._jobs:
+                self._jobs.remove(job)
+            # Abandoned early (consumer closed the stream): drop queued pages.
+            for future in job.futures:
+                future.cancel()
+            job.futures.clear()
+            job.items.clear()
+            job.remaining.clear()
+            self._closed.append(job.doc_id)
+            self._pump()
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _new_executor(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        ctx = select_mp_context() or multiprocessing.get_context()
+        # Fresh per executor, so records of killed workers do not linger.
+        self._starts = ctx.Array("d", 2 * self.workers)
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
             mp_context=ctx,
-            initializer=_render_pool_init,
-            initargs=(tmp_path,),
-        ) as ex:
-            for index, jpeg in ex.map(_render_pool_task, tasks, chunksize=4):
-                result[index] = jpeg
-        return result
-    except Exception:
-        logger.warning(
-            "parallel page rendering failed; falling back to serial",
-            exc_info=True,
+            initializer=_init_render_worker,
+            initargs=(self._starts, ctx.Value("i", 0)),
         )
-        return None
+
+    def _pump(self) -> None:
+        """Submit pages round-robin across jobs (lock held)."""
+        capacity = self.workers * _RENDER_QUEUE_PER_WORKER
+        idle = 0
+        while self._queued < capacity and self._jobs and idle < len(self._jobs):
+            job = self._jobs[0]
+            self._jobs.rotate(-1)
+            if (
+                not job.remaining
+                or len(job.futures) >= job.window
+                or (job.lease is not None and job.running >= job.lease.held)
+            ):
+                idle += 1
+                continue
+            idle = 0
+            index = job.remaining.popleft()
+            job.futures.append(self._submit(job, index, job.render_args))
+            self._submitted.notify_all()
+
+    def _submit(self, job: _RenderJob, item, args: tuple) -> Future:
+        """Submit one task of ``job`` to the executor (lock held)."""
+        self._tickets += 1
+        try:
+            future = self._executor.submit(
+                _run_render_task,
+                self._tickets,
+                job.task,
+                (job.doc_id, job.pdf_path, tuple(self._closed), item) + args,
+            )
+        except (BrokenProcessPool, RuntimeError):
+            self.broken = True
+            self._submitted.notify_all()
+            raise
+        self._queued += 1
+        job.running += 1
+        job.items[future] = (item, args, self._tickets)
+        future.add_done_callback(
+            functools.partial(self._task_done, job, self._generation)
+        )
+        return future
+
+    def _task_done(self, job: _RenderJob, generation: int, future) -> None:
+        with self._lock:
+            if generation != self._generation:
+                # Counted afresh by _restart.
+                return
+            if not future.cancelled() and future.exception() is None:
+                self._crashes = 0
+            self._queued -= 1
+            job.running -= 1
+            try:
+                self._pump()
+            except Exception:
+                # Surfaces to the consumers through their own futures.
+                logger.debug("render pool refill failed", exc_info=True)
+
+
+_render_pool: RenderPool | None = None
+_render_pool_lock = threading.Lock()
+
+
+def get_render_pool(workers: int) -> RenderPool:
+    """Return the process-wide render pool, (re)creating it when needed."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None and (
+            _render_pool.broken or _render_pool.workers != workers
+        ):
+            _render_pool.shutdown()
+            _render_pool = None
+        if _render_pool is None:
+            logger.info("Starting PDF render pool with %d workers", workers)
+            _render_pool = RenderPool(workers)
+        return _render_pool
+
+
+def shutdown_render_pool(wait: bool = False) -> None:
+    """Shut down this process's render pool, if one was started."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=wait)
+            _render_pool = None
+
+
+@contextlib.contextmanager
+def _spooled_pdf(content: bytes, pdf_path: str | None = None) -> Iterator[str]:
+    """Path of the PDF on disk for pool workers, writing ``content`` if needed."""
+    if pdf_path is not None:
+        yield pdf_path
+        return
+    import tempfile
+
+    with tempfile.NamedTemporaryFile(
+        prefix="docreader_render_", suffix=".pdf", delete=False
+    ) as tmp:
+        tmp.write(content)
+    try:
+        yield tmp.name
     finally:
-        if tmp_path:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+
+
+class _ScannedPageRenderer:
+    """Renders scanned pages as they are found, yielding ``(index, jpeg)``.
+
+    :meth:`add` queues a page as soon as it is known, so the shared render
+    pool works on it (up to ``ahead`` pages in advance) while the request
+    thread goes on with other pages; iterating yields the pages in the order
+    they were added. Without a usable pool, or once it fails, the pages not
+    yet yielded are rendered serially on ``pdf`` as they are consumed; pdfium
+    cannot be interrupted in the request thread, so those renders have no
+    timeout.
+
+    With ``verify``, each page is classified before it is rendered and pages
+    that turn out not to be scanned yield ``(index, None)``. Pages the pool
+    watchdog gives up on yield ``(index, _SKIPPED_PAGE)``; they and the pages
+    retried at low DPI are recorded in ``degraded``.
+
+    The ``pdf_render`` slot (taken by the first pool submission, or when
+    serial rendering starts), spooled upload and pool job are owned by
+    ``stack``, which the caller closes once done with the renderer.
+    """
+
+    def __init__(
+        self,
+        pdf,
+        content: bytes,
+        scale: float,
+        quality: int,
+        max_edge: int,
+        stack: contextlib.ExitStack,
+        pdf_path: str | None = None,
+        ahead: int | None = None,
+        parallel: bool = True,
+        verify: bool = False,
+        degraded: _DegradedPages | None = None,
+    ):
+        self.pdf = pdf
+        self.content = content
+        self.pdf_path = pdf_path
+        self.render_args = (scale, quality, max_edge)
+        self.verify = verify
+        self.stack = stack
+        self.workers = CONFIG.pdf_render_parallelism
+        self.ahead = ahead or self.workers * _RENDER_WINDOW_PER_WORKER
+        self.parallel = (
+            parallel and self.workers > 1 and select_mp_context() is not None
+        )
+        self.indices: list = []
+        self.degraded = degraded if degraded is not None else _DegradedPages()
+        self._pool = None
+        self._job = None
+        self._has_slot = False
+
+    def _take_slot(self) -> None:
+        if not self._has_slot:
+            self.stack.enter_context(
+                parser_worker_limit("pdf_render", CONFIG.pdf_render_max_workers)
+            )
+            self._has_slot = True
+
+    def add(self, index: int) -> None:
+        self.indices.append(index)
+        if not self.parallel:
+            return
+        try:
+            if self._job is None:
+                self._start_job()
+            self._pool.add_items(self._job, [index])
+        except Exception:
+            # Pages already queued still come from the pool.
+            logger.warning("queueing page render failed", exc_info=True)
+            self.parallel = False
+
+    def finish(self) -> None:
+        """No more pages will be added."""
+        if self._job is not None:
+            self._pool.end_items(self._job)
+
+    def _start_job(self) -> None:
+        self._take_slot()
+        path = self.stack.enter_context(_spooled_pdf(self.content, self.pdf_path))
+        self._pool = get_render_pool(self.workers)
+        task = _render_scanned_task if self.verify else _render_pool_task
+        lease = self.stack.enter_context(cpu_lease("pdf_render", self.workers))
+        self._job = self._pool.open_job(
+            path,
+            task,
+            self.render_args,
+            self.ahead,
+            lease=lease,
+            fallback=self._low_dpi,
+            placeholder=self._skip,
+        )
+        self.stack.callback(self._pool.release, self._job)
+
+    def _low_dpi(self, index: int):
+        scale = max(1, PAGE_FALLBACK_DPI) / 72
+        if scale >= self.render_args[0]:
+            return None
+        self.degraded.low_dpi.append(index)
+        return [(index, (scale,) + self.render_args[1:])]
+
+    def _skip(self, index: int):
+        self.degraded.skipped.append(index)
+        return index, _SKIPPED_PAGE
+
+    def __iter__(self):
+        if not self.indices:
+            return
+        self._take_slot()
+        done = 0
+        if self._job is not None:
             try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
+                for item in self._pool.iter_results(self._job):
+                    yield item
+                    done += 1
+            except ParseCancelled:
+                raise
+            except Exception:
+                logger.warning(
+                    "parallel page rendering failed after %d/%d pages; "
+                    "falling back to serial",
+                    done,
+                    len(self.indices),
+                    exc_info=True,
+                )
 
+        import pypdfium2.raw as pdfium_r
+
+        for i in self.indices[done:]:
+            check_cancelled()
+            page = self.pdf[i]
+            try:
+                if self.verify:
+                    jpeg = _render_scanned_page(page, pdfium_r, *self.render_args)
+                else:
+                    jpeg = _render_page_to_jpeg(page, *self.render_args)
+            finally:
+                _close_pdfium_resource(page)
+            yield i, jpeg
+
+
+def _iter_rendered_pages(
+    pdf,
+    content: bytes,
+    indices: list,
+    scale: float,
+    quality: int,
+    max_edge: int,
+    pdf_path: str | None = None,
+    degraded: _DegradedPages | None = None,
+):
+    """Render the given (scanned) page indices to JPEG, yielding ``(index, jpeg)``.
+
+    Pages are yielded in the order of ``indices`` as soon as each is ready,
+    rendered in the shared render pool when possible (see
+    :class:`_ScannedPageRenderer`). At most a small window of pages is in
+    flight, so memory stays bounded per page even when the consumer (a
+    streaming RPC) is slower than the workers. Skipped pages yield
+    ``_SKIPPED_PAGE`` and are recorded, with low-DPI ones, in ``degraded``.
+    """
+    with contextlib.ExitStack() as stack:
+        renderer = _ScannedPageRenderer(
+            pdf,
+            content,
+            scale,
+            quality,
+            max_edge,
+            stack,
+            pdf_path,
+            parallel=len(indices) > 1,
+            degraded=degraded,
+        )
+        for i in indices:
+            renderer.add(i)
+        renderer.finish()
+        yield from renderer
+
+
+# --- Pass 1: per-page analysis --------------------------------------------
 
-def _render_scanned_pages(
-    pdf, content: bytes, indices: list, scale: float, quality: int, max_edge: int
-) -> dict:
-    """Render the given (scanned) page indices to JPEG bytes.
 
-    Tries process-parallel rendering first (big win for large scanned PDFs),
-    transparently falling back to serial rendering on the already-open ``pdf``
-    handle when parallelism is unavailable or fails.
+def _analyze_page(
+    page, index, raw, base_name, scale, quality, max_edge, timer, deadline=None
+):
+    """Text, class and vector-figure clips of one page: ``(text, cls, clips)``.
+
+    Everything here is local to the page, so it runs equally in the request
+    thread or in a render-pool worker; cross-page filtering happens later.
+    In the request thread, ``deadline`` bounds the page-object walk (see
+    :func:`_page_objects`).
     """
-    parallel = _render_pages_parallel(
-        content, indices, scale, quality, max_edge, CONFIG.pdf_render_parallelism
-    )
-    if parallel is not None:
-        return parallel
+    with timer.span("text", index):
+        plain = _extract_page_text(page)
+    with timer.span("classify", index):
+        ratio = _page_image_area_ratio(page, raw, deadline)
+    cls = _classify_page(ratio, len(plain.strip()))
+    # Layout reconstruction only pays off (and is only spent) on native text
+    # pages; scanned pages are rendered, not read.
+    if cls == "text" and LAYOUT_ORDERING:
+        if _plain_is_well_formed(plain):
+            text = plain
+        else:
+            with timer.span("layout", index):
+                layout = _extract_layout_text(page, raw)
+            if layout and not _should_prefer_plain(plain, layout):
+                text = layout
+            else:
+                text = plain
+    else:
+        text = plain
+    clips: list = []
+    if cls == "text":
+        with timer.span("vector_clips", index):
+            clips = _extract_vector_figure_clips(
+                page, index, plain, raw, base_name, scale, quality, max_edge
+            )
+    with timer.span("postprocess", index):
+        text = _postprocess_pdf_text(text)
+    if clips:
+        text = _inject_figure_markdown_before_captions(text, clips)
+    return text, cls, clips
+
 
-    out: dict = {}
+def _analyze_document_page(
+    pdf, index, base_name, scale, quality, max_edge, timer, deadline=None
+):
+    """:func:`_analyze_page` of page ``index`` of the open document ``pdf``."""
+    import pypdfium2.raw as pdfium_r
+
+    page = pdf[index]
+    try:
+        return _analyze_page(
+            page, index, pdfium_r, base_name, scale, quality, max_edge, timer, deadline
+        )
+    finally:
+        _close_pdfium_resource(page)
+
+
+def _analyze_pages_task(args):
+    """Render-pool task: analyse a run of pages of a document.
+
+    Returns ``(index, text, cls, clips, stage_seconds)`` per page; the stage
+    times are replayed into the request's timer.
+    """
+    import pypdfium2.raw as pdfium_r
+
+    doc_id, pdf_path, closed, indices, base_name, scale, quality, max_edge = args
+    pdf = _render_worker_doc(doc_id, pdf_path, closed)
+    timer = StageTimer(per_page=True)
+    results = []
     for i in indices:
         page = pdf[i]
         try:
-            out[i] = _render_page_to_jpeg(page, scale, quality, max_edge)
+            text, cls, clips = _analyze_page(
+                page, i, pdfium_r, base_name, scale, quality, max_edge, timer
+            )
         finally:
             _close_pdfium_resource(page)
-    return out
+        results.append((i, text, cls, clips, timer.pages.get(i, {})))
+    return results
+
+
+def _use_parallel_analysis(page_count: int) -> bool:
+    return (
+        PARALLEL_ANALYSIS_MIN_PAGES > 0
+        and page_count >= PARALLEL_ANALYSIS_MIN_PAGES
+        and CONFIG.pdf_render_parallelism > 1
+        and select_mp_context() is not None
+    )
+
+
+def _analysis_ranges(indices: list, workers: int) -> list:
+    """Split page ``indices`` into consecutive runs, at least one per worker."""
+    size = max(1, min(ANALYSIS_RANGE_PAGES, -(-len(indices) // workers)))
+    return [tuple(indices[s : s + size]) for s in range(0, len(indices), size)]
+
+
+def _split_range(args: tuple, pages: tuple):
+    """Watchdog fallback of a pass-1 range: one task per page."""
+    if len(pages) < 2:
+        return None
+    return [((i,), args) for i in pages]
+
+
+def _skipped_range(pages: tuple) -> list:
+    """Watchdog placeholder of a pass-1 range (see :func:`_analyze_pages_task`)."""
+    return [(i, "", "skipped", [], {}) for i in pages]
+
+
+def _iter_page_analysis(
+    pdf,
+    indices: list,
+    base_name: str,
+    scale: float,
+    quality: int,
+    max_edge: int,
+    timer: StageTimer,
+    pdf_path: str | None = None,
+):
+    """Pass 1 over ``indices``, yielding ``(index, text, cls, clips)`` in order.
+
+    With ``pdf_path`` (the document on disk) page ranges are analysed in the
+    shared render pool; otherwise, or when the pool fails, pages are analysed
+    serially on ``pdf`` (resuming after the last page already yielded). A
+    range that stalls the pool is retried page by page, and a page that
+    stalls it again is yielded with class ``"skipped"``; serially, so is a
+    page whose object walk runs past ``PAGE_TIMEOUT_SECONDS``.
+    """
+    done = 0
+    if pdf_path is not None:
+        workers = CONFIG.pdf_render_parallelism
+        try:
+            pool = get_render_pool(workers)
+            args = (base_name, scale, quality, max_edge)
+            with cpu_lease("pdf_analysis", workers) as lease:
+                for results in pool.iter_tasks(
+                    pdf_path,
+                    _analysis_ranges(indices, workers),
+                    _analyze_pages_task,
+                    args,
+                    lease=lease,
+                    fallback=functools.partial(_split_range, args),
+                    placeholder=_skipped_range,
+                ):
+                    for i, text, cls, clips, stages in results:
+                        for stage, seconds in stages.items():
+                            timer.add(stage, seconds, i)
+                        yield i, text, cls, clips
+                        done += 1
+            return
+        except ParseCancelled:
+            raise
+        except Exception:
+            logger.warning(
+                "parallel page analysis failed after %d/%d pages; "
+                "falling back to serial",
+                done,
+                len(indices),
+                exc_info=True,
+            )
+
+    for i in indices[done:]:
+        check_cancelled()
+        try:
+            result = _analyze_document_page(
+                pdf, i, base_name, scale, quality, max_edge, timer, _page_deadline()
+            )
+        except _PageTimeout:
+            logger.warning(
+                "analysis of page %d timed out after %.0fs; skipping it",
+                i + 1,
+                PAGE_TIMEOUT_SECONDS,
+            )
+            result = ("", "skipped", [])
+        yield (i,) + result
+
+
+def _pdf_object_digest(obj, memo: dict) -> bytes:
+    """SHA-256 of a pypdf object and everything it references.
+
+    Indirect objects are digested once per document (``memo``), so fonts and
+    images shared by many pages are read once. Streams contribute their
+    encoded bytes.
+    """
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
+    from pypdf.generic import StreamObject
+
+    if isinstance(obj, IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        digest = memo.get(ref)
+        if digest is None:
+            # A cycle (e.g. through an annotation's /Popup) sees the marker.
+            memo[ref] = b"cycle"
+            digest = memo[ref] = _pdf_object_digest(obj.get_object(), memo)
+        return digest
+    h = hashlib.sha256()
+    if isinstance(obj, DictionaryObject):
+        h.update(b"<<")
+        for key in sorted(obj):
+            if key not in _FINGERPRINT_SKIP_KEYS:
+                h.update(key.encode("utf-8", "replace"))
+                h.update(_pdf_object_digest(obj.raw_get(key), memo))
+        if isinstance(obj, StreamObject):
+            data = getattr(obj, "_data", None)
+            h.update(b"stream")
+            h.update(data if data is not None else obj.get_data())
+    elif isinstance(obj, ArrayObject):
+        h.update(b"[")
+        for item in list.__iter__(obj):
+            h.update(_pdf_object_digest(item, memo))
+    else:
+        h.update(f"{type(obj).__name__}:{obj!r}".encode("utf-8", "replace"))
+    return h.digest()
+
+
+def _page_cache_settings() -> bytes:
+    """Everything besides the page itself that shapes its cached result.
+
+    Only settings that change a page's class, pass-1 text, vector clips or
+    rendered JPEG belong here; scheduling knobs (timeouts, parallelism,
+    render-ahead, sampling) must not invalidate the cache.
+    """
+    settings = {
+        "v": PAGE_CACHE_FORMAT_VERSION,
+        # Classification
+        "scan_image_area_ratio": SCAN_IMAGE_AREA_RATIO,
+        "scan_min_chars_per_page": SCAN_MIN_CHARS_PER_PAGE,
+        # Pass-1 text
+        "layout_ordering": LAYOUT_ORDERING,
+        "word_gap_width_ratio": WORD_GAP_WIDTH_RATIO,
+        "detect_headings": DETECT_HEADINGS,
+        "filter_hidden_text": FILTER_HIDDEN_TEXT,
+        "margin_col_width_ratio": MARGIN_COL_WIDTH_RATIO,
+        "min_heading_line_chars": MIN_HEADING_LINE_CHARS,
+        "sanitize_pdf_text": SANITIZE_PDF_TEXT,
+        "strip_chart_text_debris": STRIP_CHART_TEXT_DEBRIS,
+        # Vector figure clips
+        "render_vector_figures": RENDER_VECTOR_FIGURES,
+        "min_chart_region_chars": MIN_CHART_REGION_CHARS,
+        "min_chart_region_area_ratio": MIN_CHART_REGION_AREA_RATIO,
+        "max_chart_region_area_ratio": MAX_CHART_REGION_AREA_RATIO,
+        "max_figure_height_ratio": MAX_FIGURE_HEIGHT_RATIO,
+        # Rendered page images
+        "pdf_render_dpi": CONFIG.pdf_render_dpi,
+        "pdf_jpeg_quality": CONFIG.pdf_jpeg_quality,
+        "pdf_render_max_edge": CONFIG.pdf_render_max_edge,
+        "pdf_direct_page_images": CONFIG.pdf_direct_page_images,
+        "pdf_adaptive_render": CONFIG.pdf_adaptive_render,
+        "pdf_adaptive_min_dpi": CONFIG.pdf_adaptive_min_dpi,
+    }
+    return hashlib.sha256(repr(sorted(settings.items())).encode("utf-8")).digest()
+
+
+def _page_cache_keys(source, indices: list) -> dict:
+    """``{index: key}`` of the page cache for ``indices`` of ``source``.
+
+    A page's key is a fingerprint of its content stream and resources (read
+    with pypdf, as pdfium does not expose them) plus the parser settings, so
+    an unchanged page of a revised upload keeps its key. Documents pypdf
+    cannot read (encrypted, malformed) get no keys.
+    """
+    from pypdf import PdfReader
+
+    settings = _page_cache_settings()
+    try:
+        reader = PdfReader(
+            source if isinstance(source, str) else io.BytesIO(source), strict=False
+        )
+        memo: dict = {}
+        keys = {}
+        for i in indices:
+            check_cancelled()
+            digest = _pdf_object_digest(reader.pages[i], memo)
+            keys[i] = hashlib.sha256(settings + digest).hexdigest()
+        return keys
+    except ParseCancelled:
+        raise
+    except Exception:
+        logger.info("page fingerprinting failed; page cache skipped", exc_info=True)
+        return {}
+
+
+def _page_cache_entry(text: str, cls: str, clips: list, jpeg, prefix: str) -> dict:
+    """Cache entry of a page whose figure refs start with ``prefix``."""
+    return {
+        "text": text.replace(prefix, _PAGE_REF_TOKEN),
+        "cls": cls,
+        "clips": [
+            (ref.replace(prefix, _PAGE_REF_TOKEN), data, y, caption)
+            for ref, data, y, caption in clips
+        ],
+        "jpeg": jpeg,
+    }
+
+
+def _from_page_cache_entry(entry: dict, prefix: str) -> tuple:
+    """``(text, cls, clips, jpeg)`` of a cache entry, refs starting with ``prefix``."""
+    clips = [
+        (ref.replace(_PAGE_REF_TOKEN, prefix), data, y, caption)
+        for ref, data, y, caption in entry["clips"]
+    ]
+    text = entry["text"].replace(_PAGE_REF_TOKEN, prefix)
+    return text, entry["cls"], clips, entry["jpeg"]
 
 
 def _select_embedded_images(
@@ -1166,11 +2496,100 @@ def _select_embedded_images(
     return kept
 
 
-def _extract_embedded_images(pdf, classes, raw, base_name: str, quality: int) -> dict:
+def _jpeg_frame_size(data: bytes):
+    """``(width, height)`` of a JPEG that can be emitted as is, else None.
+
+    Only one- and three-component JPEGs qualify: CMYK (often Adobe-inverted)
+    streams render wrongly outside the PDF. So do streams with an EXIF block,
+    whose orientation viewers would apply although the PDF ignores it.
+    """
+    if data[:2] != b"\xff\xd8":
+        return None
+    pos, end = 2, len(data)
+    while pos + 4 <= end:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:  # no length field
+            pos += 2
+            continue
+        if marker == 0xE1 and data[pos + 4 : pos + 8] == b"Exif":
+            return None
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if pos + 10 > end or data[pos + 9] not in (1, 3):
+                return None
+            height = int.from_bytes(data[pos + 5 : pos + 7], "big")
+            width = int.from_bytes(data[pos + 7 : pos + 9], "big")
+            return (width, height) if width and height else None
+        if marker == 0xDA:  # scan data before any frame header
+            return None
+        pos += 2 + int.from_bytes(data[pos + 2 : pos + 4], "big")
+    return None
+
+
+def _embedded_jpeg(obj):
+    """Original stream and size of a DCT-encoded image object, or None."""
+    try:
+        if obj.get_filters(skip_simple=True) != ["DCTDecode"]:
+            return None
+        data = bytes(obj.get_data(decode_simple=True))
+    except Exception:
+        return None
+    size = _jpeg_frame_size(data)
+    return (data, size) if size else None
+
+
+def _encode_fitted_jpeg(pil, quality: int, max_edge: int) -> bytes:
+    """JPEG-encode ``pil``, scaled down so its long edge is at most ``max_edge``."""
+    if pil.mode not in ("RGB", "L"):
+        pil = pil.convert("RGB")
+    if max_edge > 0 and max(pil.size) > max_edge:
+        ratio = max_edge / max(pil.size)
+        pil = pil.resize(
+            (max(1, int(pil.width * ratio)), max(1, int(pil.height * ratio)))
+        )
+    return _pil_to_jpeg_bytes(pil, quality)
+
+
+def _fit_jpeg(data: bytes, size: tuple, quality: int, max_edge: int) -> bytes:
+    """``data`` unchanged if it fits within ``max_edge``, else a smaller JPEG.
+
+    Oversized JPEGs are decoded in draft mode, so libjpeg already scales them
+    down while decoding.
+    """
+    if max_edge <= 0 or max(size) <= max_edge:
+        return data
+    from PIL import Image
+
+    pil = Image.open(io.BytesIO(data))
+    ratio = max_edge / max(pil.size)
+    pil.draft("RGB", (int(pil.width * ratio), int(pil.height * ratio)))
+    return _encode_fitted_jpeg(pil, quality, max_edge)
+
+
+def _extract_embedded_images(
+    pdf,
+    classes,
+    raw,
+    base_name: str,
+    quality: int,
+    degraded: _DegradedPages | None = None,
+) -> dict:
     """Extract filtered embedded figures from native text pages.
 
-    Returns ``{page_index: [(ref_path, base64_jpeg, y_top), ...]}`` ordered so
+    Returns ``{page_index: [(ref_path, jpeg_bytes, y_top), ...]}`` ordered so
     callers can place figures after the page text in top-to-bottom order.
+
+    DCT (JPEG) images are hashed on their compressed stream and, when they fit
+    within ``pdf_render_max_edge``, emitted unchanged; other images are
+    decoded, hashed on their pixels and re-encoded.
+
+    This runs in the request thread, so a page's scan stops after
+    ``PAGE_TIMEOUT_SECONDS``: the figures found until then are kept and the
+    page is recorded in ``degraded``.
     """
     import hashlib
 
@@ -1178,7 +2597,7 @@ def _extract_embedded_images(pdf, classes, raw, base_name: str, quality: int) ->
     if not text_indices:
         return {}
 
-    candidates: list = []  # parallel to meta; holds heavy pixel data
+    candidates: list = []  # parallel to meta; JPEG stream or decoded PIL image
     meta: list = []
     for i in text_indices:
         page = pdf[i]
@@ -1187,7 +2606,7 @@ def _extract_embedded_images(pdf, classes, raw, base_name: str, quality: int) ->
             page_area = float(width) * float(height)
             if page_area <= 0:
                 continue
-            for obj in page.get_objects():
+            for obj in _page_objects(page, _page_deadline()):
                 if obj.type != raw.FPDF_PAGEOBJ_IMAGE:
                     continue
                 try:
@@ -1197,21 +2616,35 @@ def _extract_embedded_images(pdf, classes, raw, base_name: str, quality: int) ->
                 area_ratio = abs((right - left) * (top - bottom)) / page_area
                 if area_ratio < EMBED_MIN_AREA_RATIO:
                     continue  # cheap skip before decoding (logos/decorations)
-                try:
-                    pil = obj.get_bitmap().to_pil()
-                except Exception:
-                    continue
-                content_hash = hashlib.md5(pil.tobytes()).hexdigest()
-                candidates.append((i, top, pil))
+                jpeg = _embedded_jpeg(obj)
+                if jpeg is not None:
+                    image, (img_w, img_h) = jpeg
+                    content_hash = hashlib.md5(image).hexdigest()
+                else:
+                    try:
+                        image = obj.get_bitmap().to_pil()
+                    except Exception:
+                        continue
+                    img_w, img_h = image.size
+                    content_hash = hashlib.md5(image.tobytes()).hexdigest()
+                candidates.append((i, top, image))
                 meta.append(
                     {
                         "page": i,
-                        "width": pil.width,
-                        "height": pil.height,
+                        "width": img_w,
+                        "height": img_h,
                         "area_ratio": area_ratio,
                         "hash": content_hash,
                     }
                 )
+        except _PageTimeout:
+            logger.warning(
+                "embedded image scan of page %d timed out after %.0fs",
+                i + 1,
+                PAGE_TIMEOUT_SECONDS,
+            )
+            if degraded is not None:
+                degraded.partial_images.append(i)
         finally:
             _close_pdfium_resource(page)
 
@@ -1225,22 +2658,17 @@ def _extract_embedded_images(pdf, classes, raw, base_name: str, quality: int) ->
     per_page_count: dict = defaultdict(int)
     max_edge = CONFIG.pdf_render_max_edge
     for idx in kept_idx:
-        page_i, y_top, pil = candidates[idx]
-        if pil.mode not in ("RGB", "L"):
-            pil = pil.convert("RGB")
-        if max_edge > 0 and max(pil.size) > max_edge:
-            ratio = max_edge / max(pil.size)
-            pil = pil.resize(
-                (max(1, int(pil.width * ratio)), max(1, int(pil.height * ratio)))
-            )
-        buf = io.BytesIO()
-        pil.save(buf, format="JPEG", quality=quality, optimize=True)
+        page_i, y_top, image = candidates[idx]
+        if isinstance(image, bytes):
+            # Original JPEG stream: no decode and no generation loss if it fits.
+            size = (meta[idx]["width"], meta[idx]["height"])
+            data = _fit_jpeg(image, size, quality, max_edge)
+        else:
+            data = _encode_fitted_jpeg(image, quality, max_edge)
         per_page_count[page_i] += 1
         fname = f"{base_name}_p{page_i+1}_img{per_page_count[page_i]}.jpg"
         ref_path = f"images/{fname}"
-        result[page_i].append(
-            (ref_path, base64.b64encode(buf.getvalue()).decode("utf-8"), y_top)
-        )
+        result[page_i].append((ref_path, data, y_top))
 
     # Top-to-bottom within each page (PDF y grows upward, so larger y first).
     for page_i in result:
@@ -1293,11 +2721,18 @@ class PDFScannedParser(BaseParser):
     performs OCR on the extracted page images.
     """
 
+    accepts_source_path = True
+    accepts_page_selection = True
+
+    def page_count(self, content: bytes) -> int:
+        return _pdf_page_count(self.source_path or content)
+
     def parse_into_text(self, content: bytes) -> Document:
+        return merge_document_parts(self.iter_parse_into_text(content))
+
+    def iter_parse_into_text(self, content: bytes) -> Iterator[DocumentPart]:
         import pypdfium2 as pdfium
 
-        images = {}
-        markdown_lines = []
         base_name = os.path.splitext(self.file_name or "document")[0]
 
         logger.info(
@@ -1306,39 +2741,50 @@ class PDFScannedParser(BaseParser):
         )
 
         try:
-            with parser_worker_limit("pdf_render", CONFIG.pdf_render_max_workers):
-                pdf = pdfium.PdfDocument(content)
+            pdf = pdfium.PdfDocument(self.source_path or content)
+            try:
+                page_count = len(pdf)
+                indices = self.selected_pages(page_count)
+                scale = max(1, CONFIG.pdf_render_dpi) / 72
+                quality = _normalize_image_quality(CONFIG.pdf_jpeg_quality)
+                degraded = _DegradedPages()
+
+                # Holds the pdf_render slot while pages are rendered.
+                rendered = _iter_rendered_pages(
+                    pdf,
+                    content,
+                    indices,
+                    scale,
+                    quality,
+                    CONFIG.pdf_render_max_edge,
+                    pdf_path=self.source_path,
+                    degraded=degraded,
+                )
                 try:
-                    page_count = len(pdf)
-                    scale = max(1, CONFIG.pdf_render_dpi) / 72
-                    quality = _normalize_image_quality(CONFIG.pdf_jpeg_quality)
-
-                    rendered = _render_scanned_pages(
-                        pdf,
-                        content,
-                        list(range(page_count)),
-                        scale,
-                        quality,
-                        CONFIG.pdf_render_max_edge,
-                    )
+                    for i, jpeg in rendered:
+                        if jpeg == _SKIPPED_PAGE:
+                            yield DocumentPart(content="", page_index=i)
+                            continue
+                        page_filename = f"{base_name}_page_{i+1}.jpg"
+                        ref_path = f"images/{page_filename}"
+                        yield DocumentPart(
+                            content=f"![{page_filename}]({ref_path})",
+                            images={ref_path: jpeg},
+                            page_index=i,
+                        )
                 finally:
-                    _close_pdfium_resource(pdf)
-
-            for i in range(page_count):
-                page_filename = f"{base_name}_page_{i+1}.jpg"
-                ref_path = f"images/{page_filename}"
-                markdown_lines.append(f"![{page_filename}]({ref_path})")
-                images[ref_path] = base64.b64encode(rendered[i]).decode("utf-8")
-
-            text = "\n\n".join(markdown_lines)
-            return Document(
-                content=text,
-                images=images,
-                metadata={
-                    "image_source_type": "scanned_pdf",
-                    "page_count": page_count,
-                },
-            )
+                    rendered.close()
+            finally:
+                _close_pdfium_resource(pdf)
+
+            PDF_PAGES.inc(len(indices), kind="scanned")
+            metadata = {"image_source_type": "scanned_pdf", "page_count": page_count}
+            if self.page_selection is not None:
+                metadata["selected_pages"] = self.page_selection.describe()
+            metadata.update(degraded.metadata())
+            yield DocumentPart(metadata=metadata)
+        except ParseCancelled:
+            raise
         except Exception as e:
             logger.exception("PDFScannedParser failed to parse PDF: %s", e)
             raise e
@@ -1356,9 +2802,17 @@ class PDFParser(BaseParser):
     the parser falls back to rendering all pages as images (safe last resort).
     """
 
+    accepts_source_path = True
+    accepts_page_selection = True
+
+    def page_count(self, content: bytes) -> int:
+        return _pdf_page_count(self.source_path or content)
+
     def parse_into_text(self, content: bytes) -> Document:
         try:
             return self._route(content)
+        except ParseCancelled:
+            raise
         except Exception:
             logger.exception(
                 "PDFParser: per-page routing failed for %s; "
@@ -1366,10 +2820,42 @@ class PDFParser(BaseParser):
                 self.file_name,
             )
             return PDFScannedParser(
-                file_name=self.file_name, file_type=self.file_type
+                file_name=self.file_name,
+                file_type=self.file_type,
+                source_path=self.source_path,
+                page_selection=self.page_selection,
             ).parse_into_text(content)
 
+    def iter_parse_into_text(self, content: bytes) -> Iterator[DocumentPart]:
+        # Same fallback as parse_into_text, but only while nothing has been
+        # emitted yet: fragments already streamed cannot be taken back.
+        started = False
+        try:
+            for part in self._iter_route(content):
+                started = True
+                yield part
+            return
+        except ParseCancelled:
+            raise
+        except Exception:
+            if started:
+                raise
+            logger.exception(
+                "PDFParser: per-page routing failed for %s; "
+                "falling back to full image rendering",
+                self.file_name,
+            )
+        yield from PDFScannedParser(
+            file_name=self.file_name,
+            file_type=self.file_type,
+            source_path=self.source_path,
+            page_selection=self.page_selection,
+        ).iter_parse_into_text(content)
+
     def _route(self, content: bytes) -> Document:
+        return merge_document_parts(self._iter_route(content))
+
+    def _iter_route(self, content: bytes) -> Iterator[DocumentPart]:
         import pypdfium2 as pdfium
         import pypdfium2.raw as pdfium_r
 
@@ -1377,129 +2863,237 @@ class PDFParser(BaseParser):
         scale = max(1, CONFIG.pdf_render_dpi) / 72
         quality = _normalize_image_quality(CONFIG.pdf_jpeg_quality)
 
-        pdf = pdfium.PdfDocument(content)
-        images: dict = {}
+        embedded_count = 0
+        vector_figure_count = 0
+        pdf_path = self.source_path
+        # Render-pool resources: temp copy of the upload for pool workers (when
+        # one is needed), the pdf_render slot and the scanned-page render job.
+        resources = contextlib.ExitStack()
+        timer = StageTimer(per_page=PAGE_TIMINGS)
+        with timer.span("open"):
+            pdf = pdfium.PdfDocument(self.source_path or content)
         try:
             page_count = len(pdf)
-
-            # Pass 1: cheap text extraction + image-area classification.
-            texts: list = []
-            classes: list = []
+            # Selected pages; the cross-page filters below only see these.
+            indices = self.selected_pages(page_count)
+            # Pages unchanged since an earlier upload (same content stream and
+            # resources) come from the page cache; only the others are worked.
+            page_cache = get_page_cache()
+            cache_keys: dict = {}
+            cached: dict = {}
+            if page_cache is not None:
+                with timer.span("page_cache"):
+                    cache_keys = _page_cache_keys(self.source_path or content, indices)
+                    for i, key in cache_keys.items():
+                        entry = page_cache.get(key)
+                        if entry is not None:
+                            cached[i] = _from_page_cache_entry(
+                                entry, f"{base_name}_p{i + 1}_fig"
+                            )
+            todo = [i for i in indices if i not in cached]
+            # Long, evenly scanned documents (fax archives) skip pass 1.
+            with timer.span("sample"):
+                fully_scanned = _looks_fully_scanned(pdf, todo, pdfium_r)
+
+            # Pass 1: cheap text extraction + image-area classification. This
+            # has to see the whole document before anything is emitted
+            # (running header/footer removal and the embedded-image repetition
+            # filter are cross-page), so only the per-page work is parallel.
+            # Long documents are analysed in page ranges on the render pool.
+            if not fully_scanned and _use_parallel_analysis(len(todo)):
+                pdf_path = resources.enter_context(_spooled_pdf(content, pdf_path))
+                analysis_path = pdf_path
+            else:
+                analysis_path = None
+            # Scanned pages go to the render pool as soon as they are
+            # classified, so rendering overlaps the rest of pass 1 and the
+            # embedded-image extraction; pass 2 then collects them in order.
+            degraded = _DegradedPages()
+            renderer = _ScannedPageRenderer(
+                pdf,
+                content,
+                scale,
+                quality,
+                CONFIG.pdf_render_max_edge,
+                resources,
+                pdf_path,
+                ahead=RENDER_AHEAD_PAGES,
+                verify=fully_scanned,
+                degraded=degraded,
+            )
+            # Indexed by page; unselected pages keep class None.
+            texts: list = [""] * page_count
+            classes: list = [None] * page_count
             vector_clips: dict = {}
-            for i in range(page_count):
-                page = pdf[i]
-                try:
-                    plain = _extract_page_text(page)
-                    ratio = _page_image_area_ratio(page, pdfium_r)
-                    cls = _classify_page(ratio, len(plain.strip()))
-                    # Layout reconstruction only pays off (and is only spent) on
-                    # native text pages; scanned pages are rendered, not read.
-                    if cls == "text" and LAYOUT_ORDERING:
-                        if _plain_is_well_formed(plain):
-                            text = plain
-                        else:
-                            layout = _extract_layout_text(page, pdfium_r)
-                            if layout and not _should_prefer_plain(plain, layout):
-                                text = layout
-                            else:
-                                text = plain
-                    else:
-                        text = plain
-                    if cls == "text":
-                        clips = _extract_vector_figure_clips(
-                            page,
+            for i, (text, cls, clips, _jpeg) in cached.items():
+                texts[i], classes[i] = text, cls
+                if clips:
+                    vector_clips[i] = clips
+            if fully_scanned:
+                # Taken as scanned; the render workers check each page and
+                # pass 2 analyses the ones that are not.
+                analysis = [(i, "", "scanned", []) for i in todo]
+            else:
+                analysis = _iter_page_analysis(
+                    pdf,
+                    todo,
+                    base_name,
+                    scale,
+                    quality,
+                    CONFIG.pdf_render_max_edge,
+                    timer,
+                    pdf_path=analysis_path,
+                )
+            for i, text, cls, clips in analysis:
+                if clips:
+                    vector_clips[i] = clips
+                texts[i] = text
+                classes[i] = cls
+                if cls == "scanned":
+                    renderer.add(i)
+                elif cls == "skipped":
+                    degraded.skipped.append(i)
+            renderer.finish()
+
+            # Pass-1 texts are cached as they are: the filters below see the
+            # whole document.
+            page_texts = texts
+            with timer.span("strip_repeating"):
+                texts = _strip_repeating_lines(texts, classes)
+
+            # Embedded figures from native text pages so the Go App can
+            # OCR/caption them (logos/watermarks/tiny images filtered).
+            embedded: dict = {}
+            if EXTRACT_EMBEDDED_IMAGES:
+                with timer.span("embedded_images"):
+                    embedded = _extract_embedded_images(
+                        pdf, classes, pdfium_r, base_name, quality, degraded
+                    )
+
+            def remember(i: int, text: str, jpeg=None) -> None:
+                # Degraded pages are worked again next time.
+                if i in cache_keys and i not in cached and i not in degraded.low_dpi:
+                    entry = _page_cache_entry(
+                        text,
+                        classes[i],
+                        vector_clips.get(i, []),
+                        jpeg,
+                        f"{base_name}_p{i + 1}_fig",
+                    )
+                    page_cache.put(cache_keys[i], entry)
+
+            # Pass 2: emit pages in reading order. Scanned pages are rendered
+            # (heavy work, rate-limited) and emitted one by one as they finish.
+            rendered = iter(renderer)
+            resources.callback(rendered.close)
+            for i in indices:
+                check_cancelled()
+                if classes[i] == "scanned" and i in cached:
+                    img_bytes = cached[i][3]
+                elif classes[i] == "scanned":
+                    # Wall time spent waiting for the render workers.
+                    with timer.span("render", i):
+                        index, img_bytes = next(rendered)
+                    if index != i:
+                        raise RuntimeError(
+                            f"render order mismatch: expected page {i}, got {index}"
+                        )
+                    if img_bytes == _SKIPPED_PAGE:
+                        classes[i] = "skipped"
+                    elif img_bytes is None:
+                        # Fast path only: a page the sample missed has a text
+                        # layer after all. It is analysed now, without the
+                        # cross-page filters and embedded-image extraction.
+                        texts[i], classes[i], clips = _analyze_document_page(
+                            pdf,
                             i,
-                            plain,
-                            pdfium_r,
                             base_name,
                             scale,
                             quality,
                             CONFIG.pdf_render_max_edge,
+                            timer,
                         )
                         if clips:
                             vector_clips[i] = clips
-                            for ref_path, b64, _y, _cap in clips:
-                                images[ref_path] = b64
-                    text = _postprocess_pdf_text(text)
-                    if cls == "text" and vector_clips.get(i):
-                        text = _inject_figure_markdown_before_captions(
-                            text, vector_clips[i]
-                        )
-                finally:
-                    _close_pdfium_resource(page)
-                texts.append(text)
-                classes.append(cls)
-
-            texts = _strip_repeating_lines(texts, classes)
-            scanned_indices = [i for i, c in enumerate(classes) if c == "scanned"]
-
-            # Pass 2: render only the scanned pages (heavy work, rate-limited).
-            if scanned_indices:
-                with parser_worker_limit("pdf_render", CONFIG.pdf_render_max_workers):
-                    rendered = _render_scanned_pages(
-                        pdf,
-                        content,
-                        scanned_indices,
-                        scale,
-                        quality,
-                        CONFIG.pdf_render_max_edge,
+                        page_texts[i] = texts[i]
+                    else:
+                        remember(i, page_texts[i], img_bytes)
+                if classes[i] == "scanned":
+                    page_filename = f"{base_name}_page_{i+1}.jpg"
+                    ref_path = f"images/{page_filename}"
+                    yield DocumentPart(
+                        content=f"![{page_filename}]({ref_path})",
+                        images={ref_path: img_bytes},
+                        page_index=i,
                     )
-                for i, img_bytes in rendered.items():
-                    ref_path = f"images/{base_name}_page_{i+1}.jpg"
-                    images[ref_path] = base64.b64encode(img_bytes).decode("utf-8")
-
-            # Pass 3: extract embedded figures from native text pages so the Go
-            # App can OCR/caption them (logos/watermarks/tiny images filtered).
-            embedded: dict = {}
-            if EXTRACT_EMBEDDED_IMAGES:
-                embedded = _extract_embedded_images(
-                    pdf, classes, pdfium_r, base_name, quality
-                )
-                for refs in embedded.values():
-                    for ref_path, b64, _y in refs:
-                        images[ref_path] = b64
-        finally:
-            _close_pdfium_resource(pdf)
+                    continue
+                if classes[i] == "skipped":
+                    # Given up by the render-pool watchdog.
+                    yield DocumentPart(content="", page_index=i)
+                    continue
 
-        # Assemble markdown in reading order.
-        embedded_count = 0
-        vector_figure_count = 0
-        blocks = []
-        for i in range(page_count):
-            if classes[i] == "scanned":
-                page_filename = f"{base_name}_page_{i+1}.jpg"
-                blocks.append(f"![{page_filename}](images/{page_filename})")
-            else:
+                remember(i, page_texts[i])
+                blocks = []
+                page_images: dict = {}
                 stripped = texts[i].strip()
                 if stripped:
                     blocks.append(stripped)
-                vector_figure_count += len(vector_clips.get(i, []))
-                page_images = list(embedded.get(i, []))
-                page_images.sort(key=lambda item: item[2], reverse=True)
-                for ref_path, _b64, _y in page_images:
+                for ref_path, jpeg, _y, _cap in vector_clips.get(i, []):
+                    page_images[ref_path] = jpeg
+                    vector_figure_count += 1
+                figures = list(embedded.get(i, []))
+                figures.sort(key=lambda item: item[2], reverse=True)
+                for ref_path, jpeg, _y in figures:
                     fname = os.path.basename(ref_path)
                     blocks.append(f"![{fname}]({ref_path})")
+                    page_images[ref_path] = jpeg
                     embedded_count += 1
+                yield DocumentPart(
+                    content="\n\n".join(blocks),
+                    images=page_images,
+                    page_index=i,
+                )
+        finally:
+            _close_pdfium_resource(pdf)
+            resources.close()
 
-        content_text = "\n\n".join(blocks).strip()
-
+        timer.finish()
+        scanned_indices = [i for i, c in enumerate(classes) if c == "scanned"]
+        skipped_count = classes.count("skipped")
+        text_page_count = len(indices) - len(scanned_indices) - skipped_count
         metadata = {
             "page_count": page_count,
             "scanned_page_count": len(scanned_indices),
-            "text_page_count": page_count - len(scanned_indices),
+            "text_page_count": text_page_count,
             "embedded_image_count": embedded_count,
             "vector_figure_count": vector_figure_count,
             "image_source_type": "scanned_pdf" if scanned_indices else "pdf_text_layer",
+            **timer.summary(),
         }
+        if self.page_selection is not None:
+            metadata["selected_pages"] = self.page_selection.describe()
+        if fully_scanned:
+            metadata["scanned_fast_path"] = True
+        metadata.update(degraded.metadata())
+        if page_cache is not None:
+            metadata["page_cache_hits"] = len(cached)
 
         logger.info(
-            "PDFParser: %s -> %d pages (%d scanned, %d text), "
-            "embedded_images=%d, content_len=%d",
+            "PDFParser: %s -> %d/%d pages (%d scanned, %d text), embedded_images=%d",
             self.file_name,
+            len(indices),
             page_count,
             len(scanned_indices),
-            page_count - len(scanned_indices),
+            text_page_count,
             embedded_count,
-            len(content_text),
         )
-        return Document(content=content_text, images=images, metadata=metadata)
+        PDF_PAGES.inc(len(scanned_indices), kind="scanned")
+        PDF_PAGES.inc(text_page_count, kind="text")
+        for stage, seconds in timer.totals.items():
+            PDF_STAGE_DURATION.observe(seconds, stage=stage)
+        if CONFIG.otel_tracing:
+            timer.export_otel(
+                "docreader.pdf.route",
+                {"file_name": self.file_name or "", "page_count": page_count},
+            )
+        yield DocumentPart(metadata=metadata)
@@ -8,6 +8,7 @@ import subprocess
 import tempfile
 import time
 from pathlib import Path
+from docreader.parser.concurrency import cpu_lease
 from docreader.parser.excel_convert import find_soffice
 
 logger = logging.getLogger(__name__)
@@ -59,7 +60,8 @@ def convert_ppt_to_pptx_bytes(content: bytes, suffix: str = ".ppt") -> bytes | N
                 src,
             ]
             try:
-                result = subprocess.run(cmd, capture_output=True, timeout=120)
+                with cpu_lease("soffice", 1):
+                    result = subprocess.run(cmd, capture_output=True, timeout=120)
             except (OSError, subprocess.TimeoutExpired) as exc:
                 logger.warning("LibreOffice PPT convert failed to start: %s", exc)
                 return None
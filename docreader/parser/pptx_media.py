@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 import io
 import logging
 import os
@@ -13,6 +12,8 @@ import uuid
 import zipfile
 from typing import Dict, List, Tuple
 
+from docreader.parser.concurrency import cpu_lease
+
 logger = logging.getLogger(__name__)
 
 _MARKDOWN_IMAGE = re.compile(r"!\[([^\]]*)\]\(([^)]+)\)")
@@ -45,11 +46,12 @@ def _rasterize_with_imagemagick(data: bytes, suffix: str) -> bytes | None:
         with open(src, "wb") as handle:
             handle.write(data)
         try:
-            result = subprocess.run(
-                [convert, src, dst],
-                capture_output=True,
-                timeout=60,
-            )
+            with cpu_lease("imagemagick", 1):
+                result = subprocess.run(
+                    [convert, src, dst],
+                    capture_output=True,
+                    timeout=60,
+                )
         except (OSError, subprocess.TimeoutExpired) as exc:
             logger.warning("ImageMagick convert failed: %s", exc)
             return None
@@ -126,13 +128,13 @@ def _is_unresolved_image_ref(url: str) -> bool:
 
 def attach_pptx_media_to_markdown(
     markdown: str, pptx_bytes: bytes
-) -> Tuple[str, Dict[str, str]]:
+) -> Tuple[str, Dict[str, bytes]]:
     """Replace unresolved ![](...) refs with images/ paths and inline image payloads."""
     media = extract_pptx_media_rasterized(pptx_bytes)
     if not media:
         return markdown, {}
 
-    images: Dict[str, str] = {}
+    images: Dict[str, bytes] = {}
     media_iter = iter(media)
 
     def repl(match: re.Match[str]) -> str:
@@ -144,7 +146,7 @@ def attach_pptx_media_to_markdown(
         except StopIteration:
             return match.group(0)
         ref = f"images/{uuid.uuid4()}.png"
-        images[ref] = base64.b64encode(png).decode()
+        images[ref] = png
         return f"![{alt}]({ref})"
 
     return _MARKDOWN_IMAGE.sub(repl, markdown), images
@@ -1,23 +1,25 @@
+import importlib
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from docreader.parser.base_parser import BaseParser
-from docreader.parser.doc_parser import DocParser
-from docreader.parser.docx2_parser import Docx2Parser
-from docreader.parser.excel_parser import ExcelParser
-from docreader.parser.image_parser import ImageParser
-from docreader.parser.markdown_parser import MarkdownParser
-from docreader.parser.markitdown_parser import MarkitdownParser
-from docreader.parser.opendataloader_parser import (
-    OpenDataLoaderParser,
-    opendataloader_available,
-)
-from docreader.parser.pdf_parser import PDFParser
 
 logger = logging.getLogger(__name__)
 
 BUILTIN_ENGINE = "builtin"
 
+# A parser class, or a lazy "module.path:ClassName" reference to one.
+ParserRef = Union[Type[BaseParser], str]
+
+
+def _load(ref):
+    """Import a "module.path:attr" reference (objects are returned as is)."""
+    if not isinstance(ref, str):
+        return ref
+    module_name, _, attr = ref.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
 
 class ParserEngineRegistry:
     """Registry for parser engines.
@@ -25,20 +27,29 @@ class ParserEngineRegistry:
     Each engine maps file extensions to parser classes.
     When a requested engine doesn't support a file type, the registry
     falls back to the builtin engine automatically.
+
+    Parser classes (and ``check_available`` callables) may be registered as
+    lazy ``"module.path:Name"`` strings; the module is imported the first time
+    the entry is used, so a deployment that only parses PDFs never imports
+    pandas, markitdown or python-docx. :meth:`warm_up` imports entries ahead
+    of the first request.
     """
 
     def __init__(self):
-        self._engines: Dict[str, Dict[str, Type[BaseParser]]] = {}
+        self._engines: Dict[str, Dict[str, ParserRef]] = {}
         self._descriptions: Dict[str, str] = {}
-        self._check_available: Dict[str, Callable[..., Tuple[bool, str]]] = {}
+        self._check_available: Dict[
+            str, Union[Callable[..., Tuple[bool, str]], str]
+        ] = {}
         self._unavailable_hint: Dict[str, str] = {}
+        self._load_lock = threading.Lock()
 
     def register(
         self,
         name: str,
-        file_types: Dict[str, Type[BaseParser]],
+        file_types: Dict[str, ParserRef],
         description: str = "",
-        check_available: Callable[..., Tuple[bool, str]] | None = None,
+        check_available: Callable[..., Tuple[bool, str]] | str | None = None,
         unavailable_hint: str = "",
     ):
         self._engines[name] = file_types
@@ -61,23 +72,63 @@ class ParserEngineRegistry:
         ft = file_type.lower()
 
         if engine and engine in self._engines:
-            cls = self._engines[engine].get(ft)
-            if cls:
+            if ft in self._engines[engine]:
                 logger.info("Using engine '%s' for file type '%s'", engine, ft)
-                return cls
+                return self._resolve(engine, ft)
             logger.info(
                 "Engine '%s' does not support '%s', falling back to builtin",
                 engine,
                 ft,
             )
 
-        builtin = self._engines.get(BUILTIN_ENGINE, {})
-        cls = builtin.get(ft)
-        if cls:
-            return cls
+        if ft in self._engines.get(BUILTIN_ENGINE, {}):
+            return self._resolve(BUILTIN_ENGINE, ft)
 
         raise ValueError(f"Unsupported file type: {file_type}")
 
+    def _resolve(self, engine: str, ft: str) -> Type[BaseParser]:
+        """Return the parser class of an entry, importing it on first use."""
+        ref = self._engines[engine][ft]
+        if not isinstance(ref, str):
+            return ref
+        with self._load_lock:
+            ref = self._engines[engine][ft]
+            if isinstance(ref, str):
+                logger.info("Loading parser %s for engine '%s'", ref, engine)
+                cls = _load(ref)
+                # Every file type sharing this reference gets the class.
+                for engine_types in self._engines.values():
+                    for key, value in engine_types.items():
+                        if value == ref:
+                            engine_types[key] = cls
+                ref = cls
+        return ref
+
+    def warm_up(self, names: Iterable[str]) -> List[str]:
+        """Import parsers ahead of the first request.
+
+        ``names`` are file types (``pdf``), engine names (``markitdown``) or
+        ``all``. Unknown names and import failures are logged, not raised.
+        Returns the ``engine:file_type`` entries that were loaded.
+        """
+        wanted = {n.strip().lower() for n in names if n and n.strip()}
+        loaded = []
+        for engine, types in list(self._engines.items()):
+            for ft in list(types):
+                if not ("all" in wanted or engine in wanted or ft in wanted):
+                    continue
+                try:
+                    self._resolve(engine, ft)
+                    loaded.append(f"{engine}:{ft}")
+                except Exception as e:
+                    logger.warning("Warm-up of %s:%s failed: %s", engine, ft, e)
+        known = {"all", *self._engines}
+        known.update(ft for types in self._engines.values() for ft in types)
+        for name in sorted(wanted - known):
+            logger.warning("Unknown parser warm-up entry '%s'", name)
+        logger.info("Warmed up %d parser entries", len(loaded))
+        return loaded
+
     def list_engines(self, overrides: Optional[Dict[str, str]] = None) -> List[Dict]:
         """Return metadata for all registered engines, including availability.
 
@@ -92,7 +143,7 @@ class ParserEngineRegistry:
             check = self._check_available.get(name)
             if check is not None:
                 try:
-                    available, unavailable_reason = check(overrides)
+                    available, unavailable_reason = _load(check)(overrides)
                 except Exception as e:
                     available = False
                     unavailable_reason = str(e) or self._unavailable_hint.get(name, "")
@@ -112,25 +163,37 @@ class ParserEngineRegistry:
     def get_engine_names(self) -> List[str]:
         return list(self._engines.keys())
 
+    def resolve_engine_name(self, engine: str, file_type: str) -> str:
+        """Name of the engine :meth:`get_parser_class` would use."""
+        if engine and file_type.lower() in self._engines.get(engine, {}):
+            return engine
+        return BUILTIN_ENGINE
+
 
 def _build_default_registry() -> ParserEngineRegistry:
     """Create and populate the default registry with all known engines."""
     reg = ParserEngineRegistry()
 
+    image_parser = "docreader.parser.image_parser:ImageParser"
+    markdown_parser = "docreader.parser.markdown_parser:MarkdownParser"
+    excel_parser = "docreader.parser.excel_parser:ExcelParser"
+    markitdown_parser = "docreader.parser.markitdown_parser:MarkitdownParser"
+
     _image_types = {
-        ext: ImageParser for ext in ("jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp")
+        ext: image_parser
+        for ext in ("jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp")
     }
 
     reg.register(
         BUILTIN_ENGINE,
         {
-            "docx": Docx2Parser,
-            "doc": DocParser,
-            "pdf": PDFParser,
-            "md": MarkdownParser,
-            "markdown": MarkdownParser,
-            "xlsx": ExcelParser,
-            "xls": ExcelParser,
+            "docx": "docreader.parser.docx2_parser:Docx2Parser",
+            "doc": "docreader.parser.doc_parser:DocParser",
+            "pdf": "docreader.parser.pdf_parser:PDFParser",
+            "md": markdown_parser,
+            "markdown": markdown_parser,
+            "xlsx": excel_parser,
+            "xls": excel_parser,
             **_image_types,
         },
         description="内置解析引擎",
@@ -139,25 +202,30 @@ def _build_default_registry() -> ParserEngineRegistry:
     reg.register(
         "markitdown",
         {
-            "md": MarkitdownParser,
-            "markdown": MarkitdownParser,
-            "pdf": MarkitdownParser,
-            "docx": MarkitdownParser,
-            "doc": MarkitdownParser,
-            "pptx": MarkitdownParser,
-            "ppt": MarkitdownParser,
-            "xlsx": MarkitdownParser,
-            "xls": MarkitdownParser,
-            "csv": MarkitdownParser,
+            ft: markitdown_parser
+            for ft in (
+                "md",
+                "markdown",
+                "pdf",
+                "docx",
+                "doc",
+                "pptx",
+                "ppt",
+                "xlsx",
+                "xls",
+                "csv",
+            )
         },
         description="MarkItDown 解析引擎（微软 MarkItDown 库）",
     )
 
     reg.register(
         "opendataloader",
-        {"pdf": OpenDataLoaderParser},
+        {"pdf": "docreader.parser.opendataloader_parser:OpenDataLoaderParser"},
         description="OpenDataLoader PDF（版面分析，需 Java 11+）",
-        check_available=opendataloader_available,
+        check_available=(
+            "docreader.parser.opendataloader_parser:opendataloader_available"
+        ),
         unavailable_hint="请安装 opendataloader-pdf 与 Java 11+",
     )
 
@@ -289,7 +289,7 @@ if __name__ == "__main__":
 
     print(f"\n--- images ({len(doc.images)}) ---")
     for path in list(doc.images.keys())[:10]:
-        print(f"  {path}  ({len(doc.images[path])} chars base64)")
+        print(f"  {path}  ({len(doc.images[path])} bytes)")
 
     print(f"\n--- content ({len(doc.content)} chars) ---")
     print(doc.content[:300000])
@@ -25,8 +25,18 @@ type ReadConfig struct {
 	state                 protoimpl.MessageState `protogen:"open.v1"`
 	ParserEngine          string                 `protobuf:"bytes,1,opt,name=parser_engine,json=parserEngine,proto3" json:"parser_engine,omitempty"`
 	ParserEngineOverrides map[string]string      `protobuf:"bytes,2,rep,name=parser_engine_overrides,json=parserEngineOverrides,proto3" json:"parser_engine_overrides,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
-	unknownFields         protoimpl.UnknownFields
-	sizeCache             protoimpl.SizeCache
+	// Stream fragment/image frames as pages are parsed, closed by a `done`
+	// frame (ReadStream only; ignored by Read).
+	IncrementalStream bool `protobuf:"varint,4,opt,name=incremental_stream,json=incrementalStream,proto3" json:"incremental_stream,omitempty"`
+	// Parse only some pages (PDF and DOCX). 1-based and inclusive; 0 leaves
+	// that end of the range open. Output keeps absolute page numbers
+	// (fragment page_index, image names), so shards can be stitched in order.
+	FromPage int32 `protobuf:"varint,5,opt,name=from_page,json=fromPage,proto3" json:"from_page,omitempty"`
+	ToPage   int32 `protobuf:"varint,6,opt,name=to_page,json=toPage,proto3" json:"to_page,omitempty"`
+	// Explicit 1-based pages to parse; takes precedence over from_page/to_page.
+	Pages         []int32 `protobuf:"varint,7,rep,packed,name=pages,proto3" json:"pages,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
 }
 
 func (x *ReadConfig) Reset() {
@@ -73,6 +83,34 @@ func (x *ReadConfig) GetParserEngineOverrides() map[string]string {
 	return nil
 }
 
+func (x *ReadConfig) GetIncrementalStream() bool {
+	if x != nil {
+		return x.IncrementalStream
+	}
+	return false
+}
+
+func (x *ReadConfig) GetFromPage() int32 {
+	if x != nil {
+		return x.FromPage
+	}
+	return 0
+}
+
+func (x *ReadConfig) GetToPage() int32 {
+	if x != nil {
+		return x.ToPage
+	}
+	return 0
+}
+
+func (x *ReadConfig) GetPages() []int32 {
+	if x != nil {
+		return x.Pages
+	}
+	return nil
+}
+
 // Unified read request: set file_content for file mode, url for URL mode.
 type ReadRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -166,6 +204,200 @@ func (x *ReadRequest) GetRequestId() string {
 	return ""
 }
 
+// One message of a ReadUpload call. The first message carries `header`: a
+// ReadRequest describing the file (file_name / file_type / config /
+// request_id) whose file_content and url must be empty. Every following
+// message carries the next `chunk` of the file (1 MiB is a good size).
+type ReadUploadRequest struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Types that are valid to be assigned to Payload:
+	//
+	//	*ReadUploadRequest_Header
+	//	*ReadUploadRequest_Chunk
+	Payload       isReadUploadRequest_Payload `protobuf_oneof:"payload"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ReadUploadRequest) Reset() {
+	*x = ReadUploadRequest{}
+	mi := &file_docreader_proto_msgTypes[2]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReadUploadRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReadUploadRequest) ProtoMessage() {}
+
+func (x *ReadUploadRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[2]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReadUploadRequest.ProtoReflect.Descriptor instead.
+func (*ReadUploadRequest) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{2}
+}
+
+func (x *ReadUploadRequest) GetPayload() isReadUploadRequest_Payload {
+	if x != nil {
+		return x.Payload
+	}
+	return nil
+}
+
+func (x *ReadUploadRequest) GetHeader() *ReadRequest {
+	if x != nil {
+		if x, ok := x.Payload.(*ReadUploadRequest_Header); ok {
+			return x.Header
+		}
+	}
+	return nil
+}
+
+func (x *ReadUploadRequest) GetChunk() []byte {
+	if x != nil {
+		if x, ok := x.Payload.(*ReadUploadRequest_Chunk); ok {
+			return x.Chunk
+		}
+	}
+	return nil
+}
+
+type isReadUploadRequest_Payload interface {
+	isReadUploadRequest_Payload()
+}
+
+type ReadUploadRequest_Header struct {
+	Header *ReadRequest `protobuf:"bytes,1,opt,name=header,proto3,oneof"`
+}
+
+type ReadUploadRequest_Chunk struct {
+	Chunk []byte `protobuf:"bytes,2,opt,name=chunk,proto3,oneof"`
+}
+
+func (*ReadUploadRequest_Header) isReadUploadRequest_Payload() {}
+
+func (*ReadUploadRequest_Chunk) isReadUploadRequest_Payload() {}
+
+type ReadBatchRequest struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Requests      []*ReadRequest         `protobuf:"bytes,1,rep,name=requests,proto3" json:"requests,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ReadBatchRequest) Reset() {
+	*x = ReadBatchRequest{}
+	mi := &file_docreader_proto_msgTypes[3]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReadBatchRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReadBatchRequest) ProtoMessage() {}
+
+func (x *ReadBatchRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[3]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReadBatchRequest.ProtoReflect.Descriptor instead.
+func (*ReadBatchRequest) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{3}
+}
+
+func (x *ReadBatchRequest) GetRequests() []*ReadRequest {
+	if x != nil {
+		return x.Requests
+	}
+	return nil
+}
+
+// Result of one request of a ReadBatch call. Parse failures are reported in
+// response.error, like Read.
+type ReadBatchResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// The request's request_id, or the id generated for it when unset.
+	RequestId string `protobuf:"bytes,1,opt,name=request_id,json=requestId,proto3" json:"request_id,omitempty"`
+	// Position of the request in ReadBatchRequest.requests.
+	Index         int32         `protobuf:"varint,2,opt,name=index,proto3" json:"index,omitempty"`
+	Response      *ReadResponse `protobuf:"bytes,3,opt,name=response,proto3" json:"response,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ReadBatchResponse) Reset() {
+	*x = ReadBatchResponse{}
+	mi := &file_docreader_proto_msgTypes[4]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReadBatchResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReadBatchResponse) ProtoMessage() {}
+
+func (x *ReadBatchResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[4]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReadBatchResponse.ProtoReflect.Descriptor instead.
+func (*ReadBatchResponse) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{4}
+}
+
+func (x *ReadBatchResponse) GetRequestId() string {
+	if x != nil {
+		return x.RequestId
+	}
+	return ""
+}
+
+func (x *ReadBatchResponse) GetIndex() int32 {
+	if x != nil {
+		return x.Index
+	}
+	return 0
+}
+
+func (x *ReadBatchResponse) GetResponse() *ReadResponse {
+	if x != nil {
+		return x.Response
+	}
+	return nil
+}
+
 type ImageRef struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
 	Filename      string                 `protobuf:"bytes,1,opt,name=filename,proto3" json:"filename,omitempty"`
@@ -179,7 +411,7 @@ type ImageRef struct {
 
 func (x *ImageRef) Reset() {
 	*x = ImageRef{}
-	mi := &file_docreader_proto_msgTypes[2]
+	mi := &file_docreader_proto_msgTypes[5]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -191,7 +423,7 @@ func (x *ImageRef) String() string {
 func (*ImageRef) ProtoMessage() {}
 
 func (x *ImageRef) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[2]
+	mi := &file_docreader_proto_msgTypes[5]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -204,7 +436,7 @@ func (x *ImageRef) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ImageRef.ProtoReflect.Descriptor instead.
 func (*ImageRef) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{2}
+	return file_docreader_proto_rawDescGZIP(), []int{5}
 }
 
 func (x *ImageRef) GetFilename() string {
@@ -255,7 +487,7 @@ type ReadResponse struct {
 
 func (x *ReadResponse) Reset() {
 	*x = ReadResponse{}
-	mi := &file_docreader_proto_msgTypes[3]
+	mi := &file_docreader_proto_msgTypes[6]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -267,7 +499,7 @@ func (x *ReadResponse) String() string {
 func (*ReadResponse) ProtoMessage() {}
 
 func (x *ReadResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[3]
+	mi := &file_docreader_proto_msgTypes[6]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -280,7 +512,7 @@ func (x *ReadResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReadResponse.ProtoReflect.Descriptor instead.
 func (*ReadResponse) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{3}
+	return file_docreader_proto_rawDescGZIP(), []int{6}
 }
 
 func (x *ReadResponse) GetMarkdownContent() string {
@@ -332,7 +564,7 @@ type ReadStreamMeta struct {
 
 func (x *ReadStreamMeta) Reset() {
 	*x = ReadStreamMeta{}
-	mi := &file_docreader_proto_msgTypes[4]
+	mi := &file_docreader_proto_msgTypes[7]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -344,7 +576,7 @@ func (x *ReadStreamMeta) String() string {
 func (*ReadStreamMeta) ProtoMessage() {}
 
 func (x *ReadStreamMeta) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[4]
+	mi := &file_docreader_proto_msgTypes[7]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -357,7 +589,7 @@ func (x *ReadStreamMeta) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReadStreamMeta.ProtoReflect.Descriptor instead.
 func (*ReadStreamMeta) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{4}
+	return file_docreader_proto_rawDescGZIP(), []int{7}
 }
 
 func (x *ReadStreamMeta) GetMarkdownContent() string {
@@ -395,14 +627,141 @@ func (x *ReadStreamMeta) GetImageCount() uint32 {
 	return 0
 }
 
-// One frame of a ReadStream. The first frame carries `meta`; every subsequent
-// frame carries a single `image`.
+// A partial markdown fragment of an incremental ReadStream. Every image the
+// fragment references is sent (as `image` frames) before the fragment itself.
+// Joining all fragments with "\n\n" yields the full markdown content.
+type ReadStreamFragment struct {
+	state           protoimpl.MessageState `protogen:"open.v1"`
+	MarkdownContent string                 `protobuf:"bytes,1,opt,name=markdown_content,json=markdownContent,proto3" json:"markdown_content,omitempty"`
+	PageIndex       int32                  `protobuf:"varint,2,opt,name=page_index,json=pageIndex,proto3" json:"page_index,omitempty"` // 0-based source page, -1 if not page-based
+	unknownFields   protoimpl.UnknownFields
+	sizeCache       protoimpl.SizeCache
+}
+
+func (x *ReadStreamFragment) Reset() {
+	*x = ReadStreamFragment{}
+	mi := &file_docreader_proto_msgTypes[8]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReadStreamFragment) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReadStreamFragment) ProtoMessage() {}
+
+func (x *ReadStreamFragment) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[8]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReadStreamFragment.ProtoReflect.Descriptor instead.
+func (*ReadStreamFragment) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{8}
+}
+
+func (x *ReadStreamFragment) GetMarkdownContent() string {
+	if x != nil {
+		return x.MarkdownContent
+	}
+	return ""
+}
+
+func (x *ReadStreamFragment) GetPageIndex() int32 {
+	if x != nil {
+		return x.PageIndex
+	}
+	return 0
+}
+
+// Final frame of an incremental ReadStream, sent exactly once.
+type ReadStreamDone struct {
+	state         protoimpl.MessageState `protogen:"open.v1"`
+	Metadata      map[string]string      `protobuf:"bytes,1,rep,name=metadata,proto3" json:"metadata,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	Error         string                 `protobuf:"bytes,2,opt,name=error,proto3" json:"error,omitempty"`
+	FragmentCount uint32                 `protobuf:"varint,3,opt,name=fragment_count,json=fragmentCount,proto3" json:"fragment_count,omitempty"`
+	ImageCount    uint32                 `protobuf:"varint,4,opt,name=image_count,json=imageCount,proto3" json:"image_count,omitempty"`
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *ReadStreamDone) Reset() {
+	*x = ReadStreamDone{}
+	mi := &file_docreader_proto_msgTypes[9]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *ReadStreamDone) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*ReadStreamDone) ProtoMessage() {}
+
+func (x *ReadStreamDone) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[9]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use ReadStreamDone.ProtoReflect.Descriptor instead.
+func (*ReadStreamDone) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{9}
+}
+
+func (x *ReadStreamDone) GetMetadata() map[string]string {
+	if x != nil {
+		return x.Metadata
+	}
+	return nil
+}
+
+func (x *ReadStreamDone) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
+func (x *ReadStreamDone) GetFragmentCount() uint32 {
+	if x != nil {
+		return x.FragmentCount
+	}
+	return 0
+}
+
+func (x *ReadStreamDone) GetImageCount() uint32 {
+	if x != nil {
+		return x.ImageCount
+	}
+	return 0
+}
+
+// One frame of a ReadStream. By default the first frame carries `meta` and
+// every subsequent frame carries a single `image`. Incremental streams carry
+// `image` / `fragment` frames and end with `done`.
 type ReadStreamResponse struct {
 	state protoimpl.MessageState `protogen:"open.v1"`
 	// Types that are valid to be assigned to Payload:
 	//
 	//	*ReadStreamResponse_Meta
 	//	*ReadStreamResponse_Image
+	//	*ReadStreamResponse_Fragment
+	//	*ReadStreamResponse_Done
 	Payload       isReadStreamResponse_Payload `protobuf_oneof:"payload"`
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
@@ -410,7 +769,7 @@ type ReadStreamResponse struct {
 
 func (x *ReadStreamResponse) Reset() {
 	*x = ReadStreamResponse{}
-	mi := &file_docreader_proto_msgTypes[5]
+	mi := &file_docreader_proto_msgTypes[10]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -422,7 +781,7 @@ func (x *ReadStreamResponse) String() string {
 func (*ReadStreamResponse) ProtoMessage() {}
 
 func (x *ReadStreamResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[5]
+	mi := &file_docreader_proto_msgTypes[10]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -435,7 +794,7 @@ func (x *ReadStreamResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ReadStreamResponse.ProtoReflect.Descriptor instead.
 func (*ReadStreamResponse) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{5}
+	return file_docreader_proto_rawDescGZIP(), []int{10}
 }
 
 func (x *ReadStreamResponse) GetPayload() isReadStreamResponse_Payload {
@@ -463,6 +822,24 @@ func (x *ReadStreamResponse) GetImage() *ImageRef {
 	return nil
 }
 
+func (x *ReadStreamResponse) GetFragment() *ReadStreamFragment {
+	if x != nil {
+		if x, ok := x.Payload.(*ReadStreamResponse_Fragment); ok {
+			return x.Fragment
+		}
+	}
+	return nil
+}
+
+func (x *ReadStreamResponse) GetDone() *ReadStreamDone {
+	if x != nil {
+		if x, ok := x.Payload.(*ReadStreamResponse_Done); ok {
+			return x.Done
+		}
+	}
+	return nil
+}
+
 type isReadStreamResponse_Payload interface {
 	isReadStreamResponse_Payload()
 }
@@ -475,10 +852,22 @@ type ReadStreamResponse_Image struct {
 	Image *ImageRef `protobuf:"bytes,2,opt,name=image,proto3,oneof"`
 }
 
+type ReadStreamResponse_Fragment struct {
+	Fragment *ReadStreamFragment `protobuf:"bytes,3,opt,name=fragment,proto3,oneof"`
+}
+
+type ReadStreamResponse_Done struct {
+	Done *ReadStreamDone `protobuf:"bytes,4,opt,name=done,proto3,oneof"`
+}
+
 func (*ReadStreamResponse_Meta) isReadStreamResponse_Payload() {}
 
 func (*ReadStreamResponse_Image) isReadStreamResponse_Payload() {}
 
+func (*ReadStreamResponse_Fragment) isReadStreamResponse_Payload() {}
+
+func (*ReadStreamResponse_Done) isReadStreamResponse_Payload() {}
+
 type ListEnginesRequest struct {
 	state           protoimpl.MessageState `protogen:"open.v1"`
 	ConfigOverrides map[string]string      `protobuf:"bytes,1,rep,name=config_overrides,json=configOverrides,proto3" json:"config_overrides,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
@@ -488,7 +877,7 @@ type ListEnginesRequest struct {
 
 func (x *ListEnginesRequest) Reset() {
 	*x = ListEnginesRequest{}
-	mi := &file_docreader_proto_msgTypes[6]
+	mi := &file_docreader_proto_msgTypes[11]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -500,7 +889,7 @@ func (x *ListEnginesRequest) String() string {
 func (*ListEnginesRequest) ProtoMessage() {}
 
 func (x *ListEnginesRequest) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[6]
+	mi := &file_docreader_proto_msgTypes[11]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -513,7 +902,7 @@ func (x *ListEnginesRequest) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListEnginesRequest.ProtoReflect.Descriptor instead.
 func (*ListEnginesRequest) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{6}
+	return file_docreader_proto_rawDescGZIP(), []int{11}
 }
 
 func (x *ListEnginesRequest) GetConfigOverrides() map[string]string {
@@ -536,7 +925,7 @@ type ParserEngineInfo struct {
 
 func (x *ParserEngineInfo) Reset() {
 	*x = ParserEngineInfo{}
-	mi := &file_docreader_proto_msgTypes[7]
+	mi := &file_docreader_proto_msgTypes[12]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -548,7 +937,7 @@ func (x *ParserEngineInfo) String() string {
 func (*ParserEngineInfo) ProtoMessage() {}
 
 func (x *ParserEngineInfo) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[7]
+	mi := &file_docreader_proto_msgTypes[12]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -561,7 +950,7 @@ func (x *ParserEngineInfo) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ParserEngineInfo.ProtoReflect.Descriptor instead.
 func (*ParserEngineInfo) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{7}
+	return file_docreader_proto_rawDescGZIP(), []int{12}
 }
 
 func (x *ParserEngineInfo) GetName() string {
@@ -608,7 +997,7 @@ type ListEnginesResponse struct {
 
 func (x *ListEnginesResponse) Reset() {
 	*x = ListEnginesResponse{}
-	mi := &file_docreader_proto_msgTypes[8]
+	mi := &file_docreader_proto_msgTypes[13]
 	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 	ms.StoreMessageInfo(mi)
 }
@@ -620,7 +1009,7 @@ func (x *ListEnginesResponse) String() string {
 func (*ListEnginesResponse) ProtoMessage() {}
 
 func (x *ListEnginesResponse) ProtoReflect() protoreflect.Message {
-	mi := &file_docreader_proto_msgTypes[8]
+	mi := &file_docreader_proto_msgTypes[13]
 	if x != nil {
 		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
 		if ms.LoadMessageInfo() == nil {
@@ -633,7 +1022,7 @@ func (x *ListEnginesResponse) ProtoReflect() protoreflect.Message {
 
 // Deprecated: Use ListEnginesResponse.ProtoReflect.Descriptor instead.
 func (*ListEnginesResponse) Descriptor() ([]byte, []int) {
-	return file_docreader_proto_rawDescGZIP(), []int{8}
+	return file_docreader_proto_rawDescGZIP(), []int{13}
 }
 
 func (x *ListEnginesResponse) GetEngines() []*ParserEngineInfo {
@@ -643,15 +1032,81 @@ func (x *ListEnginesResponse) GetEngines() []*ParserEngineInfo {
 	return nil
 }
 
+type InspectResponse struct {
+	state protoimpl.MessageState `protogen:"open.v1"`
+	// Pages that ReadConfig page ranges refer to; 0 when the parser for this
+	// file does not support page selection.
+	PageCount             int32  `protobuf:"varint,1,opt,name=page_count,json=pageCount,proto3" json:"page_count,omitempty"`
+	SupportsPageSelection bool   `protobuf:"varint,2,opt,name=supports_page_selection,json=supportsPageSelection,proto3" json:"supports_page_selection,omitempty"`
+	Error                 string `protobuf:"bytes,3,opt,name=error,proto3" json:"error,omitempty"`
+	unknownFields         protoimpl.UnknownFields
+	sizeCache             protoimpl.SizeCache
+}
+
+func (x *InspectResponse) Reset() {
+	*x = InspectResponse{}
+	mi := &file_docreader_proto_msgTypes[14]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *InspectResponse) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*InspectResponse) ProtoMessage() {}
+
+func (x *InspectResponse) ProtoReflect() protoreflect.Message {
+	mi := &file_docreader_proto_msgTypes[14]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use InspectResponse.ProtoReflect.Descriptor instead.
+func (*InspectResponse) Descriptor() ([]byte, []int) {
+	return file_docreader_proto_rawDescGZIP(), []int{14}
+}
+
+func (x *InspectResponse) GetPageCount() int32 {
+	if x != nil {
+		return x.PageCount
+	}
+	return 0
+}
+
+func (x *InspectResponse) GetSupportsPageSelection() bool {
+	if x != nil {
+		return x.SupportsPageSelection
+	}
+	return false
+}
+
+func (x *InspectResponse) GetError() string {
+	if x != nil {
+		return x.Error
+	}
+	return ""
+}
+
 var File_docreader_proto protoreflect.FileDescriptor
 
 const file_docreader_proto_rawDesc = "" +
 	"\n" +
-	"\x0fdocreader.proto\x12\tdocreader\"\xeb\x01\n" +
+	"\x0fdocreader.proto\x12\tdocreader\"\xe6\x02\n" +
 	"\n" +
 	"ReadConfig\x12#\n" +
 	"\rparser_engine\x18\x01 \x01(\tR\fparserEngine\x12h\n" +
-	"\x17parser_engine_overrides\x18\x02 \x03(\v20.docreader.ReadConfig.ParserEngineOverridesEntryR\x15parserEngineOverrides\x1aH\n" +
+	"\x17parser_engine_overrides\x18\x02 \x03(\v20.docreader.ReadConfig.ParserEngineOverridesEntryR\x15parserEngineOverrides\x12-\n" +
+	"\x12incremental_stream\x18\x04 \x01(\bR\x11incrementalStream\x12\x1b\n" +
+	"\tfrom_page\x18\x05 \x01(\x05R\bfromPage\x12\x17\n" +
+	"\ato_page\x18\x06 \x01(\x05R\x06toPage\x12\x14\n" +
+	"\x05pages\x18\a \x03(\x05R\x05pages\x1aH\n" +
 	"\x1aParserEngineOverridesEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
 	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01J\x04\b\x03\x10\x04\"\xe0\x01\n" +
@@ -663,7 +1118,18 @@ const file_docreader_proto_rawDesc = "" +
 	"\x05title\x18\x05 \x01(\tR\x05title\x12-\n" +
 	"\x06config\x18\x06 \x01(\v2\x15.docreader.ReadConfigR\x06config\x12\x1d\n" +
 	"\n" +
-	"request_id\x18\a \x01(\tR\trequestId\"\xa6\x01\n" +
+	"request_id\x18\a \x01(\tR\trequestId\"h\n" +
+	"\x11ReadUploadRequest\x120\n" +
+	"\x06header\x18\x01 \x01(\v2\x16.docreader.ReadRequestH\x00R\x06header\x12\x16\n" +
+	"\x05chunk\x18\x02 \x01(\fH\x00R\x05chunkB\t\n" +
+	"\apayload\"F\n" +
+	"\x10ReadBatchRequest\x122\n" +
+	"\brequests\x18\x01 \x03(\v2\x16.docreader.ReadRequestR\brequests\"}\n" +
+	"\x11ReadBatchResponse\x12\x1d\n" +
+	"\n" +
+	"request_id\x18\x01 \x01(\tR\trequestId\x12\x14\n" +
+	"\x05index\x18\x02 \x01(\x05R\x05index\x123\n" +
+	"\bresponse\x18\x03 \x01(\v2\x17.docreader.ReadResponseR\bresponse\"\xa6\x01\n" +
 	"\bImageRef\x12\x1a\n" +
 	"\bfilename\x18\x01 \x01(\tR\bfilename\x12!\n" +
 	"\foriginal_ref\x18\x02 \x01(\tR\voriginalRef\x12\x1b\n" +
@@ -691,10 +1157,25 @@ const file_docreader_proto_rawDesc = "" +
 	"imageCount\x1a;\n" +
 	"\rMetadataEntry\x12\x10\n" +
 	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
-	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"}\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"^\n" +
+	"\x12ReadStreamFragment\x12)\n" +
+	"\x10markdown_content\x18\x01 \x01(\tR\x0fmarkdownContent\x12\x1d\n" +
+	"\n" +
+	"page_index\x18\x02 \x01(\x05R\tpageIndex\"\xf0\x01\n" +
+	"\x0eReadStreamDone\x12C\n" +
+	"\bmetadata\x18\x01 \x03(\v2'.docreader.ReadStreamDone.MetadataEntryR\bmetadata\x12\x14\n" +
+	"\x05error\x18\x02 \x01(\tR\x05error\x12%\n" +
+	"\x0efragment_count\x18\x03 \x01(\rR\rfragmentCount\x12\x1f\n" +
+	"\vimage_count\x18\x04 \x01(\rR\n" +
+	"imageCount\x1a;\n" +
+	"\rMetadataEntry\x12\x10\n" +
+	"\x03key\x18\x01 \x01(\tR\x03key\x12\x14\n" +
+	"\x05value\x18\x02 \x01(\tR\x05value:\x028\x01\"\xeb\x01\n" +
 	"\x12ReadStreamResponse\x12/\n" +
 	"\x04meta\x18\x01 \x01(\v2\x19.docreader.ReadStreamMetaH\x00R\x04meta\x12+\n" +
-	"\x05image\x18\x02 \x01(\v2\x13.docreader.ImageRefH\x00R\x05imageB\t\n" +
+	"\x05image\x18\x02 \x01(\v2\x13.docreader.ImageRefH\x00R\x05image\x12;\n" +
+	"\bfragment\x18\x03 \x01(\v2\x1d.docreader.ReadStreamFragmentH\x00R\bfragment\x12/\n" +
+	"\x04done\x18\x04 \x01(\v2\x19.docreader.ReadStreamDoneH\x00R\x04doneB\t\n" +
 	"\apayload\"\xb7\x01\n" +
 	"\x12ListEnginesRequest\x12]\n" +
 	"\x10config_overrides\x18\x01 \x03(\v22.docreader.ListEnginesRequest.ConfigOverridesEntryR\x0fconfigOverrides\x1aB\n" +
@@ -709,12 +1190,21 @@ const file_docreader_proto_rawDesc = "" +
 	"\tavailable\x18\x04 \x01(\bR\tavailable\x12-\n" +
 	"\x12unavailable_reason\x18\x05 \x01(\tR\x11unavailableReason\"L\n" +
 	"\x13ListEnginesResponse\x125\n" +
-	"\aengines\x18\x01 \x03(\v2\x1b.docreader.ParserEngineInfoR\aengines2\xdf\x01\n" +
+	"\aengines\x18\x01 \x03(\v2\x1b.docreader.ParserEngineInfoR\aengines\"~\n" +
+	"\x0fInspectResponse\x12\x1d\n" +
+	"\n" +
+	"page_count\x18\x01 \x01(\x05R\tpageCount\x126\n" +
+	"\x17supports_page_selection\x18\x02 \x01(\bR\x15supportsPageSelection\x12\x14\n" +
+	"\x05error\x18\x03 \x01(\tR\x05error2\xbd\x03\n" +
 	"\tDocReader\x129\n" +
 	"\x04Read\x12\x16.docreader.ReadRequest\x1a\x17.docreader.ReadResponse\"\x00\x12G\n" +
 	"\n" +
-	"ReadStream\x12\x16.docreader.ReadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x000\x01\x12N\n" +
-	"\vListEngines\x12\x1d.docreader.ListEnginesRequest\x1a\x1e.docreader.ListEnginesResponse\"\x00B5Z3github.com/Tencent/WeKnora/internal/docreader/protob\x06proto3"
+	"ReadStream\x12\x16.docreader.ReadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x000\x01\x12O\n" +
+	"\n" +
+	"ReadUpload\x12\x1c.docreader.ReadUploadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x00(\x010\x01\x12J\n" +
+	"\tReadBatch\x12\x1b.docreader.ReadBatchRequest\x1a\x1c.docreader.ReadBatchResponse\"\x000\x01\x12N\n" +
+	"\vListEngines\x12\x1d.docreader.ListEnginesRequest\x1a\x1e.docreader.ListEnginesResponse\"\x00\x12?\n" +
+	"\aInspect\x12\x16.docreader.ReadRequest\x1a\x1a.docreader.InspectResponse\"\x00B5Z3github.com/Tencent/WeKnora/internal/docreader/protob\x06proto3"
 
 var (
 	file_docreader_proto_rawDescOnce sync.Once
@@ -728,43 +1218,62 @@ func file_docreader_proto_rawDescGZIP() []byte {
 	return file_docreader_proto_rawDescData
 }
 
-var file_docreader_proto_msgTypes = make([]protoimpl.MessageInfo, 13)
+var file_docreader_proto_msgTypes = make([]protoimpl.MessageInfo, 20)
 var file_docreader_proto_goTypes = []any{
 	(*ReadConfig)(nil),          // 0: docreader.ReadConfig
 	(*ReadRequest)(nil),         // 1: docreader.ReadRequest
-	(*ImageRef)(nil),            // 2: docreader.ImageRef
-	(*ReadResponse)(nil),        // 3: docreader.ReadResponse
-	(*ReadStreamMeta)(nil),      // 4: docreader.ReadStreamMeta
-	(*ReadStreamResponse)(nil),  // 5: docreader.ReadStreamResponse
-	(*ListEnginesRequest)(nil),  // 6: docreader.ListEnginesRequest
-	(*ParserEngineInfo)(nil),    // 7: docreader.ParserEngineInfo
-	(*ListEnginesResponse)(nil), // 8: docreader.ListEnginesResponse
-	nil,                         // 9: docreader.ReadConfig.ParserEngineOverridesEntry
-	nil,                         // 10: docreader.ReadResponse.MetadataEntry
-	nil,                         // 11: docreader.ReadStreamMeta.MetadataEntry
-	nil,                         // 12: docreader.ListEnginesRequest.ConfigOverridesEntry
+	(*ReadUploadRequest)(nil),   // 2: docreader.ReadUploadRequest
+	(*ReadBatchRequest)(nil),    // 3: docreader.ReadBatchRequest
+	(*ReadBatchResponse)(nil),   // 4: docreader.ReadBatchResponse
+	(*ImageRef)(nil),            // 5: docreader.ImageRef
+	(*ReadResponse)(nil),        // 6: docreader.ReadResponse
+	(*ReadStreamMeta)(nil),      // 7: docreader.ReadStreamMeta
+	(*ReadStreamFragment)(nil),  // 8: docreader.ReadStreamFragment
+	(*ReadStreamDone)(nil),      // 9: docreader.ReadStreamDone
+	(*ReadStreamResponse)(nil),  // 10: docreader.ReadStreamResponse
+	(*ListEnginesRequest)(nil),  // 11: docreader.ListEnginesRequest
+	(*ParserEngineInfo)(nil),    // 12: docreader.ParserEngineInfo
+	(*ListEnginesResponse)(nil), // 13: docreader.ListEnginesResponse
+	(*InspectResponse)(nil),     // 14: docreader.InspectResponse
+	nil,                         // 15: docreader.ReadConfig.ParserEngineOverridesEntry
+	nil,                         // 16: docreader.ReadResponse.MetadataEntry
+	nil,                         // 17: docreader.ReadStreamMeta.MetadataEntry
+	nil,                         // 18: docreader.ReadStreamDone.MetadataEntry
+	nil,                         // 19: docreader.ListEnginesRequest.ConfigOverridesEntry
 }
 var file_docreader_proto_depIdxs = []int32{
-	9,  // 0: docreader.ReadConfig.parser_engine_overrides:type_name -> docreader.ReadConfig.ParserEngineOverridesEntry
+	15, // 0: docreader.ReadConfig.parser_engine_overrides:type_name -> docreader.ReadConfig.ParserEngineOverridesEntry
 	0,  // 1: docreader.ReadRequest.config:type_name -> docreader.ReadConfig
-	2,  // 2: docreader.ReadResponse.image_refs:type_name -> docreader.ImageRef
-	10, // 3: docreader.ReadResponse.metadata:type_name -> docreader.ReadResponse.MetadataEntry
-	11, // 4: docreader.ReadStreamMeta.metadata:type_name -> docreader.ReadStreamMeta.MetadataEntry
-	4,  // 5: docreader.ReadStreamResponse.meta:type_name -> docreader.ReadStreamMeta
-	2,  // 6: docreader.ReadStreamResponse.image:type_name -> docreader.ImageRef
-	12, // 7: docreader.ListEnginesRequest.config_overrides:type_name -> docreader.ListEnginesRequest.ConfigOverridesEntry
-	7,  // 8: docreader.ListEnginesResponse.engines:type_name -> docreader.ParserEngineInfo
-	1,  // 9: docreader.DocReader.Read:input_type -> docreader.ReadRequest
-	1,  // 10: docreader.DocReader.ReadStream:input_type -> docreader.ReadRequest
-	6,  // 11: docreader.DocReader.ListEngines:input_type -> docreader.ListEnginesRequest
-	3,  // 12: docreader.DocReader.Read:output_type -> docreader.ReadResponse
-	5,  // 13: docreader.DocReader.ReadStream:output_type -> docreader.ReadStreamResponse
-	8,  // 14: docreader.DocReader.ListEngines:output_type -> docreader.ListEnginesResponse
-	12, // [12:15] is the sub-list for method output_type
-	9,  // [9:12] is the sub-list for method input_type
-	9,  // [9:9] is the sub-list for extension type_name
-	9,  // [9:9] is the sub-list for extension extendee
-	0,  // [0:9] is the sub-list for field type_name
+	1,  // 2: docreader.ReadUploadRequest.header:type_name -> docreader.ReadRequest
+	1,  // 3: docreader.ReadBatchRequest.requests:type_name -> docreader.ReadRequest
+	6,  // 4: docreader.ReadBatchResponse.response:type_name -> docreader.ReadResponse
+	5,  // 5: docreader.ReadResponse.image_refs:type_name -> docreader.ImageRef
+	16, // 6: docreader.ReadResponse.metadata:type_name -> docreader.ReadResponse.MetadataEntry
+	17, // 7: docreader.ReadStreamMeta.metadata:type_name -> docreader.ReadStreamMeta.MetadataEntry
+	18, // 8: docreader.ReadStreamDone.metadata:type_name -> docreader.ReadStreamDone.MetadataEntry
+	7,  // 9: docreader.ReadStreamResponse.meta:type_name -> docreader.ReadStreamMeta
+	5,  // 10: docreader.ReadStreamResponse.image:type_name -> docreader.ImageRef
+	8,  // 11: docreader.ReadStreamResponse.fragment:type_name -> docreader.ReadStreamFragment
+	9,  // 12: docreader.ReadStreamResponse.done:type_name -> docreader.ReadStreamDone
+	19, // 13: docreader.ListEnginesRequest.config_overrides:type_name -> docreader.ListEnginesRequest.ConfigOverridesEntry
+	12, // 14: docreader.ListEnginesResponse.engines:type_name -> docreader.ParserEngineInfo
+	1,  // 15: docreader.DocReader.Read:input_type -> docreader.ReadRequest
+	1,  // 16: docreader.DocReader.ReadStream:input_type -> docreader.ReadRequest
+	2,  // 17: docreader.DocReader.ReadUpload:input_type -> docreader.ReadUploadRequest
+	3,  // 18: docreader.DocReader.ReadBatch:input_type -> docreader.ReadBatchRequest
+	11, // 19: docreader.DocReader.ListEngines:input_type -> docreader.ListEnginesRequest
+	1,  // 20: docreader.DocReader.Inspect:input_type -> docreader.ReadRequest
+	6,  // 21: docreader.DocReader.Read:output_type -> docreader.ReadResponse
+	10, // 22: docreader.DocReader.ReadStream:output_type -> docreader.ReadStreamResponse
+	10, // 23: docreader.DocReader.ReadUpload:output_type -> docreader.ReadStreamResponse
+	4,  // 24: docreader.DocReader.ReadBatch:output_type -> docreader.ReadBatchResponse
+	13, // 25: docreader.DocReader.ListEngines:output_type -> docreader.ListEnginesResponse
+	14, // 26: docreader.DocReader.Inspect:output_type -> docreader.InspectResponse
+	21, // [21:27] is the sub-list for method output_type
+	15, // [15:21] is the sub-list for method input_type
+	15, // [15:15] is the sub-list for extension type_name
+	15, // [15:15] is the sub-list for extension extendee
+	0,  // [0:15] is the sub-list for field type_name
 }
 
 func init() { file_docreader_proto_init() }
@@ -772,9 +1281,15 @@ func file_docreader_proto_init() {
 	if File_docreader_proto != nil {
 		return
 	}
-	file_docreader_proto_msgTypes[5].OneofWrappers = []any{
+	file_docreader_proto_msgTypes[2].OneofWrappers = []any{
+		(*ReadUploadRequest_Header)(nil),
+		(*ReadUploadRequest_Chunk)(nil),
+	}
+	file_docreader_proto_msgTypes[10].OneofWrappers = []any{
 		(*ReadStreamResponse_Meta)(nil),
 		(*ReadStreamResponse_Image)(nil),
+		(*ReadStreamResponse_Fragment)(nil),
+		(*ReadStreamResponse_Done)(nil),
 	}
 	type x struct{}
 	out := protoimpl.TypeBuilder{
@@ -782,7 +1297,7 @@ func file_docreader_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_docreader_proto_rawDesc), len(file_docreader_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   13,
+			NumMessages:   20,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -21,7 +21,10 @@ const _ = grpc.SupportPackageIsVersion9
 const (
 	DocReader_Read_FullMethodName        = "/docreader.DocReader/Read"
 	DocReader_ReadStream_FullMethodName  = "/docreader.DocReader/ReadStream"
+	DocReader_ReadUpload_FullMethodName  = "/docreader.DocReader/ReadUpload"
+	DocReader_ReadBatch_FullMethodName   = "/docreader.DocReader/ReadBatch"
 	DocReader_ListEngines_FullMethodName = "/docreader.DocReader/ListEngines"
+	DocReader_Inspect_FullMethodName     = "/docreader.DocReader/Inspect"
 )
 
 // DocReaderClient is the client API for DocReader service.
@@ -35,8 +38,28 @@ type DocReaderClient interface {
 	// small so large scanned PDFs (hundreds of page images, far exceeding the
 	// unary message-size cap) can be returned without RESOURCE_EXHAUSTED and
 	// with bounded memory on both ends.
+	//
+	// With ReadConfig.incremental_stream set, parsers that support it emit
+	// output page by page instead: `fragment` / `image` frames in document
+	// order as each page finishes, then a single closing `done` frame.
 	ReadStream(ctx context.Context, in *ReadRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ReadStreamResponse], error)
+	// ReadUpload is ReadStream for large files: the client streams the file
+	// in chunks (first message: `header`, then `chunk`s in order) instead of
+	// one file_content message bounded by the gRPC message-size cap. The server
+	// spools chunks to disk and parsers read the spooled file, so an upload is
+	// never held in memory whole. Responses are ReadStream frames.
+	ReadUpload(ctx context.Context, opts ...grpc.CallOption) (grpc.BidiStreamingClient[ReadUploadRequest, ReadStreamResponse], error)
+	// ReadBatch parses many documents in one call (bulk imports of small
+	// files). Requests are scheduled concurrently on the server and one
+	// ReadBatchResponse is streamed back per request as soon as it completes,
+	// in completion order, tagged with the request's request_id and index.
+	ReadBatch(ctx context.Context, in *ReadBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ReadBatchResponse], error)
 	ListEngines(ctx context.Context, in *ListEnginesRequest, opts ...grpc.CallOption) (*ListEnginesResponse, error)
+	// Inspect reports the page count of a file without parsing it, so a client
+	// can split a large document into ReadConfig page ranges and spread them
+	// across replicas. Takes a file-mode ReadRequest (file_content, file_name,
+	// file_type and config.parser_engine are used).
+	Inspect(ctx context.Context, in *ReadRequest, opts ...grpc.CallOption) (*InspectResponse, error)
 }
 
 type docReaderClient struct {
@@ -76,6 +99,38 @@ func (c *docReaderClient) ReadStream(ctx context.Context, in *ReadRequest, opts
 // This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
 type DocReader_ReadStreamClient = grpc.ServerStreamingClient[ReadStreamResponse]
 
+func (c *docReaderClient) ReadUpload(ctx context.Context, opts ...grpc.CallOption) (grpc.BidiStreamingClient[ReadUploadRequest, ReadStreamResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &DocReader_ServiceDesc.Streams[1], DocReader_ReadUpload_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[ReadUploadRequest, ReadStreamResponse]{ClientStream: stream}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type DocReader_ReadUploadClient = grpc.BidiStreamingClient[ReadUploadRequest, ReadStreamResponse]
+
+func (c *docReaderClient) ReadBatch(ctx context.Context, in *ReadBatchRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[ReadBatchResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &DocReader_ServiceDesc.Streams[2], DocReader_ReadBatch_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[ReadBatchRequest, ReadBatchResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type DocReader_ReadBatchClient = grpc.ServerStreamingClient[ReadBatchResponse]
+
 func (c *docReaderClient) ListEngines(ctx context.Context, in *ListEnginesRequest, opts ...grpc.CallOption) (*ListEnginesResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(ListEnginesResponse)
@@ -86,6 +141,16 @@ func (c *docReaderClient) ListEngines(ctx context.Context, in *ListEnginesReques
 	return out, nil
 }
 
+func (c *docReaderClient) Inspect(ctx context.Context, in *ReadRequest, opts ...grpc.CallOption) (*InspectResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(InspectResponse)
+	err := c.cc.Invoke(ctx, DocReader_Inspect_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // DocReaderServer is the server API for DocReader service.
 // All implementations must embed UnimplementedDocReaderServer
 // for forward compatibility.
@@ -97,8 +162,28 @@ type DocReaderServer interface {
 	// small so large scanned PDFs (hundreds of page images, far exceeding the
 	// unary message-size cap) can be returned without RESOURCE_EXHAUSTED and
 	// with bounded memory on both ends.
+	//
+	// With ReadConfig.incremental_stream set, parsers that support it emit
+	// output page by page instead: `fragment` / `image` frames in document
+	// order as each page finishes, then a single closing `done` frame.
 	ReadStream(*ReadRequest, grpc.ServerStreamingServer[ReadStreamResponse]) error
+	// ReadUpload is ReadStream for large files: the client streams the file
+	// in chunks (first message: `header`, then `chunk`s in order) instead of
+	// one file_content message bounded by the gRPC message-size cap. The server
+	// spools chunks to disk and parsers read the spooled file, so an upload is
+	// never held in memory whole. Responses are ReadStream frames.
+	ReadUpload(grpc.BidiStreamingServer[ReadUploadRequest, ReadStreamResponse]) error
+	// ReadBatch parses many documents in one call (bulk imports of small
+	// files). Requests are scheduled concurrently on the server and one
+	// ReadBatchResponse is streamed back per request as soon as it completes,
+	// in completion order, tagged with the request's request_id and index.
+	ReadBatch(*ReadBatchRequest, grpc.ServerStreamingServer[ReadBatchResponse]) error
 	ListEngines(context.Context, *ListEnginesRequest) (*ListEnginesResponse, error)
+	// Inspect reports the page count of a file without parsing it, so a client
+	// can split a large document into ReadConfig page ranges and spread them
+	// across replicas. Takes a file-mode ReadRequest (file_content, file_name,
+	// file_type and config.parser_engine are used).
+	Inspect(context.Context, *ReadRequest) (*InspectResponse, error)
 	mustEmbedUnimplementedDocReaderServer()
 }
 
@@ -115,9 +200,18 @@ func (UnimplementedDocReaderServer) Read(context.Context, *ReadRequest) (*ReadRe
 func (UnimplementedDocReaderServer) ReadStream(*ReadRequest, grpc.ServerStreamingServer[ReadStreamResponse]) error {
 	return status.Errorf(codes.Unimplemented, "method ReadStream not implemented")
 }
+func (UnimplementedDocReaderServer) ReadUpload(grpc.BidiStreamingServer[ReadUploadRequest, ReadStreamResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method ReadUpload not implemented")
+}
+func (UnimplementedDocReaderServer) ReadBatch(*ReadBatchRequest, grpc.ServerStreamingServer[ReadBatchResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method ReadBatch not implemented")
+}
 func (UnimplementedDocReaderServer) ListEngines(context.Context, *ListEnginesRequest) (*ListEnginesResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method ListEngines not implemented")
 }
+func (UnimplementedDocReaderServer) Inspect(context.Context, *ReadRequest) (*InspectResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method Inspect not implemented")
+}
 func (UnimplementedDocReaderServer) mustEmbedUnimplementedDocReaderServer() {}
 func (UnimplementedDocReaderServer) testEmbeddedByValue()                   {}
 
@@ -168,6 +262,24 @@ func _DocReader_ReadStream_Handler(srv interface{}, stream grpc.ServerStream) er
 // This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
 type DocReader_ReadStreamServer = grpc.ServerStreamingServer[ReadStreamResponse]
 
+func _DocReader_ReadUpload_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(DocReaderServer).ReadUpload(&grpc.GenericServerStream[ReadUploadRequest, ReadStreamResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type DocReader_ReadUploadServer = grpc.BidiStreamingServer[ReadUploadRequest, ReadStreamResponse]
+
+func _DocReader_ReadBatch_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(ReadBatchRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(DocReaderServer).ReadBatch(m, &grpc.GenericServerStream[ReadBatchRequest, ReadBatchResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type DocReader_ReadBatchServer = grpc.ServerStreamingServer[ReadBatchResponse]
+
 func _DocReader_ListEngines_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(ListEnginesRequest)
 	if err := dec(in); err != nil {
@@ -186,6 +298,24 @@ func _DocReader_ListEngines_Handler(srv interface{}, ctx context.Context, dec fu
 	return interceptor(ctx, in, info, handler)
 }
 
+func _DocReader_Inspect_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(ReadRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(DocReaderServer).Inspect(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: DocReader_Inspect_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(DocReaderServer).Inspect(ctx, req.(*ReadRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // DocReader_ServiceDesc is the grpc.ServiceDesc for DocReader service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -201,6 +331,10 @@ var DocReader_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "ListEngines",
 			Handler:    _DocReader_ListEngines_Handler,
 		},
+		{
+			MethodName: "Inspect",
+			Handler:    _DocReader_Inspect_Handler,
+		},
 	},
 	Streams: []grpc.StreamDesc{
 		{
@@ -208,6 +342,17 @@ var DocReader_ServiceDesc = grpc.ServiceDesc{
 			Handler:       _DocReader_ReadStream_Handler,
 			ServerStreams: true,
 		},
+		{
+			StreamName:    "ReadUpload",
+			Handler:       _DocReader_ReadUpload_Handler,
+			ServerStreams: true,
+			ClientStreams: true,
+		},
+		{
+			StreamName:    "ReadBatch",
+			Handler:       _DocReader_ReadBatch_Handler,
+			ServerStreams: true,
+		},
 	},
 	Metadata: "docreader.proto",
 }
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x64ocreader.proto\x12\tdocreader\"\xba\x01\n\nReadConfig\x12\x15\n\rparser_engine\x18\x01 \x01(\t\x12Q\n\x17parser_engine_overrides\x18\x02 \x03(\x0b\x32\x30.docreader.ReadConfig.ParserEngineOverridesEntry\x1a<\n\x1aParserEngineOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01J\x04\x08\x03\x10\x04\"\xa0\x01\n\x0bReadRequest\x12\x14\n\x0c\x66ile_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x11\n\tfile_type\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\x12\r\n\x05title\x18\x05 \x01(\t\x12%\n\x06\x63onfig\x18\x06 \x01(\x0b\x32\x15.docreader.ReadConfig\x12\x12\n\nrequest_id\x18\x07 \x01(\t\"n\n\x08ImageRef\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x14\n\x0coriginal_ref\x18\x02 \x01(\t\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x13\n\x0bstorage_key\x18\x04 \x01(\t\x12\x12\n\nimage_data\x18\x05 \x01(\x0c\"\xe2\x01\n\x0cReadResponse\x12\x18\n\x10markdown_content\x18\x01 \x01(\t\x12\'\n\nimage_refs\x18\x02 \x03(\x0b\x32\x13.docreader.ImageRef\x12\x16\n\x0eimage_dir_path\x18\x03 \x01(\t\x12\x37\n\x08metadata\x18\x04 \x03(\x0b\x32%.docreader.ReadResponse.MetadataEntry\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xd2\x01\n\x0eReadStreamMeta\x12\x18\n\x10markdown_content\x18\x01 \x01(\t\x12\x16\n\x0eimage_dir_path\x18\x02 \x01(\t\x12\x39\n\x08metadata\x18\x03 \x03(\x0b\x32\'.docreader.ReadStreamMeta.MetadataEntry\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x13\n\x0bimage_count\x18\x05 \x01(\r\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"p\n\x12ReadStreamResponse\x12)\n\x04meta\x18\x01 \x01(\x0b\x32\x19.docreader.ReadStreamMetaH\x00\x12$\n\x05image\x18\x02 \x01(\x0b\x32\x13.docreader.ImageRefH\x00\x42\t\n\x07payload\"\x9a\x01\n\x12ListEnginesRequest\x12L\n\x10\x63onfig_overrides\x18\x01 \x03(\x0b\x32\x32.docreader.ListEnginesRequest.ConfigOverridesEntry\x1a\x36\n\x14\x43onfigOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"x\n\x10ParserEngineInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x12\n\nfile_types\x18\x03 \x03(\t\x12\x11\n\tavailable\x18\x04 \x01(\x08\x12\x1a\n\x12unavailable_reason\x18\x05 \x01(\t\"C\n\x13ListEnginesResponse\x12,\n\x07\x65ngines\x18\x01 \x03(\x0b\x32\x1b.docreader.ParserEngineInfo2\xdf\x01\n\tDocReader\x12\x39\n\x04Read\x12\x16.docreader.ReadRequest\x1a\x17.docreader.ReadResponse\"\x00\x12G\n\nReadStream\x12\x16.docreader.ReadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x00\x30\x01\x12N\n\x0bListEngines\x12\x1d.docreader.ListEnginesRequest\x1a\x1e.docreader.ListEnginesResponse\"\x00\x42\x35Z3github.com/Tencent/WeKnora/internal/docreader/protob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x64ocreader.proto\x12\tdocreader\"\x89\x02\n\nReadConfig\x12\x15\n\rparser_engine\x18\x01 \x01(\t\x12Q\n\x17parser_engine_overrides\x18\x02 \x03(\x0b\x32\x30.docreader.ReadConfig.ParserEngineOverridesEntry\x12\x1a\n\x12incremental_stream\x18\x04 \x01(\x08\x12\x11\n\tfrom_page\x18\x05 \x01(\x05\x12\x0f\n\x07to_page\x18\x06 \x01(\x05\x12\r\n\x05pages\x18\x07 \x03(\x05\x1a<\n\x1aParserEngineOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01J\x04\x08\x03\x10\x04\"\xa0\x01\n\x0bReadRequest\x12\x14\n\x0c\x66ile_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x11\n\tfile_type\x18\x03 \x01(\t\x12\x0b\n\x03url\x18\x04 \x01(\t\x12\r\n\x05title\x18\x05 \x01(\t\x12%\n\x06\x63onfig\x18\x06 \x01(\x0b\x32\x15.docreader.ReadConfig\x12\x12\n\nrequest_id\x18\x07 \x01(\t\"Y\n\x11ReadUploadRequest\x12(\n\x06header\x18\x01 \x01(\x0b\x32\x16.docreader.ReadRequestH\x00\x12\x0f\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"<\n\x10ReadBatchRequest\x12(\n\x08requests\x18\x01 \x03(\x0b\x32\x16.docreader.ReadRequest\"a\n\x11ReadBatchResponse\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12\r\n\x05index\x18\x02 \x01(\x05\x12)\n\x08response\x18\x03 \x01(\x0b\x32\x17.docreader.ReadResponse\"n\n\x08ImageRef\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x14\n\x0coriginal_ref\x18\x02 \x01(\t\x12\x11\n\tmime_type\x18\x03 \x01(\t\x12\x13\n\x0bstorage_key\x18\x04 \x01(\t\x12\x12\n\nimage_data\x18\x05 \x01(\x0c\"\xe2\x01\n\x0cReadResponse\x12\x18\n\x10markdown_content\x18\x01 \x01(\t\x12\'\n\nimage_refs\x18\x02 \x03(\x0b\x32\x13.docreader.ImageRef\x12\x16\n\x0eimage_dir_path\x18\x03 \x01(\t\x12\x37\n\x08metadata\x18\x04 \x03(\x0b\x32%.docreader.ReadResponse.MetadataEntry\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xd2\x01\n\x0eReadStreamMeta\x12\x18\n\x10markdown_content\x18\x01 \x01(\t\x12\x16\n\x0eimage_dir_path\x18\x02 \x01(\t\x12\x39\n\x08metadata\x18\x03 \x03(\x0b\x32\'.docreader.ReadStreamMeta.MetadataEntry\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x13\n\x0bimage_count\x18\x05 \x01(\r\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"B\n\x12ReadStreamFragment\x12\x18\n\x10markdown_content\x18\x01 \x01(\t\x12\x12\n\npage_index\x18\x02 \x01(\x05\"\xb8\x01\n\x0eReadStreamDone\x12\x39\n\x08metadata\x18\x01 \x03(\x0b\x32\'.docreader.ReadStreamDone.MetadataEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x16\n\x0e\x66ragment_count\x18\x03 \x01(\r\x12\x13\n\x0bimage_count\x18\x04 \x01(\r\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xce\x01\n\x12ReadStreamResponse\x12)\n\x04meta\x18\x01 \x01(\x0b\x32\x19.docreader.ReadStreamMetaH\x00\x12$\n\x05image\x18\x02 \x01(\x0b\x32\x13.docreader.ImageRefH\x00\x12\x31\n\x08\x66ragment\x18\x03 \x01(\x0b\x32\x1d.docreader.ReadStreamFragmentH\x00\x12)\n\x04\x64one\x18\x04 \x01(\x0b\x32\x19.docreader.ReadStreamDoneH\x00\x42\t\n\x07payload\"\x9a\x01\n\x12ListEnginesRequest\x12L\n\x10\x63onfig_overrides\x18\x01 \x03(\x0b\x32\x32.docreader.ListEnginesRequest.ConfigOverridesEntry\x1a\x36\n\x14\x43onfigOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"x\n\x10ParserEngineInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x12\n\nfile_types\x18\x03 \x03(\t\x12\x11\n\tavailable\x18\x04 \x01(\x08\x12\x1a\n\x12unavailable_reason\x18\x05 \x01(\t\"C\n\x13ListEnginesResponse\x12,\n\x07\x65ngines\x18\x01 \x03(\x0b\x32\x1b.docreader.ParserEngineInfo\"U\n\x0fInspectResponse\x12\x12\n\npage_count\x18\x01 \x01(\x05\x12\x1f\n\x17supports_page_selection\x18\x02 \x01(\x08\x12\r\n\x05\x65rror\x18\x03 \x01(\t2\xbd\x03\n\tDocReader\x12\x39\n\x04Read\x12\x16.docreader.ReadRequest\x1a\x17.docreader.ReadResponse\"\x00\x12G\n\nReadStream\x12\x16.docreader.ReadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x00\x30\x01\x12O\n\nReadUpload\x12\x1c.docreader.ReadUploadRequest\x1a\x1d.docreader.ReadStreamResponse\"\x00(\x01\x30\x01\x12J\n\tReadBatch\x12\x1b.docreader.ReadBatchRequest\x1a\x1c.docreader.ReadBatchResponse\"\x00\x30\x01\x12N\n\x0bListEngines\x12\x1d.docreader.ListEnginesRequest\x1a\x1e.docreader.ListEnginesResponse\"\x00\x12?\n\x07Inspect\x12\x16.docreader.ReadRequest\x1a\x1a.docreader.InspectResponse\"\x00\x42\x35Z3github.com/Tencent/WeKnora/internal/docreader/protob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -38,34 +38,50 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_READRESPONSE_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_READSTREAMMETA_METADATAENTRY']._loaded_options = None
   _globals['_READSTREAMMETA_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_READSTREAMDONE_METADATAENTRY']._loaded_options = None
+  _globals['_READSTREAMDONE_METADATAENTRY']._serialized_options = b'8\001'
   _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._loaded_options = None
   _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._serialized_options = b'8\001'
   _globals['_READCONFIG']._serialized_start=31
-  _globals['_READCONFIG']._serialized_end=217
-  _globals['_READCONFIG_PARSERENGINEOVERRIDESENTRY']._serialized_start=151
-  _globals['_READCONFIG_PARSERENGINEOVERRIDESENTRY']._serialized_end=211
-  _globals['_READREQUEST']._serialized_start=220
-  _globals['_READREQUEST']._serialized_end=380
-  _globals['_IMAGEREF']._serialized_start=382
-  _globals['_IMAGEREF']._serialized_end=492
-  _globals['_READRESPONSE']._serialized_start=495
-  _globals['_READRESPONSE']._serialized_end=721
-  _globals['_READRESPONSE_METADATAENTRY']._serialized_start=674
-  _globals['_READRESPONSE_METADATAENTRY']._serialized_end=721
-  _globals['_READSTREAMMETA']._serialized_start=724
-  _globals['_READSTREAMMETA']._serialized_end=934
-  _globals['_READSTREAMMETA_METADATAENTRY']._serialized_start=674
-  _globals['_READSTREAMMETA_METADATAENTRY']._serialized_end=721
-  _globals['_READSTREAMRESPONSE']._serialized_start=936
-  _globals['_READSTREAMRESPONSE']._serialized_end=1048
-  _globals['_LISTENGINESREQUEST']._serialized_start=1051
-  _globals['_LISTENGINESREQUEST']._serialized_end=1205
-  _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._serialized_start=1151
-  _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._serialized_end=1205
-  _globals['_PARSERENGINEINFO']._serialized_start=1207
-  _globals['_PARSERENGINEINFO']._serialized_end=1327
-  _globals['_LISTENGINESRESPONSE']._serialized_start=1329
-  _globals['_LISTENGINESRESPONSE']._serialized_end=1396
-  _globals['_DOCREADER']._serialized_start=1399
-  _globals['_DOCREADER']._serialized_end=1622
+  _globals['_READCONFIG']._serialized_end=296
+  _globals['_READCONFIG_PARSERENGINEOVERRIDESENTRY']._serialized_start=230
+  _globals['_READCONFIG_PARSERENGINEOVERRIDESENTRY']._serialized_end=290
+  _globals['_READREQUEST']._serialized_start=299
+  _globals['_READREQUEST']._serialized_end=459
+  _globals['_READUPLOADREQUEST']._serialized_start=461
+  _globals['_READUPLOADREQUEST']._serialized_end=550
+  _globals['_READBATCHREQUEST']._serialized_start=552
+  _globals['_READBATCHREQUEST']._serialized_end=612
+  _globals['_READBATCHRESPONSE']._serialized_start=614
+  _globals['_READBATCHRESPONSE']._serialized_end=711
+  _globals['_IMAGEREF']._serialized_start=713
+  _globals['_IMAGEREF']._serialized_end=823
+  _globals['_READRESPONSE']._serialized_start=826
+  _globals['_READRESPONSE']._serialized_end=1052
+  _globals['_READRESPONSE_METADATAENTRY']._serialized_start=1005
+  _globals['_READRESPONSE_METADATAENTRY']._serialized_end=1052
+  _globals['_READSTREAMMETA']._serialized_start=1055
+  _globals['_READSTREAMMETA']._serialized_end=1265
+  _globals['_READSTREAMMETA_METADATAENTRY']._serialized_start=1005
+  _globals['_READSTREAMMETA_METADATAENTRY']._serialized_end=1052
+  _globals['_READSTREAMFRAGMENT']._serialized_start=1267
+  _globals['_READSTREAMFRAGMENT']._serialized_end=1333
+  _globals['_READSTREAMDONE']._serialized_start=1336
+  _globals['_READSTREAMDONE']._serialized_end=1520
+  _globals['_READSTREAMDONE_METADATAENTRY']._serialized_start=1005
+  _globals['_READSTREAMDONE_METADATAENTRY']._serialized_end=1052
+  _globals['_READSTREAMRESPONSE']._serialized_start=1523
+  _globals['_READSTREAMRESPONSE']._serialized_end=1729
+  _globals['_LISTENGINESREQUEST']._serialized_start=1732
+  _globals['_LISTENGINESREQUEST']._serialized_end=1886
+  _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._serialized_start=1832
+  _globals['_LISTENGINESREQUEST_CONFIGOVERRIDESENTRY']._serialized_end=1886
+  _globals['_PARSERENGINEINFO']._serialized_start=1888
+  _globals['_PARSERENGINEINFO']._serialized_end=2008
+  _globals['_LISTENGINESRESPONSE']._serialized_start=2010
+  _globals['_LISTENGINESRESPONSE']._serialized_end=2077
+  _globals['_INSPECTRESPONSE']._serialized_start=2079
+  _globals['_INSPECTRESPONSE']._serialized_end=2164
+  _globals['_DOCREADER']._serialized_start=2167
+  _globals['_DOCREADER']._serialized_end=2612
 # @@protoc_insertion_point(module_scope)
@@ -7,7 +7,7 @@ from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class ReadConfig(_message.Message):
-    __slots__ = ("parser_engine", "parser_engine_overrides")
+    __slots__ = ("parser_engine", "parser_engine_overrides", "incremental_stream", "from_page", "to_page", "pages")
     class ParserEngineOverridesEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -17,9 +17,17 @@ class ReadConfig(_message.Message):
         def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
     PARSER_ENGINE_FIELD_NUMBER: _ClassVar[int]
     PARSER_ENGINE_OVERRIDES_FIELD_NUMBER: _ClassVar[int]
+    INCREMENTAL_STREAM_FIELD_NUMBER: _ClassVar[int]
+    FROM_PAGE_FIELD_NUMBER: _ClassVar[int]
+    TO_PAGE_FIELD_NUMBER: _ClassVar[int]
+    PAGES_FIELD_NUMBER: _ClassVar[int]
     parser_engine: str
     parser_engine_overrides: _containers.ScalarMap[str, str]
-    def __init__(self, parser_engine: _Optional[str] = ..., parser_engine_overrides: _Optional[_Mapping[str, str]] = ...) -> None: ...
+    incremental_stream: bool
+    from_page: int
+    to_page: int
+    pages: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, parser_engine: _Optional[str] = ..., parser_engine_overrides: _Optional[_Mapping[str, str]] = ..., incremental_stream: bool = ..., from_page: _Optional[int] = ..., to_page: _Optional[int] = ..., pages: _Optional[_Iterable[int]] = ...) -> None: ...
 
 class ReadRequest(_message.Message):
     __slots__ = ("file_content", "file_name", "file_type", "url", "title", "config", "request_id")
@@ -39,6 +47,30 @@ class ReadRequest(_message.Message):
     request_id: str
     def __init__(self, file_content: _Optional[bytes] = ..., file_name: _Optional[str] = ..., file_type: _Optional[str] = ..., url: _Optional[str] = ..., title: _Optional[str] = ..., config: _Optional[_Union[ReadConfig, _Mapping]] = ..., request_id: _Optional[str] = ...) -> None: ...
 
+class ReadUploadRequest(_message.Message):
+    __slots__ = ("header", "chunk")
+    HEADER_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    header: ReadRequest
+    chunk: bytes
+    def __init__(self, header: _Optional[_Union[ReadRequest, _Mapping]] = ..., chunk: _Optional[bytes] = ...) -> None: ...
+
+class ReadBatchRequest(_message.Message):
+    __slots__ = ("requests",)
+    REQUESTS_FIELD_NUMBER: _ClassVar[int]
+    requests: _containers.RepeatedCompositeFieldContainer[ReadRequest]
+    def __init__(self, requests: _Optional[_Iterable[_Union[ReadRequest, _Mapping]]] = ...) -> None: ...
+
+class ReadBatchResponse(_message.Message):
+    __slots__ = ("request_id", "index", "response")
+    REQUEST_ID_FIELD_NUMBER: _ClassVar[int]
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    request_id: str
+    index: int
+    response: ReadResponse
+    def __init__(self, request_id: _Optional[str] = ..., index: _Optional[int] = ..., response: _Optional[_Union[ReadResponse, _Mapping]] = ...) -> None: ...
+
 class ImageRef(_message.Message):
     __slots__ = ("filename", "original_ref", "mime_type", "storage_key", "image_data")
     FILENAME_FIELD_NUMBER: _ClassVar[int]
@@ -95,13 +127,44 @@ class ReadStreamMeta(_message.Message):
     image_count: int
     def __init__(self, markdown_content: _Optional[str] = ..., image_dir_path: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ..., error: _Optional[str] = ..., image_count: _Optional[int] = ...) -> None: ...
 
+class ReadStreamFragment(_message.Message):
+    __slots__ = ("markdown_content", "page_index")
+    MARKDOWN_CONTENT_FIELD_NUMBER: _ClassVar[int]
+    PAGE_INDEX_FIELD_NUMBER: _ClassVar[int]
+    markdown_content: str
+    page_index: int
+    def __init__(self, markdown_content: _Optional[str] = ..., page_index: _Optional[int] = ...) -> None: ...
+
+class ReadStreamDone(_message.Message):
+    __slots__ = ("metadata", "error", "fragment_count", "image_count")
+    class MetadataEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    FRAGMENT_COUNT_FIELD_NUMBER: _ClassVar[int]
+    IMAGE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    metadata: _containers.ScalarMap[str, str]
+    error: str
+    fragment_count: int
+    image_count: int
+    def __init__(self, metadata: _Optional[_Mapping[str, str]] = ..., error: _Optional[str] = ..., fragment_count: _Optional[int] = ..., image_count: _Optional[int] = ...) -> None: ...
+
 class ReadStreamResponse(_message.Message):
-    __slots__ = ("meta", "image")
+    __slots__ = ("meta", "image", "fragment", "done")
     META_FIELD_NUMBER: _ClassVar[int]
     IMAGE_FIELD_NUMBER: _ClassVar[int]
+    FRAGMENT_FIELD_NUMBER: _ClassVar[int]
+    DONE_FIELD_NUMBER: _ClassVar[int]
     meta: ReadStreamMeta
     image: ImageRef
-    def __init__(self, meta: _Optional[_Union[ReadStreamMeta, _Mapping]] = ..., image: _Optional[_Union[ImageRef, _Mapping]] = ...) -> None: ...
+    fragment: ReadStreamFragment
+    done: ReadStreamDone
+    def __init__(self, meta: _Optional[_Union[ReadStreamMeta, _Mapping]] = ..., image: _Optional[_Union[ImageRef, _Mapping]] = ..., fragment: _Optional[_Union[ReadStreamFragment, _Mapping]] = ..., done: _Optional[_Union[ReadStreamDone, _Mapping]] = ...) -> None: ...
 
 class ListEnginesRequest(_message.Message):
     __slots__ = ("config_overrides",)
@@ -135,3 +198,13 @@ class ListEnginesResponse(_message.Message):
     ENGINES_FIELD_NUMBER: _ClassVar[int]
     engines: _containers.RepeatedCompositeFieldContainer[ParserEngineInfo]
     def __init__(self, engines: _Optional[_Iterable[_Union[ParserEngineInfo, _Mapping]]] = ...) -> None: ...
+
+class InspectResponse(_message.Message):
+    __slots__ = ("page_count", "supports_page_selection", "error")
+    PAGE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    SUPPORTS_PAGE_SELECTION_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    page_count: int
+    supports_page_selection: bool
+    error: str
+    def __init__(self, page_count: _Optional[int] = ..., supports_page_selection: bool = ..., error: _Optional[str] = ...) -> None: ...
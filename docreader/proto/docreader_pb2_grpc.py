@@ -44,11 +44,26 @@ class DocReaderStub(object):
                 request_serializer=docreader__pb2.ReadRequest.SerializeToString,
                 response_deserializer=docreader__pb2.ReadStreamResponse.FromString,
                 _registered_method=True)
+        self.ReadUpload = channel.stream_stream(
+                '/docreader.DocReader/ReadUpload',
+                request_serializer=docreader__pb2.ReadUploadRequest.SerializeToString,
+                response_deserializer=docreader__pb2.ReadStreamResponse.FromString,
+                _registered_method=True)
+        self.ReadBatch = channel.unary_stream(
+                '/docreader.DocReader/ReadBatch',
+                request_serializer=docreader__pb2.ReadBatchRequest.SerializeToString,
+                response_deserializer=docreader__pb2.ReadBatchResponse.FromString,
+                _registered_method=True)
         self.ListEngines = channel.unary_unary(
                 '/docreader.DocReader/ListEngines',
                 request_serializer=docreader__pb2.ListEnginesRequest.SerializeToString,
                 response_deserializer=docreader__pb2.ListEnginesResponse.FromString,
                 _registered_method=True)
+        self.Inspect = channel.unary_unary(
+                '/docreader.DocReader/Inspect',
+                request_serializer=docreader__pb2.ReadRequest.SerializeToString,
+                response_deserializer=docreader__pb2.InspectResponse.FromString,
+                _registered_method=True)
 
 
 class DocReaderServicer(object):
@@ -67,6 +82,31 @@ class DocReaderServicer(object):
         small so large scanned PDFs (hundreds of page images, far exceeding the
         unary message-size cap) can be returned without RESOURCE_EXHAUSTED and
         with bounded memory on both ends.
+
+        With ReadConfig.incremental_stream set, parsers that support it emit
+        output page by page instead: `fragment` / `image` frames in document
+        order as each page finishes, then a single closing `done` frame.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReadUpload(self, request_iterator, context):
+        """ReadUpload is ReadStream for large files: the client streams the file
+        in chunks (first message: `header`, then `chunk`s in order) instead of
+        one file_content message bounded by the gRPC message-size cap. The server
+        spools chunks to disk and parsers read the spooled file, so an upload is
+        never held in memory whole. Responses are ReadStream frames.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReadBatch(self, request, context):
+        """ReadBatch parses many documents in one call (bulk imports of small
+        files). Requests are scheduled concurrently on the server and one
+        ReadBatchResponse is streamed back per request as soon as it completes,
+        in completion order, tagged with the request's request_id and index.
         """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
@@ -78,6 +118,16 @@ class DocReaderServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Inspect(self, request, context):
+        """Inspect reports the page count of a file without parsing it, so a client
+        can split a large document into ReadConfig page ranges and spread them
+        across replicas. Takes a file-mode ReadRequest (file_content, file_name,
+        file_type and config.parser_engine are used).
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DocReaderServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -91,11 +141,26 @@ def add_DocReaderServicer_to_server(servicer, server):
                     request_deserializer=docreader__pb2.ReadRequest.FromString,
                     response_serializer=docreader__pb2.ReadStreamResponse.SerializeToString,
             ),
+            'ReadUpload': grpc.stream_stream_rpc_method_handler(
+                    servicer.ReadUpload,
+                    request_deserializer=docreader__pb2.ReadUploadRequest.FromString,
+                    response_serializer=docreader__pb2.ReadStreamResponse.SerializeToString,
+            ),
+            'ReadBatch': grpc.unary_stream_rpc_method_handler(
+                    servicer.ReadBatch,
+                    request_deserializer=docreader__pb2.ReadBatchRequest.FromString,
+                    response_serializer=docreader__pb2.ReadBatchResponse.SerializeToString,
+            ),
             'ListEngines': grpc.unary_unary_rpc_method_handler(
                     servicer.ListEngines,
                     request_deserializer=docreader__pb2.ListEnginesRequest.FromString,
                     response_serializer=docreader__pb2.ListEnginesResponse.SerializeToString,
             ),
+            'Inspect': grpc.unary_unary_rpc_method_handler(
+                    servicer.Inspect,
+                    request_deserializer=docreader__pb2.ReadRequest.FromString,
+                    response_serializer=docreader__pb2.InspectResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'docreader.DocReader', rpc_method_handlers)
@@ -161,6 +226,60 @@ class DocReader(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ReadUpload(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/docreader.DocReader/ReadUpload',
+            docreader__pb2.ReadUploadRequest.SerializeToString,
+            docreader__pb2.ReadStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReadBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/docreader.DocReader/ReadBatch',
+            docreader__pb2.ReadBatchRequest.SerializeToString,
+            docreader__pb2.ReadBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ListEngines(request,
             target,
@@ -187,3 +306,30 @@ class DocReader(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def Inspect(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/docreader.DocReader/Inspect',
+            docreader__pb2.ReadRequest.SerializeToString,
+            docreader__pb2.InspectResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
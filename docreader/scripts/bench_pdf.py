@@ -0,0 +1,657 @@
+"""PDF 解析性能基准：本地生成合成语料（无需联网），测量各 PDF 解析器的吞吐与资源占用。
+
+语料覆盖单栏原生文本、双栏论文、纯扫描件、图文混排、图表密集页和大体量中文文档，
+均由固定随机种子生成，结果可复现。每个（语料, 解析器）组合在独立子进程中运行，
+报告页/秒、各阶段耗时（PDFParser 的 stage_timings_ms）、峰值 RSS（解析进程与
+渲染进程）以及输出图片总字节数，并可与保存的基线比较。
+
+用法（在仓库根目录 WeKnora 下执行）：
+    PYTHONPATH=. docreader/.venv/bin/python docreader/scripts/bench_pdf.py
+    PYTHONPATH=. docreader/.venv/bin/python docreader/scripts/bench_pdf.py \\
+        --baseline docreader/scripts/bench_pdf_baseline.json
+    PYTHONPATH=. docreader/.venv/bin/python docreader/scripts/bench_pdf.py \\
+        --cases scanned,hybrid --parsers pdf --save-baseline /tmp/base.json
+
+与基线比较时，吞吐下降、峰值 RSS 或图片字节数增长超过 --tolerance 的组合记为
+回退，存在回退时退出码为 1。基线与运行环境（CPU 数、渲染并行度等）相关，
+换机器后应重新生成。
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+_REPO_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+
+# Bump when the generated corpus changes, so stale corpus dirs are rebuilt and
+# baselines from another corpus are not compared against.
+CORPUS_VERSION = 1
+SEED = 20240611
+
+PAGE_W, PAGE_H = 612, 792
+
+_WORDS = (
+    "performance document parser render page layout column figure table "
+    "latency throughput memory budget worker process stream image scanned "
+    "native text extraction baseline regression benchmark synthetic corpus "
+    "chart caption heading section analysis result method system model data"
+).split()
+_CJK_CHARS = (
+    "的一是在不了有和人这中大为上个国我以要他时来用们生到"
+    "作地于出就分对成会可主发年动同工也能下过子说产种面而"
+    "方后多定行学法所民得经十三之进着等部度家电力里如水化"
+    "高自二理起小物现实加量都两体制机当使点从业本去把性好"
+    "应开它合还因由其些然前外天政四日文档解析性能基准测试"
+    "页面渲染扫描版式图表标题章节结果方法系统模型数据"
+)
+
+
+# --- Synthetic PDF writer ----------------------------------------------------
+
+
+class _PdfWriter:
+    """Minimal PDF writer: standard / predefined-CMap fonts and JPEG images.
+
+    Fonts are not embedded: Helvetica is a standard font and STSong-Light with
+    the UniGB-UCS2-H CMap is a predefined CJK font every reader (and pdfium)
+    substitutes, so pages stay small and text extraction still works.
+    """
+
+    def __init__(self):
+        self._objects: list = []
+        self._pages: list = []
+        cid = self._add(
+            b"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /STSong-Light "
+            b"/CIDSystemInfo << /Registry (Adobe) /Ordering (GB1) /Supplement 4 >> "
+            b"/DW 1000 >>"
+        )
+        self._fonts = {
+            "F1": self._add(
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                b"/Encoding /WinAnsiEncoding >>"
+            ),
+            "F2": self._add(
+                b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold "
+                b"/Encoding /WinAnsiEncoding >>"
+            ),
+            "F3": self._add(
+                b"<< /Type /Font /Subtype /Type0 /BaseFont /STSong-Light "
+                b"/Encoding /UniGB-UCS2-H /DescendantFonts [%d 0 R] >>" % cid
+            ),
+        }
+        self._pages_id = self._add(None)
+
+    def _add(self, body) -> int:
+        self._objects.append(body)
+        return len(self._objects)
+
+    def _stream(self, data: bytes, extra: bytes = b"") -> int:
+        return self._add(
+            b"<< /Length %d %s>>\nstream\n" % (len(data), extra)
+            + data
+            + b"\nendstream"
+        )
+
+    def add_page(self, content: bytes, images: dict = None) -> None:
+        """Add a page; ``images`` maps XObject names to ``(jpeg, w, h, gray)``."""
+        xobjects = b""
+        for name, (jpeg, w, h, gray) in (images or {}).items():
+            ref = self._stream(
+                jpeg,
+                b"/Type /XObject /Subtype /Image /Width %d /Height %d "
+                b"/ColorSpace /%s /BitsPerComponent 8 /Filter /DCTDecode "
+                % (w, h, b"DeviceGray" if gray else b"DeviceRGB"),
+            )
+            xobjects += b"/%s %d 0 R " % (name.encode(), ref)
+        fonts = b"".join(
+            b"/%s %d 0 R " % (k.encode(), v) for k, v in self._fonts.items()
+        )
+        contents = self._stream(content)
+        self._pages.append(
+            self._add(
+                b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] "
+                b"/Resources << /Font << %s>> /XObject << %s>> >> /Contents %d 0 R >>"
+                % (self._pages_id, PAGE_W, PAGE_H, fonts, xobjects, contents)
+            )
+        )
+
+    def to_bytes(self) -> bytes:
+        kids = b" ".join(b"%d 0 R" % p for p in self._pages)
+        self._objects[self._pages_id - 1] = (
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._pages))
+        )
+        catalog = self._add(b"<< /Type /Catalog /Pages %d 0 R >>" % self._pages_id)
+        out = bytearray(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for number, body in enumerate(self._objects, 1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(self._objects) + 1)
+        for offset in offsets:
+            out += b"%010d 00000 n \n" % offset
+        out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(self._objects) + 1,
+            catalog,
+            xref,
+        )
+        return bytes(out)
+
+
+def _latin(text: str) -> bytes:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return b"(" + escaped.encode("latin-1") + b")"
+
+
+def _show(font: str, size: float, x: float, y: float, text: str) -> bytes:
+    if font == "F3":
+        shown = b"<" + text.encode("utf-16-be").hex().upper().encode() + b">"
+    else:
+        shown = _latin(text)
+    return b"BT /%s %g Tf %g %g Td %s Tj ET\n" % (font.encode(), size, x, y, shown)
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _wrap(rng: random.Random, width_chars: int, lines: int) -> list:
+    out, line = [], ""
+    while len(out) < lines:
+        word = rng.choice(_WORDS)
+        if len(line) + len(word) + 1 > width_chars:
+            out.append(line)
+            line = word
+        else:
+            line = f"{line} {word}".strip()
+    return out
+
+
+def _running_lines(title: str, number: int) -> bytes:
+    return _show("F1", 8, 72, PAGE_H - 40, title) + _show(
+        "F1", 8, PAGE_W / 2, 30, str(number)
+    )
+
+
+def _native_page(rng, title: str, number: int) -> bytes:
+    content = _running_lines(title, number)
+    content += _show("F2", 14, 72, PAGE_H - 80, f"{number}. {_sentence(rng, 4)}")
+    y = PAGE_H - 110
+    while y > 70:
+        for line in _wrap(rng, 90, rng.randint(4, 8)):
+            if y <= 70:
+                break
+            content += _show("F1", 10, 72, y, line)
+            y -= 13
+        y -= 10
+    return content
+
+
+def _two_column_page(rng, title: str, number: int) -> bytes:
+    content = _running_lines(title, number)
+    if number == 1:
+        content += _show("F2", 16, 120, PAGE_H - 80, _sentence(rng, 6))
+        top = PAGE_H - 130
+    else:
+        top = PAGE_H - 70
+    for x in (54, PAGE_W / 2 + 9):
+        y = top
+        section = 0
+        while y > 60:
+            if rng.random() < 0.15:
+                section += 1
+                content += _show("F2", 10, x, y, f"{section} {_sentence(rng, 3)}")
+                y -= 14
+            for line in _wrap(rng, 52, rng.randint(5, 10)):
+                if y <= 60:
+                    break
+                content += _show("F1", 9, x, y, line)
+                y -= 11
+            y -= 6
+    return content
+
+
+def _chart(rng, x: float, y: float, w: float, h: float) -> bytes:
+    """A bar or line chart with axes, ticks and labels at ``(x, y)``."""
+    out = b"q 0 0 0 RG 0.8 w %g %g m %g %g l %g %g l S Q\n" % (
+        x,
+        y + h,
+        x,
+        y,
+        x + w,
+        y,
+    )
+    for k in range(5):
+        ty = y + h * k / 4
+        out += b"q 0.85 0.85 0.85 RG 0.3 w %g %g m %g %g l S Q\n" % (x, ty, x + w, ty)
+        out += _show("F1", 6, x - 18, ty - 2, str(25 * k))
+    points = [rng.uniform(0.1, 0.95) for _ in range(rng.randint(6, 12))]
+    step = w / len(points)
+    if rng.random() < 0.5:
+        for k, v in enumerate(points):
+            r, g, b = rng.random(), rng.random(), rng.random()
+            out += b"q %.2f %.2f %.2f rg %g %g %g %g re f Q\n" % (
+                r,
+                g,
+                b,
+                x + k * step + 2,
+                y,
+                step - 4,
+                h * v,
+            )
+    else:
+        path = b" ".join(
+            b"%g %g %s" % (x + (k + 0.5) * step, y + h * v, b"m" if k == 0 else b"l")
+            for k, v in enumerate(points)
+        )
+        out += b"q 0.1 0.3 0.8 RG 1.2 w %s S Q\n" % path
+    for k in range(len(points)):
+        out += _show("F1", 6, x + k * step + 2, y - 9, f"Q{k + 1}")
+    return out
+
+
+def _chart_page(rng, title: str, number: int) -> bytes:
+    content = _running_lines(title, number)
+    y = PAGE_H - 80
+    for figure in range(2):
+        for line in _wrap(rng, 90, 3):
+            content += _show("F1", 10, 72, y, line)
+            y -= 13
+        content += _chart(rng, 100, y - 200, 400, 180)
+        y -= 225
+        caption = f"Figure {number}.{figure + 1}: {_sentence(rng, 6)}"
+        content += _show("F1", 9, 72, y, caption)
+        y -= 25
+    return content
+
+
+def _cjk_page(rng, number: int) -> bytes:
+    content = _show("F3", 8, 72, PAGE_H - 40, "中文基准文档") + _show(
+        "F1", 8, PAGE_W / 2, 30, str(number)
+    )
+    heading = "".join(rng.choice(_CJK_CHARS) for _ in range(8))
+    content += _show("F3", 14, 72, PAGE_H - 80, f"第{number}章 {heading}")
+    y = PAGE_H - 110
+    while y > 70:
+        for _ in range(rng.randint(3, 7)):
+            if y <= 70:
+                break
+            line = "".join(rng.choice(_CJK_CHARS) for _ in range(38))
+            content += _show("F3", 12, 72, y, line + "。")
+            y -= 17
+        y -= 8
+    return content
+
+
+def _scan_image(rng, number: int, gray: bool) -> tuple:
+    """A 150 DPI "scan" of a text page: ``(jpeg, w, h, gray)``."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    w, h = PAGE_W * 150 // 72, PAGE_H * 150 // 72
+    image = Image.new("L" if gray else "RGB", (w, h), 238 if gray else (240, 236, 226))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=22)
+    ink = 30 if gray else (25, 25, 60)
+    y = 140
+    draw.text((150, y), f"Scanned page {number}", fill=ink, font=font)
+    y += 70
+    while y < h - 160:
+        for line in _wrap(rng, 85, rng.randint(4, 9)):
+            if y >= h - 160:
+                break
+            draw.text((150, y), line, fill=ink, font=font)
+            y += 30
+        y += 24
+    buf = io.BytesIO()
+    paper = 238 if gray else (240, 236, 226)
+    image.rotate(rng.uniform(-0.8, 0.8), fillcolor=paper).save(
+        buf, format="JPEG", quality=80
+    )
+    return buf.getvalue(), w, h, gray
+
+
+def _scanned_page(rng, writer: _PdfWriter, number: int) -> None:
+    image = _scan_image(rng, number, gray=rng.random() < 0.7)
+    writer.add_page(
+        b"q %d 0 0 %d 0 0 cm /Im0 Do Q\n" % (PAGE_W, PAGE_H), {"Im0": image}
+    )
+
+
+def _build(kind: str, pages: int, seed: int) -> bytes:
+    rng = random.Random(f"{seed}:{kind}")
+    writer = _PdfWriter()
+    title = f"Synthetic {kind} document"
+    for n in range(1, pages + 1):
+        if kind == "native":
+            writer.add_page(_native_page(rng, title, n))
+        elif kind == "two_column":
+            writer.add_page(_two_column_page(rng, title, n))
+        elif kind == "scanned":
+            _scanned_page(rng, writer, n)
+        elif kind == "hybrid":
+            if n % 3 == 2:
+                _scanned_page(rng, writer, n)
+            elif n % 3 == 0:
+                writer.add_page(_chart_page(rng, title, n))
+            else:
+                writer.add_page(_native_page(rng, title, n))
+        elif kind == "charts":
+            writer.add_page(_chart_page(rng, title, n))
+        elif kind == "cjk":
+            writer.add_page(_cjk_page(rng, n))
+        else:
+            raise ValueError(f"unknown corpus kind: {kind}")
+    return writer.to_bytes()
+
+
+# Corpus: name -> pages at --scale 1.
+CASES = {
+    "native": 60,
+    "two_column": 30,
+    "scanned": 24,
+    "hybrid": 30,
+    "charts": 20,
+    "cjk": 150,
+}
+
+
+def build_corpus(directory: str, cases: list, scale: float, seed: int = SEED) -> dict:
+    """Write the corpus PDFs under ``directory``; returns ``{case: path}``."""
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+    for case in cases:
+        pages = max(1, round(CASES[case] * scale))
+        path = os.path.join(
+            directory, f"{case}-{pages}p-s{seed}-v{CORPUS_VERSION}.pdf"
+        )
+        if not os.path.exists(path):
+            data = _build(case, pages, seed)
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        paths[case] = path
+    return paths
+
+
+# --- Measurement -------------------------------------------------------------
+
+
+def _parser_class(name: str):
+    if name == "pdf":
+        from docreader.parser.pdf_parser import PDFParser
+
+        return PDFParser
+    if name == "scanned":
+        from docreader.parser.pdf_parser import PDFScannedParser
+
+        return PDFScannedParser
+    if name == "odl":
+        from docreader.parser.opendataloader_parser import OpenDataLoaderParser
+
+        return OpenDataLoaderParser
+    raise ValueError(f"unknown parser: {name}")
+
+
+PARSERS = ("pdf", "scanned", "odl")
+
+
+def _peak_rss_mb(who) -> float:
+    # ru_maxrss is in KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _measure(parser_name: str, path: str, repeat: int) -> dict:
+    """Parse ``path`` ``repeat`` times in this process (run in a child)."""
+    if parser_name == "odl":
+        from docreader.parser.opendataloader_parser import opendataloader_available
+
+        ok, msg = opendataloader_available()
+        if not ok:
+            return {"unavailable": msg}
+    from docreader.parser import pdf_parser
+
+    cls = _parser_class(parser_name)
+    with open(path, "rb") as f:
+        content = f.read()
+    file_name = os.path.basename(path)
+    seconds = []
+    doc = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        doc = cls(
+            file_name=file_name, file_type="pdf", source_path=path
+        ).parse_into_text(content)
+        seconds.append(time.perf_counter() - started)
+    # Join the render workers so their peak RSS is accounted.
+    if pdf_parser._render_pool is not None:
+        pdf_parser._render_pool.shutdown(wait=True)
+    pages = pdf_parser._pdf_page_count(content)
+    wall = statistics.median(seconds)
+    stages = json.loads(doc.metadata.get("stage_timings_ms") or "{}")
+    return {
+        "pages": pages,
+        "seconds": round(wall, 4),
+        "pages_per_sec": round(pages / wall, 2) if wall > 0 else 0.0,
+        "stages_ms": stages,
+        "image_bytes": sum(len(data) for data in doc.images.values()),
+        "images": len(doc.images),
+        "content_chars": len(doc.content),
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "workers_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+
+def _run_child(parser_name: str, path: str, repeat: int, timeout: float) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (_REPO_ROOT, env.get("PYTHONPATH")) if p
+    )
+    # Measure the parsers, not the caches.
+    env["DOCREADER_PDF_PAGE_CACHE_ENABLED"] = "false"
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", parser_name, path]
+    cmd += ["--repeat", str(repeat)]
+    try:
+        proc = subprocess.run(
+            cmd, env=env, capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout:.0f}s"}
+    if proc.returncode != 0:
+        tail = (proc.stderr or "").strip().splitlines()[-1:] or ["no output"]
+        return {"error": f"exit {proc.returncode}: {tail[0]}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _environment() -> dict:
+    from docreader.config import CONFIG
+
+    try:
+        import pypdfium2
+
+        pdfium_version = str(pypdfium2.PYPDFIUM_INFO)
+    except Exception:
+        pdfium_version = "unknown"
+    return {
+        "corpus_version": CORPUS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pypdfium2": pdfium_version,
+        "pdf_render_dpi": CONFIG.pdf_render_dpi,
+        "pdf_direct_page_images": CONFIG.pdf_direct_page_images,
+        "pdf_adaptive_render": CONFIG.pdf_adaptive_render,
+        "pdf_render_parallelism": CONFIG.pdf_render_parallelism,
+        "cpu_tokens": CONFIG.cpu_tokens,
+    }
+
+
+# --- Reporting ---------------------------------------------------------------
+
+
+def _top_stages(stages: dict, n: int = 3) -> str:
+    stages = {k: v for k, v in stages.items() if k != "total"}
+    top = sorted(stages.items(), key=lambda item: item[1], reverse=True)[:n]
+    return ", ".join(f"{k}={v:.0f}" for k, v in top)
+
+
+def _print_results(results: dict) -> None:
+    header = (
+        f"{'case':<11} {'parser':<8} {'pages':>5} {'pages/s':>8} {'sec':>7} "
+        f"{'rss MB':>7} {'wrk MB':>7} {'img MB':>7}  stages (ms)"
+    )
+    print(header)
+    print("-" * len(header))
+    for key, r in sorted(results.items()):
+        case, parser_name = key.split("/")
+        if "pages" not in r:
+            reason = r.get("error") or r.get("unavailable")
+            print(f"{case:<11} {parser_name:<8} {'-':>5}  skipped: {reason}")
+            continue
+        print(
+            f"{case:<11} {parser_name:<8} {r['pages']:>5} {r['pages_per_sec']:>8.2f} "
+            f"{r['seconds']:>7.2f} {r['peak_rss_mb']:>7.1f} "
+            f"{r['workers_peak_rss_mb']:>7.1f} {r['image_bytes'] / 1e6:>7.2f}  "
+            f"{_top_stages(r['stages_ms'])}"
+        )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Regressions of ``results`` against ``baseline``, as printable lines."""
+    regressions = []
+    for key, r in sorted(results.items()):
+        base = baseline.get(key)
+        if not base or "pages" not in r or "pages" not in base:
+            continue
+        checks = (
+            ("pages/s", r["pages_per_sec"], base["pages_per_sec"], -1),
+            ("peak RSS MB", r["peak_rss_mb"], base["peak_rss_mb"], 1),
+            ("image bytes", r["image_bytes"], base["image_bytes"], 1),
+        )
+        for label, now, before, worse in checks:
+            if not before:
+                continue
+            change = (now - before) / before
+            mark = ""
+            if change * worse > tolerance:
+                mark = "  <-- regression"
+                regressions.append(f"{key} {label}: {before} -> {now}")
+            print(
+                f"{key:<20} {label:<12} {before:>12} -> {now:>12} {change:+7.1%}{mark}"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PDF 解析性能基准（合成语料）")
+    parser.add_argument(
+        "--cases",
+        default=",".join(CASES),
+        help=f"语料类型，逗号分隔（可选：{','.join(CASES)}）",
+    )
+    parser.add_argument(
+        "--parsers",
+        default=",".join(PARSERS),
+        help="解析器，逗号分隔：pdf=PDFParser，scanned=PDFScannedParser，"
+        "odl=OpenDataLoaderParser（缺少 Java 等依赖时跳过）",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="语料页数缩放倍数（默认 1）"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="每个组合重复次数，取中位数（默认 3）"
+    )
+    parser.add_argument(
+        "--corpus-dir",
+        default=os.path.join(tempfile.gettempdir(), "docreader-bench-corpus"),
+        help="语料目录，已生成的文件会复用",
+    )
+    parser.add_argument("--out", default="", help="将结果写入该 JSON 文件")
+    parser.add_argument("--baseline", default="", help="与该基线 JSON 比较")
+    parser.add_argument("--save-baseline", default="", help="将结果保存为基线 JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="判定回退的相对变化阈值（默认 0.15）",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=1800, help="单个组合的超时秒数"
+    )
+    parser.add_argument(
+        "--child", nargs=2, metavar=("PARSER", "PATH"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_measure(args.child[0], args.child[1], args.repeat)))
+        return 0
+
+    cases = [c for c in args.cases.split(",") if c]
+    parsers = [p for p in args.parsers.split(",") if p]
+    for name in cases:
+        if name not in CASES:
+            parser.error(f"unknown case: {name}")
+    for name in parsers:
+        if name not in PARSERS:
+            parser.error(f"unknown parser: {name}")
+
+    print(f"building corpus in {args.corpus_dir} ...", file=sys.stderr)
+    paths = build_corpus(args.corpus_dir, cases, args.scale)
+    results = {}
+    for case in cases:
+        for parser_name in parsers:
+            print(f"running {case} / {parser_name} ...", file=sys.stderr)
+            results[f"{case}/{parser_name}"] = _run_child(
+                parser_name, paths[case], args.repeat, args.timeout
+            )
+
+    report = {
+        "environment": _environment(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    _print_results(results)
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+                f.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("scale") != args.scale or baseline.get("environment", {}).get(
+        "corpus_version"
+    ) != CORPUS_VERSION:
+        print("baseline is from a different corpus; not comparing", file=sys.stderr)
+        return 1
+    print()
+    regressions = compare(results, baseline.get("results", {}), args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nno regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -90,8 +90,6 @@ def main() -> int:
     print("=" * 60, file=sys.stderr)
 
     if args.out:
-        import base64
-
         out_dir = os.path.dirname(os.path.abspath(args.out))
         os.makedirs(out_dir, exist_ok=True)
         with open(args.out, "w", encoding="utf-8") as f:
@@ -99,11 +97,7 @@ def main() -> int:
         if doc.images:
             img_root = os.path.join(out_dir, "images")
             os.makedirs(img_root, exist_ok=True)
-            for ref_path, b64data in doc.images.items():
-                try:
-                    raw = base64.b64decode(b64data)
-                except Exception:
-                    raw = b64data if isinstance(b64data, bytes) else b64data.encode()
+            for ref_path, raw in doc.images.items():
                 dest = os.path.join(out_dir, ref_path)
                 os.makedirs(os.path.dirname(dest), exist_ok=True)
                 with open(dest, "wb") as imgf:
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+
+from docreader.admission import AdmissionController, AdmissionRejected, estimate_cost
+from docreader.main import DocReaderServicer
+from docreader.proto import docreader_pb2_grpc
+from docreader.proto.docreader_pb2 import ReadRequest
+from docreader.tests.test_aio_server import _image_pdf
+
+
+class EstimateCostTest(unittest.TestCase):
+    def test_pdf_cost_is_page_count(self):
+        content = _image_pdf(3)
+        self.assertEqual(estimate_cost("pdf", len(content), content=content), 3)
+
+    def test_unreadable_pdf_falls_back_to_size(self):
+        self.assertEqual(estimate_cost("pdf", 640 * 1024, content=b"junk"), 10)
+
+    def test_other_types_scale_with_size(self):
+        self.assertEqual(estimate_cost("md", 10), 1)
+        self.assertEqual(estimate_cost("docx", 320 * 1024), 10)
+        self.assertEqual(estimate_cost("png", 50 * 1024 * 1024), 1)
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class AdmissionControllerTest(unittest.TestCase):
+    def _hold(self, controller, cost):
+        """Admit a job on a thread and keep it running until released."""
+        admitted, release = threading.Event(), threading.Event()
+
+        def run():
+            with controller.admit(cost):
+                admitted.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return admitted, release, thread
+
+    def test_small_jobs_are_not_blocked_by_large_ones(self):
+        controller = AdmissionController(max_running=2, reserved_small=1, small_cost=5)
+        admitted_a, release_a, thread_a = self._hold(controller, 100)
+        self.assertTrue(admitted_a.wait(1))
+        # Second large job must wait: the remaining slot is reserved.
+        admitted_b, release_b, thread_b = self._hold(controller, 100)
+        self.assertFalse(admitted_b.wait(0.2))
+
+        with controller.admit(1, timeout=1):
+            self.assertEqual(controller.stats()["running_small"], 1)
+
+        release_a.set()
+        self.assertTrue(admitted_b.wait(1))
+        release_b.set()
+        thread_a.join()
+        thread_b.join()
+        self.assertEqual(controller.stats()["backlog_cost"], 0)
+
+    def test_small_lane_is_served_first(self):
+        controller = AdmissionController(max_running=1, reserved_small=0, small_cost=5)
+        admitted, release, thread = self._hold(controller, 1)
+        self.assertTrue(admitted.wait(1))
+
+        order = []
+
+        def job(name, cost):
+            with controller.admit(cost, timeout=5):
+                order.append(name)
+
+        large = threading.Thread(target=job, args=("large", 50))
+        large.start()
+        _wait_until(lambda: controller.stats()["queued_large"] == 1)
+        small = threading.Thread(target=job, args=("small", 1))
+        small.start()
+        _wait_until(lambda: controller.stats()["queued_small"] == 1)
+
+        release.set()
+        for t in (thread, large, small):
+            t.join()
+        self.assertEqual(order, ["small", "large"])
+
+    def test_backlog_budget_rejects_with_retry_hint(self):
+        controller = AdmissionController(max_running=1, backlog_budget=10)
+        admitted, release, thread = self._hold(controller, 8)
+        self.assertTrue(admitted.wait(1))
+
+        with self.assertRaises(AdmissionRejected) as cm:
+            with controller.admit(5):
+                pass
+        self.assertGreaterEqual(cm.exception.retry_after, 1.0)
+        self.assertEqual(controller.stats()["rejected"], 1)
+
+        release.set()
+        thread.join()
+        # An idle server admits even an oversized job.
+        with controller.admit(50):
+            pass
+
+    def test_queue_deadline(self):
+        controller = AdmissionController(max_running=1, queue_timeout=0.1)
+        admitted, release, thread = self._hold(controller, 1)
+        self.assertTrue(admitted.wait(1))
+
+        with self.assertRaises(AdmissionRejected):
+            with controller.admit(1):
+                pass
+        stats = controller.stats()
+        self.assertEqual(stats["timed_out"], 1)
+        self.assertEqual(stats["queued_small"], 0)
+        self.assertEqual(stats["backlog_cost"], 1)
+
+        release.set()
+        thread.join()
+
+    def test_async_admission(self):
+        controller = AdmissionController(max_running=1)
+
+        async def run():
+            order = []
+
+            async def job(name):
+                async with controller.admit_async(1, timeout=5):
+                    order.append(name)
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(job("a"), job("b"), job("c"))
+            return order
+
+        self.assertEqual(asyncio.run(run()), ["a", "b", "c"])
+        self.assertEqual(controller.stats()["backlog_cost"], 0)
+
+
+class ServicerAdmissionTest(unittest.TestCase):
+    def test_rejection_is_resource_exhausted_with_retry_trailer(self):
+        controller = AdmissionController(max_running=1, backlog_budget=1)
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            servicer = DocReaderServicer(controller)
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        docreader_pb2_grpc.add_DocReaderServicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        try:
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = docreader_pb2_grpc.DocReaderStub(channel)
+                request = ReadRequest(file_content=b"# hi", file_name="a.md")
+                self.assertIn("hi", stub.Read(request).markdown_content)
+
+                with controller.admit(1):
+                    with self.assertRaises(grpc.RpcError) as cm:
+                        stub.Read(request)
+        finally:
+            server.stop(0)
+
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+        trailers = dict(cm.exception.trailing_metadata())
+        self.assertGreaterEqual(int(trailers["retry-after-ms"]), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
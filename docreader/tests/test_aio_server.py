@@ -0,0 +1,248 @@
+import asyncio
+import io
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import grpc
+from PIL import Image
+
+from docreader.main import AsyncDocReaderServicer
+from docreader.parse_pool import create_parse_pool
+from docreader.proto import docreader_pb2_grpc
+from docreader.proto.docreader_pb2 import (
+    ListEnginesRequest,
+    ReadBatchRequest,
+    ReadConfig,
+    ReadRequest,
+    ReadUploadRequest,
+)
+
+
+def _image_pdf(num_pages: int) -> bytes:
+    buf = io.BytesIO()
+    pages = [Image.new("RGB", (64, 64), "gray") for _ in range(num_pages)]
+    pages[0].save(buf, format="PDF", save_all=True, append_images=pages[1:])
+    return buf.getvalue()
+
+
+class AsyncServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = create_parse_pool(2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    async def _serve(self, interceptors=None):
+        server = grpc.aio.server(interceptors=interceptors or [])
+        # Keep results off the shared on-disk parse cache under /tmp.
+        with patch("docreader.main.get_parse_cache", return_value=None):
+            servicer = AsyncDocReaderServicer(self.pool)
+        docreader_pb2_grpc.add_DocReaderServicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        return server, port
+
+    def test_read_and_stream_run_in_process_pool(self):
+        async def run():
+            server, port = await self._serve()
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    req = ReadRequest(
+                        file_content="# Title\n\nhello aio".encode(),
+                        file_name="note.md",
+                        file_type="md",
+                    )
+                    resp = await stub.Read(req)
+                    frames = [f async for f in stub.ReadStream(req)]
+                    engines = await stub.ListEngines(ListEnginesRequest())
+                return resp, frames, engines
+            finally:
+                await server.stop(0)
+
+        resp, frames, engines = asyncio.run(run())
+        self.assertEqual(resp.error, "")
+        self.assertIn("hello aio", resp.markdown_content)
+        self.assertEqual(len(frames), 1)
+        self.assertIn("hello aio", frames[0].meta.markdown_content)
+        self.assertIn("builtin", [e.name for e in engines.engines])
+
+    def test_worker_stops_after_deadline(self):
+        from docreader.parse_pool import run_in_parse_pool
+        from docreader.utils.cancel import ParseCancelled
+
+        request = ReadRequest(file_content=_image_pdf(3), file_name="late.pdf")
+
+        async def run():
+            return await run_in_parse_pool(
+                self.pool, request, "late", deadline=time.time() - 1
+            )
+
+        with self.assertRaisesRegex(ParseCancelled, "deadline"):
+            asyncio.run(run())
+
+    def test_stream_manager_calls_stay_off_the_event_loop(self):
+        from docreader import parse_pool
+
+        manager = parse_pool._get_stream_manager()
+        calls = []
+
+        class RecordingManager:
+            def Queue(self, *args):
+                calls.append(("Queue", threading.get_ident()))
+                return manager.Queue(*args)
+
+            def Event(self):
+                calls.append(("Event", threading.get_ident()))
+                event = manager.Event()
+                original_set = event.set
+
+                def set_():
+                    calls.append(("set", threading.get_ident()))
+                    original_set()
+
+                event.set = set_
+                return event
+
+        request = ReadRequest(
+            # More pages than the part queue holds: the worker is still busy.
+            file_content=_image_pdf(8),
+            file_name="aio_close.pdf",
+            config=ReadConfig(incremental_stream=True),
+        )
+
+        async def run():
+            parts = parse_pool.iter_in_parse_pool(self.pool, request, "close")
+            await parts.__anext__()
+            await parts.aclose()
+            return threading.get_ident()
+
+        with patch.object(
+            parse_pool, "_get_stream_manager", return_value=RecordingManager()
+        ):
+            loop_thread = asyncio.run(run())
+
+        self.assertEqual([name for name, _ in calls], ["Queue", "Event", "set"])
+        self.assertNotIn(loop_thread, [thread for _, thread in calls])
+
+    def test_parse_errors_are_reported_in_response(self):
+        async def run():
+            server, port = await self._serve()
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    return await stub.Read(
+                        ReadRequest(file_content=b"x", file_name="a.unknown")
+                    )
+            finally:
+                await server.stop(0)
+
+        resp = asyncio.run(run())
+        self.assertIn("Unsupported file type", resp.error)
+
+    def test_incremental_read_stream_streams_pages_from_worker(self):
+        async def run():
+            server, port = await self._serve()
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    req = ReadRequest(
+                        file_content=_image_pdf(3),
+                        file_name="aio_incremental.pdf",
+                        config=ReadConfig(incremental_stream=True),
+                    )
+                    return [f async for f in stub.ReadStream(req)]
+            finally:
+                await server.stop(0)
+
+        frames = asyncio.run(run())
+        kinds = [f.WhichOneof("payload") for f in frames]
+        self.assertEqual(kinds, ["image", "fragment"] * 3 + ["done"])
+        self.assertEqual(
+            [f.fragment.page_index for f in frames if f.HasField("fragment")], [0, 1, 2]
+        )
+        done = frames[-1].done
+        self.assertEqual(done.error, "")
+        self.assertEqual(done.fragment_count, 3)
+        self.assertEqual(done.metadata["page_count"], "3")
+
+    def test_read_upload_parses_spooled_file_in_worker(self):
+        content = _image_pdf(2)
+
+        async def upload():
+            yield ReadUploadRequest(
+                header=ReadRequest(
+                    file_name="aio_upload.pdf",
+                    config=ReadConfig(incremental_stream=True),
+                )
+            )
+            for i in range(0, len(content), 512):
+                yield ReadUploadRequest(chunk=content[i : i + 512])
+
+        async def run():
+            server, port = await self._serve()
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    return [f async for f in stub.ReadUpload(upload())]
+            finally:
+                await server.stop(0)
+
+        frames = asyncio.run(run())
+        kinds = [f.WhichOneof("payload") for f in frames]
+        self.assertEqual(kinds, ["image", "fragment"] * 2 + ["done"])
+        self.assertEqual(frames[-1].done.error, "")
+
+    def test_read_batch_streams_each_result(self):
+        requests = [
+            ReadRequest(
+                file_content=f"batch {i}".encode(),
+                file_name=f"b{i}.md",
+                request_id=f"b-{i}",
+            )
+            for i in range(5)
+        ]
+
+        async def run():
+            server, port = await self._serve()
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    call = stub.ReadBatch(ReadBatchRequest(requests=requests))
+                    return [r async for r in call]
+            finally:
+                await server.stop(0)
+
+        results = asyncio.run(run())
+        self.assertEqual(sorted(r.index for r in results), list(range(5)))
+        for r in results:
+            self.assertEqual(r.request_id, f"b-{r.index}")
+            self.assertIn(f"batch {r.index}", r.response.markdown_content)
+
+    def test_async_auth_interceptor_rejects_missing_token(self):
+        from docreader.auth import AsyncAuthInterceptor
+
+        with patch.dict(os.environ, {"GRPC_AUTH_TOKEN": "0123456789abcdef"}):
+            interceptor = AsyncAuthInterceptor()
+
+        async def run():
+            server, port = await self._serve([interceptor])
+            try:
+                async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+                    stub = docreader_pb2_grpc.DocReaderStub(ch)
+                    with self.assertRaises(grpc.aio.AioRpcError) as ctx:
+                        await stub.ListEngines(ListEnginesRequest())
+                    return ctx.exception.code()
+            finally:
+                await server.stop(0)
+
+        self.assertEqual(asyncio.run(run()), grpc.StatusCode.UNAUTHENTICATED)
+
+
+if __name__ == "__main__":
+    unittest.main()
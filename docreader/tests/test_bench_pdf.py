@@ -0,0 +1,51 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from docreader.parser.pdf_parser import PDFParser
+from docreader.scripts import bench_pdf
+
+
+class BenchCorpusTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+
+    def test_corpus_pages_route_as_intended(self):
+        paths = bench_pdf.build_corpus(self.dir, list(bench_pdf.CASES), scale=0.1)
+        metadata = {}
+        content = {}
+        for case, path in paths.items():
+            with open(path, "rb") as f:
+                doc = PDFParser(file_name=os.path.basename(path)).parse_into_text(
+                    f.read()
+                )
+            metadata[case], content[case] = doc.metadata, doc.content
+
+        for case in ("native", "two_column", "charts", "cjk"):
+            self.assertEqual(metadata[case]["scanned_page_count"], 0, case)
+        self.assertEqual(metadata["scanned"]["text_page_count"], 0)
+        self.assertEqual(metadata["hybrid"]["scanned_page_count"], 1)
+        self.assertGreater(metadata["charts"]["vector_figure_count"], 0)
+        self.assertIn("第1章", content["cjk"])
+
+    def test_corpus_is_reproducible(self):
+        first = bench_pdf._build("hybrid", 3, bench_pdf.SEED)
+        self.assertEqual(first, bench_pdf._build("hybrid", 3, bench_pdf.SEED))
+        self.assertNotEqual(first, bench_pdf._build("hybrid", 3, bench_pdf.SEED + 1))
+
+    def test_compare_flags_regressions(self):
+        base = {"pages_per_sec": 10.0, "peak_rss_mb": 100.0, "image_bytes": 1000}
+        now = {"pages_per_sec": 8.0, "peak_rss_mb": 105.0, "image_bytes": 1000}
+        with contextlib.redirect_stdout(io.StringIO()):
+            regressions = bench_pdf.compare(
+                {"a/pdf": dict(now, pages=1)}, {"a/pdf": dict(base, pages=1)}, 0.15
+            )
+        self.assertEqual(regressions, ["a/pdf pages/s: 10.0 -> 8.0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from docreader.main import DocReaderServicer
+from docreader.parser.concurrency import parser_worker_limit
+from docreader.parser.pdf_parser import PDFParser
+from docreader.proto.docreader_pb2 import ReadRequest
+from docreader.tests.test_pdf_router import _make_hybrid_pdf
+from docreader.utils.cancel import (
+    CancelToken,
+    ParseCancelled,
+    cancel_scope,
+    check_cancelled,
+    token_from_context,
+)
+
+
+class _FakeContext:
+    def __init__(self, time_remaining=None):
+        self._time_remaining = time_remaining
+        self.callbacks = []
+
+    def time_remaining(self):
+        return self._time_remaining
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+        return True
+
+
+class CancelTokenTest(unittest.TestCase):
+    def test_check_is_noop_without_token(self):
+        check_cancelled()
+
+    def test_cancel_and_deadline(self):
+        token = CancelToken()
+        with cancel_scope(token):
+            check_cancelled()
+            token.cancel()
+            with self.assertRaises(ParseCancelled):
+                check_cancelled()
+        check_cancelled()
+
+        expired = CancelToken(deadline=time.time() - 1)
+        self.assertTrue(expired.cancelled)
+        with self.assertRaisesRegex(ParseCancelled, "deadline"):
+            expired.raise_if_cancelled()
+
+    def test_token_from_context(self):
+        context = _FakeContext(time_remaining=30)
+        token = token_from_context(context)
+        self.assertFalse(token.cancelled)
+        self.assertGreater(token.deadline, time.time() + 25)
+        # RPC termination cancels the token.
+        for callback in context.callbacks:
+            callback()
+        self.assertTrue(token.cancelled)
+
+
+class CancelledParseTest(unittest.TestCase):
+    def test_limiter_wait_gives_up(self):
+        token = CancelToken()
+        with parser_worker_limit("test_cancel_limiter", 1):
+            threading.Timer(0.1, token.cancel).start()
+            with cancel_scope(token), self.assertRaises(ParseCancelled):
+                with parser_worker_limit("test_cancel_limiter", 1):
+                    self.fail("slot must not be granted")
+        # The held slot was released normally.
+        with parser_worker_limit("test_cancel_limiter", 1):
+            pass
+
+    def test_pdf_routing_stops_between_pages(self):
+        from docreader.parser import pdf_parser
+
+        token = CancelToken()
+        calls = []
+        extract = pdf_parser._extract_page_text
+
+        def extract_and_cancel(page):
+            calls.append(page)
+            token.cancel()
+            return extract(page)
+
+        parser = PDFParser(file_name="hybrid.pdf", file_type="pdf")
+        with patch.object(
+            pdf_parser, "_extract_page_text", side_effect=extract_and_cancel
+        ), patch.object(pdf_parser, "PDFScannedParser") as scanned:
+            with cancel_scope(token), self.assertRaises(ParseCancelled):
+                parser.parse_into_text(_make_hybrid_pdf())
+
+        self.assertEqual(len(calls), 1)
+        # Cancellation is not a routing failure: no full-render fallback.
+        scanned.assert_not_called()
+
+    def test_docx_page_collection_stops(self):
+        from docreader.parser.docx_parser import Docx
+
+        token = CancelToken()
+        token.cancel()
+        pending = Future()
+        with cancel_scope(token), self.assertRaises(ParseCancelled):
+            Docx()._collect_process_results({pending: 0}, [(1,)], time.time())
+
+
+class ServicerCancelTest(unittest.TestCase):
+    def test_expired_deadline_stops_the_parse(self):
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            servicer = DocReaderServicer()
+        request = ReadRequest(file_content=_make_hybrid_pdf(), file_name="h.pdf")
+
+        response = servicer.Read(request, _FakeContext(time_remaining=0))
+
+        self.assertIn("deadline", response.error)
+        self.assertEqual(response.markdown_content, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
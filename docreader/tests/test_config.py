@@ -37,6 +37,8 @@ class DocReaderConfigTest(unittest.TestCase):
         self.assertIn("DOCREADER_PDF_RENDER_MAX_WORKERS", dumped)
         self.assertIn("DOCREADER_PDF_RENDER_DPI", dumped)
         self.assertIn("DOCREADER_PDF_JPEG_QUALITY", dumped)
+        self.assertIn("DOCREADER_CPU_TOKENS", dumped)
+        self.assertIn("DOCREADER_PDF_PAGE_CACHE_ENABLED", dumped)
 
 
 if __name__ == "__main__":
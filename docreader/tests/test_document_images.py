@@ -0,0 +1,45 @@
+import unittest
+
+from docreader.main import _iter_image_refs, _resolve_images
+from docreader.models.document import Document, DocumentPart, merge_document_parts
+
+
+class DocumentImagesTest(unittest.TestCase):
+    def test_raw_bytes_are_kept_as_is(self):
+        data = b"\xff\xd8" + b"x" * 1024
+        doc = Document(content="c", images={"images/a.jpg": data})
+        self.assertIs(doc.images["images/a.jpg"], data)
+
+    def test_legacy_base64_strings_are_decoded(self):
+        doc = Document(content="c", images={"images/a.png": "QUJD"})
+        part = DocumentPart(images={"images/b.png": "REVG"})
+
+        self.assertEqual(doc.images, {"images/a.png": b"ABC"})
+        self.assertEqual(part.images, {"images/b.png": b"DEF"})
+        self.assertEqual(doc.images_base64(), {"images/a.png": "QUJD"})
+
+    def test_merge_keeps_bytes(self):
+        doc = merge_document_parts(
+            [DocumentPart(content="a", images={"images/a.jpg": b"A"})]
+        )
+        self.assertEqual(doc.images, {"images/a.jpg": b"A"})
+
+
+class ImageRefTest(unittest.TestCase):
+    def test_refs_carry_raw_bytes(self):
+        _, refs = _resolve_images({"images/p1.jpg": b"\xff\xd8jpeg"}, "rid")
+
+        self.assertEqual(refs[0].image_data, b"\xff\xd8jpeg")
+        self.assertEqual(refs[0].mime_type, "image/jpeg")
+        self.assertEqual(refs[0].filename, "p1.jpg")
+
+    def test_stream_refs_accept_legacy_strings(self):
+        images = {"images/a.png": "QUJD", "images/b.png": b"raw"}
+        refs = list(_iter_image_refs(images))
+
+        self.assertEqual([r.image_data for r in refs], [b"ABC", b"raw"])
+        self.assertEqual(images, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
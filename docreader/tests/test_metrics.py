@@ -0,0 +1,111 @@
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+from docreader import metrics
+from docreader.metrics import Counter, Histogram, Registry
+
+
+class RegistryTest(unittest.TestCase):
+    def test_counter_render(self):
+        registry = Registry()
+        counter = registry.register(Counter("x_total", "Things.", ("kind",)))
+        counter.inc(2, kind="a")
+        counter.inc(kind='q"b')
+
+        text = registry.render()
+        self.assertIn("# TYPE x_total counter", text)
+        self.assertIn('x_total{kind="a"} 2', text)
+        self.assertIn('x_total{kind="q\\"b"} 1', text)
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = Registry()
+        hist = registry.register(Histogram("h_seconds", "H.", buckets=(1, 5)))
+        for value in (0.5, 1, 3, 10):
+            hist.observe(value)
+
+        text = registry.render()
+        self.assertIn('h_seconds_bucket{le="1"} 2', text)
+        self.assertIn('h_seconds_bucket{le="5"} 3', text)
+        self.assertIn('h_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn("h_seconds_sum 14.5", text)
+        self.assertIn("h_seconds_count 4", text)
+
+    def test_labels_are_checked(self):
+        counter = Counter("c_total", "C.", ("kind",))
+        with self.assertRaises(ValueError):
+            counter.inc(engine="x")
+
+    def test_delta_export_and_merge(self):
+        worker, server = Registry(), Registry()
+        for registry in (worker, server):
+            registry.register(Counter("c_total", "C.", ("kind",)))
+            registry.register(Histogram("h_seconds", "H.", buckets=(1,)))
+        worker._metrics["c_total"].inc(3, kind="a")
+        worker._metrics["h_seconds"].observe(0.5)
+
+        server.merge_delta(worker.export_delta())
+        server.merge_delta(worker.export_delta())  # already exported: no-op
+
+        self.assertEqual(server._metrics["c_total"].value(kind="a"), 3)
+        self.assertEqual(server._metrics["h_seconds"].count(), 1)
+        self.assertEqual(worker._metrics["c_total"].value(kind="a"), 0)
+
+
+class MetricsServerTest(unittest.TestCase):
+    def test_metrics_endpoint(self):
+        server = metrics.start_metrics_server(0, host="127.0.0.1")
+        port = server.server_address[1]
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+                self.assertIn("text/plain", resp.headers["Content-Type"])
+                body = resp.read().decode()
+            self.assertIn("# TYPE docreader_parse_duration_seconds histogram", body)
+
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/other")
+            self.assertEqual(cm.exception.code, 404)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class ParseMetricsTest(unittest.TestCase):
+    def test_parse_file_records_series(self):
+        from docreader.parser import Parser
+
+        labels = {"engine": "builtin", "file_type": "md"}
+        before_count = metrics.PARSE_DURATION.count(**labels)
+        before_in = metrics.BYTES_IN.value(file_type="md")
+        before_out = metrics.BYTES_OUT.value(file_type="md", kind="markdown")
+
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            parser = Parser()
+        parser.parse_file("a.md", "md", b"# Title\n\nbody")
+
+        self.assertEqual(metrics.PARSE_DURATION.count(**labels), before_count + 1)
+        self.assertEqual(metrics.BYTES_IN.value(file_type="md"), before_in + 13)
+        self.assertGreater(
+            metrics.BYTES_OUT.value(file_type="md", kind="markdown"), before_out
+        )
+
+    def test_parse_errors_are_counted(self):
+        from docreader.parser import Parser
+
+        labels = {"engine": "builtin", "file_type": "md"}
+        before = metrics.PARSE_ERRORS.value(**labels)
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            parser = Parser()
+        with patch(
+            "docreader.parser.markdown_parser.MarkdownParser.parse",
+            side_effect=RuntimeError("boom"),
+        ):
+            with self.assertRaises(RuntimeError):
+                parser.parse_file("a.md", "md", b"# Title")
+
+        self.assertEqual(metrics.PARSE_ERRORS.value(**labels), before + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from docreader.page_cache import PageCache
+from docreader.parser import pdf_parser
+from docreader.tests.test_pdf_router import _make_hybrid_pdf, _make_text_pdf
+
+
+class PageCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_round_trip(self):
+        cache = PageCache(self.tmp.name, 1 << 20)
+        self.assertIsNone(cache.get("ab12"))
+        cache.put("ab12", {"text": "hello", "jpeg": b"x"})
+
+        self.assertEqual(cache.get("ab12"), {"text": "hello", "jpeg": b"x"})
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_disk_budget_evicts_least_recently_used(self):
+        cache = PageCache(self.tmp.name, 2500)
+        for key in ("aa", "bb"):
+            cache.put(key, {"jpeg": b"x" * 1000})
+            time.sleep(0.01)
+        # Reading refreshes the entry, so "bb" is now the oldest.
+        cache.get("aa")
+        time.sleep(0.01)
+        cache.put("cc", {"jpeg": b"x" * 1000})
+
+        self.assertIsNotNone(cache.get("aa"))
+        self.assertIsNone(cache.get("bb"))
+        self.assertIsNotNone(cache.get("cc"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_unreadable_entry_is_a_miss(self):
+        cache = PageCache(self.tmp.name, 1 << 20)
+        cache.put("ab12", {"text": "hello"})
+        with open(cache._path("ab12"), "wb") as f:
+            f.write(b"garbage")
+
+        self.assertIsNone(cache.get("ab12"))
+        self.assertFalse(os.path.exists(cache._path("ab12")))
+
+
+class PdfPageCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = PageCache(tmp.name, 1 << 26)
+        patcher = patch.object(pdf_parser, "get_page_cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _parse(self, content, file_name="h.pdf"):
+        doc = pdf_parser.PDFParser(
+            file_name=file_name, file_type="pdf"
+        ).parse_into_text(content)
+        doc.metadata.pop("stage_timings_ms")
+        return doc
+
+    def test_unchanged_document_is_served_from_the_cache(self):
+        content = _make_hybrid_pdf()
+        first = self._parse(content)
+        with patch.object(
+            pdf_parser, "_render_page_to_jpeg", side_effect=AssertionError
+        ), patch.object(
+            pdf_parser, "_iter_page_analysis", wraps=pdf_parser._iter_page_analysis
+        ) as analysis:
+            second = self._parse(content)
+
+        self.assertEqual(analysis.call_args.args[1], [])
+        self.assertEqual(first.metadata.pop("page_cache_hits"), 0)
+        self.assertEqual(second.metadata.pop("page_cache_hits"), 3)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.images, first.images)
+        self.assertEqual(second.metadata, first.metadata)
+
+    def test_only_changed_pages_are_worked(self):
+        pages = [[f"Line {n} of page {p}." for n in range(3)] for p in range(4)]
+        self._parse(_make_text_pdf(pages))
+
+        pages[2] = ["This page was revised."]
+        with patch.object(
+            pdf_parser, "_iter_page_analysis", wraps=pdf_parser._iter_page_analysis
+        ) as analysis:
+            doc = self._parse(_make_text_pdf(pages), file_name="v2.pdf")
+
+        self.assertEqual(analysis.call_args.args[1], [2])
+        self.assertEqual(doc.metadata["page_cache_hits"], 3)
+        self.assertIn("This page was revised.", doc.content)
+        self.assertIn("Line 0 of page 3.", doc.content)
+
+    def test_figure_refs_follow_the_file_name_and_page(self):
+        ref = "images/a_p2_fig1.jpg"
+        entry = pdf_parser._page_cache_entry(
+            f"![a_p2_fig1.jpg]({ref})", "text", [(ref, b"j", 1.0, "")], None, "a_p2_fig"
+        )
+        text, cls, clips, jpeg = pdf_parser._from_page_cache_entry(entry, "b_p5_fig")
+
+        self.assertEqual(text, "![b_p5_fig1.jpg](images/b_p5_fig1.jpg)")
+        self.assertEqual(clips, [("images/b_p5_fig1.jpg", b"j", 1.0, "")])
+        self.assertEqual((cls, jpeg), ("text", None))
+
+    def test_settings_are_part_of_the_key(self):
+        content = _make_hybrid_pdf()
+        keys = pdf_parser._page_cache_keys(content, [0, 1, 2])
+        self.assertEqual(len(set(keys.values())), 3)
+        with patch.object(pdf_parser, "LAYOUT_ORDERING", False):
+            changed = pdf_parser._page_cache_keys(content, [0, 1, 2])
+        self.assertFalse(set(keys.values()) & set(changed.values()))
+
+    def test_scheduling_settings_are_not_part_of_the_key(self):
+        content = _make_hybrid_pdf()
+        keys = pdf_parser._page_cache_keys(content, [0, 1, 2])
+        with patch.object(pdf_parser, "PAGE_TIMEOUT_SECONDS", 5.0), patch.object(
+            pdf_parser, "RENDER_AHEAD_PAGES", 1
+        ), patch.object(pdf_parser, "PARALLEL_ANALYSIS_MIN_PAGES", 0), patch.object(
+            pdf_parser, "SCANNED_SAMPLE_MIN_PAGES", 0
+        ):
+            self.assertEqual(pdf_parser._page_cache_keys(content, [0, 1, 2]), keys)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import io
+import unittest
+from unittest.mock import patch
+
+from docreader.main import DocReaderServicer
+from docreader.models.read_config import PageSelection
+from docreader.parse_cache import parse_cache_key
+from docreader.parser.pdf_parser import PDFParser, PDFScannedParser
+from docreader.proto.docreader_pb2 import ReadConfig, ReadRequest
+from docreader.tests.test_pdf_router import _make_hybrid_pdf, _make_image_only_pdf
+
+
+def _make_docx(pages) -> bytes:
+    """DOCX with one paragraph per entry of ``pages``, separated by page breaks."""
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+
+    doc = Document()
+    for i, text in enumerate(pages):
+        paragraph = doc.add_paragraph(text)
+        if i < len(pages) - 1:
+            paragraph.add_run().add_break(WD_BREAK.PAGE)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+class PageSelectionTest(unittest.TestCase):
+    def test_range_indices(self):
+        self.assertEqual(PageSelection(2, 4).indices(10), [1, 2, 3])
+        self.assertEqual(PageSelection(8).indices(10), [7, 8, 9])
+        # A range running past the end is clamped (last shard of a split).
+        self.assertEqual(PageSelection(9, 20).indices(10), [8, 9])
+
+    def test_pages_take_precedence(self):
+        selection = PageSelection(1, 2, pages=(5, 3, 3, 40))
+        self.assertEqual(selection.indices(10), [2, 4])
+        self.assertEqual(selection.describe(), "3,5,40")
+
+    def test_invalid_and_empty_selections(self):
+        with self.assertRaises(ValueError):
+            PageSelection(5, 2)
+        with self.assertRaises(ValueError):
+            PageSelection(pages=(0,))
+        with self.assertRaises(ValueError):
+            PageSelection(20).indices(10)
+
+    def test_from_config(self):
+        self.assertIsNone(PageSelection.from_config(ReadConfig()))
+        self.assertIsNone(PageSelection.from_config(ReadConfig(from_page=1)))
+        selection = PageSelection.from_config(ReadConfig(from_page=3, to_page=4))
+        self.assertEqual(selection.describe(), "3-4")
+
+    def test_cache_key_depends_on_selection(self):
+        whole = parse_cache_key("a.pdf", "pdf", b"x")
+        self.assertEqual(
+            whole, parse_cache_key("a.pdf", "pdf", b"x", None, None, None)
+        )
+        self.assertNotEqual(
+            whole, parse_cache_key("a.pdf", "pdf", b"x", None, None, PageSelection(2))
+        )
+
+
+class PdfPageSelectionTest(unittest.TestCase):
+    def test_pdf_parser_emits_selected_pages_only(self):
+        parser = PDFParser(
+            file_name="h.pdf", file_type="pdf", page_selection=PageSelection(2, 3)
+        )
+        parts = list(parser.iter_parse_into_text(_make_hybrid_pdf()))
+
+        self.assertEqual([p.page_index for p in parts[:-1]], [1, 2])
+        self.assertEqual(list(parts[0].images), ["images/h_page_2.jpg"])
+        metadata = parts[-1].metadata
+        self.assertEqual(metadata["page_count"], 3)
+        self.assertEqual(metadata["selected_pages"], "2-3")
+        self.assertEqual(metadata["scanned_page_count"], 1)
+        self.assertEqual(metadata["text_page_count"], 1)
+
+    def test_scanned_parser_renders_selected_pages_only(self):
+        parser = PDFScannedParser(
+            file_name="s.pdf",
+            file_type="pdf",
+            page_selection=PageSelection(pages=(4, 2)),
+        )
+        doc = parser.parse_into_text(_make_image_only_pdf(5))
+
+        self.assertEqual(
+            sorted(doc.images), ["images/s_page_2.jpg", "images/s_page_4.jpg"]
+        )
+        self.assertEqual(doc.metadata["page_count"], 5)
+        self.assertEqual(doc.metadata["selected_pages"], "2,4")
+
+    def test_page_count(self):
+        parser = PDFParser(file_name="s.pdf", file_type="pdf")
+        self.assertEqual(parser.page_count(_make_image_only_pdf(3)), 3)
+
+
+class DocxPageSelectionTest(unittest.TestCase):
+    def test_docx_parser_honours_selection(self):
+        from docreader.parser.docx_parser import DocxParser
+
+        content = _make_docx(["first page", "second page", "third page"])
+        self.assertEqual(DocxParser(file_name="a.docx").page_count(content), 3)
+
+        parser = DocxParser(
+            file_name="a.docx", page_selection=PageSelection(pages=(2,))
+        )
+        doc = parser.parse_into_text(content)
+
+        self.assertIn("second page", doc.content)
+        self.assertNotIn("first page", doc.content)
+        self.assertNotIn("third page", doc.content)
+        self.assertEqual(doc.metadata["selected_pages"], "2")
+
+
+class InspectTest(unittest.TestCase):
+    def setUp(self):
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            self.servicer = DocReaderServicer()
+
+    def test_pdf_page_count(self):
+        response = self.servicer.Inspect(
+            ReadRequest(file_name="s.pdf", file_content=_make_image_only_pdf(4)), None
+        )
+        self.assertEqual(response.error, "")
+        self.assertEqual(response.page_count, 4)
+        self.assertTrue(response.supports_page_selection)
+
+    def test_unpaged_and_invalid_requests(self):
+        response = self.servicer.Inspect(
+            ReadRequest(file_name="a.md", file_content=b"# hi"), None
+        )
+        self.assertEqual(response.page_count, 0)
+        self.assertFalse(response.supports_page_selection)
+
+        response = self.servicer.Inspect(ReadRequest(url="http://example.com"), None)
+        self.assertTrue(response.error)
+
+    def test_read_rejects_selection_for_unpaged_parser(self):
+        response = self.servicer.Read(
+            ReadRequest(
+                file_name="a.md",
+                file_content=b"# hi",
+                config=ReadConfig(from_page=2),
+            ),
+            None,
+        )
+        self.assertIn("does not support page selection", response.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
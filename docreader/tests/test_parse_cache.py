@@ -0,0 +1,211 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from docreader.models.document import Document
+from docreader.parse_cache import DiskCache, ParseCache, parse_cache_key
+
+
+def _doc(text: str, **images) -> Document:
+    return Document(content=text, images=images, metadata={"n": 1})
+
+
+class ParseCacheKeyTest(unittest.TestCase):
+    def test_key_depends_on_content_engine_and_overrides(self):
+        base = parse_cache_key("a.pdf", "pdf", b"data", "builtin", {})
+
+        self.assertEqual(base, parse_cache_key("a.pdf", "pdf", b"data", "builtin", {}))
+        self.assertNotEqual(base, parse_cache_key("a.pdf", "pdf", b"datb", "builtin", {}))
+        self.assertNotEqual(base, parse_cache_key("a.pdf", "pdf", b"data", "markitdown"))
+        self.assertNotEqual(
+            base, parse_cache_key("a.pdf", "pdf", b"data", "builtin", {"x": "1"})
+        )
+        # Page image refs are derived from the file name.
+        self.assertNotEqual(base, parse_cache_key("b.pdf", "pdf", b"data", "builtin"))
+
+    def test_key_depends_on_render_config(self):
+        from docreader import config
+
+        base = parse_cache_key("a.pdf", "pdf", b"data")
+        with patch.dict(os.environ, {"DOCREADER_PDF_RENDER_DPI": "96"}):
+            cfg = config.load_config()
+        with patch("docreader.parse_cache.CONFIG", cfg):
+            self.assertNotEqual(base, parse_cache_key("a.pdf", "pdf", b"data"))
+
+        for env in (
+            {"DOCREADER_PDF_DIRECT_PAGE_IMAGES": "false"},
+            {"DOCREADER_PDF_ADAPTIVE_RENDER": "true"},
+            {"DOCREADER_PDF_ADAPTIVE_MIN_DPI": "120"},
+        ):
+            with patch.dict(os.environ, env):
+                cfg = config.load_config()
+            with patch("docreader.parse_cache.CONFIG", cfg):
+                self.assertNotEqual(base, parse_cache_key("a.pdf", "pdf", b"data"))
+
+
+class ParseCacheTest(unittest.TestCase):
+    def test_memory_lru_evicts_least_recently_used(self):
+        cache = ParseCache(memory_max_bytes=30)
+        cache.put("a", _doc("a" * 10))
+        cache.put("b", _doc("b" * 10))
+        self.assertIsNotNone(cache.get("a"))
+        cache.put("c", _doc("c" * 15))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").content, "a" * 10)
+        self.assertEqual(cache.get("c").content, "c" * 15)
+        stats = cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["memory_hits"], 3)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_hits_are_copies(self):
+        cache = ParseCache(memory_max_bytes=1 << 20)
+        cache.put("k", _doc("text", **{"images/p1.jpg": b"\xff\xd8"}))
+
+        first = cache.get("k")
+        first.images.pop("images/p1.jpg")
+        first.metadata["n"] = 2
+
+        second = cache.get("k")
+        self.assertEqual(second.images, {"images/p1.jpg": b"\xff\xd8"})
+        self.assertEqual(second.metadata, {"n": 1})
+
+    def test_empty_results_are_not_cached(self):
+        cache = ParseCache(memory_max_bytes=1 << 20)
+        cache.put("k", Document(content=""))
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(cache.stats()["stores"], 0)
+
+    def test_degraded_results_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParseCache(1 << 20, disk_dir=tmp, disk_max_bytes=1 << 20)
+            for key in ("low_dpi_pages", "skipped_pages", "partial_image_pages"):
+                cache.put(key, Document(content="text", metadata={key: "2"}))
+                self.assertIsNone(cache.get(key))
+            self.assertEqual(os.listdir(tmp), [])
+            self.assertEqual(cache.stats()["stores"], 0)
+
+    def test_disk_tier_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = ParseCache(0, disk_dir=tmp, disk_max_bytes=1 << 20)
+            writer.put("k", _doc("from disk", **{"images/x.png": b"ABC"}))
+
+            reader = ParseCache(1 << 20, disk_dir=tmp, disk_max_bytes=1 << 20)
+            doc = reader.get("k")
+            self.assertEqual(doc.content, "from disk")
+            self.assertEqual(doc.images, {"images/x.png": b"ABC"})
+            self.assertEqual(reader.stats()["disk_hits"], 1)
+
+            # Promoted into the memory tier.
+            reader.get("k")
+            self.assertEqual(reader.stats()["memory_hits"], 1)
+
+    def test_disk_tier_evicts_oldest_entries_over_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParseCache(0, disk_dir=tmp, disk_max_bytes=1 << 20)
+            cache.put("a", _doc("x" * 100))
+            os.utime(os.path.join(tmp, "a.pkl"), (1, 1))
+            # Both pickles have the same size: b alone fits the eviction target.
+            cache.disk.max_bytes = 2 * os.path.getsize(os.path.join(tmp, "a.pkl")) - 1
+            cache.put("b", _doc("y" * 100))
+
+            self.assertEqual(sorted(os.listdir(tmp)), ["b.pkl"])
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b").content, "y" * 100)
+
+    def test_disk_tier_evicts_below_budget(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ParseCache(0, disk_dir=tmp, disk_max_bytes=1 << 20)
+            for i, key in enumerate("abc"):
+                cache.put(key, _doc(key * 100))
+                os.utime(os.path.join(tmp, f"{key}.pkl"), (i + 1, i + 1))
+            size = os.path.getsize(os.path.join(tmp, "a.pkl"))
+            cache.disk.max_bytes = 3 * size
+            cache.put("d", _doc("d" * 100))
+
+            # Over budget by one entry, but evicts down to 90% of it.
+            self.assertEqual(sorted(os.listdir(tmp)), ["c.pkl", "d.pkl"])
+
+    def test_corrupt_disk_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "k.pkl"), "wb") as f:
+                f.write(b"not a pickle")
+            cache = ParseCache(0, disk_dir=tmp, disk_max_bytes=1 << 20)
+
+            self.assertIsNone(cache.get("k"))
+            self.assertFalse(os.path.exists(os.path.join(tmp, "k.pkl")))
+
+
+class DiskCacheTest(unittest.TestCase):
+    def test_shared_writable_dir_is_refused(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chmod(tmp, 0o777)
+            planted = os.path.join(tmp, "k.pkl")
+            with open(planted, "wb") as f:
+                f.write(b"planted")
+            cache = DiskCache(tmp, 1 << 20)
+
+            with self.assertLogs("docreader.parse_cache", level="WARNING"):
+                self.assertIsNone(cache.get("k"))
+            cache.put("other", {"x": 1})
+            self.assertEqual(os.listdir(tmp), ["k.pkl"])
+
+    def test_private_dir_is_created_and_tightened(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            created = os.path.join(tmp, "new")
+            DiskCache(created, 1 << 20).put("k", {"x": 1})
+            self.assertEqual(os.stat(created).st_mode & 0o777, 0o700)
+
+            os.chmod(tmp, 0o755)
+            cache = DiskCache(tmp, 1 << 20)
+            cache.put("k", {"x": 1})
+            self.assertEqual(cache.get("k"), {"x": 1})
+            self.assertEqual(os.stat(tmp).st_mode & 0o777, 0o700)
+
+
+class ParserCacheIntegrationTest(unittest.TestCase):
+    def test_parse_file_serves_repeat_uploads_from_cache(self):
+        from docreader.parser import Parser
+
+        cache = ParseCache(memory_max_bytes=1 << 20)
+        with patch("docreader.parser.parser.get_parse_cache", return_value=cache):
+            parser = Parser()
+
+        content = b"# Title\n\nhello cache"
+        first = parser.parse_file("a.md", "md", content)
+        with patch.object(parser.registry, "get_parser_class") as get_cls:
+            second = parser.parse_file("a.md", "md", content)
+            get_cls.assert_not_called()
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+        Parser(use_cache=False).parse_file("a.md", "md", content)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_parse_file_does_not_cache_degraded_results(self):
+        from docreader.parser import Parser
+
+        cache = ParseCache(memory_max_bytes=1 << 20)
+        with patch("docreader.parser.parser.get_parse_cache", return_value=cache):
+            parser = Parser()
+        degraded = Document(content="page 1", metadata={"skipped_pages": "2"})
+
+        with patch.object(Parser, "_create_parser") as create:
+            create.return_value.parse.return_value = degraded
+            create.side_effect = lambda cls, name, ftype, content, *a: (
+                create.return_value,
+                content,
+            )
+            parser.parse_file("a.pdf", "pdf", b"%PDF-1.4")
+            parser.parse_file("a.pdf", "pdf", b"%PDF-1.4")
+
+        self.assertEqual(create.call_count, 2)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,21 @@
-import base64
 import io
 import threading
 import time
 import unittest
 import uuid
+from unittest.mock import patch
 
 from PIL import Image
 
-from docreader.parser.concurrency import parser_worker_limit
+from docreader.parser import concurrency
+from docreader.parser.concurrency import (
+    CpuBudget,
+    cpu_lease,
+    parser_worker_limit,
+    select_mp_context,
+)
 from docreader.parser.pdf_parser import PDFScannedParser, _normalize_image_quality
+from docreader.utils.cancel import CancelToken, ParseCancelled, cancel_scope
 
 
 class ParserConcurrencyTest(unittest.TestCase):
@@ -64,8 +71,7 @@ class ParserConcurrencyTest(unittest.TestCase):
         self.assertEqual(document.metadata["page_count"], 2)
         self.assertEqual(len(document.images), 2)
         self.assertIn("images/scan_page_2.jpg", document.images)
-        image_bytes = base64.b64decode(document.images[image_ref])
-        self.assertTrue(image_bytes.startswith(b"\xff\xd8"))
+        self.assertTrue(document.images[image_ref].startswith(b"\xff\xd8"))
 
     def test_scanned_pdf_parser_logs_malformed_pdf_without_format_error(self):
         parser = PDFScannedParser(file_name="broken.pdf")
@@ -84,5 +90,85 @@ class ParserConcurrencyTest(unittest.TestCase):
         self.assertEqual(_normalize_image_quality(120), 95)
 
 
+def _hold_tokens(budget, n, held, release):
+    budget.acquire(n, "test")
+    held.set()
+    release.wait(5)
+    budget.release(n)
+
+
+class CpuBudgetTest(unittest.TestCase):
+    def setUp(self):
+        self.budget = CpuBudget(4)
+        patcher = patch.object(concurrency, "get_cpu_budget", return_value=self.budget)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lease_takes_what_is_free(self):
+        with cpu_lease("a", 3) as first:
+            self.assertEqual(first.held, 3)
+            self.assertEqual(self.budget.free, 1)
+        self.assertEqual(self.budget.free, 4)
+
+    def test_nested_lease_does_not_block(self):
+        with cpu_lease("outer", 4):
+            with cpu_lease("inner", 2) as inner:
+                self.assertEqual(inner.held, 0)
+            # Once the outer lease is gone the inner one may grow.
+        with cpu_lease("outer", 4) as outer:
+            with cpu_lease("inner", 2) as inner:
+                outer.release()
+                self.assertEqual(inner.rebalance(), 2)
+
+    def test_lease_shrinks_while_others_wait_and_grows_back(self):
+        with cpu_lease("busy", 4) as lease:
+            waiter = threading.Thread(
+                target=lambda: self.budget.acquire(2, "waiter"), daemon=True
+            )
+            waiter.start()
+            while not self.budget.contended:
+                time.sleep(0.01)
+            self.assertEqual(lease.rebalance(), 1)
+            waiter.join(2)
+            self.assertFalse(waiter.is_alive())
+
+            self.assertEqual(lease.rebalance(), 2)
+            self.budget.release(2)
+            self.assertEqual(lease.rebalance(), 4)
+
+    def test_cancelled_request_stops_waiting(self):
+        token = CancelToken()
+        token.cancel()
+        with cpu_lease("a", 4):
+            outside = threading.Thread(target=self._lease_cancelled, args=(token,))
+            outside.start()
+            outside.join(5)
+        self.assertEqual(self.cancelled, True)
+        self.assertEqual(self.budget.free, 4)
+
+    def _lease_cancelled(self, token):
+        try:
+            with cancel_scope(token), cpu_lease("b", 1):
+                self.cancelled = False
+        except ParseCancelled:
+            self.cancelled = True
+
+    def test_budget_is_shared_with_child_processes(self):
+        ctx = select_mp_context()
+        if ctx is None:
+            self.skipTest("multiprocessing unavailable")
+        budget = CpuBudget(3, ctx)
+        held, release = ctx.Event(), ctx.Event()
+        child = ctx.Process(target=_hold_tokens, args=(budget, 2, held, release))
+        child.start()
+        try:
+            self.assertTrue(held.wait(10))
+            self.assertEqual(budget.free, 1)
+        finally:
+            release.set()
+            child.join(10)
+        self.assertEqual(budget.free, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
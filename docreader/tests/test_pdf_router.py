@@ -1,20 +1,34 @@
+import ctypes
+import dataclasses
 import io
+import statistics
 import unittest
+from unittest.mock import patch
 
+import numpy as np
 from PIL import Image
 
+from docreader.models.document import merge_document_parts
 from docreader.parser.pdf_parser import (
     PDFParser,
     _classify_page,
     _filter_reading_columns,
+    _glyph_array,
+    _glyph_chars,
+    _group_medians,
+    _page_glyph_boxes,
+    _render_page_to_jpeg,
     _group_lines,
+    _sample_indices,
     _is_artifact_column,
+    _jpeg_frame_size,
     _join_line_glyphs,
     _merge_orphan_punctuation_lines,
     _point_in_boxes,
     _segments_to_markdown,
     _select_embedded_images,
     _should_prefer_plain,
+    _sole_page_image,
     _split_columns,
     _strip_repeating_lines,
 )
@@ -36,6 +50,81 @@ def _make_image_only_pdf(num_pages: int = 2) -> bytes:
     return buf.getvalue()
 
 
+def _make_text_pdf(pages) -> bytes:
+    """Build a native-text PDF; ``pages`` is a list of per-page line lists."""
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_r
+
+    pdf = pdfium.PdfDocument.new()
+    for lines in pages:
+        page = pdf.new_page(612, 792)
+        y = 740
+        for line in lines:
+            obj = pdfium_r.FPDFPageObj_NewTextObj(
+                pdf.raw, b"Helvetica", ctypes.c_float(12)
+            )
+            data = (line + "\0").encode("utf-16-le")
+            text = (ctypes.c_ushort * (len(data) // 2)).from_buffer_copy(data)
+            pdfium_r.FPDFText_SetText(obj, text)
+            pdfium_r.FPDFPageObj_Transform(obj, 1, 0, 0, 1, 72, y)
+            pdfium_r.FPDFPage_InsertObject(page.raw, obj)
+            y -= 16
+        pdfium_r.FPDFPage_GenerateContent(page.raw)
+        page.close()
+    buf = io.BytesIO()
+    pdf.save(buf)
+    pdf.close()
+    return buf.getvalue()
+
+
+def _make_hybrid_pdf() -> bytes:
+    """Three pages: native text, scanned (full-page image), native text."""
+    import pypdfium2 as pdfium
+
+    text = pdfium.PdfDocument(
+        _make_text_pdf(
+            [
+                ["Native page one with a proper text layer."],
+                ["Native page three closes the document."],
+            ]
+        )
+    )
+    scanned = pdfium.PdfDocument(_make_image_only_pdf(1))
+    out = pdfium.PdfDocument.new()
+    out.import_pages(text, [0])
+    out.import_pages(scanned, [0])
+    out.import_pages(text, [1])
+    buf = io.BytesIO()
+    out.save(buf)
+    for doc in (out, text, scanned):
+        doc.close()
+    return buf.getvalue()
+
+
+def _jpeg(size, mode="RGB") -> bytes:
+    buf = io.BytesIO()
+    Image.new(mode, size, "navy" if mode == "RGB" else 40).save(buf, format="JPEG")
+    return buf.getvalue()
+
+
+def _make_text_pdf_with_jpeg(jpeg: bytes) -> bytes:
+    """One native text page with ``jpeg`` embedded as a DCT image below the text."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(_make_text_pdf([["A native page with a figure."]]))
+    page = pdf[0]
+    image = pdfium.PdfImage.new(pdf)
+    image.load_jpeg(io.BytesIO(jpeg), pages=[page])
+    image.set_matrix(pdfium.PdfMatrix().scale(300, 200).translate(72, 300))
+    page.insert_obj(image)
+    page.gen_content()
+    page.close()
+    buf = io.BytesIO()
+    pdf.save(buf)
+    pdf.close()
+    return buf.getvalue()
+
+
 class ClassifyPageTest(unittest.TestCase):
     def test_full_page_image_is_scanned_even_with_text(self):
         # Scanned newspaper: image covers the page, embedded OCR text exists.
@@ -111,18 +200,18 @@ class ReadingOrderTest(unittest.TestCase):
     def test_single_column_stays_single(self):
         # One column of glyphs at x~100, no full-height gutter.
         chars = [_char("a", 100, 110, 700 - i * 12, 712 - i * 12) for i in range(5)]
-        cols = _split_columns(chars, scale=12.0, width=600.0)
+        cols = _split_columns(_glyph_array(chars), scale=12.0, width=600.0)
         self.assertEqual(len(cols), 1)
 
     def test_two_columns_split_left_to_right(self):
         # Left column x~50-150, right column x~400-500, wide empty gutter between.
         left = [_char("L", 50, 150, 700 - i * 12, 712 - i * 12) for i in range(4)]
         right = [_char("R", 400, 500, 700 - i * 12, 712 - i * 12) for i in range(4)]
-        cols = _split_columns(left + right, scale=12.0, width=600.0)
+        cols = _split_columns(_glyph_array(left + right), scale=12.0, width=600.0)
         self.assertEqual(len(cols), 2)
         # Reading order: left column before right column.
-        self.assertEqual(cols[0][0]["ch"], "L")
-        self.assertEqual(cols[1][0]["ch"], "R")
+        self.assertEqual(_glyph_chars(cols[0])[0], "L")
+        self.assertEqual(_glyph_chars(cols[1])[0], "R")
 
     def test_group_lines_orders_by_y_then_x(self):
         # Two visual lines; within a line glyphs given out of x-order.
@@ -131,7 +220,7 @@ class ReadingOrderTest(unittest.TestCase):
             _char("A", 100, 110, 700, 712),
             _char("C", 100, 110, 680, 692),  # next line down
         ]
-        lines = _group_lines(chars)
+        lines = _group_lines(_glyph_array(chars))
         self.assertEqual([ln["text"] for ln in lines], ["AB", "C"])
 
     def test_join_line_glyphs_inserts_word_spaces(self):
@@ -140,11 +229,23 @@ class ReadingOrderTest(unittest.TestCase):
             _char("c", 0, 4, 0, 10),
             _char("f", 10, 14, 0, 10),
         ]
-        self.assertEqual(_join_line_glyphs(chars), "c f")
+        self.assertEqual(_join_line_glyphs(_glyph_array(chars)), "c f")
 
     def test_join_line_glyphs_keeps_adjacent_letters(self):
         chars = [_char("A", 100, 110, 700, 712), _char("B", 110, 120, 700, 712)]
-        self.assertEqual(_join_line_glyphs(chars), "AB")
+        self.assertEqual(_join_line_glyphs(_glyph_array(chars)), "AB")
+
+    def test_group_medians_match_statistics_median(self):
+        values = [3.0, 1.0, 2.0, 0.0, 5.0, 4.0, 7.5, -1.0]
+        groups = [0, 0, 0, 1, 1, 1, 1, 2]
+        medians = _group_medians(
+            np.array(values), np.array(groups), n_groups=4, default=9.0
+        )
+        # Non-positive values are ignored; groups with none get the default.
+        self.assertEqual(
+            medians.tolist(),
+            [statistics.median([3.0, 1.0, 2.0]), statistics.median([5, 4, 7.5]), 9, 9],
+        )
 
 
 class HeadingDetectionTest(unittest.TestCase):
@@ -171,6 +272,61 @@ class HiddenTextFilterTest(unittest.TestCase):
         boxes = [(0.0, 0.0, 10.0, 10.0)]
         self.assertTrue(_point_in_boxes(5.0, 5.0, boxes))
         self.assertFalse(_point_in_boxes(20.0, 5.0, boxes))
+        inside = _point_in_boxes(np.array([5.0, 20.0]), np.array([5.0, 5.0]), boxes)
+        self.assertEqual(inside.tolist(), [True, False])
+
+
+class GlyphExtractionTest(unittest.TestCase):
+    def test_bulk_boxes_match_per_char_api(self):
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_r
+
+        content = _make_text_pdf([["Hello layout", "第二行 mixed 42"]])
+        with pdfium.PdfDocument(content) as pdf:
+            page = pdf[0]
+            textpage = page.get_textpage()
+            try:
+                n = textpage.count_chars()
+                boxes, codes = _page_glyph_boxes(textpage, n, pdfium_r)
+                expected = [textpage.get_charbox(i) for i in range(n)]
+                text = [textpage.get_text_range(i, 1) for i in range(n)]
+            finally:
+                textpage.close()
+                page.close()
+
+        self.assertGreater(n, 0)
+        self.assertEqual([tuple(b) for b in boxes.tolist()], expected)
+        self.assertEqual([chr(c) if c else "" for c in codes.tolist()], text)
+
+    def test_excluded_and_inserted_text_units(self):
+        # Chars "a", <excluded>, "b", <excluded>; pdfium inserts "\r\n" after "a".
+        text = "a\r\nb"
+        text_indices = [0, -1, 3, -1]
+
+        class Raw:
+            def FPDFText_GetTextIndexFromCharIndex(self, handle, i):
+                return text_indices[i]
+
+            def FPDFText_GetText(self, handle, start, count, buf):
+                self_test.assertEqual((start, count), (0, 3))
+                # Sized for every unit written, NUL included.
+                self_test.assertGreaterEqual(len(buf), len(text) + 1)
+                for k, ch in enumerate(text):
+                    buf[k] = ord(ch)
+                return len(text) + 1
+
+            def FPDFText_GetCharBox(self, handle, i, left, right, bottom, top):
+                left.value, right.value, bottom.value, top.value = i, i + 1, 0, 1
+                return True
+
+        class TextPage:
+            raw = None
+
+        self_test = self
+        boxes, codes = _page_glyph_boxes(TextPage(), 4, Raw())
+
+        self.assertEqual(len(boxes), 4)
+        self.assertEqual(codes.tolist(), [ord("a"), 0, ord("b"), 0])
 
 
 class MarginColumnFilterTest(unittest.TestCase):
@@ -185,14 +341,18 @@ class MarginColumnFilterTest(unittest.TestCase):
             _char("a", 170, 180, 700, 712),
             _char("n", 180, 190, 700, 712),
         ]
-        cols = _filter_reading_columns(margin + body, scale=10.0, width=612.0)
+        cols = _filter_reading_columns(
+            _glyph_array(margin + body), scale=10.0, width=612.0
+        )
         self.assertEqual(len(cols), 1)
-        self.assertEqual(cols[0][0]["ch"], "L")
+        self.assertEqual(_glyph_chars(cols[0])[0], "L")
 
     def test_keeps_real_two_column_layout(self):
         left = [_char("L", 50, 150, 700 - i * 12, 712 - i * 12) for i in range(4)]
         right = [_char("R", 400, 500, 700 - i * 12, 712 - i * 12) for i in range(4)]
-        cols = _filter_reading_columns(left + right, scale=12.0, width=600.0)
+        cols = _filter_reading_columns(
+            _glyph_array(left + right), scale=12.0, width=600.0
+        )
         self.assertEqual(len(cols), 2)
 
 
@@ -415,14 +575,57 @@ class PDFRouterIntegrationTest(unittest.TestCase):
         self.assertEqual(len(doc.images), 2)
         self.assertIn("images/imgonly_page_1.jpg", doc.images)
         self.assertIn("![imgonly_page_1.jpg](images/imgonly_page_1.jpg)", doc.content)
-        # JPEG magic bytes after decoding.
-        import base64
+        # Raw JPEG bytes.
+        self.assertTrue(doc.images["images/imgonly_page_1.jpg"].startswith(b"\xff\xd8"))
 
-        self.assertTrue(
-            base64.b64decode(doc.images["images/imgonly_page_1.jpg"]).startswith(
-                b"\xff\xd8"
-            )
+    def test_incremental_parse_yields_pages_in_order(self):
+        pdf_bytes = _make_hybrid_pdf()
+        parser = PDFParser(file_name="hybrid.pdf", file_type="pdf")
+
+        parts = list(parser.iter_parse_into_text(pdf_bytes))
+
+        self.assertEqual([p.page_index for p in parts], [0, 1, 2, -1])
+        self.assertIn("Native page one", parts[0].content)
+        self.assertEqual(
+            parts[1].content, "![hybrid_page_2.jpg](images/hybrid_page_2.jpg)"
         )
+        self.assertEqual(list(parts[1].images), ["images/hybrid_page_2.jpg"])
+        self.assertIn("Native page three", parts[2].content)
+        self.assertEqual(parts[-1].metadata["scanned_page_count"], 1)
+
+        whole = parser.parse_into_text(pdf_bytes)
+        merged = merge_document_parts(parts)
+        # Stage timings differ between runs.
+        merged.metadata.pop("stage_timings_ms")
+        whole.metadata.pop("stage_timings_ms")
+        self.assertEqual(merged, whole)
+
+    def test_stage_timings_in_metadata(self):
+        import json
+
+        with patch("docreader.parser.pdf_parser.PAGE_TIMINGS", True):
+            doc = PDFParser(file_name="hybrid.pdf", file_type="pdf").parse_into_text(
+                _make_hybrid_pdf()
+            )
+
+        stages = json.loads(doc.metadata["stage_timings_ms"])
+        for stage in ("text", "classify", "postprocess", "strip_repeating", "render"):
+            self.assertIn(stage, stages)
+        self.assertGreaterEqual(stages["total"], stages["render"])
+        pages = json.loads(doc.metadata["page_timings_ms"])
+        self.assertEqual([p["page"] for p in pages], [1, 2, 3])
+        self.assertIn("render", pages[1])
+        self.assertNotIn("render", pages[0])
+
+    def test_scanned_parser_streams_one_part_per_page(self):
+        from docreader.parser.pdf_parser import PDFScannedParser
+
+        parser = PDFScannedParser(file_name="scan.pdf")
+        parts = list(parser.iter_parse_into_text(_make_image_only_pdf(3)))
+
+        self.assertEqual([p.page_index for p in parts], [0, 1, 2, -1])
+        self.assertTrue(all(len(p.images) == 1 for p in parts[:3]))
+        self.assertEqual(parts[-1].metadata["page_count"], 3)
 
     def test_malformed_pdf_raises_after_fallback(self):
         # Routing fails to open the PDF, falls back to full rendering which also
@@ -433,5 +636,199 @@ class PDFRouterIntegrationTest(unittest.TestCase):
             )
 
 
+class EmbeddedJpegTest(unittest.TestCase):
+    def test_frame_size_only_for_gray_and_rgb(self):
+        self.assertEqual(_jpeg_frame_size(_jpeg((300, 200))), (300, 200))
+        self.assertEqual(_jpeg_frame_size(_jpeg((90, 120), "L")), (90, 120))
+        self.assertIsNone(_jpeg_frame_size(_jpeg((300, 200), "CMYK")))
+        self.assertIsNone(_jpeg_frame_size(b"\x89PNG"))
+
+    def test_small_jpeg_is_emitted_unchanged(self):
+        jpeg = _jpeg((300, 200))
+        doc = PDFParser(file_name="f.pdf", file_type="pdf").parse_into_text(
+            _make_text_pdf_with_jpeg(jpeg)
+        )
+
+        self.assertEqual(doc.images["images/f_p1_img1.jpg"], jpeg)
+        self.assertIn("![f_p1_img1.jpg](images/f_p1_img1.jpg)", doc.content)
+
+    def test_oversized_jpeg_is_downscaled(self):
+        from docreader.parser import pdf_parser
+
+        content = _make_text_pdf_with_jpeg(_jpeg((300, 200)))
+        cfg = dataclasses.replace(pdf_parser.CONFIG, pdf_render_max_edge=150)
+        with patch.object(pdf_parser, "CONFIG", cfg):
+            doc = PDFParser(file_name="f.pdf", file_type="pdf").parse_into_text(
+                content
+            )
+
+        image = Image.open(io.BytesIO(doc.images["images/f_p1_img1.jpg"]))
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(image.size, (150, 100))
+
+
+class DirectPageImageTest(unittest.TestCase):
+    scale = 200 / 72  # 64pt page -> 178px when rendered
+
+    def _render(self, content, max_edge=0):
+        import pypdfium2 as pdfium
+
+        with pdfium.PdfDocument(content) as pdf:
+            page = pdf[0]
+            try:
+                jpeg = _render_page_to_jpeg(page, self.scale, 90, max_edge)
+            finally:
+                page.close()
+        return Image.open(io.BytesIO(jpeg))
+
+    def test_single_image_page_uses_the_image(self):
+        self.assertEqual(self._render(_make_image_only_pdf(1)).size, (64, 64))
+
+    def test_oversized_image_is_downscaled(self):
+        self.assertEqual(
+            self._render(_make_image_only_pdf(1), max_edge=32).size, (32, 32)
+        )
+
+    def test_disabled_renders_the_page(self):
+        from docreader.parser import pdf_parser
+
+        cfg = dataclasses.replace(
+            pdf_parser.CONFIG, pdf_direct_page_images=False, pdf_adaptive_render=False
+        )
+        with patch.object(pdf_parser, "CONFIG", cfg):
+            self.assertEqual(self._render(_make_image_only_pdf(1)).size, (178, 178))
+
+    def test_visible_text_over_image_is_rendered(self):
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_r
+
+        pdf = pdfium.PdfDocument(_make_image_only_pdf(1))
+        page = pdf[0]
+        self.assertIsNotNone(_sole_page_image(page, pdfium_r))
+        text = pdfium_r.FPDFPageObj_NewTextObj(pdf.raw, b"Helvetica", ctypes.c_float(8))
+        data = "stamp\0".encode("utf-16-le")
+        pdfium_r.FPDFText_SetText(
+            text, (ctypes.c_ushort * (len(data) // 2)).from_buffer_copy(data)
+        )
+        pdfium_r.FPDFPage_InsertObject(page.raw, text)
+
+        self.assertIsNone(_sole_page_image(page, pdfium_r))
+        page.close()
+        pdf.close()
+
+
+class AdaptiveRenderTest(unittest.TestCase):
+    def _render(self, image):
+        import pypdfium2 as pdfium
+
+        from docreader.parser import pdf_parser
+
+        buf = io.BytesIO()
+        image.save(buf, format="PDF", resolution=72)
+        cfg = dataclasses.replace(
+            pdf_parser.CONFIG,
+            pdf_direct_page_images=False,
+            pdf_adaptive_render=True,
+            pdf_adaptive_min_dpi=100,
+        )
+        with patch.object(pdf_parser, "CONFIG", cfg), pdfium.PdfDocument(
+            buf.getvalue()
+        ) as pdf:
+            page = pdf[0]
+            try:
+                jpeg = _render_page_to_jpeg(page, 200 / 72, 90)
+            finally:
+                page.close()
+        return Image.open(io.BytesIO(jpeg))
+
+    def _page(self, lines=0):
+        # 144 x 216 pt of tinted paper with ``lines`` lines of "text".
+        image = Image.new("RGB", (144, 216), (240, 236, 220))
+        for k in range(lines):
+            for x in range(12, 132, 8):
+                image.paste((30, 30, 30), (x, 12 + 9 * k, x + 5, 17 + 9 * k))
+        return image
+
+    def test_blank_page_is_rendered_small_and_gray(self):
+        rendered = self._render(self._page())
+        self.assertEqual(rendered.size, (200, 300))
+        self.assertEqual(rendered.mode, "L")
+
+    def test_dense_page_gets_the_full_dpi(self):
+        rendered = self._render(self._page(lines=22))
+        self.assertEqual(rendered.size, (400, 600))
+        self.assertEqual(rendered.mode, "L")
+
+    def test_colour_is_kept(self):
+        image = self._page(lines=22)
+        image.paste((200, 30, 30), (40, 100, 100, 160))
+        self.assertEqual(self._render(image).mode, "RGB")
+
+
+class ScannedFastPathTest(unittest.TestCase):
+    def _parse(self, content, **kwargs):
+        from docreader.parser import pdf_parser
+
+        with patch.object(pdf_parser, "SCANNED_SAMPLE_MIN_PAGES", 4), patch.object(
+            pdf_parser, "SCANNED_SAMPLE_PAGES", 2
+        ), patch.object(
+            pdf_parser, "_iter_page_analysis", wraps=pdf_parser._iter_page_analysis
+        ) as analysis:
+            parts = list(
+                PDFParser(file_name="fax.pdf", file_type="pdf").iter_parse_into_text(
+                    content
+                )
+            )
+        return parts, analysis.called
+
+    def test_sample_indices_are_spread(self):
+        self.assertEqual(_sample_indices(list(range(100)), 5), [0, 25, 50, 74, 99])
+        self.assertEqual(_sample_indices([3, 4], 8), [3, 4])
+        self.assertEqual(_sample_indices(list(range(9)), 1), [4])
+
+    def test_scanned_document_skips_pass_one(self):
+        from docreader.parser.pdf_parser import PDFScannedParser
+
+        content = _make_image_only_pdf(6)
+        parts, analysed = self._parse(content)
+
+        self.assertFalse(analysed)
+        metadata = parts[-1].metadata
+        self.assertTrue(metadata["scanned_fast_path"])
+        self.assertEqual(metadata["scanned_page_count"], 6)
+        scanned = PDFScannedParser(file_name="fax.pdf").parse_into_text(content)
+        self.assertEqual(merge_document_parts(parts).images, scanned.images)
+
+    def test_text_page_missed_by_the_sample_is_analysed(self):
+        import pypdfium2 as pdfium
+
+        scans = pdfium.PdfDocument(_make_image_only_pdf(5))
+        text = pdfium.PdfDocument(_make_text_pdf([["A typed cover letter page."]]))
+        out = pdfium.PdfDocument.new()
+        out.import_pages(scans, [0, 1])
+        out.import_pages(text, [0])
+        out.import_pages(scans, [2, 3, 4])
+        buf = io.BytesIO()
+        out.save(buf)
+        for doc in (out, text, scans):
+            doc.close()
+
+        parts, analysed = self._parse(buf.getvalue())
+
+        self.assertFalse(analysed)
+        self.assertEqual([p.page_index for p in parts], [0, 1, 2, 3, 4, 5, -1])
+        self.assertIn("typed cover letter", parts[2].content)
+        self.assertEqual(parts[2].images, {})
+        self.assertEqual(parts[-1].metadata["scanned_page_count"], 5)
+        self.assertEqual(parts[-1].metadata["text_page_count"], 1)
+
+    def test_sample_with_text_runs_pass_one(self):
+        content = _make_text_pdf([["Native text page."]] * 4)
+        parts, analysed = self._parse(content)
+
+        self.assertTrue(analysed)
+        self.assertNotIn("scanned_fast_path", parts[-1].metadata)
+
+
 if __name__ == "__main__":
     unittest.main()
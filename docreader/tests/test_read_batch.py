@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import patch
+
+from docreader.main import DocReaderServicer
+from docreader.proto.docreader_pb2 import ReadBatchRequest, ReadRequest
+
+
+class ReadBatchTest(unittest.TestCase):
+    def setUp(self):
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            self.servicer = DocReaderServicer()
+
+    def test_results_are_tagged_by_request_id_and_index(self):
+        requests = [
+            ReadRequest(
+                file_content=f"# Doc {i}\n\nbody {i}".encode(),
+                file_name=f"doc{i}.md",
+                request_id=f"req-{i}",
+            )
+            for i in range(6)
+        ]
+        results = list(
+            self.servicer.ReadBatch(ReadBatchRequest(requests=requests), None)
+        )
+
+        self.assertEqual(sorted(r.index for r in results), list(range(6)))
+        for r in results:
+            self.assertEqual(r.request_id, f"req-{r.index}")
+            self.assertEqual(r.response.error, "")
+            self.assertIn(f"body {r.index}", r.response.markdown_content)
+
+    def test_failures_do_not_abort_the_batch(self):
+        requests = [
+            ReadRequest(file_content=b"x", file_name="bad.unknown"),
+            ReadRequest(file_content=b"# ok", file_name="ok.md"),
+        ]
+        results = {
+            r.index: r
+            for r in self.servicer.ReadBatch(ReadBatchRequest(requests=requests), None)
+        }
+
+        self.assertIn("Unsupported file type", results[0].response.error)
+        self.assertTrue(results[0].request_id)
+        self.assertEqual(results[1].response.error, "")
+
+    def test_markitdown_instance_is_shared(self):
+        from docreader.parser.markitdown_parser import StdMarkitdownParser
+
+        first = StdMarkitdownParser(file_name="a.docx")
+        second = StdMarkitdownParser(file_name="b.docx")
+        self.assertIs(first.markitdown, second.markitdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
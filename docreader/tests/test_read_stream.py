@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+
+from docreader.main import DocReaderServicer
+from docreader.proto.docreader_pb2 import ReadConfig, ReadRequest
+
+
+class IncrementalReadStreamTest(unittest.TestCase):
+    def setUp(self):
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            self.servicer = DocReaderServicer()
+
+    def _frames(self, **kwargs):
+        request = ReadRequest(config=ReadConfig(incremental_stream=True), **kwargs)
+        return list(self.servicer.ReadStream(request, None))
+
+    def test_non_paged_parser_is_streamed_as_single_fragment(self):
+        frames = self._frames(file_content=b"# Title\n\nbody", file_name="a.md")
+
+        self.assertEqual(
+            [f.WhichOneof("payload") for f in frames], ["fragment", "done"]
+        )
+        self.assertIn("body", frames[0].fragment.markdown_content)
+        self.assertEqual(frames[0].fragment.page_index, -1)
+        self.assertEqual(frames[1].done.fragment_count, 1)
+
+    def test_errors_close_the_stream_with_done(self):
+        frames = self._frames(file_content=b"x", file_name="a.unknown")
+
+        self.assertEqual(len(frames), 1)
+        self.assertIn("Unsupported file type", frames[0].done.error)
+
+    def test_default_stream_is_unchanged(self):
+        request = ReadRequest(file_content=b"# Title\n\nbody", file_name="a.md")
+        frames = list(self.servicer.ReadStream(request, None))
+
+        self.assertEqual([f.WhichOneof("payload") for f in frames], ["meta"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import unittest
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+
+from docreader.main import DocReaderServicer
+from docreader.proto import docreader_pb2_grpc
+from docreader.proto.docreader_pb2 import ReadConfig, ReadRequest, ReadUploadRequest
+from docreader.tests.test_aio_server import _image_pdf
+from docreader.utils.tempfile import UploadSpool, UploadTooLargeError
+
+
+def _upload(header: ReadRequest, content: bytes, chunk_size: int = 1000):
+    yield ReadUploadRequest(header=header)
+    for i in range(0, len(content), chunk_size):
+        yield ReadUploadRequest(chunk=content[i : i + chunk_size])
+
+
+class UploadSpoolTest(unittest.TestCase):
+    def test_chunks_are_spooled_and_removed_on_exit(self):
+        with UploadSpool(suffix=".pdf") as spool:
+            spool.write(b"abc")
+            spool.write(b"def")
+            path = spool.finish()
+            self.assertTrue(path.endswith(".pdf"))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"abcdef")
+        self.assertFalse(os.path.exists(path))
+
+    def test_limit_is_enforced(self):
+        with UploadSpool(max_bytes=4) as spool:
+            spool.write(b"abcd")
+            with self.assertRaises(UploadTooLargeError):
+                spool.write(b"e")
+            path = spool.path
+        self.assertFalse(os.path.exists(path))
+
+
+class ParsePathTest(unittest.TestCase):
+    def test_parse_path_matches_parse_file(self):
+        from docreader.parser import Parser
+
+        parser = Parser(use_cache=False)
+        content = _image_pdf(2)
+        with UploadSpool(suffix=".pdf") as spool:
+            spool.write(content)
+            path = spool.finish()
+            from_path = parser.parse_path("scan.pdf", "pdf", path)
+        from_bytes = parser.parse_file("scan.pdf", "pdf", content)
+
+        self.assertEqual(from_path.content, from_bytes.content)
+        self.assertEqual(from_path.images, from_bytes.images)
+
+
+class ReadUploadTest(unittest.TestCase):
+    def setUp(self):
+        with patch("docreader.parser.parser.get_parse_cache", return_value=None):
+            servicer = DocReaderServicer()
+        self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        docreader_pb2_grpc.add_DocReaderServicer_to_server(servicer, self.server)
+        port = self.server.add_insecure_port("127.0.0.1:0")
+        self.server.start()
+        self.channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+        self.stub = docreader_pb2_grpc.DocReaderStub(self.channel)
+
+    def tearDown(self):
+        self.channel.close()
+        self.server.stop(0)
+
+    def test_chunked_upload_is_parsed(self):
+        header = ReadRequest(
+            file_name="upload.pdf", config=ReadConfig(incremental_stream=True)
+        )
+        frames = list(self.stub.ReadUpload(_upload(header, _image_pdf(2))))
+
+        kinds = [f.WhichOneof("payload") for f in frames]
+        self.assertEqual(kinds, ["image", "fragment"] * 2 + ["done"])
+        self.assertEqual(frames[-1].done.error, "")
+        self.assertEqual(frames[-1].done.metadata["page_count"], "2")
+
+    def test_non_incremental_upload_returns_meta_frame(self):
+        header = ReadRequest(file_name="note.md")
+        frames = list(self.stub.ReadUpload(_upload(header, b"# Title\n\nuploaded")))
+
+        self.assertEqual(frames[0].WhichOneof("payload"), "meta")
+        self.assertIn("uploaded", frames[0].meta.markdown_content)
+
+    def test_missing_header_is_rejected(self):
+        with self.assertRaises(grpc.RpcError) as cm:
+            list(self.stub.ReadUpload(iter([ReadUploadRequest(chunk=b"x")])))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
+    def test_oversized_upload_is_rejected(self):
+        header = ReadRequest(file_name="big.md")
+        with patch("docreader.main.CONFIG") as cfg:
+            cfg.grpc_max_upload_size_mb = 10
+            with self.assertRaises(grpc.RpcError) as cm:
+                list(self.stub.ReadUpload(_upload(header, b"x" * 100, chunk_size=8)))
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import unittest
+
+from docreader.parser.base_parser import BaseParser
+from docreader.parser.markdown_parser import MarkdownParser
+from docreader.parser.registry import BUILTIN_ENGINE, ParserEngineRegistry
+
+
+def _available(overrides):
+    return False, "missing backend"
+
+
+class LazyRegistryTest(unittest.TestCase):
+    def _registry(self):
+        reg = ParserEngineRegistry()
+        ref = "docreader.parser.markdown_parser:MarkdownParser"
+        reg.register(BUILTIN_ENGINE, {"md": ref, "markdown": ref})
+        reg.register(
+            "other",
+            {"pdf": "docreader.parser.no_such_module:Parser"},
+            check_available=f"{__name__}:_available",
+        )
+        return reg
+
+    def test_string_entries_resolve_on_first_use(self):
+        reg = self._registry()
+        self.assertIsInstance(reg._engines[BUILTIN_ENGINE]["md"], str)
+
+        self.assertIs(reg.get_parser_class("", "MD"), MarkdownParser)
+        # Entries sharing the reference are resolved together.
+        self.assertIs(reg._engines[BUILTIN_ENGINE]["markdown"], MarkdownParser)
+        self.assertTrue(issubclass(reg.get_parser_class("other", "md"), BaseParser))
+
+    def test_list_engines_does_not_import_parsers(self):
+        reg = self._registry()
+        engines = {e["name"]: e for e in reg.list_engines()}
+
+        self.assertEqual(engines["other"]["file_types"], ["pdf"])
+        self.assertFalse(engines["other"]["available"])
+        self.assertEqual(engines["other"]["unavailable_reason"], "missing backend")
+        self.assertIsInstance(reg._engines["other"]["pdf"], str)
+
+    def test_warm_up(self):
+        reg = self._registry()
+        with self.assertLogs("docreader.parser.registry", "WARNING"):
+            loaded = reg.warm_up(["markdown", "other", "nonsense"])
+
+        self.assertIn(f"{BUILTIN_ENGINE}:markdown", loaded)
+        self.assertIs(reg._engines[BUILTIN_ENGINE]["md"], MarkdownParser)
+        # A broken entry is reported, not raised, and stays lazy.
+        self.assertNotIn("other:pdf", loaded)
+        self.assertEqual(reg.resolve_engine_name("other", "pdf"), "other")
+
+    def test_server_import_is_lazy(self):
+        code = (
+            "import sys, docreader.main\n"
+            "heavy = ('pandas', 'markitdown', 'docx', 'trafilatura',"
+            " 'pypdfium2', 'docreader.parser.pdf_parser')\n"
+            "print('loaded=' + ','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertIn("loaded=\n", out.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
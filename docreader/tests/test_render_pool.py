@@ -0,0 +1,502 @@
+import dataclasses
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+from docreader.parser import pdf_parser
+from docreader.parser.pdf_parser import (
+    _SKIPPED_PAGE,
+    RenderPool,
+    _RenderJob,
+    _render_worker_doc,
+)
+from docreader.tests.test_pdf_router import (
+    _jpeg,
+    _make_hybrid_pdf,
+    _make_image_only_pdf,
+    _make_text_pdf_with_jpeg,
+)
+from docreader.utils.cancel import CancelToken, ParseCancelled, cancel_scope
+
+
+class _RecordingExecutor:
+    """Executor stand-in whose futures complete only when the test says so."""
+
+    def __init__(self, *args, **kwargs):
+        self.submitted = []
+        self.args = []
+        self.tickets = []
+
+    def submit(self, fn, ticket, task, args):
+        future = Future()
+        self.submitted.append((args[0], args[3], future))
+        self.args.append(args[3:])
+        self.tickets.append(ticket)
+        return future
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+class RenderPoolSchedulingTest(unittest.TestCase):
+    def setUp(self):
+        with patch("concurrent.futures.ProcessPoolExecutor", _RecordingExecutor):
+            self.pool = RenderPool(workers=2)
+        self.executor = self.pool._executor
+
+    def _job(self, doc_id, pages, window=4):
+        job = _RenderJob(doc_id, "/tmp/x.pdf", list(range(pages)), (1, 85, 0), window)
+        self.pool._jobs.append(job)
+        return job
+
+    def test_pages_are_dispatched_round_robin(self):
+        self._job("a", 10)
+        self._job("b", 10)
+        with self.pool._lock:
+            self.pool._pump()
+
+        submitted = [(doc, index) for doc, index, _ in self.executor.submitted]
+        # workers * _RENDER_QUEUE_PER_WORKER pages in the executor at once.
+        self.assertEqual(submitted, [("a", 0), ("b", 0), ("a", 1), ("b", 1)])
+
+        # A finished page frees a slot for the next job in turn.
+        self.executor.submitted[0][2].set_result((0, b"jpeg"))
+        self.assertEqual(self.executor.submitted[-1][:2], ("a", 2))
+
+    def test_cpu_lease_bounds_running_pages(self):
+        class Lease:
+            held = 1
+
+            def rebalance(self):
+                return self.held
+
+        lease = Lease()
+        job = self._job("a", 10)
+        job.lease = lease
+        with self.pool._lock:
+            self.pool._pump()
+        self.assertEqual(len(self.executor.submitted), 1)
+
+        # A finished page frees the token for the next one.
+        self.executor.submitted[0][2].set_result((0, b"p0"))
+        self.assertEqual(len(self.executor.submitted), 2)
+        self.assertEqual(job.running, 1)
+
+        lease.held = 3
+        with self.pool._lock:
+            self.pool._pump()
+        self.assertEqual(job.running, 3)
+
+    def test_window_bounds_unconsumed_pages(self):
+        job = self._job("a", 10, window=2)
+        with self.pool._lock:
+            self.pool._pump()
+        self.assertEqual(len(job.futures), 2)
+
+        for _, _, future in list(self.executor.submitted):
+            future.set_result(None)
+        # Rendered but unconsumed pages still count against the window.
+        self.assertEqual(len(self.executor.submitted), 2)
+        self.assertEqual(self.pool._queued, 0)
+
+    def test_job_waits_for_a_free_slot(self):
+        self._job("a", 10)
+        with self.pool._lock:
+            self.pool._pump()
+        self.assertEqual(len(self.executor.submitted), 4)
+
+        received = []
+        pages = self.pool.iter_pages("/tmp/b.pdf", [7], 1, 85, 0)
+        consumer = threading.Thread(target=lambda: received.extend(pages), daemon=True)
+        consumer.start()
+        time.sleep(0.05)
+        self.assertEqual(len(self.executor.submitted), 4)
+        self.executor.submitted[0][2].set_result((0, b"a0"))
+        _, index, future = self.executor.submitted[-1]
+        self.assertEqual(index, 7)
+        future.set_result((7, b"b7"))
+        consumer.join(2)
+
+        self.assertEqual(received, [(7, b"b7")])
+        self.assertEqual(len(self.pool._jobs), 1)
+
+    def test_cancelled_request_drops_its_pages(self):
+        token = CancelToken()
+        pages = self.pool.iter_pages("/tmp/a.pdf", list(range(6)), 1, 85, 0)
+        threading.Timer(0.1, token.cancel).start()
+        with cancel_scope(token), self.assertRaises(ParseCancelled):
+            next(pages)
+
+        self.assertTrue(self.executor.submitted)
+        self.assertTrue(all(f.cancelled() for _, _, f in self.executor.submitted))
+        self.assertEqual(self.pool._queued, 0)
+        self.assertEqual(len(self.pool._jobs), 0)
+
+    def test_pages_can_be_added_while_results_are_consumed(self):
+        job = self.pool.open_job("/tmp/a.pdf", None, (1, 85, 0), window=4)
+        self.pool.add_items(job, [3])
+        self.assertEqual([i for _, i, _ in self.executor.submitted], [3])
+
+        received = []
+        consumer = threading.Thread(
+            target=lambda: received.extend(self.pool.iter_results(job)), daemon=True
+        )
+        consumer.start()
+        self.executor.submitted[0][2].set_result((3, b"p3"))
+        self.pool.add_items(job, [5])
+        self.executor.submitted[1][2].set_result((5, b"p5"))
+        time.sleep(0.05)
+        # Still feeding: the consumer waits for more pages.
+        self.assertTrue(consumer.is_alive())
+
+        self.pool.end_items(job)
+        consumer.join(2)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(received, [(3, b"p3"), (5, b"p5")])
+        self.assertEqual(len(self.pool._jobs), 0)
+
+    def test_release_drops_an_open_job(self):
+        job = self.pool.open_job("/tmp/a.pdf", None, (1, 85, 0), window=2)
+        self.pool.add_items(job, list(range(6)))
+        self.pool.release(job)
+        self.pool.release(job)
+
+        self.assertTrue(all(f.cancelled() for _, _, f in self.executor.submitted))
+        self.assertEqual(self.pool._queued, 0)
+        self.assertEqual(len(self.pool._jobs), 0)
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+class RenderPoolWatchdogTest(unittest.TestCase):
+    def setUp(self):
+        for patcher in (
+            patch("concurrent.futures.ProcessPoolExecutor", _RecordingExecutor),
+            patch.object(pdf_parser, "CANCEL_POLL_SECONDS", 0.01),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.pool = RenderPool(workers=2)
+        self.pool.page_timeout = 0.05
+
+    def _start(self, executor, n, worker=0):
+        """Run task ``n`` of ``executor`` as if ``worker`` had picked it up."""
+        future = executor.submitted[n][2]
+        if not future.running():
+            future.set_running_or_notify_cancel()
+        starts = self.pool._starts
+        starts[2 * worker] = executor.tickets[n]
+        starts[2 * worker + 1] = time.time()
+
+    def _consume(self, pages):
+        job = self.pool.open_job(
+            "/tmp/a.pdf",
+            None,
+            (2, 85, 0),
+            window=4,
+            items=pages,
+            feeding=False,
+            fallback=lambda i: [(i, (1, 85, 0))],
+            placeholder=lambda i: (i, _SKIPPED_PAGE),
+        )
+        received = []
+
+        def consume():
+            try:
+                received.extend(self.pool.iter_results(job))
+            except BrokenProcessPool as e:
+                received.append(e)
+
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        return consumer, received
+
+    def test_stalled_page_is_retried_at_low_dpi_then_skipped(self):
+        first = self.pool._executor
+        consumer, received = self._consume([0, 1])
+        first.submitted[1][2].set_result((1, b"p1"))
+        self._start(first, 0)
+
+        _wait_for(lambda: self.pool._executor is not first)
+        retry = self.pool._executor
+        # Only the stalled page is resubmitted, at the fallback scale.
+        self.assertEqual(retry.args, [(0, 1, 85, 0)])
+        self._start(retry, 0)
+
+        consumer.join(5)
+        self.assertFalse(consumer.is_alive())
+        self.assertIsNot(self.pool._executor, retry)
+        self.assertEqual(self.pool._executor.submitted, [])
+        self.assertEqual(received, [(0, _SKIPPED_PAGE), (1, b"p1")])
+        self.assertEqual(self.pool._queued, 0)
+
+    def test_queued_page_is_not_timed(self):
+        first = self.pool._executor
+        consumer, received = self._consume([0, 1])
+        # Handed to the executor's call queue, but no worker has started it.
+        first.submitted[0][2].set_running_or_notify_cancel()
+        time.sleep(self.pool.page_timeout * 4)
+        self.assertIs(self.pool._executor, first)
+
+        self._start(first, 0, worker=1)
+        _wait_for(lambda: self.pool._executor is not first)
+        self.assertEqual(self.pool._executor.args, [(0, 1, 85, 0), (1, 2, 85, 0)])
+        for index, (_, _, future) in enumerate(self.pool._executor.submitted):
+            future.set_result((index, b"p"))
+        consumer.join(5)
+        self.assertEqual([page for page, _ in received], [0, 1])
+
+    def test_crash_before_the_page_started_does_not_degrade_it(self):
+        first = self.pool._executor
+        consumer, received = self._consume([0, 1])
+        for _, _, future in first.submitted:
+            future.set_exception(BrokenProcessPool("worker died"))
+
+        _wait_for(lambda: self.pool._executor is not first)
+        retry = self.pool._executor
+        self.assertEqual(retry.args, [(0, 2, 85, 0), (1, 2, 85, 0)])
+        for index, (_, _, future) in enumerate(retry.submitted):
+            future.set_result((index, b"p"))
+        consumer.join(5)
+        self.assertEqual(received, [(0, b"p"), (1, b"p")])
+
+    def test_worker_crash_resubmits_pages_in_flight(self):
+        first = self.pool._executor
+        consumer, received = self._consume([0, 1, 2])
+        self._start(first, 0)
+        for _, _, future in first.submitted:
+            future.set_exception(BrokenProcessPool("worker died"))
+
+        _wait_for(lambda: self.pool._executor is not first)
+        retry = self.pool._executor
+        self.assertEqual(retry.args, [(0, 1, 85, 0), (1, 2, 85, 0), (2, 2, 85, 0)])
+        for index, (_, _, future) in enumerate(retry.submitted):
+            future.set_result((index, f"p{index}".encode()))
+
+        consumer.join(5)
+        self.assertEqual([page for page, _ in received], [0, 1, 2])
+        self.assertFalse(self.pool.broken)
+
+    def test_repeated_crashes_break_the_pool(self):
+        consumer, received = self._consume([0, 1, 2])
+        for _ in range(pdf_parser._RENDER_MAX_CRASHES + 1):
+            executor = self.pool._executor
+            self._start(executor, 0)
+            for _, _, future in executor.submitted:
+                future.set_exception(BrokenProcessPool("worker died"))
+            _wait_for(lambda: self.pool._executor is not executor or self.pool.broken)
+
+        consumer.join(5)
+        self.assertTrue(self.pool.broken)
+        # Page 0 crashed twice and was skipped; page 1 broke the pool.
+        self.assertEqual(received[0], (0, _SKIPPED_PAGE))
+        self.assertIsInstance(received[1], BrokenProcessPool)
+
+
+class DegradedPagesTest(unittest.TestCase):
+    def test_scanned_parser_records_skipped_pages(self):
+        def render(pdf, content, indices, *args, degraded, **kwargs):
+            degraded.low_dpi.extend([0, 2])
+            degraded.skipped.append(2)
+            for i in indices:
+                yield i, _SKIPPED_PAGE if i == 2 else b"\xff\xd8jpeg"
+
+        with patch.object(pdf_parser, "_iter_rendered_pages", render):
+            doc = pdf_parser.PDFScannedParser(file_name="s.pdf").parse_into_text(
+                _make_image_only_pdf(3)
+            )
+
+        self.assertEqual(
+            sorted(doc.images), ["images/s_page_1.jpg", "images/s_page_2.jpg"]
+        )
+        self.assertEqual(doc.metadata["low_dpi_pages"], "1")
+        self.assertEqual(doc.metadata["skipped_pages"], "3")
+
+    def test_serial_analysis_skips_a_page_past_its_deadline(self):
+        deadlines = iter([0.0])  # the first page's walk is already late
+
+        with patch.object(
+            pdf_parser, "_page_deadline", lambda: next(deadlines, None)
+        ), patch.object(pdf_parser, "PARALLEL_ANALYSIS_MIN_PAGES", 0):
+            doc = pdf_parser.PDFParser(
+                file_name="h.pdf", file_type="pdf"
+            ).parse_into_text(_make_hybrid_pdf())
+
+        self.assertNotIn("Native page one", doc.content)
+        self.assertIn("Native page three", doc.content)
+        self.assertEqual(doc.metadata["skipped_pages"], "1")
+
+    def test_embedded_image_scan_stops_past_its_deadline(self):
+        import pypdfium2 as pdfium
+        import pypdfium2.raw as pdfium_r
+
+        degraded = pdf_parser._DegradedPages()
+        pdf = pdfium.PdfDocument(_make_text_pdf_with_jpeg(_jpeg((300, 200))))
+        try:
+            with patch.object(pdf_parser, "_page_deadline", return_value=0.0):
+                embedded = pdf_parser._extract_embedded_images(
+                    pdf, ["text"], pdfium_r, "f", 85, degraded
+                )
+            found = pdf_parser._extract_embedded_images(
+                pdf, ["text"], pdfium_r, "f", 85
+            )
+        finally:
+            pdf.close()
+
+        self.assertEqual(embedded, {})
+        self.assertEqual(list(found), [0])
+        self.assertEqual(degraded.metadata(), {"partial_image_pages": "1"})
+
+
+class RenderWorkerDocCacheTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_make_image_only_pdf(2))
+        self.addCleanup(os.unlink, self.path)
+        self.addCleanup(self._clear)
+
+    def _clear(self):
+        while pdf_parser._WORKER_RENDER_DOCS:
+            pdf_parser._WORKER_RENDER_DOCS.popitem()[1].close()
+
+    def test_documents_are_reused_and_released(self):
+        first = _render_worker_doc("doc-1", self.path, ())
+        self.assertIs(_render_worker_doc("doc-1", self.path, ()), first)
+
+        _render_worker_doc("doc-2", self.path, ("doc-1",))
+        self.assertEqual(list(pdf_parser._WORKER_RENDER_DOCS), ["doc-2"])
+
+    def test_cache_is_bounded(self):
+        for i in range(pdf_parser._WORKER_RENDER_DOC_CACHE + 2):
+            _render_worker_doc(f"doc-{i}", self.path, ())
+        self.assertEqual(
+            len(pdf_parser._WORKER_RENDER_DOCS), pdf_parser._WORKER_RENDER_DOC_CACHE
+        )
+        self.assertNotIn("doc-0", pdf_parser._WORKER_RENDER_DOCS)
+
+
+class RenderPoolIntegrationTest(unittest.TestCase):
+    def test_pool_is_shared_across_documents(self):
+        if pdf_parser.select_mp_context() is None:
+            self.skipTest("multiprocessing unavailable")
+        import pypdfium2 as pdfium
+
+        content = _make_image_only_pdf(3)
+        pdf = pdfium.PdfDocument(content)
+        self.addCleanup(pdf.close)
+        cfg = dataclasses.replace(pdf_parser.CONFIG, pdf_render_parallelism=2)
+
+        def render(indices):
+            return list(
+                pdf_parser._iter_rendered_pages(pdf, content, indices, 1, 85, 0)
+            )
+
+        try:
+            with patch.object(pdf_parser, "CONFIG", cfg):
+                first = render([0, 1, 2])
+                pool = pdf_parser.get_render_pool(2)
+                second = render([2, 0])
+            self.assertIs(pdf_parser.get_render_pool(2), pool)
+        finally:
+            pdf_parser.shutdown_render_pool(wait=True)
+
+        self.assertEqual([i for i, _ in first], [0, 1, 2])
+        self.assertEqual([i for i, _ in second], [2, 0])
+        self.assertEqual(second[0][1], first[2][1])
+        self.assertTrue(first[0][1].startswith(b"\xff\xd8"))
+        self.assertEqual(pool._queued, 0)
+
+    def test_parallel_analysis_matches_serial(self):
+        if pdf_parser.select_mp_context() is None:
+            self.skipTest("multiprocessing unavailable")
+        content = _make_hybrid_pdf()
+
+        def parse(workers, min_pages):
+            cfg = dataclasses.replace(pdf_parser.CONFIG, pdf_render_parallelism=workers)
+            with patch.object(pdf_parser, "CONFIG", cfg), patch.object(
+                pdf_parser, "PARALLEL_ANALYSIS_MIN_PAGES", min_pages
+            ):
+                doc = pdf_parser.PDFParser(
+                    file_name="h.pdf", file_type="pdf"
+                ).parse_into_text(content)
+            doc.metadata.pop("stage_timings_ms")
+            return doc
+
+        try:
+            with patch.object(
+                pdf_parser,
+                "_iter_page_analysis",
+                wraps=pdf_parser._iter_page_analysis,
+            ) as analysis:
+                parallel = parse(2, 1)
+            self.assertIsNotNone(analysis.call_args.kwargs["pdf_path"])
+        finally:
+            pdf_parser.shutdown_render_pool(wait=True)
+        serial = parse(1, 0)
+
+        self.assertEqual(parallel.content, serial.content)
+        self.assertEqual(parallel.images, serial.images)
+        self.assertEqual(parallel.metadata, serial.metadata)
+
+    def test_scanned_pages_render_during_classification(self):
+        if pdf_parser.select_mp_context() is None:
+            self.skipTest("multiprocessing unavailable")
+        cfg = dataclasses.replace(pdf_parser.CONFIG, pdf_render_parallelism=2)
+        seen = []
+
+        def extract(*args, **kwargs):
+            # Runs between pass 1 and pass 2: the scanned page is queued.
+            pool = pdf_parser.get_render_pool(2)
+            seen.append(len(pool._jobs))
+            raise RuntimeError("boom")
+
+        try:
+            with patch.object(pdf_parser, "CONFIG", cfg), patch.object(
+                pdf_parser, "_extract_embedded_images", side_effect=extract
+            ):
+                parser = pdf_parser.PDFParser(file_name="h.pdf", file_type="pdf")
+                with self.assertRaises(RuntimeError):
+                    list(parser._iter_route(_make_hybrid_pdf()))
+            pool = pdf_parser.get_render_pool(2)
+            # The failed request's job is released.
+            self.assertEqual(len(pool._jobs), 0)
+        finally:
+            pdf_parser.shutdown_render_pool(wait=True)
+
+        self.assertEqual(seen, [1])
+
+
+class AnalysisRangesTest(unittest.TestCase):
+    def test_ranges_cover_pages_in_order(self):
+        with patch.object(pdf_parser, "ANALYSIS_RANGE_PAGES", 16):
+            ranges = pdf_parser._analysis_ranges(list(range(40)), 2)
+            self.assertEqual(
+                [(r[0], r[-1]) for r in ranges], [(0, 15), (16, 31), (32, 39)]
+            )
+            # Short selections still give every worker a range.
+            self.assertEqual(
+                pdf_parser._analysis_ranges([2, 3, 7, 9, 10], 4),
+                [(2, 3), (7, 9), (10,)],
+            )
+
+
+def tearDownModule():
+    # Join the workers before interpreter exit, or forkserver's semaphores
+    # are torn down under them.
+    pdf_parser.shutdown_render_pool(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
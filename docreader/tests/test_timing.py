@@ -0,0 +1,54 @@
+import json
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from docreader.utils.timing import StageTimer
+
+
+class StageTimerTest(unittest.TestCase):
+    def test_aggregates_by_stage_and_page(self):
+        timer = StageTimer(per_page=True)
+        timer.add("text", 0.010, page=0)
+        timer.add("text", 0.020, page=1)
+        timer.add("layout", 0.005, page=1)
+        with timer.span("strip_repeating"):
+            pass
+        timer.finish()
+
+        summary = timer.summary()
+        stages = json.loads(summary["stage_timings_ms"])
+        self.assertAlmostEqual(stages["text"], 30.0)
+        self.assertIn("strip_repeating", stages)
+        self.assertIn("total", stages)
+        pages = json.loads(summary["page_timings_ms"])
+        self.assertEqual(pages[1], {"page": 2, "text": 20.0, "layout": 5.0})
+
+    def test_page_breakdown_is_opt_in(self):
+        timer = StageTimer()
+        timer.add("text", 0.01, page=0)
+        self.assertNotIn("page_timings_ms", timer.summary())
+
+    def test_export_otel_without_package(self):
+        with patch.dict(sys.modules, {"opentelemetry": None}):
+            self.assertFalse(StageTimer().export_otel("doc"))
+
+    def test_export_otel_emits_child_spans(self):
+        trace = MagicMock()
+        module = MagicMock(trace=trace)
+        timer = StageTimer()
+        timer.add("text", 0.01, page=0)
+        timer.add("render", 0.02, page=1)
+        timer.finish()
+
+        with patch.dict(sys.modules, {"opentelemetry": module}):
+            self.assertTrue(timer.export_otel("doc", {"page_count": 2}))
+
+        tracer = trace.get_tracer.return_value
+        names = [c.args[0] for c in tracer.start_span.call_args_list]
+        self.assertEqual(names, ["doc", "doc.text", "doc.render"])
+        tracer.start_span.return_value.end.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Cancellation tokens tied to the lifetime of a gRPC call.
+
+The servicer derives a :class:`CancelToken` from the RPC context (client
+cancellation and deadline) and installs it with :func:`cancel_scope` for the
+duration of the parse. Long-running parsers call :func:`check_cancelled`
+between pages; it raises :class:`ParseCancelled` once the caller has gone
+away, so the remaining pages are not rendered for nobody.
+
+Tokens cross into parse-pool worker processes as a manager ``Event`` plus an
+absolute deadline (wall-clock seconds), so both checks work there too.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often blocking waits (limiter slots, render results) re-check the token.
+CANCEL_POLL_SECONDS = 0.5
+
+_current_token: ContextVar[Optional["CancelToken"]] = ContextVar(
+    "cancel_token", default=None
+)
+
+
+class ParseCancelled(Exception):
+    """The RPC that requested this parse was cancelled or hit its deadline."""
+
+
+class CancelToken:
+    """Cancelled explicitly via :meth:`cancel` or implicitly at ``deadline``.
+
+    ``event`` may be any object with ``set`` / ``is_set`` (e.g. a manager
+    Event shared with a worker process); ``deadline`` is a ``time.time()``
+    timestamp.
+    """
+
+    def __init__(self, event=None, deadline: Optional[float] = None):
+        self.event = event if event is not None else threading.Event()
+        self.deadline = deadline
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self.deadline is not None and time.time() >= self.deadline:
+            return True
+        return self.event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.event.is_set():
+            raise ParseCancelled("request cancelled by the client")
+        if self.deadline is not None and time.time() >= self.deadline:
+            raise ParseCancelled("request deadline exceeded")
+
+
+def deadline_from_context(context) -> Optional[float]:
+    """Absolute deadline of a gRPC call (None without one)."""
+    remaining = context.time_remaining() if context is not None else None
+    if remaining is None:
+        return None
+    return time.time() + remaining
+
+
+def token_from_context(context) -> Optional[CancelToken]:
+    """Token cancelled when the (sync) gRPC call terminates or times out."""
+    if context is None:
+        return None
+    token = CancelToken(deadline=deadline_from_context(context))
+    # Runs when the RPC terminates for any reason; after a normal completion
+    # the parse is already over, so cancelling is harmless.
+    context.add_callback(token.cancel)
+    return token
+
+
+@contextlib.contextmanager
+def cancel_scope(token: Optional[CancelToken]) -> Iterator[None]:
+    """Make ``token`` the current token for :func:`check_cancelled`."""
+    reset = _current_token.set(token)
+    try:
+        yield
+    finally:
+        _current_token.reset(reset)
+
+
+def current_token() -> Optional[CancelToken]:
+    return _current_token.get()
+
+
+def check_cancelled() -> None:
+    """Raise ParseCancelled if the current request has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
@@ -3,7 +3,7 @@ Encoding and Decoding Utilities Module
 
 This module provides utilities for encoding and decoding various data types,
 with a focus on image and text data conversion:
-- Image encoding/decoding (base64)
+- Image encoding/decoding (raw bytes and base64)
 - Text encoding/decoding (multiple character sets)
 - Bytes conversion utilities
 """
@@ -20,61 +20,73 @@ from PIL import Image
 logger = logging.getLogger(__name__)
 
 
-def decode_image(image: Union[str, bytes, Image.Image, np.ndarray]) -> str:
-    """Convert image to base64 encoded string.
-
-    This function handles multiple image input formats and converts them
-    to a base64 encoded string representation, which is useful for embedding
-    images in JSON, HTML, or other text-based formats.
+def image_to_bytes(image: Union[str, bytes, Image.Image, np.ndarray]) -> bytes:
+    """Convert image to raw encoded image bytes.
 
     Args:
         image: Image in one of the following formats:
             - str: File path to an image file
             - bytes: Raw image bytes data
-            - Image.Image: PIL/Pillow Image object
-            - np.ndarray: NumPy array representing image data
+            - Image.Image: PIL/Pillow Image object (saved in its original
+              format, PNG if unknown)
+            - np.ndarray: NumPy array representing image data (saved as PNG)
 
     Returns:
-        str: Base64 encoded string representation of the image
+        bytes: Encoded image file bytes
 
     Raises:
         ValueError: If the image type is not supported
-
-    Example:
-        >>> # From file path
-        >>> base64_str = decode_image("/path/to/image.png")
-        >>> # From PIL Image
-        >>> from PIL import Image
-        >>> img = Image.open("photo.jpg")
-        >>> base64_str = decode_image(img)
     """
     if isinstance(image, str):
-        # Handle file path: read file and encode to base64
         with open(image, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode()
+            return image_file.read()
 
     elif isinstance(image, bytes):
-        # Handle raw bytes: directly encode to base64
-        return base64.b64encode(image).decode()
+        return image
 
     elif isinstance(image, Image.Image):
-        # Handle PIL Image: save to buffer then encode
         buffer = io.BytesIO()
         # Use original format if available, otherwise default to PNG
         img_format = image.format if image.format else "PNG"
         image.save(buffer, format=img_format)
-        return base64.b64encode(buffer.getvalue()).decode()
+        return buffer.getvalue()
 
     elif isinstance(image, np.ndarray):
-        # Handle numpy array: convert to PIL Image, then encode as PNG
         pil_image = Image.fromarray(image)
         buffer = io.BytesIO()
         pil_image.save(buffer, format="PNG")
-        return base64.b64encode(buffer.getvalue()).decode()
+        return buffer.getvalue()
 
     raise ValueError(f"Unsupported image type: {type(image)}")
 
 
+def decode_image(image: Union[str, bytes, Image.Image, np.ndarray]) -> str:
+    """Convert image to base64 encoded string.
+
+    This function handles multiple image input formats and converts them
+    to a base64 encoded string representation, which is useful for embedding
+    images in JSON, HTML, or other text-based formats.
+
+    Args:
+        image: Image in one of the formats accepted by :func:`image_to_bytes`
+
+    Returns:
+        str: Base64 encoded string representation of the image
+
+    Raises:
+        ValueError: If the image type is not supported
+
+    Example:
+        >>> # From file path
+        >>> base64_str = decode_image("/path/to/image.png")
+        >>> # From PIL Image
+        >>> from PIL import Image
+        >>> img = Image.open("photo.jpg")
+        >>> base64_str = decode_image(img)
+    """
+    return base64.b64encode(image_to_bytes(image)).decode()
+
+
 def encode_image(image: str, errors="strict") -> bytes:
     """Decode a base64 encoded image string back to bytes.
 
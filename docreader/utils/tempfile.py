@@ -1,4 +1,6 @@
+import contextlib
 import logging
+import mmap
 import os
 import tempfile
 
@@ -41,6 +43,80 @@ class TempFileContext:
         return False
 
 
+class UploadTooLargeError(ValueError):
+    """Raised when a spooled upload exceeds its size limit."""
+
+
+class UploadSpool:
+    def __init__(self, max_bytes: int = 0, suffix: str = ""):
+        """
+        Temporary file that a chunked upload is written to as it arrives
+        :param max_bytes: Upload size limit in bytes (0 for no limit)
+        :param suffix: File suffix
+        """
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self.size = 0
+        self.path = None
+        self._file = None
+
+    def __enter__(self):
+        """
+        Create the spool file when entering context
+        """
+        fd, self.path = tempfile.mkstemp(prefix="docreader_upload_", suffix=self.suffix)
+        self._file = os.fdopen(fd, "wb")
+        return self
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk, enforcing the size limit
+        """
+        self.size += len(chunk)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise UploadTooLargeError(
+                f"upload exceeds the {self.max_bytes} byte limit"
+            )
+        self._file.write(chunk)
+
+    def finish(self) -> str:
+        """
+        Flush and close the spool file; returns its path
+        """
+        self._file.close()
+        logger.info(f"Spooled {self.size} bytes of upload to {self.path}")
+        return self.path
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Delete the spool file when exiting context
+        """
+        if self._file and not self._file.closed:
+            self._file.close()
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+        # Return False to propagate exception (if any exception occurred)
+        return False
+
+
+@contextlib.contextmanager
+def mapped_file(path: str):
+    """Yield a read-only mmap of ``path`` (``b""`` for an empty file)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            try:
+                mm.close()
+            except BufferError:
+                # A parser still holds a view; the map is released with it.
+                pass
+
+
 class TempDirContext:
     def __init__(self):
         """
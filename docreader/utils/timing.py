@@ -0,0 +1,114 @@
+"""Lightweight per-stage timing spans for parser pipelines.
+
+A :class:`StageTimer` accumulates wall time per stage, per document and
+(optionally) per page. Parsers return the aggregates in ``Document.metadata``
+and can export them as OpenTelemetry spans when the ``opentelemetry`` API is
+installed and ``DOCREADER_OTEL_TRACING`` is on.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimer:
+    """Accumulate ``span`` durations by stage and page.
+
+    ``span(stage, page=i)`` charges the elapsed time to ``stage`` in the
+    document totals and, when ``per_page`` is set, to page ``i``; ``span`` with
+    no page is a document-level stage (e.g. cross-page filters).
+    """
+
+    def __init__(self, per_page: bool = False):
+        self.per_page = per_page
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.pages: Dict[int, Dict[str, float]] = {}
+        # (stage, page, start_ns, end_ns) for tracing export.
+        self.spans: List[Tuple[str, Optional[int], int, int]] = []
+
+    @contextmanager
+    def span(self, stage: str, page: Optional[int] = None) -> Iterator[None]:
+        start_ns = time.time_ns()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start, page, start_ns)
+
+    def add(
+        self,
+        stage: str,
+        seconds: float,
+        page: Optional[int] = None,
+        start_ns: Optional[int] = None,
+    ) -> None:
+        """Record ``seconds`` of ``stage`` measured elsewhere."""
+        self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+        if page is not None and self.per_page:
+            stages = self.pages.setdefault(page, {})
+            stages[stage] = stages.get(stage, 0.0) + seconds
+        if start_ns is None:
+            start_ns = time.time_ns() - int(seconds * 1e9)
+        self.spans.append((stage, page, start_ns, start_ns + int(seconds * 1e9)))
+
+    def finish(self) -> None:
+        self.end_ns = time.time_ns()
+
+    def summary(self) -> dict:
+        """Metadata entries: JSON-encoded stage totals (and per-page timings).
+
+        Values are JSON strings because response metadata is a string map.
+        """
+        end_ns = self.end_ns or time.time_ns()
+        totals = {stage: _ms(seconds) for stage, seconds in self.totals.items()}
+        totals["total"] = _ms((end_ns - self.start_ns) / 1e9)
+        summary = {"stage_timings_ms": json.dumps(totals, sort_keys=True)}
+        if self.per_page:
+            pages = [
+                {"page": page + 1, **{s: _ms(v) for s, v in stages.items()}}
+                for page, stages in sorted(self.pages.items())
+            ]
+            summary["page_timings_ms"] = json.dumps(pages)
+        return summary
+
+    def export_otel(self, name: str, attributes: Optional[dict] = None) -> bool:
+        """Emit the recorded spans as children of a ``name`` span.
+
+        Returns False when the OpenTelemetry API is not installed. Without a
+        configured SDK the API tracer is a no-op, so this is cheap to call.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            logger.debug("opentelemetry not installed; skipping span export")
+            return False
+
+        tracer = trace.get_tracer("docreader")
+        root = tracer.start_span(
+            name, start_time=self.start_ns, attributes=attributes or {}
+        )
+        ctx = trace.set_span_in_context(root)
+        for stage, page, start_ns, end_ns in self.spans:
+            span = tracer.start_span(
+                f"{name}.{stage}",
+                context=ctx,
+                start_time=start_ns,
+                attributes={"page": page + 1} if page is not None else {},
+            )
+            span.end(end_time=end_ns)
+        for stage, seconds in self.totals.items():
+            root.set_attribute(f"stage.{stage}.ms", _ms(seconds))
+        root.end(end_time=self.end_ns or time.time_ns())
+        return True
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)